@@ -0,0 +1,188 @@
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from benchmarks.rules import ROWS, scale_rules, scaling_table
+from benchmarks.suite import (
+    DATA_DIR,
+    LARGE_SIZE,
+    SIZES,
+    compare_results,
+    load_results,
+    regressions_table,
+    run_benchmarks,
+    save_results,
+)
+from cin_validator.rules.registry import LazyRegistry
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command(name="run")
+@click.option(
+    "--size",
+    "-n",
+    "sizes",
+    multiple=True,
+    type=int,
+    default=SIZES,
+    show_default=True,
+    help="Number of children. Can be repeated.",
+)
+@click.option(
+    "--large",
+    is_flag=True,
+    help=f"Also benchmark a return of {LARGE_SIZE} children.",
+)
+@click.option("--ruleset", "-r", default="cin2024_25")
+@click.option("--seed", default=0)
+@click.option("--repeat", default=1, help="Runs per size. The fastest is kept.")
+@click.option("--memory/--no-memory", default=True, help="Measure peak memory.")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    default="benchmarks/results.json",
+    show_default=True,
+)
+@click.option(
+    "--data_dir",
+    type=click.Path(),
+    default=str(DATA_DIR),
+    help="Where the generated inputs are kept between runs.",
+)
+def run_cmd(sizes, large, ruleset, seed, repeat, memory, output, data_dir):
+    """
+    Benchmarks validation of synthetic returns.
+
+    Called using:
+    python -m benchmarks run -n 1000 -n 10000 -o benchmarks/baseline.json
+    """
+    sizes = list(sizes)
+    if large and LARGE_SIZE not in sizes:
+        sizes.append(LARGE_SIZE)
+
+    def report(size, size_results):
+        slowest = sorted(
+            size_results["stages"].items(),
+            key=lambda item: item[1]["wall_seconds"],
+            reverse=True,
+        )[:5]
+        click.echo(
+            f"{size} children: {size_results['wall_seconds']:.2f}s. Slowest: "
+            + ", ".join(
+                f"{stage} {values['wall_seconds']:.2f}s" for stage, values in slowest
+            )
+        )
+
+    results = run_benchmarks(
+        sizes, ruleset, seed, repeat, memory, Path(data_dir), on_size_done=report
+    )
+    save_results(results, output)
+    click.echo(f"Written {output}")
+
+
+@cli.command(name="compare")
+@click.argument("results", type=click.Path(exists=True))
+@click.option(
+    "--baseline",
+    "-b",
+    type=click.Path(exists=True),
+    default="benchmarks/baseline.json",
+    show_default=True,
+)
+@click.option(
+    "--threshold",
+    "-t",
+    default=0.2,
+    show_default=True,
+    help="Share by which a stage may get worse before it is flagged.",
+)
+@click.option(
+    "--min_seconds",
+    default=0.01,
+    show_default=True,
+    help="Smaller increases in time are ignored.",
+)
+def compare_cmd(results, baseline, threshold, min_seconds):
+    """
+    Flags the rules and stages that are slower, or use more memory, than in the baseline.
+    Exits with 1 if there are any, so that it can be used in CI.
+
+    Called using:
+    python -m benchmarks compare benchmarks/results.json -b benchmarks/baseline.json
+    """
+    baseline_results, current_results = load_results(baseline), load_results(results)
+    for setting in ["ruleset", "seed", "trace_memory"]:
+        if baseline_results.get(setting) != current_results.get(setting):
+            click.secho(
+                f"The results differ in {setting}: {baseline_results.get(setting)} "
+                f"in the baseline, {current_results.get(setting)} now.",
+                err=True,
+                fg="yellow",
+            )
+
+    regressions = compare_results(
+        baseline_results, current_results, threshold, min_seconds
+    )
+    if not regressions:
+        click.echo(f"No stage is more than {threshold:.0%} worse than the baseline.")
+        return
+    click.echo(regressions_table(regressions))
+    sys.exit(1)
+
+
+@cli.command(name="rules")
+@click.argument("rule_codes", nargs=-1)
+@click.option("--ruleset", "-r", default="cin2024_25")
+@click.option(
+    "--rows",
+    "-n",
+    multiple=True,
+    type=int,
+    default=ROWS,
+    show_default=True,
+    help="Rows in the largest table. Can be repeated.",
+)
+@click.option("--repeat", default=3, help="Runs per size. The fastest is kept.")
+@click.option(
+    "--output", "-o", type=click.Path(), help="Also write the results as json."
+)
+def rules_cmd(rule_codes, ruleset, rows, repeat, output):
+    """
+    Times rules on their test_validate sample data, replicated to larger sizes,
+    and shows how the time of each rule grows. All rules run if no codes are given.
+
+    Called using:
+    python -m benchmarks rules 8840 8510 -n 1000 -n 10000 -n 100000
+    """
+    registry = LazyRegistry(ruleset)
+    unknown = [code for code in rule_codes if code not in registry]
+    if unknown:
+        click.secho(
+            f"Unknown rules in {ruleset}: {', '.join(unknown)}", err=True, fg="red"
+        )
+        sys.exit(1)
+
+    def report(scaling):
+        click.echo(f"{scaling.code}: {scaling.complexity or scaling.error}", err=True)
+
+    results = scale_rules(
+        ruleset, rule_codes or None, rows, repeat, on_rule_done=report
+    )
+    click.echo(scaling_table(results))
+    if output:
+        Path(output).write_text(
+            json.dumps([asdict(scaling) for scaling in results], indent=2)
+        )
+        click.echo(f"Written {output}")
+
+
+if __name__ == "__main__":
+    cli()
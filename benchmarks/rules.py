@@ -0,0 +1,276 @@
+import contextlib
+import copy
+import importlib
+import io
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from cin_validator.rule_engine import CINTable, RuleContext, RuleDefinition
+from cin_validator.rules.registry import LazyRegistry
+
+# Micro-benchmarks of single rules, built from the sample data in each rule's test_validate.
+# The sample tables are replicated up to a number of rows, with the IDs of each copy made unique so that
+# every copy describes other children. Each rule is timed at several sizes and the growth of its time
+# is matched to a complexity class, so that rules which scale worse than linearly stand out.
+
+ROWS = [1_000, 4_000, 16_000]
+# columns that identify children and their episodes, assessments and plans.
+ID_COLUMNS = ["LAchildID", "CINdetailsID", "AssessmentID", "CPPID"]
+# rules whose time less than doubles between the smallest and largest data are not affected by its size.
+CONSTANT_GROWTH = 2
+# how time grows with the number of rows n, for each complexity class.
+COMPLEXITIES = {
+    "linear": lambda n: n,
+    "n log n": lambda n: n * np.log(n),
+    "quadratic": lambda n: n**2,
+}
+
+
+class _SampleCaptured(Exception):
+    """stops a test_validate once its sample data has been captured."""
+
+
+@dataclass
+class RuleScaling:
+    """
+    How the time of a rule grows with the size of its data.
+
+    :param str code: the rule code.
+    :param list rows: number of rows in the largest table at each size.
+    :param list seconds: fastest time of the rule at each size.
+    :param int sample_rows: number of rows in the largest table of the sample data.
+    :param float overhead: time of the rule on its sample data.
+    :param str complexity: the complexity class that best fits the times.
+    :param float exponent: k in time = a * rows ** k, between the two largest sizes.
+    :param str error: why the rule could not be benchmarked, if it could not.
+    """
+
+    code: str
+    rows: list[int] = field(default_factory=list)
+    seconds: list[float] = field(default_factory=list)
+    sample_rows: int = 0
+    overhead: float = 0.0
+    complexity: Optional[str] = None
+    exponent: Optional[float] = None
+    error: Optional[str] = None
+
+
+def sample_data(ruleset: str, code: str) -> dict:
+    """
+    Runs the test_validate of a rule until it calls run_rule, and keeps the data that it passes.
+
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :param str code: the rule code.
+    :returns: the sample tables, keyed by CINTable.
+    :rtype: dict
+    :raises ValueError: if the test does not run the rule.
+    """
+    entry = LazyRegistry(ruleset).entries[code]
+    rule_module = importlib.import_module(entry.import_path)
+    captured = {}
+
+    def capture(rule_func, datasets):
+        captured.update(copy.deepcopy(datasets))
+        raise _SampleCaptured
+
+    original = rule_module.run_rule
+    rule_module.run_rule = capture
+    try:
+        rule_module.test_validate()
+    except _SampleCaptured:
+        pass
+    finally:
+        rule_module.run_rule = original
+    if not captured:
+        raise ValueError(f"The test of rule {code} does not run the rule.")
+    return captured
+
+
+def replicate(datasets: dict, copies: int) -> dict:
+    """
+    :param dict datasets: tables keyed by CINTable.
+    :param int copies: number of copies of each table.
+    :returns: the tables repeated, with the IDs in each copy after the first given a suffix.
+        The header describes the whole return, so it is not repeated.
+    :rtype: dict
+    """
+    replicated = {}
+    for table, df in datasets.items():
+        if table is CINTable.Header or copies == 1:
+            replicated[table] = df.copy()
+            continue
+        repeated = df.iloc[np.tile(np.arange(len(df)), copies)].reset_index(drop=True)
+        copy_numbers = pd.Series(np.repeat(np.arange(copies), len(df)))
+        suffixes = "_" + copy_numbers.astype(str)
+        for column in ID_COLUMNS:
+            if column in repeated.columns:
+                ids = repeated[column]
+                repeated[column] = ids.where(
+                    ids.isna() | (copy_numbers == 0), ids.astype(str) + suffixes
+                )
+        replicated[table] = repeated
+    return replicated
+
+
+def largest_table(datasets: dict) -> int:
+    return max(
+        (len(df) for table, df in datasets.items() if table is not CINTable.Header),
+        default=0,
+    )
+
+
+def time_rule(rule: RuleDefinition, datasets: dict, repeat: int = 3) -> float:
+    """
+    :param RuleDefinition rule: the rule to time.
+    :param dict datasets: tables keyed by CINTable. Each run gets its own copy, made outside the timing.
+    :param int repeat: number of runs.
+    :returns: the fastest time, in seconds.
+    :rtype: float
+    """
+    best = math.inf
+    for _ in range(repeat):
+        data_files = copy.deepcopy(datasets)
+        # some rules print their issues, which would slow them down and fill the terminal.
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            rule.func(data_files, RuleContext(rule))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _relative_error(n: np.ndarray, t: np.ndarray, growth) -> float:
+    """
+    Fits time = c + a * growth(rows), with c and a at least 0, and returns the sum of squared relative errors.
+    The constant c takes in the fixed costs of a rule, such as calls to pandas, which dominate on small data.
+    """
+    # dividing by the times makes the errors relative, so that every size weighs the same.
+    terms = np.column_stack([np.ones_like(n), growth(n)]) / t[:, None]
+    target = np.ones_like(t)
+    coefficients = np.linalg.lstsq(terms, target, rcond=None)[0]
+    if (coefficients < 0).any():
+        # the best fit with a negative term is replaced by the best fit with one term only.
+        candidates = []
+        for column in range(2):
+            term = terms[:, column]
+            coefficients = np.zeros(2)
+            coefficients[column] = (term @ target) / (term @ term)
+            candidates.append(coefficients)
+        return min(np.sum((terms @ c - target) ** 2) for c in candidates)
+    return float(np.sum((terms @ coefficients - target) ** 2))
+
+
+def fit_complexity(rows: list[int], seconds: list[float]) -> tuple[str, float]:
+    """
+    Matches times to the complexity class whose growth they follow most closely.
+
+    :param list rows: number of rows at each size.
+    :param list seconds: times at each size.
+    :returns: the complexity class, and the exponent k of time = a * rows ** k between the two largest sizes.
+    :rtype: tuple
+    """
+    n = np.array(rows, dtype=float)
+    # times at or below the resolution of the clock carry no information about growth.
+    t = np.maximum(np.array(seconds, dtype=float), 1e-6)
+    exponent = float(np.log(t[-1] / t[-2]) / np.log(n[-1] / n[-2]))
+    if t[-1] < CONSTANT_GROWTH * t[0]:
+        return "constant", exponent
+    errors = {
+        name: _relative_error(n, t, growth) for name, growth in COMPLEXITIES.items()
+    }
+    return min(errors, key=errors.get), exponent
+
+
+def scale_rule(
+    ruleset: str, code: str, rows: Iterable[int] = ROWS, repeat: int = 3
+) -> RuleScaling:
+    """
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :param str code: the rule code.
+    :param list rows: numbers of rows, in the largest table, to time the rule at.
+    :param int repeat: runs at each size. The fastest is kept.
+    :returns: the times of the rule and how they grow.
+    :rtype: RuleScaling
+    """
+    scaling = RuleScaling(code)
+    try:
+        rule = LazyRegistry(ruleset)[code]
+        sample = sample_data(ruleset, code)
+        sample_rows = scaling.sample_rows = largest_table(sample)
+        if not sample_rows:
+            raise ValueError(
+                f"Rule {code} only reads the header, which does not grow with the return."
+            )
+        scaling.overhead = time_rule(rule, sample, repeat)
+        for target in rows:
+            datasets = replicate(sample, max(1, math.ceil(target / sample_rows)))
+            scaling.rows.append(largest_table(datasets))
+            scaling.seconds.append(time_rule(rule, datasets, repeat))
+    except Exception as e:
+        scaling.error = f"{type(e).__name__}, {e}"
+        return scaling
+    # the sample data is the smallest size.
+    scaling.complexity, scaling.exponent = fit_complexity(
+        [sample_rows] + scaling.rows, [scaling.overhead] + scaling.seconds
+    )
+    return scaling
+
+
+def scale_rules(
+    ruleset: str,
+    codes: Optional[Iterable[str]] = None,
+    rows: Iterable[int] = ROWS,
+    repeat: int = 3,
+    on_rule_done=None,
+) -> list[RuleScaling]:
+    """
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :param list codes: the rules to benchmark. All rules of the ruleset if not given.
+    :param list rows: numbers of rows to time each rule at.
+    :param int repeat: runs at each size.
+    :param function on_rule_done: called with the RuleScaling of each rule, e.g. to report progress.
+    :returns: the results, the rules that scale worst first.
+    :rtype: list
+    """
+    rows = list(rows)
+    results = []
+    for code in codes or LazyRegistry(ruleset):
+        scaling = scale_rule(ruleset, code, rows, repeat)
+        if on_rule_done is not None:
+            on_rule_done(scaling)
+        results.append(scaling)
+    results.sort(
+        key=lambda scaling: (scaling.error is None, scaling.exponent or 0.0),
+        reverse=True,
+    )
+    return results
+
+
+def scaling_table(results: list[RuleScaling]) -> str:
+    """
+    :param list results: as returned by scale_rules.
+    :returns: the time of each rule at each size and its complexity class, as text.
+    :rtype: str
+    """
+    if not results:
+        return ""
+    sizes = max((scaling.rows for scaling in results), key=len)
+    rows = [
+        f"{'rule':<8}"
+        + "".join(f"{f'{size} rows':>14}" for size in sizes)
+        + f"{'exponent':>10}  complexity"
+    ]
+    for scaling in results:
+        if scaling.error is not None:
+            rows.append(f"{scaling.code:<8}error: {scaling.error}")
+            continue
+        rows.append(
+            f"{scaling.code:<8}"
+            + "".join(f"{seconds * 1000:>11.2f} ms" for seconds in scaling.seconds)
+            + f"{scaling.exponent:>10.2f}  {scaling.complexity}"
+        )
+    return "\n".join(rows)
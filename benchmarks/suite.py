@@ -0,0 +1,204 @@
+import datetime
+import json
+import platform
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+
+from cin_validator.profiler import profile_file
+from cin_validator.rules.registry import LazyRegistry
+from cin_validator.synthetic import write_census
+
+# Benchmarks of the whole validation pipeline on synthetic returns of increasing size.
+# Every stage that the timer command measures is recorded: ingest (XML parse and XMLtoCSV), typing (process_data),
+# each rule, and report assembly (include_issue_child and create_user_report).
+# Results are saved as json. A baseline saved before a change can be compared with results after it to find
+# the rules and stages that became slower or use more memory.
+
+# the default sizes are quick enough for CI. The large size is only run when asked for.
+SIZES = [1_000, 10_000]
+LARGE_SIZE = 100_000
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@dataclass
+class Regression:
+    """
+    A stage that got worse between a baseline and new results.
+
+    :param str size: number of children in the input.
+    :param str stage: the stage, or the code of a rule.
+    :param str metric: wall_seconds, cpu_seconds or peak_memory.
+    :param float baseline: value in the baseline.
+    :param float current: value in the new results.
+    """
+
+    size: str
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def input_file(children: int, seed: int, ruleset: str, data_dir: Path) -> Path:
+    """
+    :param int children: number of children in the input.
+    :param int seed: seed of the synthetic return.
+    :param str ruleset: the rules it is validated with, which set its collection year.
+    :param Path data_dir: where generated inputs are kept, so that they are only generated once.
+    :returns: path of the synthetic return.
+    :rtype: Path
+    """
+    collection_year = f"20{ruleset[-2:]}"
+    path = Path(data_dir) / f"cin_{collection_year}_{children}_seed{seed}.xml"
+    if not path.exists():
+        write_census(path, children, seed=seed, collection_year=collection_year)
+    return path
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = SIZES,
+    ruleset: str = "cin2024_25",
+    seed: int = 0,
+    repeat: int = 1,
+    trace_memory: bool = True,
+    data_dir: Path = DATA_DIR,
+    on_size_done=None,
+) -> dict:
+    """
+    :param list sizes: numbers of children to benchmark with.
+    :param str ruleset: the rules to run.
+    :param int seed: seed of the synthetic returns.
+    :param int repeat: number of runs per size. The fastest time and highest memory of each stage are kept.
+    :param bool trace_memory: whether peak memory is measured. Tracing slows validation down, so results with and
+        without it should not be compared.
+    :param Path data_dir: where generated inputs are kept.
+    :param function on_size_done: called with each size and its results, e.g. to report progress.
+    :returns: the results, as saved by save_results.
+    :rtype: dict
+    """
+    registry = LazyRegistry(ruleset)
+    results = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "ruleset": ruleset,
+        "seed": seed,
+        "repeat": repeat,
+        "trace_memory": trace_memory,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.platform(),
+        "sizes": {},
+    }
+    for size in sizes:
+        path = input_file(size, seed, ruleset, data_dir)
+        stages: dict[str, dict] = {}
+        for _ in range(repeat):
+            profiler = profile_file(path, ruleset, registry, trace_memory=trace_memory)
+            for stage in profiler.stages:
+                best = stages.setdefault(
+                    stage.stage,
+                    {
+                        "kind": stage.kind,
+                        "wall_seconds": stage.wall_seconds,
+                        "cpu_seconds": stage.cpu_seconds,
+                        "peak_memory": stage.peak_memory,
+                    },
+                )
+                best["wall_seconds"] = min(best["wall_seconds"], stage.wall_seconds)
+                best["cpu_seconds"] = min(best["cpu_seconds"], stage.cpu_seconds)
+                if stage.peak_memory is not None:
+                    best["peak_memory"] = max(best["peak_memory"], stage.peak_memory)
+        results["sizes"][str(size)] = {
+            "wall_seconds": sum(stage["wall_seconds"] for stage in stages.values()),
+            "stages": stages,
+        }
+        if on_size_done is not None:
+            on_size_done(size, results["sizes"][str(size)])
+    return results
+
+
+def save_results(results: dict, path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2))
+
+
+def load_results(path: Path) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.2,
+    min_seconds: float = 0.01,
+    min_memory: int = 1024**2,
+) -> list[Regression]:
+    """
+    Finds the stages that are slower, or use more memory, than in the baseline. Sizes and stages that are not in
+    both results are skipped.
+
+    :param dict baseline: results from before a change.
+    :param dict current: results from after it.
+    :param float threshold: the share by which a stage may get worse, e.g. 0.2 for 20%.
+    :param float min_seconds: smaller increases in time are ignored, as they are within the noise of fast stages.
+    :param int min_memory: smaller increases in peak memory, in bytes, are ignored.
+    :returns: the regressions, worst first.
+    :rtype: list
+    """
+    regressions = []
+    for size, size_results in current["sizes"].items():
+        if size not in baseline["sizes"]:
+            continue
+        baseline_stages = baseline["sizes"][size]["stages"]
+        # the total only has a wall time.
+        pairs = [("total", size_results, baseline["sizes"][size])]
+        pairs += [
+            (stage, values, baseline_stages[stage])
+            for stage, values in size_results["stages"].items()
+            if stage in baseline_stages
+        ]
+        for stage, values, baseline_values in pairs:
+            for metric, noise in [
+                ("wall_seconds", min_seconds),
+                ("cpu_seconds", min_seconds),
+                ("peak_memory", min_memory),
+            ]:
+                old, new = baseline_values.get(metric), values.get(metric)
+                if old is None or new is None:
+                    continue
+                if new > old * (1 + threshold) and new - old > noise:
+                    regressions.append(Regression(size, stage, metric, old, new))
+    regressions.sort(key=lambda regression: regression.ratio, reverse=True)
+    return regressions
+
+
+def regressions_table(regressions: list[Regression]) -> str:
+    """
+    :param list regressions: as returned by compare_results.
+    :returns: the regressions as text.
+    :rtype: str
+    """
+    rows = [
+        f"{'size':>8}  {'stage':<22}{'metric':<14}{'baseline':>12}{'now':>12}{'ratio':>8}"
+    ]
+    for regression in regressions:
+        rows.append(
+            f"{regression.size:>8}  {regression.stage:<22}{regression.metric:<14}"
+            f"{format_value(regression.metric, regression.baseline):>12}"
+            f"{format_value(regression.metric, regression.current):>12}"
+            f"{regression.ratio:>8.2f}"
+        )
+    return "\n".join(rows)
+
+
+def format_value(metric: str, value: float) -> str:
+    if metric == "peak_memory":
+        return f"{value / 1024**2:.1f} MB"
+    return f"{value:.4f} s"
@@ -1,14 +1,29 @@
-import datetime
 import importlib
 import json
 import os
-import xml.etree.ElementTree as ET
+import signal
+import sys
 from pathlib import Path
 
 import click
-import pytest
 
-from cin_validator import cin_validator
+# pandas, pytest and the rules are imported by the commands that need them so that
+# light commands such as list start quickly.
+from cin_validator.batch import find_files, validate_batch, write_summary
+from cin_validator.convert import FORMATS, convert_files
+from cin_validator.daemon import (
+    DEFAULT_SOCKET,
+    ValidationServer,
+    request_validation,
+    validate_file,
+)
+from cin_validator.rules.registry import (
+    MANIFEST_PATH,
+    LazyRegistry,
+    get_manifest_entries,
+    load_registries,
+    write_manifest,
+)
 
 
 @click.group()
@@ -34,10 +49,9 @@ def list_cmd(ruleset):
     :returns: A list of validation rules in the given ruleset.
     :rtype: list
     """
-    module = importlib.import_module(f"cin_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
-    for _, rule in ruleset_registry.items():
-        click.echo(f"{rule.code}\t{rule.message} ({rule.rule_type.name})")
+    # the manifest describes every rule without importing the rule files.
+    for _, rule in get_manifest_entries(ruleset).items():
+        click.echo(f"{rule.code}\t{rule.message} ({rule.rule_type})")
 
 
 @cli.command(name="run")
@@ -50,7 +64,49 @@ def list_cmd(ruleset):
 )
 @click.option("--select", "-s", default=None)
 @click.option("--output/--no_output", "-o/-no", default=False)
-def run_all(filename: str, ruleset, select, output):
+@click.option(
+    "--daemon",
+    is_flag=True,
+    default=False,
+    help="Send the file to a running `serve` process instead of validating it here.",
+)
+@click.option("--socket", "socket_path", default=str(DEFAULT_SOCKET))
+@click.option(
+    "--memory_budget",
+    type=int,
+    default=None,
+    help="Megabytes that validation should stay within. Data that would not fit is spilled to disk.",
+)
+@click.option(
+    "--spill_format",
+    type=click.Choice(["pickle", "arrow"]),
+    default="pickle",
+    help="How spilled tables are written. arrow requires pyarrow.",
+)
+@click.option(
+    "--batch_size",
+    type=int,
+    default=None,
+    help="Validate this many children at a time, so that memory does not grow with the file.",
+)
+@click.option(
+    "--report_format",
+    type=click.Choice(["csv", "jsonl", "parquet"]),
+    default="csv",
+    help="Format of the user report written with --output. parquet requires pyarrow.",
+)
+def run_all(
+    filename: str,
+    ruleset,
+    select,
+    output,
+    daemon,
+    socket_path,
+    memory_budget,
+    spill_format,
+    batch_size,
+    report_format,
+):
     """
     Used to run all of a set of validation rules on input data.
 
@@ -63,35 +119,216 @@ def run_all(filename: str, ruleset, select, output):
     :param str filename: Refers to the filepath of data to be validated.
     :param str ruleset: The folder name of the validation rules to run input data against.
     :param select: specify the rules that should be run. CLI works with a single string only.
-    :param bool output: If true, produces csv output of error report, if False (default)
-        does not.
+    :param bool output: If true, writes the error report to user_report.<report_format> as each rule
+        finishes, if False (default) does not.
+    :param bool daemon: If true, the file is validated by the process started with
+        python -m cin_validator serve, which has already loaded the rules.
+    :param str socket_path: the socket that the daemon listens on.
+    :param int memory_budget: megabytes that validation should stay within. If the data would not fit,
+        its tables are written to disk and each rule reads the columns it needs from there.
+    :param str spill_format: how spilled tables are written, pickle or arrow.
+    :param int batch_size: if given, children are read and validated in batches of this size. The issues
+        of each batch are appended to the report as soon as they are found.
+    :param str report_format: csv, jsonl or parquet. The daemon only returns csv.
     :returns: DataFrame report of errors using selected validation rules, also output as
         JSON when output is True.
     :rtype: DataFrame, JSON
     """
 
-    fulltree = ET.parse(filename)
-    root = fulltree.getroot()
+    if daemon and memory_budget is not None:
+        click.secho(
+            "--memory_budget cannot be used with --daemon, whose memory is shared by all requests.",
+            err=True,
+            fg="red",
+        )
+        sys.exit(1)
 
-    raw_data = cin_validator.convert_data(root)
-    data_files = cin_validator.process_data(raw_data)
+    if output:
+        from cin_validator.report_writers import check_format
+
+        try:
+            check_format(report_format)
+        except ImportError as e:
+            click.secho(str(e), err=True, fg="red")
+            sys.exit(1)
+
+    if batch_size is not None:
+        if daemon or memory_budget is not None:
+            click.secho(
+                "--batch_size cannot be used with --daemon or --memory_budget.",
+                err=True,
+                fg="red",
+            )
+            sys.exit(1)
+        run_in_batches(filename, ruleset, select, output, batch_size, report_format)
+        return
+
+    if daemon and report_format != "csv":
+        click.secho("The daemon only returns reports as csv.", err=True, fg="red")
+        sys.exit(1)
+
+    if daemon:
+        try:
+            result = request_validation(
+                filename.name, ruleset, select, output, socket_path
+            )
+        except OSError:
+            click.secho(
+                f"No daemon is listening on {socket_path}. Start one with: python -m cin_validator serve",
+                err=True,
+                fg="red",
+            )
+            sys.exit(1)
+        if "error" in result:
+            click.secho(result["error"], err=True, fg="red")
+            sys.exit(1)
+    else:
+        # get rules based on specified year. Rule files are imported when they are run.
+        ruleset_registry = LazyRegistry(ruleset)
+        if memory_budget is not None:
+            memory_budget *= 1024**2
+        result = validate_file(
+            filename,
+            ruleset,
+            ruleset_registry,
+            select,
+            memory_budget=memory_budget,
+            spill_format=spill_format,
+            report_path=Path(f"user_report.{report_format}") if output else None,
+        )
+
+    if result["user_report"] is not None:
+        # the daemon returns the whole report, which is written here.
+        Path("user_report.csv").write_text(result["user_report"])
+
+    issues = result["issues"]
+    click.echo(f"{sum(issues.values())} issue locations from {len(issues)} rules.")
+    for code, count in issues.items():
+        click.echo(f"{code}: {count}")
+    if "memory" in result:
+        click.echo(result["memory"])
+
+
+def run_in_batches(
+    filename, ruleset: str, select, output: bool, batch_size: int, report_format: str
+):
+    """
+    Validates a file in batches of children for the run command, see validate_in_batches.
+    With output, the issues of each batch are appended to user_report.<report_format>.
+    """
+    from cin_validator.chunked import validate_in_batches
+    from cin_validator.report_writers import report_writer
+
+    writer = report_writer(Path(f"user_report.{report_format}")) if output else None
+    try:
+        result = validate_in_batches(
+            filename,
+            ruleset,
+            LazyRegistry(ruleset),
+            select,
+            batch_size,
+            on_issues=writer.write if writer is not None else None,
+        )
+    finally:
+        if writer is not None:
+            writer.close()
+
+    click.echo(
+        f"Validated {result.children} children in {result.batches} batches: "
+        f"{sum(result.issues.values())} issue locations."
+    )
+    if not result.multichild_issues.empty:
+        click.echo(result.multichild_issues)
 
-    # get rules based on specified year.
-    module = importlib.import_module(f"cin_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
 
-    validator = cin_validator.CinValidator(
-        data_files, ruleset_registry, selected_rules=select
+@cli.command(name="validate-batch")
+@click.argument("path", required=True)
+@click.option(
+    "--ruleset",
+    "-r",
+    default="cin2024_25",
+    help="Which ruleset to use, e.g. cin2024_25",
+)
+@click.option(
+    "--output_dir", "-o", default="batch_reports", help="Where reports are written."
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+def validate_batch_cmd(path, ruleset, output_dir, workers):
+    """
+    Validates many CIN XML files at once, using several processes.
+
+    Writes a user report for each file, files.csv with the status and timing of each file
+    and summary.csv with the number of issues of each file for each rule.
+    Files that cannot be validated are reported and do not stop the batch.
+
+    Call using:
+    python -m cin_validator validate-batch <folder or glob of XML files>
+    For example:
+    python -m cin_validator validate-batch "returns/*.xml" -r cin2023_24
+
+    :param str path: a folder, whose XML files are all validated, or a glob pattern.
+    :param str ruleset: The folder name of the validation rules to run input data against.
+    :param str output_dir: the folder that reports are written to.
+    :param int workers: number of processes that validate files.
+    """
+    files = find_files(path)
+    if not files:
+        click.secho(f"No XML files found at {path}", err=True, fg="red")
+        sys.exit(1)
+
+    def show_progress(result, done, total):
+        if result.status == "failed":
+            click.secho(
+                f"[{done}/{total}] {result.file} failed: {result.error}",
+                err=True,
+                fg="red",
+            )
+        else:
+            click.echo(
+                f"[{done}/{total}] {result.file}: {result.issues} issues in {result.seconds:.1f}s"
+            )
+
+    results = validate_batch(
+        files, ruleset, Path(output_dir), workers=workers, on_result=show_progress
     )
+    write_summary(results, Path(output_dir))
 
-    full_issue_df = validator.full_issue_df
+    failed = sum(result.status == "failed" for result in results)
+    click.echo(
+        f"Validated {len(results) - failed} of {len(results)} files. Reports are in {output_dir}"
+    )
+    if failed:
+        sys.exit(1)
 
-    if output:
-        validator.user_report.to_csv("user_report.csv")
 
-    # click.echo(full_issue_df)
-    # click.echo(validator.multichild_issues)
-    click.echo(validator.data_files["Assessments"])
+@cli.command(name="serve")
+@click.option("--socket", "socket_path", default=str(DEFAULT_SOCKET))
+def serve_cmd(socket_path):
+    """
+    Starts a process that keeps every ruleset loaded and validates the files sent by
+    python -m cin_validator run --daemon <filepath_to_data>
+    so that repeated runs do not pay for starting python and importing the rules.
+
+    Call using:
+    python -m cin_validator serve
+
+    :param str socket_path: where the Unix socket is created.
+    """
+    registries = load_registries()
+    # stopping the daemon with kill removes its socket, as Ctrl+C does.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with ValidationServer(Path(socket_path), registries) as server:
+        click.echo(f"Listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
 
 
 @cli.command(name="test")
@@ -124,17 +361,16 @@ def test_cmd(rule, ruleset):
     :returns: Pytest output in terminal of rules passing and failing.
     :rtype: Pytest output in terminal.
     """
+    import pytest
 
     module = importlib.import_module(f"cin_validator.rules.{ruleset}")
     module_folder = Path(module.__file__).parent
 
-    ruleset_registry = getattr(module, "registry")
-
     if rule:
         rule = str(rule)
         # when rule code is specified, test specific rule.
-        rule_def = ruleset_registry.get(rule)
-        if not rule_def:
+        rule_entry = get_manifest_entries(ruleset).get(rule)
+        if not rule_entry:
             # if the get returns a <NoneType>
             click.secho(f"Rule {rule} not found.", err=True, fg="red")
             return 1
@@ -150,41 +386,257 @@ def test_cmd(rule, ruleset):
     pytest.main(test_files)
 
 
+@cli.command(name="manifest")
+def manifest_cmd():
+    """
+    Regenerates cin_validator/rules/manifest.py from the rule files.
+    Run this after adding, removing or changing the definition of a rule.
+
+    Call using:
+    python -m cin_validator manifest
+    """
+    write_manifest()
+    click.echo(f"Written {MANIFEST_PATH}")
+
+
 @cli.command(name="xmltocsv")
-@click.argument("filename", type=click.Path(), required=True)
-def cli_converter(filename: str):
+@click.argument("paths", nargs=-1, required=True)
+@click.option(
+    "--format",
+    "-f",
+    "file_format",
+    type=click.Choice(FORMATS),
+    default="csv",
+    help="Format of the tables. parquet and feather require pyarrow.",
+)
+@click.option(
+    "--output_dir", "-o", default="output_csvs", help="Where tables are written."
+)
+@click.option(
+    "--partition_by_la",
+    is_flag=True,
+    help="Write the tables of each file in a LEA=<LEA of its header> folder.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+def cli_converter(paths, file_format, output_dir, partition_by_la, workers):
     """
-    Converts XML to CSV at selected filepath. Does not require XML to be validated against validation rules and does not validate against rules.
+    Converts XML to CSV, Parquet or Feather tables. Does not require XML to be validated against validation rules and does not validate against rules.
+    Many files are converted at once, using several processes.
     Called using:
     python -m cin_validator xmltocsv <filepath>
+    or, for every XML file of folders or matching globs:
+    python -m cin_validator xmltocsv "returns/*.xml" -f parquet --partition_by_la
+
+    :param tuple paths: XML files, folders whose XML files are all converted, or glob patterns.
+    :param str file_format: csv, parquet or feather.
+    :param str output_dir: the folder that tables are written to. It is created if it doesn't already exist.
+    :param bool partition_by_la: whether the tables of each file are written in a folder per LEA.
+    :param int workers: number of processes that convert files.
+    :returns: a table per CIN table in output_dir for a single file. Otherwise, a folder per CIN table
+        with a table per file.
+    :rtype: CSVs (multiple), or Parquet or Feather files.
+    """
+    files = []
+    for path in paths:
+        found = [Path(path)] if Path(path).is_file() else find_files(path)
+        if not found:
+            click.echo(f"{path} can't be found, have you entered it correctly?")
+        files.extend(file for file in found if file not in files)
+    if not files:
+        sys.exit(1)
+
+    def show_progress(result, done, total):
+        if result.status == "failed":
+            click.secho(
+                f"[{done}/{total}] {result.file} failed: {result.error}",
+                err=True,
+                fg="red",
+            )
+        elif total > 1:
+            click.echo(f"[{done}/{total}] {result.file} in {result.seconds:.1f}s")
+
+    try:
+        results = convert_files(
+            files,
+            Path(output_dir),
+            file_format,
+            partition_by_la=partition_by_la,
+            workers=workers,
+            on_result=show_progress,
+        )
+    except ImportError as e:
+        click.secho(str(e), err=True, fg="red")
+        sys.exit(1)
+
+    failed = sum(result.status == "failed" for result in results)
+    if len(results) > 1:
+        click.echo(
+            f"Converted {len(results) - failed} of {len(results)} files. Tables are in {output_dir}"
+        )
+    if failed:
+        sys.exit(1)
 
-    :param str filename: filename (or path) of XML file to convert to CSV.
-    :returns: CSV of XML input into output_csvs directory (which will be created
-        if it doesn't already exist).
-    :rtype: CSVs (multiple).
 
+@cli.command(name="timer")
+@click.argument("filepath", type=click.Path(exists=True), required=True)
+@click.option(
+    "--ruleset",
+    "-r",
+    default="cin2024_25",
+    help="Which ruleset to use, e.g. cin2024_25",
+)
+@click.option("--select", "-s", default=None)
+@click.option(
+    "--json",
+    "json_path",
+    type=click.Path(),
+    default=None,
+    help="Where to write the profile. Defaults to <file name>_profile.json.",
+)
+@click.option("--top", "-n", default=20, help="Number of stages shown.")
+@click.option(
+    "--memory/--no-memory",
+    default=True,
+    help="Measure peak memory per stage. Tracing memory slows validation down.",
+)
+def timer(filepath, ruleset, select, json_path, top, memory):
     """
-    if Path(filename).exists():
-        fulltree = ET.parse(filename)
-        root = fulltree.getroot()
+    Profiles the validation of a file: wall time, cpu time and peak memory of reading the XML,
+    converting it, processing the tables, each rule, include_issue_child and create_user_report.
 
-        cin_tables_dict = cin_validator.convert_data(root)
-        for k, v in cin_tables_dict.items():
-            filepath = Path(f"output_csvs/{k}.csv")
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            v.to_csv(filepath)
-    else:
-        click.echo(f"{filename} can't be found, have you entered it correctly?")
+    Called using:
+    python -m cin_validator timer <filepath>
 
+    :param str filepath: the CIN XML file to validate.
+    :param str ruleset: The folder name of the validation rules to run input data against.
+    :param select: specify the rules that should be run.
+    :param str json_path: where the profile of every stage is written as json.
+    :param int top: number of stages shown, slowest first.
+    :param bool memory: whether peak memory is measured.
+    """
+    from cin_validator.profiler import profile_file
 
-@cli.command(name="timer")
-@click.argument("filepath", type=str, required=True)
-def timer(filepath):
-    st = datetime.datetime.now()
-    os.system(f"python -m cin_validator run {filepath}")
-    et = datetime.datetime.now()
-    time_elapsed = et - st
-    click.echo(f"Time to run: {time_elapsed}")
+    profiler = profile_file(filepath, ruleset, LazyRegistry(ruleset), select, memory)
+
+    json_path = json_path or f"{Path(filepath).stem}_profile.json"
+    profiler.to_json(json_path, file=str(filepath), ruleset=ruleset)
+
+    click.echo(profiler.table(top))
+    click.echo(
+        f"Time to run: {sum(stage.wall_seconds for stage in profiler.stages):.2f}s"
+    )
+    click.echo(f"Written {json_path}")
+
+
+@cli.command(name="profile-rule")
+@click.argument("filepath", type=click.Path(exists=True), required=True)
+@click.argument("rule_codes", nargs=-1, required=True)
+@click.option(
+    "--ruleset",
+    "-r",
+    default="cin2024_25",
+    help="Which ruleset to use, e.g. cin2024_25",
+)
+@click.option("--repeat", default=3, help="Number of times each rule runs.")
+@click.option("--top", "-n", default=15, help="Number of functions shown per rule.")
+@click.option(
+    "--output_dir",
+    "-o",
+    type=click.Path(),
+    default="rule_profiles",
+    help="Where the .pstats files and summary.json are written.",
+)
+def profile_rule_cmd(filepath, rule_codes, ruleset, repeat, top, output_dir):
+    """
+    Runs rules under cProfile to show which functions their time is spent in.
+
+    Called using:
+    python -m cin_validator profile-rule <filepath> <rule code> [<rule code>...]
+
+    :param str filepath: the CIN XML file to validate.
+    :param tuple rule_codes: the rules to profile.
+    :param str ruleset: The folder name of the validation rules to run input data against.
+    :param int repeat: number of times each rule runs.
+    :param int top: number of functions shown per rule, most cumulative time first.
+    :param str output_dir: where a .pstats file per rule and summary.json are written.
+    """
+    from cin_validator.profiler import profile_rules, summary_table
+
+    registry = LazyRegistry(ruleset)
+    unknown = [code for code in rule_codes if code not in registry]
+    if unknown:
+        click.secho(
+            f"Unknown rules in {ruleset}: {', '.join(unknown)}", err=True, fg="red"
+        )
+        sys.exit(1)
+
+    summary = profile_rules(
+        filepath, ruleset, registry, list(rule_codes), output_dir, repeat, top
+    )
+    click.echo(summary_table(summary))
+    click.echo(f"Written {Path(output_dir) / 'summary.json'}")
+
+
+@cli.command(name="generate")
+@click.argument("output", type=click.Path(), required=True)
+@click.option("--children", "-n", default=1000, help="Number of children.")
+@click.option("--seed", default=0, help="The same seed always gives the same file.")
+@click.option(
+    "--year",
+    default="2025",
+    help="Collection year, e.g. 2025 for the cin2024_25 rules.",
+)
+@click.option("--lea", default="201", help="Three digit code of the local authority.")
+@click.option(
+    "--error_rate",
+    default=0.0,
+    help="Share of children with an injected error, for every error group.",
+)
+@click.option(
+    "--errors",
+    "-e",
+    multiple=True,
+    help="Error rate of one group as GROUP=RATE, e.g. -e upn=0.05. Overrides --error_rate.",
+)
+def generate_cmd(output, children, seed, year, lea, error_rate, errors):
+    """
+    Writes a synthetic CIN census XML file, e.g. to benchmark validation of large returns.
+
+    Called using:
+    python -m cin_validator generate <output path> -n <number of children>
+
+    :param str output: path of the XML file to write.
+    :param int children: number of children in the return.
+    :param int seed: seeds the random choices.
+    :param str year: collection year.
+    :param str lea: code of the local authority.
+    :param float error_rate: share of children with an error of each group.
+    :param tuple errors: error rates of single groups, as GROUP=RATE.
+    """
+    from cin_validator.synthetic import ERROR_GROUPS, write_census
+
+    error_rates = {group: error_rate for group in ERROR_GROUPS if error_rate}
+    for error in errors:
+        group, _, rate = error.partition("=")
+        if group not in ERROR_GROUPS:
+            click.secho(
+                f"Unknown error group {group}, expected one of {', '.join(ERROR_GROUPS)}",
+                err=True,
+                fg="red",
+            )
+            sys.exit(1)
+        error_rates[group] = float(rate)
+
+    injected = write_census(output, children, seed, year, lea, error_rates)
+    click.echo(f"Written {children} children to {output}")
+    for group, count in injected.items():
+        click.echo(f"{count} {group} errors: {ERROR_GROUPS[group]}")
 
 
 if __name__ == "__main__":
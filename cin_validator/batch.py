@@ -0,0 +1,236 @@
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from cin_validator.rules.registry import LazyRegistry
+
+# Validation of many CIN XML files at once, e.g. the returns of several LAs.
+# Each file is read and validated by a worker process that writes its own user report.
+# A file that cannot be validated is recorded as failed and the rest of the batch carries on.
+
+# registry of each ruleset in a worker process, so that rules are imported once per worker.
+_worker_registries: dict[str, LazyRegistry] = {}
+
+
+@dataclass
+class FileResult:
+    """
+    The outcome of validating one file of a batch.
+
+    :param str file: path of the XML file.
+    :param str status: "validated" or "failed".
+    :param float seconds: time taken to read and validate the file.
+    :param str report: path of the user report written for the file.
+    :param str multichild_report: path of the la-level and header issues written for the file.
+    :param dict issue_counts: number of issues found for each rule code, including la-level issues.
+    :param str error: why the file could not be validated.
+    """
+
+    file: str
+    status: str
+    seconds: float
+    report: Optional[str] = None
+    multichild_report: Optional[str] = None
+    issue_counts: dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def issues(self) -> int:
+        return sum(self.issue_counts.values())
+
+
+def find_files(path: str) -> list[Path]:
+    """
+    :param str path: a directory, whose XML files are all selected, or a glob pattern such as returns/*.xml.
+    :returns: the files to validate, sorted by path.
+    :rtype: list
+    """
+    if Path(path).is_dir():
+        return sorted(Path(path).glob("*.xml"))
+    return sorted(Path(match) for match in glob.glob(path, recursive=True))
+
+
+def unique_names(files: list[Path]) -> list[str]:
+    """
+    Names each file after its stem. Files with the same name in different folders get a number
+    added so that what is written for them does not overwrite each other.
+
+    :param list files: the files of the batch.
+    :returns: the name of each file, in the same order.
+    :rtype: list
+    """
+    seen: dict[str, int] = {}
+    names = []
+    for file in files:
+        count = seen.get(file.stem, 0) + 1
+        seen[file.stem] = count
+        names.append(file.stem if count == 1 else f"{file.stem}_{count}")
+    return names
+
+
+def report_paths(files: list[Path], output_dir: Path) -> list[Path]:
+    """
+    Names the user report of each file after the file, as in unique_names.
+
+    :param list files: the files of the batch.
+    :param Path output_dir: the folder that the reports are written to.
+    :returns: the report path of each file, in the same order.
+    :rtype: list
+    """
+    return [output_dir / f"{name}_user_report.csv" for name in unique_names(files)]
+
+
+def multichild_report_path(report_path: Path) -> Path:
+    """
+    :param Path report_path: the user report of a file, as named by report_paths.
+    :returns: where the la-level and header issues of the file are written, next to its user report.
+    :rtype: Path
+    """
+    name = report_path.name.replace("_user_report.csv", "_multichild_issues.csv")
+    return report_path.with_name(name)
+
+
+def validate_batch_file(file: Path, ruleset: str, report_path: Path) -> FileResult:
+    """
+    Validates one file and writes its user report, and its la-level and header issues
+    next to it. Runs in a worker process.
+
+    :param Path file: the XML file to validate.
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :param Path report_path: where the user report is written.
+    :returns: the outcome, failed if the file could not be read or validated.
+    :rtype: FileResult
+    """
+    from cin_validator.cin_validator import validate_xml
+
+    start = time.perf_counter()
+    multichild_path = multichild_report_path(report_path)
+    try:
+        if ruleset not in _worker_registries:
+            _worker_registries[ruleset] = LazyRegistry(ruleset)
+        validator = validate_xml(file, ruleset, _worker_registries[ruleset])
+        validator.user_report.to_csv(report_path)
+        validator.multichild_issues.to_csv(multichild_path, index=False)
+    except Exception as e:
+        return FileResult(
+            file=str(file),
+            status="failed",
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}, {e}",
+        )
+
+    issue_counts: dict[str, int] = {}
+    if "rule_code" in validator.user_report:
+        for code, n in validator.user_report["rule_code"].value_counts().items():
+            issue_counts[str(code)] = int(n)
+    multichild_codes = validator.multichild_issues["rule_code"].astype(str)
+    # header issues are in the user report too, so only la-level issues are added.
+    for code, n in multichild_codes.value_counts().items():
+        if code not in issue_counts:
+            issue_counts[code] = int(n)
+    return FileResult(
+        file=str(file),
+        status="validated",
+        seconds=time.perf_counter() - start,
+        report=str(report_path),
+        multichild_report=str(multichild_path),
+        issue_counts=issue_counts,
+    )
+
+
+def validate_batch(
+    files: list[Path],
+    ruleset: str,
+    output_dir: Path,
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[FileResult, int, int], None]] = None,
+) -> list[FileResult]:
+    """
+    Validates files across a pool of worker processes.
+
+    :param list files: the XML files to validate.
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :param Path output_dir: the folder that the user reports are written to. It is created if needed.
+    :param int workers: number of worker processes. Defaults to the number of CPUs.
+    :param function on_result: called with each result, the number of files done and the number of
+        files in the batch, as soon as a file is done. Used to report progress.
+    :returns: the result of each file, in the order of files.
+    :rtype: list
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    reports = report_paths(files, output_dir)
+
+    results: dict[Path, FileResult] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(validate_batch_file, file, ruleset, report): file
+            for file, report in zip(files, reports)
+        }
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # e.g. the worker process died. Errors raised by the validation are caught in the worker.
+                result = FileResult(
+                    file=str(file),
+                    status="failed",
+                    seconds=0.0,
+                    error=f"{type(e).__name__}, {e}",
+                )
+            results[file] = result
+            if on_result is not None:
+                on_result(result, len(results), len(files))
+
+    return [results[file] for file in files]
+
+
+def write_summary(results: list[FileResult], output_dir: Path):
+    """
+    Writes the outcome of a batch:
+    files.csv has the status, timing, issue count, reports and error of each file.
+    summary.csv has the number of issues of each file (rows) for each rule (columns). The counts of failed
+    files are left empty.
+
+    :param list results: the results of validate_batch.
+    :param Path output_dir: the folder that the tables are written to.
+    :returns: the two tables.
+    :rtype: tuple of DataFrames
+    """
+    import pandas as pd
+
+    files = pd.DataFrame(
+        [
+            {
+                "file": result.file,
+                "status": result.status,
+                "seconds": round(result.seconds, 3),
+                "issues": result.issues,
+                "report": result.report,
+                "multichild_report": result.multichild_report,
+                "error": result.error,
+            }
+            for result in results
+        ]
+    )
+    summary = pd.DataFrame(
+        {
+            result.file: result.issue_counts
+            for result in results
+            if result.status == "validated"
+        },
+        dtype="Int64",
+    ).T.fillna(0)
+    # failed files have no counts, rather than counts of 0.
+    summary = summary.reindex(
+        index=[result.file for result in results],
+        columns=sorted(summary.columns, key=str),
+    )
+    summary.index.name = "file"
+
+    files.to_csv(output_dir / "files.csv", index=False)
+    summary.to_csv(output_dir / "summary.csv")
+    return files, summary
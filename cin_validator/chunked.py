@@ -0,0 +1,414 @@
+import dataclasses
+import warnings
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+
+from cin_validator.cin_validator import (
+    CinValidator,
+    convert_data,
+    enum_keys,
+    process_data,
+)
+from cin_validator.planner import table_pattern
+from cin_validator.rule_engine import CINTable, RuleDefinition
+from cin_validator.rule_patterns import ReturnCounts, ValueUnique
+from cin_validator.spill import rule_columns, source_names
+from cin_validator.utils import SURROGATE_KEYS, add_surrogate_keys, id_values
+
+# Validation of large returns in batches of children, so that memory does not grow with the size of the file.
+# Children are read from the XML one batch at a time. Each batch is converted and validated like a whole
+# file would be, and its issues are handed over before the next batch is read.
+# Rules that compare children with each other, or that describe the whole return, cannot run per batch.
+# What they need is kept from each batch instead: the header, the rows that share a value which must be
+# unique, and the counts of ReturnCounts rules. They run once on those at the end.
+
+BATCH_SIZE = 1_000
+# rules that require the values of a column to be unique across children, beyond the ValueUnique specs.
+# Unlike ValueUnique, they ignore rows without a value.
+CROSS_CHILD_RULES = {"1520": "UPN"}
+
+
+def unique_column(rule: RuleDefinition) -> Optional[tuple[str, str, bool]]:
+    """
+    :param RuleDefinition rule: any rule.
+    :returns: the table and column whose values the rule requires to be unique across children, and whether
+        missing values are equal to each other. None for other rules.
+    :rtype: tuple
+    """
+    if rule.code in CROSS_CHILD_RULES:
+        return rule.module.name, CROSS_CHILD_RULES[rule.code], False
+    spec = table_pattern(rule)
+    if isinstance(spec, ValueUnique):
+        return spec.table.name, spec.column, True
+    return None
+
+
+def is_whole_return_rule(rule: RuleDefinition) -> bool:
+    """
+    :param RuleDefinition rule: any rule.
+    :returns: whether the rule needs every child of the return at once. That is, it checks the header,
+        pushes la-level issues or requires a value to be unique across children, see unique_column.
+    :rtype: bool
+    """
+    if rule.module is CINTable.Header or unique_column(rule) is not None:
+        return True
+    spec = getattr(rule.func, "__pattern__", None)
+    if spec is not None:
+        # the source of rule_patterns.py names push_la_level for every spec.
+        return isinstance(spec, ReturnCounts)
+    return "push_la_level" in (source_names(rule) or ())
+
+
+def iter_batches(source, batch_size: int = BATCH_SIZE) -> Iterator[ET.Element]:
+    """
+    Reads a CIN XML file one batch of children at a time. Children that have been yielded are
+    removed from the tree so that the memory they used can be released.
+
+    :param source: path or open file of the XML.
+    :param int batch_size: number of children per batch.
+    :returns: for each batch, a root that holds the header and the children of the batch, as XMLtoCSV expects.
+    :rtype: generator
+    """
+    header = None
+    children = None
+    batch: list[ET.Element] = []
+    batches = 0
+
+    def batch_root() -> ET.Element:
+        root = ET.Element("Message")
+        root.append(header)
+        ET.SubElement(root, "Children").extend(batch)
+        return root
+
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if element.tag == "Children":
+                children = element
+            continue
+        if element.tag == "Header":
+            header = element
+        elif element.tag == "Child" and children is not None:
+            batch.append(element)
+            if len(batch) == batch_size:
+                yield batch_root()
+                batches += 1
+                batch = []
+                children.clear()
+    # a return without children is still checked, e.g. by the rules on its header.
+    if batch or not batches:
+        yield batch_root()
+
+
+@dataclass
+class ChunkedResult:
+    """
+    What is kept of a validation in batches. The issues of each batch are passed to on_issues instead.
+
+    :param int children: number of children validated.
+    :param int batches: number of batches.
+    :param dict issues: number of issue locations found, per rule code.
+    :param DataFrame multichild_issues: issues of the whole return, as in CinValidator.multichild_issues.
+    :param set split_children: LAchildIDs that appear in more than one batch.
+    """
+
+    children: int = 0
+    batches: int = 0
+    issues: dict = field(default_factory=dict)
+    multichild_issues: pd.DataFrame = field(default_factory=pd.DataFrame)
+    split_children: set = field(default_factory=set)
+
+
+class DuplicateValues:
+    """
+    Finds the rows of a table that share their value in a column with another row of the return, one batch
+    at a time. The first row of each value is kept in case another row with that value comes later, so
+    memory grows with the number of different values rather than with the return.
+
+    :param str column: the column whose values must be unique.
+    :param bool match_missing: whether missing values are equal to each other, as in DataFrame.duplicated.
+        Otherwise rows without a value are left out.
+    """
+
+    def __init__(self, column: str, match_missing: bool):
+        self.column = column
+        self.match_missing = match_missing
+        self.seen: set = set()
+        self.first: list[pd.DataFrame] = []
+        self.repeated: list[pd.DataFrame] = []
+
+    def values(self, df: pd.DataFrame) -> pd.Series:
+        if self.match_missing:
+            return id_values(df[self.column])
+        return df[self.column]
+
+    def add(self, df: pd.DataFrame):
+        """
+        :param DataFrame df: the rows of a batch, indexed by their position in the return.
+        """
+        if not self.match_missing:
+            df = df[df[self.column].notna()]
+        values = self.values(df)
+        repeated = values.duplicated() | values.isin(self.seen)
+        self.seen.update(values[~repeated])
+        self.first.append(df[~repeated])
+        self.repeated.append(df[repeated])
+
+    def rows(self) -> pd.DataFrame:
+        """
+        :returns: the rows whose value is shared with another row, indexed by their position in the return.
+        :rtype: DataFrame
+        """
+        first = pd.concat(self.first)
+        repeated = pd.concat(self.repeated)
+        shared = first[self.values(first).isin(self.values(repeated))]
+        return pd.concat([shared, repeated])
+
+
+class WholeReturnData:
+    """
+    Keeps what whole-return rules need from every batch, so that they can run once at the end: the header,
+    the rows that DuplicateValues finds for rules that require unique values, and the counts of ReturnCounts
+    rules, summed over the batches.
+
+    :param list rules: the whole-return rules.
+    :raises ValueError: if a rule pushes la-level issues without ReturnCounts, as its result for the whole
+        return cannot be put together from batches.
+    """
+
+    def __init__(self, rules: list[RuleDefinition]):
+        self.rules = rules
+        self.duplicates: dict[str, list[DuplicateValues]] = {}
+        self.counted: dict[str, ReturnCounts] = {}
+        for rule in rules:
+            unique = unique_column(rule)
+            spec = getattr(rule.func, "__pattern__", None)
+            if unique is not None:
+                table, column, match_missing = unique
+                self.duplicates.setdefault(table, []).append(
+                    DuplicateValues(column, match_missing)
+                )
+            elif isinstance(spec, ReturnCounts):
+                self.counted[rule.code] = spec
+            elif rule.module is not CINTable.Header:
+                raise ValueError(
+                    f"Rule {rule.code} cannot be validated in batches. "
+                    "Rules evaluated at LA level should be written with ReturnCounts."
+                )
+        self.counts: dict[str, Counter] = {code: Counter() for code in self.counted}
+        # counting stops for a rule that raises an exception. It is raised again when the rule runs.
+        self.errors: dict[str, Exception] = {}
+        self.header: Optional[pd.DataFrame] = None
+        self.columns: Optional[dict[str, list[str]]] = None
+
+    def add(self, data: dict, offsets: dict[str, int]):
+        """
+        :param dict data: the processed tables of a batch, keyed by table name.
+        :param dict offsets: number of rows of each table in the batches before this one, keyed by table name.
+        """
+        if self.columns is None:
+            self.columns = self.select_columns(data)
+        if self.header is None:
+            # every batch has the same header.
+            self.header = data["Header"]
+        for name, aggregates in self.duplicates.items():
+            df = data[name][self.columns[name]]
+            df = df.set_axis(df.index + offsets.get(name, 0))
+            for aggregate in aggregates:
+                aggregate.add(df)
+        data_container = enum_keys(data)
+        for code, spec in self.counted.items():
+            if code in self.errors:
+                continue
+            try:
+                self.counts[code].update(spec.count(data_container))
+            except Exception as e:
+                self.errors[code] = e
+
+    def select_columns(self, data: dict) -> dict[str, list[str]]:
+        all_columns = {name: list(df.columns) for name, df in data.items()}
+        selected: dict[str, set] = {name: set() for name in all_columns}
+        for rule in self.rules:
+            unique = unique_column(rule)
+            if unique is None:
+                continue
+            table = unique[0]
+            rule_selection = rule_columns(rule, all_columns)
+            if rule_selection is None:
+                selected[table] |= set(all_columns[table])
+            else:
+                selected[table] |= rule_selection[table]
+        # surrogate keys are numbered per batch, so they are added again to the whole return.
+        surrogate_keys = set(SURROGATE_KEYS.values())
+        return {
+            name: [
+                column
+                for column in all_columns[name]
+                if column in selected[name] and column not in surrogate_keys
+            ]
+            for name in all_columns
+        }
+
+    def tables(self) -> tuple[dict, dict]:
+        """
+        :returns: the kept rows of the whole return, keyed by table name, and the position in the return of
+            each of their rows. Tables that no rule needs are empty.
+        :rtype: tuple
+        """
+        tables = {}
+        positions = {}
+        for name, columns in self.columns.items():
+            if name == "Header":
+                df = self.header
+            elif name in self.duplicates:
+                df = pd.concat(
+                    [aggregate.rows() for aggregate in self.duplicates[name]]
+                )
+                # a row can share values of several columns.
+                df = df[~df.index.duplicated()].sort_index()
+            else:
+                df = pd.DataFrame(columns=columns)
+            positions[name] = df.index
+            tables[name] = df.reset_index(drop=True)
+        return add_surrogate_keys(tables), positions
+
+    def registry(self) -> dict[str, RuleDefinition]:
+        """
+        :returns: the whole-return rules keyed by code. ReturnCounts rules are replaced by rules that check the
+            counts of the whole return.
+        :rtype: dict
+        """
+        registry = {}
+        for rule in self.rules:
+            if rule.code in self.counted:
+                rule = dataclasses.replace(rule, func=self.counted_rule(rule.code))
+            registry[rule.code] = rule
+        return registry
+
+    def counted_rule(self, code: str) -> Callable:
+        counts, error = self.counts[code], self.errors.get(code)
+
+        def count(data_container):
+            if error is not None:
+                raise error
+            return counts
+
+        return ReturnCounts(count, self.counted[code].flagged).compile()
+
+
+def offset_rows(user_report: pd.DataFrame, offsets: dict[str, int]) -> pd.DataFrame:
+    """
+    :param DataFrame user_report: the user report of a batch.
+    :param dict offsets: number of rows of each table in the batches before this one, keyed by table name.
+    :returns: the report, with row numbers counted from the start of the return.
+    :rtype: DataFrame
+    """
+    located = user_report["tables_affected"].isin(list(offsets))
+    rows = user_report.loc[located, "ROW_ID"].astype("int64")
+    shifted = rows + user_report.loc[located, "tables_affected"].map(offsets)
+    user_report.loc[located, "ROW_ID"] = shifted.astype(str)
+    return user_report
+
+
+def restore_rows(user_report: pd.DataFrame, positions: dict) -> pd.DataFrame:
+    """
+    :param DataFrame user_report: the user report of the rows kept by WholeReturnData.
+    :param dict positions: the position in the return of each kept row, keyed by table name.
+    :returns: the report, with row numbers counted from the start of the return.
+    :rtype: DataFrame
+    """
+    for name, rows in positions.items():
+        located = user_report["tables_affected"] == name
+        if located.any():
+            kept_rows = user_report.loc[located, "ROW_ID"].astype("int64")
+            user_report.loc[located, "ROW_ID"] = rows[kept_rows].astype(str)
+    return user_report
+
+
+def validate_in_batches(
+    source,
+    ruleset: str,
+    ruleset_registry,
+    selected_rules: Optional[list[str]] = None,
+    batch_size: int = BATCH_SIZE,
+    on_issues: Optional[Callable[[pd.DataFrame], None]] = None,
+) -> ChunkedResult:
+    """
+    Validates a CIN XML file in batches of children. Each batch's issues are passed to on_issues before the
+    next batch is read, and the issues of whole-return rules are passed last.
+
+    Issues are the same as those of validate_xml, with row numbers counted from the start of the return, as
+    long as the records of a child are not split between batches. Rules that compare the records of a child
+    only see those in the same batch, so a warning is raised when an LAchildID appears in more than one batch.
+    Whole-return rules, such as 8510, still compare every child.
+
+    :param source: path or open file of the XML to validate.
+    :param str ruleset: name of the rule folder, e.g. cin2024_25.
+    :param dict ruleset_registry: the rules of the ruleset, keyed by rule code.
+    :param list selected_rules: rule codes that should be run. All rules run if None.
+    :param int batch_size: number of children per batch.
+    :param function on_issues: called with the user report of each batch, sorted as in CinValidator.user_report.
+    :returns: a summary of the validation.
+    :rtype: ChunkedResult
+    :raises ValueError: if a selected rule cannot be validated in batches, see WholeReturnData.
+    """
+    codes = [
+        code
+        for code in ruleset_registry
+        if not selected_rules or code in selected_rules
+    ]
+    whole_return = [
+        code for code in codes if is_whole_return_rule(ruleset_registry[code])
+    ]
+    per_batch = [code for code in codes if code not in whole_return]
+    kept = WholeReturnData([ruleset_registry[code] for code in whole_return])
+
+    result = ChunkedResult()
+    offsets: dict[str, int] = {}
+    children: set = set()
+
+    def report(validator: CinValidator):
+        user_report = validator.user_report
+        if user_report.empty:
+            return
+        for code, count in user_report["rule_code"].value_counts().items():
+            result.issues[code] = result.issues.get(code, 0) + count
+        if on_issues is not None:
+            on_issues(user_report)
+
+    for root in iter_batches(source, batch_size):
+        data = process_data(convert_data(root), ruleset)
+        result.batches += 1
+        result.children += len(data["ChildIdentifiers"])
+        batch_children = set(data["ChildIdentifiers"]["LAchildID"].dropna())
+        result.split_children |= batch_children & children
+        children |= batch_children
+        if whole_return:
+            kept.add(data, offsets)
+        if per_batch:
+            validator = CinValidator(
+                data, ruleset_registry, selected_rules=per_batch, ruleset=ruleset
+            )
+            offset_rows(validator.user_report, offsets)
+            report(validator)
+        for name, df in data.items():
+            offsets[name] = offsets.get(name, 0) + len(df)
+        del root, data
+
+    if result.split_children:
+        warnings.warn(
+            f"{len(result.split_children)} LAchildIDs appear in more than one batch, "
+            f"e.g. {sorted(result.split_children)[0]}. Rules that compare the records of a child "
+            "may miss issues between batches. Use a larger batch size or validate the whole file."
+        )
+
+    if whole_return and result.batches:
+        tables, positions = kept.tables()
+        validator = CinValidator(tables, kept.registry(), ruleset=ruleset)
+        restore_rows(validator.user_report, positions)
+        report(validator)
+        result.multichild_issues = validator.multichild_issues
+    return result
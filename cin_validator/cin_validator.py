@@ -1,12 +1,34 @@
 import copy
+import gc
+import time
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Callable, Mapping, Optional
 
 import pandas as pd
 
+from cin_validator.code_lists import apply_code_lists, get_code_lists
+from cin_validator.hooks import HookList, ValidationHooks
 from cin_validator.ingress import XMLtoCSV
+from cin_validator.planner import plan_rules, run_table_scan
+from cin_validator.report_writers import ReportWriter
+from cin_validator.rule_costs import RuleCosts
 from cin_validator.rule_engine import CINTable, RuleContext, RuleDefinition
-from cin_validator.utils import process_date_columns
+from cin_validator.spill import SpilledTables, SpilledView, needs_spill, rule_columns
+from cin_validator.upn import add_upn_checks
+from cin_validator.utils import add_surrogate_keys, process_date_columns
+
+# columns of the report of all issue locations, before it is regularised.
+ISSUE_COLUMNS = [
+    "tables_affected",
+    "columns_affected",
+    "ROW_ID",
+    "ERROR_ID",
+    "rule_code",
+    "rule_description",
+    "rule_type",
+    "la_level",
+    "LAchildID",
+]
 
 pd.options.mode.chained_assignment = None
 # Suppresses false-positive SettingWithCopyError when column types are changes in the include_issue_child function.
@@ -58,10 +80,16 @@ def convert_data(root: ET.Element):
     return cin_tables
 
 
-def process_data(cin_tables: dict):
+def process_data(cin_tables: dict, ruleset: Optional[str] = None):
     """
-    formats date columns
+    formats date columns, stores coded columns as categoricals, adds integer keys for the ID columns
+    and parses UPN columns once for the UPN rules.
+    The added columns, child_code, episode_key and plan_key (see utils.SURROGATE_KEYS) and <column>_<check>
+    for UPN and FormerUPN (see upn.CHECK_COLUMNS), are part of the schema of processed tables that rules read.
+    They are never output: reports only read the columns that issues affect, and the tables sent back to
+    users and written by xmltocsv are converted before this.
     :param dict cin_tables: data to be converted
+    :param str ruleset: name of the ruleset whose code lists apply, e.g. cin2024_25. Defaults to the latest.
     :return dict cin_tables_dict: original dataframes where date columns have been formatted.
     """
 
@@ -70,9 +98,31 @@ def process_data(cin_tables: dict):
         name: process_date_columns(table) for name, table in cin_tables.items()
     }
 
+    # "value must be one of" checks can then compare integer category codes.
+    cin_tables_dict = apply_code_lists(cin_tables_dict, get_code_lists(ruleset))
+
+    # merges and groupbys in rules can then use int64 keys instead of string IDs.
+    cin_tables_dict = add_surrogate_keys(cin_tables_dict)
+
+    # UPN rules then read the checks of UPN and FormerUPN instead of parsing them once per rule.
+    cin_tables_dict = add_upn_checks(cin_tables_dict)
+
     return cin_tables_dict
 
 
+def read_columns(cin_data: Mapping, table: str, columns) -> pd.DataFrame:
+    """
+    :param dict cin_data: dataframes of user's input data, keyed by table name, or SpilledTables.
+    :param str table: name of the table.
+    :param list columns: the columns that are needed.
+    :returns: the table. Spilled tables are only read for the columns that are needed.
+    :rtype: DataFrame
+    """
+    if isinstance(cin_data, SpilledTables):
+        return cin_data.load(table, set(columns))
+    return cin_data[table]
+
+
 def include_issue_child(issue_df: pd.DataFrame, cin_data: dict):
     """
     :param DataFrame issue_df: complete data about all issue locations.
@@ -97,12 +147,15 @@ def include_issue_child(issue_df: pd.DataFrame, cin_data: dict):
         # some ROW_ID values exist as ints and others as strs. Unify so that .unique() doesn't contain doubles.
         table_rows = table_df["ROW_ID"].astype("int").unique()
 
-        # naming the index of the data allows it to be mapped back to the issue_df
-        table_data = cin_data[table]
-        table_data.index.name = "ROW_ID"
-        table_data.reset_index(inplace=True)
-        # select the data for the rows with appear in issue_df and get the child ids
-        linker_df = table_data.iloc[table_rows][["LAchildID", "ROW_ID"]]
+        # select the data for the rows with appear in issue_df and get the child ids.
+        # the data is not changed, so that the child ids of each rule can be found as it finishes.
+        child_ids = read_columns(cin_data, table, ["LAchildID"])["LAchildID"]
+        linker_df = pd.DataFrame(
+            {
+                "LAchildID": child_ids.iloc[table_rows].to_numpy(),
+                "ROW_ID": child_ids.index[table_rows],
+            }
+        )
 
         # work around: ensure that columns from both sources have the same type to prevent merge error
         table_df["ROW_ID"] = table_df["ROW_ID"].astype("int64")
@@ -141,21 +194,41 @@ def create_user_report(issue_df: pd.DataFrame, cin_data: dict):
         # in the case where issue_df is empty, return an empty user report.
         return pd.DataFrame()
 
+    def datetime_to_str(element):
+        if isinstance(element, pd.Timestamp):
+            # convert datetime elements to str date values
+            return str(element.strftime("%Y-%m-%d"))
+        elif isinstance(element, tuple):
+            # loop through tuples and convert each element accordingly. mostly in ERROR_ID column.
+            return tuple(map(datetime_to_str, element))
+        else:
+            # ensure all other elements are strings too.
+            return str(element)
+
     reports = []
     for table in issue_df["tables_affected"].dropna().unique():
         table_issues = issue_df[issue_df["tables_affected"] == table]
+        # spilled tables are read once per table, and only for the columns with issues.
+        table_data = read_columns(
+            cin_data, table, table_issues["columns_affected"].unique()
+        )
 
         table_reports = []
         for column in table_issues["columns_affected"].unique():
             only_column = table_issues[table_issues["columns_affected"] == column]
             column_rows = only_column["ROW_ID"].unique().astype("int")
 
-            column_data = cin_data[table][column]
+            column_data = table_data[column]
             # fancy indexing. get all the values for a sequence of row positions in a column.
             column_values = column_data[column_rows]
             column_values.rename("value_flagged", inplace=True)
             column_values.index.name = "ROW_ID"
             values_df = column_values.reset_index()
+            # values become text before the reports of all columns are combined. Otherwise a column whose
+            # values are all missing shows them as NaT or nan depending on which other columns have issues.
+            values_df["value_flagged"] = (
+                values_df["value_flagged"].astype("object").map(datetime_to_str)
+            )
             values_df = values_df.assign(ROW_ID=values_df["ROW_ID"].astype("object"))
 
             # work around: ensure that columns from both sources (user data and rule output) have the same type to prevent merge error
@@ -200,17 +273,6 @@ def create_user_report(issue_df: pd.DataFrame, cin_data: dict):
         ]
     ]
 
-    def datetime_to_str(element):
-        if isinstance(element, pd.Timestamp):
-            # convert datetime elements to str date values
-            return str(element.strftime("%Y-%m-%d"))
-        elif isinstance(element, tuple):
-            # loop through tuples and convert each element accordingly. mostly in ERROR_ID column.
-            return tuple(map(datetime_to_str, element))
-        else:
-            # ensure all other elements are strings too.
-            return str(element)
-
     user_report = user_report.applymap(datetime_to_str)
 
     # Related issue locations should be displayed next to each other.
@@ -225,19 +287,81 @@ def create_user_report(issue_df: pd.DataFrame, cin_data: dict):
         ignore_index=True,
     )
 
+    # rows of different tables can share a number, so the table is part of each location.
     user_report.drop_duplicates(
-        ["LAchildID", "rule_code", "columns_affected", "ROW_ID"], inplace=True
+        ["LAchildID", "rule_code", "tables_affected", "columns_affected", "ROW_ID"],
+        inplace=True,
     )
 
     return user_report
 
 
+def rule_user_report(issues: pd.DataFrame, cin_data: Mapping) -> pd.DataFrame:
+    """
+    :param DataFrame issues: the issues of one rule, see found_issues.
+    :param dict cin_data: dataframes of user's input data, or SpilledTables. They are not modified.
+    :returns: the rows of the user report for those issues, as create_user_report makes them from all issues.
+    :rtype: DataFrame
+    """
+    # the issues get every column of the full issue report, as in process_issues.
+    issues = pd.concat([pd.DataFrame(columns=ISSUE_COLUMNS), issues], ignore_index=True)
+    return create_user_report(include_issue_child(issues, cin_data), cin_data)
+
+
+def rule_issue_dfs(ctx: RuleContext) -> pd.Series:
+    """
+    :param RuleContext ctx: the context of a rule that has been run.
+    :returns: the type 0, 1, 2 and 3 and la-level issues that the rule pushed, in that order.
+    :rtype: Series
+    """
+    return pd.Series(
+        [
+            ctx.type_zero_issues,
+            ctx.type_one_issues,
+            ctx.type_two_issues,
+            ctx.type_three_issues,
+            ctx.la_level_issues,
+        ]
+    )
+
+
+def issue_count(issue_dfs_per_rule: pd.Series) -> int:
+    """
+    :param Series issue_dfs_per_rule: the issues that a rule pushed, from rule_issue_dfs.
+    :returns: the number of issues that the rule found.
+    :rtype: int
+    """
+    return max(len(issues) for issues in issue_dfs_per_rule)
+
+
+def found_issues(rule: RuleDefinition, issue_dfs_per_rule: pd.Series) -> pd.DataFrame:
+    """
+    :param RuleDefinition rule: a rule that has been run.
+    :param Series issue_dfs_per_rule: the issues it pushed, from rule_issue_dfs.
+    :returns: the issues as they are added to the report, empty if the rule passed.
+    :rtype: DataFrame
+    """
+    # error_df_lengths is a list of lengths of all elements in issue_dfs_per_rule respectively.
+    error_df_lengths = pd.Series([len(x) for x in issue_dfs_per_rule])
+    if error_df_lengths.max() == 0:
+        return pd.DataFrame()
+    ind = error_df_lengths.idxmax()
+    if ind == 4:
+        # la-level issues already contain the rule code and description.
+        return issue_dfs_per_rule[4]
+    # add the rule's code and description to it's error_df
+    # temporary: add rule type to track if all types are in df.
+    return issue_dfs_per_rule[ind].assign(
+        rule_code=rule.code, rule_description=rule.message, rule_type=ind
+    )
+
+
 class CinValidator:
     """
     A class to contain the process of CIN validation. Generates error reports as dataframes.
 
-    :param any data_files: Data files for validation, either a DataContainerWrapper object, or a
-        dictionary of DataFrames.
+    :param any data_files: Data files for validation, either a DataContainerWrapper object, a
+        dictionary of DataFrames, or SpilledTables.
     :param dir ruleset: The directory containing the validation rules to be run according to the year in which they were published.
     """
 
@@ -246,6 +370,13 @@ class CinValidator:
         data_files,
         ruleset_registry,
         selected_rules: Optional[list[str]] = None,
+        on_rule_done: Optional[
+            Callable[[RuleDefinition, pd.DataFrame, int, int], None]
+        ] = None,
+        rule_costs: Optional[RuleCosts] = None,
+        hooks: Optional[list[ValidationHooks]] = None,
+        report_writer: Optional[ReportWriter] = None,
+        ruleset: Optional[str] = None,
     ) -> None:
         """
         Initialises CinValidator class.
@@ -257,31 +388,55 @@ class CinValidator:
         :param any data_files: The data extracted from input XML (or CSV) for validation.
         :param str issue_id: Can be used to choose a particular instance of an error using ERROR_ID.
         :param list selected_rules: array of rule codes (as strings) selected by the user. Determines what rules should be run.
+        :param function on_rule_done: called after each rule with the rule, the issues it found (see process_issues),
+            the number of rules run so far and the number of rules to run. Used to report progress. Validation stops
+            if it raises an exception.
+        :param RuleCosts rule_costs: run time history of the rules. If given, rules run from cheapest to most
+            expensive and their run times are recorded in it. The reports are the same in any order.
+        :param list hooks: ValidationHooks called before and after each rule and reporting stage, and when a rule
+            raises an exception.
+        :param ReportWriter report_writer: if given, the user report rows of each rule are written to it as soon
+            as the rule has run, in the order that rules run. user_report is then None, as the report is not
+            assembled in memory.
+        :param str ruleset: name of the rule folder, e.g. cin2024_25, whose code lists the rules check against.
+            Taken from ruleset_registry if None.
         :returns: DataFrame of error report which could be a filtered version if issue_id is input.
         :rtype: DataFrame
         """
 
         self.data_files = data_files
         self.ruleset_registry = ruleset_registry
+        self.on_rule_done = on_rule_done
+        self.rule_costs = rule_costs
+        self.hooks = HookList(hooks or [])
+        self.report_writer = report_writer
+        self.ruleset = ruleset or getattr(ruleset_registry, "ruleset", None)
 
         # save independent version of data to be used in report.
-        raw_data = copy.deepcopy(self.data_files)
+        raw_data = self.raw_data = copy.deepcopy(self.data_files)
 
         # run
         self.create_issue_report_df(selected_rules)
 
         # add child_id to issue location report.
-        self.full_issue_df: pd.DataFrame = include_issue_child(
-            self.full_issue_df, raw_data
+        self.full_issue_df: pd.DataFrame = self.run_stage(
+            "include_issue_child", include_issue_child, self.full_issue_df, raw_data
         )
-        self.user_report = create_user_report(self.full_issue_df, raw_data)
+        if report_writer is None:
+            self.user_report = self.run_stage(
+                "create_user_report", create_user_report, self.full_issue_df, raw_data
+            )
+        else:
+            # the rows of every rule have already been written.
+            self.user_report = None
 
         # regularise full_issue_df
         self.full_issue_df.rename(columns={"ROW_ID": "row_id"}, inplace=True)
         self.full_issue_df.rename(columns={"LAchildID": "child_id"}, inplace=True)
         self.full_issue_df.drop(columns=["ERROR_ID"], inplace=True, errors="ignore")
         self.full_issue_df.drop_duplicates(
-            ["child_id", "rule_code", "columns_affected", "row_id"], inplace=True
+            ["child_id", "rule_code", "tables_affected", "columns_affected", "row_id"],
+            inplace=True,
         )
         self.full_issue_df.reset_index(drop=True, inplace=True)
 
@@ -297,6 +452,121 @@ class CinValidator:
             ["rule_code", "rule_description"]
         ]
 
+    def run_stage(self, stage: str, func: Callable, *args):
+        """
+        Runs a reporting stage between the before_stage and after_stage hooks.
+
+        :param str stage: name of the stage.
+        :param function func: the stage. It returns a DataFrame of issues.
+        :param args: passed to func.
+        :returns: what func returns.
+        :rtype: DataFrame
+        """
+        self.hooks.before_stage(stage)
+        start = time.perf_counter()
+        issues = func(*args)
+        self.hooks.after_stage(stage, time.perf_counter() - start, len(issues))
+        return issues
+
+    def run_rule(self, rule: RuleDefinition, data_container: dict) -> pd.Series:
+        """
+        Runs one rule on its own copy of the data.
+
+        :param RuleDefinition rule: the rule to run.
+        :param dict data_container: the CIN tables keyed by CINTable. They are not modified.
+        :returns: the issues that the rule pushed, see rule_issue_dfs.
+        :rtype: Series
+        """
+        data_files = self.rule_data(rule, data_container)
+        ctx = RuleContext(rule, self.ruleset)
+        self.hooks.before_rule(rule)
+        start = time.perf_counter()
+        try:
+            try:
+                rule.func(data_files, ctx)
+            except Exception:
+                if not isinstance(data_files, SpilledView):
+                    raise
+                # the rule may read a column that its source does not name. Run it again on whole tables.
+                # Rules that do so without raising are listed in spill.WHOLE_TABLE_RULES instead.
+                ctx = RuleContext(rule, self.ruleset)
+                rule.func(copy.deepcopy(data_container), ctx)
+        except Exception as e:
+            self.rule_failed(rule, time.perf_counter() - start, e)
+        elapsed = time.perf_counter() - start
+        if self.rule_costs is not None:
+            self.rule_costs.record(rule.code, elapsed)
+        issue_dfs_per_rule = rule_issue_dfs(ctx)
+        self.hooks.after_rule(rule, elapsed, issue_count(issue_dfs_per_rule))
+        return issue_dfs_per_rule
+
+    def rule_failed(self, rule: RuleDefinition, elapsed: float, error: Exception):
+        """
+        Reports a rule that raised an exception, whether it ran on its own or in a table scan.
+        The validation carries on without the issues that the rule did not push.
+
+        :param RuleDefinition rule: the rule that failed.
+        :param float elapsed: seconds until it failed.
+        :param Exception error: what it raised.
+        """
+        self.hooks.on_error(rule, elapsed, error)
+        print(f"Error with rule {rule.code}: {type(error).__name__}, {error}")
+
+    def rule_data(self, rule: RuleDefinition, data_container: Mapping) -> Mapping:
+        """
+        :param RuleDefinition rule: the rule that is about to run.
+        :param dict data_container: the CIN tables keyed by CINTable.
+        :returns: a copy of the data that the rule can modify. Spilled tables are read from disk when the rule
+            asks for them, with only the columns that the rule names.
+        :rtype: dict
+        """
+        if isinstance(data_container, SpilledView):
+            store = data_container.store
+            return store.view(rule_columns(rule, store.columns))
+        return copy.deepcopy(data_container)
+
+    def run_scan(
+        self, table: CINTable, rules: list[RuleDefinition], data_container: dict
+    ) -> dict[str, pd.Series]:
+        """
+        Runs the rules that check the rows of one table in a single scan of it. See run_table_scan.
+
+        :param CINTable table: the table shared by the rules.
+        :param list rules: the rules to run.
+        :param dict data_container: the CIN tables keyed by CINTable. They are not modified.
+        :returns: the issues of each rule, keyed by rule code.
+        :rtype: dict
+        """
+        stage = f"scan {table.name}"
+        self.hooks.before_stage(stage)
+        for rule in rules:
+            self.hooks.before_rule(rule)
+        start = time.perf_counter()
+        contexts = run_table_scan(
+            table,
+            rules,
+            data_container,
+            ruleset=self.ruleset,
+            on_error=lambda rule, e: self.rule_failed(
+                rule, time.perf_counter() - start, e
+            ),
+        )
+        elapsed = time.perf_counter() - start
+
+        # the rules of a scan share its cost.
+        rule_seconds = elapsed / len(rules)
+        issue_dfs = {}
+        issues = 0
+        for rule in rules:
+            if self.rule_costs is not None:
+                self.rule_costs.record(rule.code, rule_seconds)
+            issue_dfs[rule.code] = rule_issue_dfs(contexts[rule.code])
+            rule_issues = issue_count(issue_dfs[rule.code])
+            issues += rule_issues
+            self.hooks.after_rule(rule, rule_seconds, rule_issues)
+        self.hooks.after_stage(stage, elapsed, issues)
+        return issue_dfs
+
     def get_rules_to_run(
         self, registry, selected_rules: Optional[list[str]] = None
     ) -> list[RuleDefinition]:
@@ -306,40 +576,43 @@ class CinValidator:
         :param list selected_rules: array of rule codes as strings
         """
         if selected_rules:
+            # select by key so that lazily loaded registries only import the selected rules.
             rules_to_run = [
-                rule for _, rule in registry.items() if str(rule.code) in selected_rules
+                registry[code] for code in registry if code in selected_rules
             ]
             return rules_to_run
         else:
             return registry.values()
 
-    def process_issues(self, rule: RuleDefinition, ctx: RuleContext):
+    def process_issues(
+        self,
+        rule: RuleDefinition,
+        ctx: Optional[RuleContext] = None,
+        issue_dfs_per_rule: Optional[pd.Series] = None,
+    ):
         """
         process result of running a rule on the user's data.
 
         :param RuleDefinition-class rule: the rule that was run on the data
         :param RuleContext-object ctx: "manages state" per rule. contains updated issue_dfs if any were added when rule was run on the data.
-        :returns : None
+        :param Series issue_dfs_per_rule: the issues of the rule, if rule_issue_dfs has already been called for ctx.
+        :returns: the issues that the rule found, empty if it passed.
+        :rtype: DataFrame
 
         """
-        issue_dfs_per_rule = pd.Series(
-            [
-                ctx.type_zero_issues,
-                ctx.type_one_issues,
-                ctx.type_two_issues,
-                ctx.type_three_issues,
-                ctx.la_level_issues,
-            ]
-        )
+        if issue_dfs_per_rule is None:
+            issue_dfs_per_rule = rule_issue_dfs(ctx)
         # error_df_lengths is a list of lengths of all elements in issue_dfs_per_rule respectively.
         error_df_lengths = pd.Series([len(x) for x in issue_dfs_per_rule])
         if error_df_lengths.max() == 0:
             # if the rule didn't push to any of the issue accumulators, then it didn't find any issues in the file.
             self.rules_passed.append(rule.code)
+            return pd.DataFrame()
         elif error_df_lengths.idxmax() == 4:
             # If the maximum value is in position 4, this is a return level validation rule.
             # It has no locations attached so it is only displayed in the rule descriptions.
             self.la_rules_broken.append(issue_dfs_per_rule[4])
+            return issue_dfs_per_rule[4]
         else:
             # get the rule type based on which attribute had elements pushed to it (i.e non-zero length)
             # its corresponding error_df can be found by issue_dfs_per_rule[ind]
@@ -355,22 +628,32 @@ class CinValidator:
                 [self.issue_instances, issue_dict_df], ignore_index=True
             )
 
-            # add the rule's code and description to it's error_df
-            issue_dfs_per_rule[ind]["rule_code"] = rule.code
-            issue_dfs_per_rule[ind]["rule_description"] = rule.message
-
-            # temporary: add rule type to track if all types are in df.
-            issue_dfs_per_rule[ind]["rule_type"] = ind
+            rule_issues = found_issues(rule, issue_dfs_per_rule)
 
             # combine this rule's error_df with the cummulative error_df
             self.full_issue_df = pd.concat(
-                [self.full_issue_df, issue_dfs_per_rule[ind]],
+                [self.full_issue_df, rule_issues],
                 ignore_index=True,
             )
 
             # Elements of the rule_descriptors df to explain error codes
             self.rules_broken.append(rule.code)
             self.rule_messages.append(f"{str(rule.code)} - {rule.message}")
+            return rule_issues
+
+    def write_user_report(self, rule: RuleDefinition, issue_dfs_per_rule: pd.Series):
+        """
+        Writes the rows of the user report for the issues of a rule to report_writer.
+
+        :param RuleDefinition rule: the rule that was run on the data.
+        :param Series issue_dfs_per_rule: its issues, see rule_issue_dfs.
+        """
+        lengths = [len(issues) for issues in issue_dfs_per_rule]
+        if max(lengths) == 0 or lengths.index(max(lengths)) == 4:
+            # la-level issues have no locations. As in process_issues, they are left out of the user report.
+            return
+        rows = rule_user_report(found_issues(rule, issue_dfs_per_rule), self.raw_data)
+        self.report_writer.write(rows)
 
     def create_issue_report_df(self, selected_rules: Optional[list[str]] = None):
         """
@@ -396,21 +679,13 @@ class CinValidator:
         :raises: Errors with rules that raise errors when validating data.
         """
 
-        enum_data_files = enum_keys(self.data_files)
+        if isinstance(self.data_files, SpilledTables):
+            # tables are read from disk by each rule, and released after it.
+            enum_data_files = self.data_files.view(cache=False)
+        else:
+            enum_data_files = enum_keys(self.data_files)
         self.issue_instances = pd.DataFrame()
-        self.full_issue_df = pd.DataFrame(
-            columns=[
-                "tables_affected",
-                "columns_affected",
-                "ROW_ID",
-                "ERROR_ID",
-                "rule_code",
-                "rule_description",
-                "rule_type",
-                "la_level",
-                "LAchildID",
-            ]
-        )
+        self.full_issue_df = pd.DataFrame(columns=ISSUE_COLUMNS)
         self.rules_passed: list[str] = []
 
         self.rules_broken: list[str] = []
@@ -419,15 +694,43 @@ class CinValidator:
 
         registry = self.ruleset_registry
 
-        rules_to_run = self.get_rules_to_run(registry, selected_rules)
+        rules_to_run = list(self.get_rules_to_run(registry, selected_rules))
+
+        if self.hooks.isolate_rules:
+            # each rule runs on its own so that hooks can measure it.
+            scans, others = {}, rules_to_run
+        else:
+            # rules that only check the rows of one table share a single copy and scan of that table.
+            scans, others = plan_rules(rules_to_run)
+
+        issue_dfs: dict[str, pd.Series] = {}
+        for table, table_rules in scans.items():
+            issue_dfs.update(self.run_scan(table, table_rules, enum_data_files))
+
+        if self.rule_costs is None:
+            schedule = rules_to_run
+        else:
+            # scanned rules are already done. The others run from cheapest to most expensive
+            # so that on_rule_done receives most issues early.
+            scanned = [rule for rule in rules_to_run if rule.code in issue_dfs]
+            schedule = scanned + self.rule_costs.order(others)
+
+        for done, rule in enumerate(schedule, start=1):
+            if rule.code not in issue_dfs:
+                issue_dfs[rule.code] = self.run_rule(rule, enum_data_files)
+            if self.report_writer is not None:
+                self.write_user_report(rule, issue_dfs[rule.code])
+            if self.on_rule_done is not None:
+                self.on_rule_done(
+                    rule,
+                    found_issues(rule, issue_dfs[rule.code]),
+                    done,
+                    len(schedule),
+                )
+
+        # the report lists rules in the order of the registry, whatever order they ran in.
         for rule in rules_to_run:
-            data_files = copy.deepcopy(enum_data_files)
-            ctx = RuleContext(rule)
-            try:
-                rule.func(data_files, ctx)
-            except Exception as e:
-                print(f"Error with rule {rule.code}: {type(e).__name__}, {e}")
-            self.process_issues(rule, ctx)
+            self.process_issues(rule, issue_dfs_per_rule=issue_dfs[rule.code])
 
         # df of all broken rule codes and related error messages.
         child_level_rules = pd.DataFrame(
@@ -439,3 +742,46 @@ class CinValidator:
         except:
             # if la_rules_broken is still an empty list
             self.la_rule_issues = pd.DataFrame()
+
+
+def validate_xml(
+    filename,
+    ruleset: str,
+    ruleset_registry,
+    selected_rules: Optional[list[str]] = None,
+    memory_budget: Optional[int] = None,
+    spill_format: str = "pickle",
+    report_writer: Optional[ReportWriter] = None,
+) -> CinValidator:
+    """
+    Reads, converts and validates a CIN XML file, as done by the run command.
+
+    :param filename: path or open file of the XML to validate.
+    :param str ruleset: name of the rule folder, e.g. cin2024_25.
+    :param dict ruleset_registry: the rules of the ruleset, keyed by rule code.
+    :param list selected_rules: rule codes that should be run. All rules run if None.
+    :param int memory_budget: bytes that validation should stay within. If the data would not fit,
+        its tables are spilled to disk once it has been read, see cin_validator/spill.py.
+    :param str spill_format: how spilled tables are written, pickle or arrow.
+    :param ReportWriter report_writer: where the user report is written, rule by rule, see CinValidator.
+    :returns: the validator, which holds the reports.
+    :rtype: CinValidator
+    """
+    root = ET.parse(filename).getroot()
+
+    raw_data = convert_data(root)
+    data_files = process_data(raw_data, ruleset)
+
+    if memory_budget is not None and needs_spill(data_files, memory_budget):
+        data_files = SpilledTables(data_files, file_format=spill_format)
+        # the tables are now on disk. Release the parsed XML and the tables read from it.
+        del root, raw_data
+        gc.collect()
+
+    return CinValidator(
+        data_files,
+        ruleset_registry,
+        selected_rules=selected_rules,
+        report_writer=report_writer,
+        ruleset=ruleset,
+    )
@@ -0,0 +1,192 @@
+from typing import Optional
+
+import pandas as pd
+
+# Valid values of coded fields, as listed in the code sets of the CIN census specification.
+# A collection year whose lists changed starts from the previous year's lists and only overrides what changed.
+# Years without changes use the previous year's lists.
+cin2022_23 = {
+    "ReferralSource": [
+        "1A",
+        "1B",
+        "1C",
+        "1D",
+        "2A",
+        "2B",
+        "3A",
+        "3B",
+        "3C",
+        "3D",
+        "3E",
+        "3F",
+        "4",
+        "5A",
+        "5B",
+        "5C",
+        "5D",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+    ],
+    "PrimaryNeedCode": ["N0", "N1", "N2", "N3", "N4", "N5", "N6", "N7", "N8", "N9"],
+    "ReasonForClosure": [
+        "RC1",
+        "RC2",
+        "RC3",
+        "RC4",
+        "RC5",
+        "RC6",
+        "RC7",
+        "RC8",
+        "RC9",
+    ],
+    "Ethnicity": [
+        "ABAN",
+        "AIND",
+        "AOTH",
+        "APKN",
+        "BAFR",
+        "BCRB",
+        "BOTH",
+        "CHNE",
+        "MOTH",
+        "MWAS",
+        "MWBA",
+        "MWBC",
+        "NOBT",
+        "OOTH",
+        "REFU",
+        "WBRI",
+        "WIRI",
+        "WIRT",
+        "WOTH",
+        "WROM",
+    ],
+    "Disability": [
+        "NONE",
+        "MOB",
+        "HAND",
+        "PC",
+        "INC",
+        "COMM",
+        "LD",
+        "HEAR",
+        "VIS",
+        "BEH",
+        "CON",
+        "AUT",
+        "DDA",
+    ],
+    "AssessmentFactor": [
+        "1A",
+        "1B",
+        "1C",
+        "2A",
+        "2B",
+        "2C",
+        "3A",
+        "3B",
+        "3C",
+        "4A",
+        "4B",
+        "4C",
+        "5A",
+        "5B",
+        "5C",
+        "6A",
+        "6B",
+        "6C",
+        "7A",
+        "8B",
+        "8C",
+        "8D",
+        "8E",
+        "8F",
+        "9A",
+        "10A",
+        "11A",
+        "12A",
+        "13A",
+        "14A",
+        "15A",
+        "16A",
+        "17A",
+        "18A",
+        "18B",
+        "18C",
+        "19A",
+        "19B",
+        "19C",
+        "20",
+        "21",
+        "22A",
+        "23A",
+        "24A",
+    ],
+    "InitialCategoryOfAbuse": ["NEG", "PHY", "SAB", "EMO", "MUL"],
+    "LatestCategoryOfAbuse": ["NEG", "PHY", "SAB", "EMO", "MUL"],
+    "GenderCurrent": ["1", "2", "0", "9"],
+}
+cin2024_25 = cin2022_23 | {"Sex": ["M", "F", "U"]}
+
+CODE_LISTS = {
+    "cin2022_23": cin2022_23,
+    "cin2023_24": cin2022_23,
+    "cin2024_25": cin2024_25,
+}
+
+
+def get_code_lists(ruleset: Optional[str] = None) -> dict[str, list[str]]:
+    """
+    Gets the code lists that apply to a ruleset. Falls back to the most recent lists
+    if the ruleset has none of its own.
+
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :returns: valid codes mapped to the name of the column they apply to.
+    :rtype: dict
+    """
+    return CODE_LISTS.get(ruleset, CODE_LISTS[max(CODE_LISTS)])
+
+
+def apply_code_lists(cin_tables: dict, code_lists: dict[str, list[str]]):
+    """
+    Stores coded columns as categoricals whose first categories are the valid codes.
+    Values that are not valid codes are appended as extra categories so that they can
+    still be shown to the user.
+
+    :param dict cin_tables: dataframes of CIN data, keyed by table name or CINTable.
+    :param dict code_lists: valid codes mapped to the name of the column they apply to.
+    :returns: the same tables, with coded columns converted.
+    :rtype: dict
+    """
+    for table in cin_tables.values():
+        for column, codes in code_lists.items():
+            if column not in table.columns:
+                continue
+            values = table[column].astype(object)
+            values = values.where(values.notna(), None)
+            extra = [
+                value for value in pd.unique(values.dropna()) if value not in codes
+            ]
+            table[column] = pd.Categorical(values, categories=[*codes, *extra])
+    return cin_tables
+
+
+def valid_code(column: pd.Series, codes: list[str]) -> pd.Series:
+    """
+    Checks which values of a column are valid codes.
+    Columns created by apply_code_lists are checked by comparing integer category codes.
+
+    :param Series column: coded column, categorical or not.
+    :param list codes: the valid codes.
+    :returns: True where the value is one of the codes. False for missing values.
+    :rtype: Series
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories
+        if list(categories[: len(codes)]) == list(codes):
+            category_codes = column.cat.codes
+            return (category_codes >= 0) & (category_codes < len(codes))
+    return column.astype(str).isin(codes) & column.notna()
@@ -0,0 +1,215 @@
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from cin_validator.batch import unique_names
+
+# Conversion of CIN XML files to a table per CIN table, without validating them, e.g. for analytics.
+# Each file is read and converted by a worker process that writes its own tables, so that many returns
+# are converted at once. A file that cannot be converted is recorded as failed and the rest carry on.
+# Tables are written as CSV, or as Parquet or Feather files, which require pyarrow.
+
+FORMATS = ["csv", "parquet", "feather"]
+
+
+def check_format(file_format: str):
+    """
+    :param str file_format: csv, parquet or feather.
+    :raises ValueError: if the format is not known.
+    :raises ImportError: if the format requires pyarrow and it is not installed.
+    """
+    if file_format not in FORMATS:
+        raise ValueError(
+            f"Unknown table format {file_format}, expected one of {', '.join(FORMATS)}"
+        )
+    if file_format != "csv":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                f"Writing tables in the {file_format} format requires pyarrow: pip install pyarrow"
+            ) from e
+
+
+@dataclass
+class ConversionResult:
+    """
+    The outcome of converting one file.
+
+    :param str file: path of the XML file.
+    :param str status: "converted" or "failed".
+    :param float seconds: time taken to read, convert and write the file.
+    :param str lea: the LEA in the header of the file.
+    :param dict rows: number of rows written for each table.
+    :param str error: why the file could not be converted.
+    """
+
+    file: str
+    status: str
+    seconds: float
+    lea: Optional[str] = None
+    rows: dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def table_path(
+    output_dir: Path,
+    table: str,
+    file_format: str,
+    name: Optional[str] = None,
+    lea: Optional[str] = None,
+) -> Path:
+    """
+    :param Path output_dir: the folder that tables are written to.
+    :param str table: name of the CIN table, e.g. ChildIdentifiers.
+    :param str file_format: csv, parquet or feather.
+    :param str name: name of the file that the table comes from. If None, the table is written
+        straight into output_dir, as when a single file is converted.
+    :param str lea: if given, the table goes in a LEA=<lea> folder, so that the tables of an LA can be
+        read together, e.g. as a partitioned dataset with pyarrow.
+    :returns: where the table is written, output_dir/<table>[/LEA=<lea>]/<name>.<format>.
+    :rtype: Path
+    """
+    if name is None:
+        return output_dir / f"{table}.{file_format}"
+    folder = output_dir / table
+    if lea is not None:
+        folder = folder / f"LEA={lea}"
+    return folder / f"{name}.{file_format}"
+
+
+def write_table(df, path: Path, file_format: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if file_format == "csv":
+        df.to_csv(path)
+    elif file_format == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        # feather files cannot store an index.
+        df.reset_index(drop=True).to_feather(path)
+
+
+def convert_file(
+    file: Path,
+    output_dir: Path,
+    file_format: str = "csv",
+    name: Optional[str] = None,
+    partition_by_la: bool = False,
+) -> ConversionResult:
+    """
+    Converts one file and writes its tables. Runs in a worker process.
+
+    :param Path file: the XML file to convert.
+    :param Path output_dir: the folder that tables are written to.
+    :param str file_format: csv, parquet or feather.
+    :param str name: name that the tables of the file are written under, as in table_path.
+    :param bool partition_by_la: whether tables are written in a folder per LEA.
+    :returns: the outcome, failed if the file could not be read, converted or written.
+    :rtype: ConversionResult
+    """
+    from cin_validator.cin_validator import convert_data
+
+    start = time.perf_counter()
+    try:
+        tables = convert_data(ET.parse(file).getroot())
+        leas = tables["Header"]["LEA"].dropna()
+        lea = str(leas.iloc[0]) if len(leas) else None
+        for table, df in tables.items():
+            path = table_path(
+                output_dir,
+                table,
+                file_format,
+                name,
+                lea=(lea or "unknown") if partition_by_la else None,
+            )
+            write_table(df, path, file_format)
+    except Exception as e:
+        return ConversionResult(
+            file=str(file),
+            status="failed",
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}, {e}",
+        )
+
+    return ConversionResult(
+        file=str(file),
+        status="converted",
+        seconds=time.perf_counter() - start,
+        lea=lea,
+        rows={table: len(df) for table, df in tables.items()},
+    )
+
+
+def convert_files(
+    files: list[Path],
+    output_dir: Path,
+    file_format: str = "csv",
+    partition_by_la: bool = False,
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[ConversionResult, int, int], None]] = None,
+) -> list[ConversionResult]:
+    """
+    Converts files across a pool of worker processes. A single file is converted in this process, and its
+    tables are written straight into output_dir unless they are partitioned by LA. Otherwise each table
+    gets a folder, which holds a file per XML file, named as in batch.unique_names.
+
+    :param list files: the XML files to convert.
+    :param Path output_dir: the folder that tables are written to. It is created if needed.
+    :param str file_format: csv, parquet or feather.
+    :param bool partition_by_la: whether the tables of each file are written in a LEA=<lea> folder,
+        taken from the header of the file.
+    :param int workers: number of worker processes. Defaults to the number of CPUs.
+    :param function on_result: called with each result, the number of files done and the number of
+        files to convert, as soon as a file is done. Used to report progress.
+    :returns: the result of each file, in the order of files.
+    :rtype: list
+    :raises ValueError: if the format is not known.
+    :raises ImportError: if the format requires pyarrow and it is not installed.
+    """
+    check_format(file_format)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if len(files) == 1 and not partition_by_la:
+        names: list[Optional[str]] = [None]
+    else:
+        names = unique_names(files)
+
+    results: dict[Path, ConversionResult] = {}
+
+    def done(file: Path, result: ConversionResult):
+        results[file] = result
+        if on_result is not None:
+            on_result(result, len(results), len(files))
+
+    if len(files) == 1 or workers == 1:
+        for file, name in zip(files, names):
+            done(
+                file,
+                convert_file(file, output_dir, file_format, name, partition_by_la),
+            )
+        return [results[file] for file in files]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                convert_file, file, output_dir, file_format, name, partition_by_la
+            ): file
+            for file, name in zip(files, names)
+        }
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # e.g. the worker process died. Errors raised by the conversion are caught in the worker.
+                result = ConversionResult(
+                    file=str(file),
+                    status="failed",
+                    seconds=0.0,
+                    error=f"{type(e).__name__}, {e}",
+                )
+            done(file, result)
+
+    return [results[file] for file in files]
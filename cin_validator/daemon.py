@@ -0,0 +1,172 @@
+import json
+import socket
+import socketserver
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Optional
+
+# A warm validation process for repeated runs from the command line.
+# `python -m cin_validator serve` loads pandas and every rule once, then validates the files sent to it by
+# `python -m cin_validator run --daemon <file>` over a Unix socket. The client only imports the standard library.
+# Each request and each response is one line of JSON.
+
+DEFAULT_SOCKET = Path(tempfile.gettempdir()) / "cin_validator.sock"
+
+
+def validate_file(
+    filename,
+    ruleset: str,
+    registry: Mapping,
+    select: Optional[str] = None,
+    output: bool = False,
+    memory_budget: Optional[int] = None,
+    spill_format: str = "pickle",
+    report_path: Optional[Path] = None,
+) -> dict:
+    """
+    Validates a CIN XML file. Used by the run command, with or without the daemon.
+
+    :param filename: path or open file of the XML to validate.
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :param Mapping registry: the rules of the ruleset, keyed by rule code.
+    :param str select: rule codes that should be run. All rules run if None.
+    :param bool output: whether the user report should be returned as CSV text.
+    :param int memory_budget: bytes that validation should stay within, see validate_xml.
+    :param str spill_format: how tables are written if they are spilled, pickle or arrow.
+    :param Path report_path: if given, the user report is written to this file rule by rule, in the format
+        of its extension: csv, jsonl or parquet. See cin_validator/report_writers.py.
+    :returns: the number of issue locations of each rule code, and the user report when output is True.
+        With a memory budget, also the peak memory compared to the budget.
+    :rtype: dict
+    """
+    import pandas as pd
+
+    from cin_validator.cin_validator import validate_xml
+    from cin_validator.report_writers import report_writer
+    from cin_validator.spill import SpilledTables, budget_report
+
+    if report_path is None:
+        validator = validate_xml(
+            filename, ruleset, registry, select, memory_budget, spill_format
+        )
+    else:
+        with report_writer(report_path) as writer:
+            validator = validate_xml(
+                filename,
+                ruleset,
+                registry,
+                select,
+                memory_budget,
+                spill_format,
+                report_writer=writer,
+            )
+
+    user_report = validator.user_report
+    issues = (
+        user_report["rule_code"].astype(str).value_counts()
+        if not user_report.empty
+        else pd.Series(dtype="int64")
+    )
+    result = {
+        "issues": {code: int(count) for code, count in issues.items()},
+        "user_report": user_report.to_csv() if output else None,
+    }
+    if memory_budget is not None:
+        spilled = isinstance(validator.data_files, SpilledTables)
+        result["memory"] = budget_report(memory_budget, spilled)
+    return result
+
+
+class ValidationHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # e.g. remove_stale_socket checking that the daemon is alive.
+            return
+        try:
+            request = json.loads(line)
+            response = validate_file(
+                request["filename"],
+                request["ruleset"],
+                self.server.registries[request["ruleset"]],
+                select=request.get("select"),
+                output=request.get("output", False),
+            )
+        except Exception as e:
+            # the daemon keeps running, the client reports the error.
+            response = {"error": f"{type(e).__name__}, {e}"}
+        try:
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        except BrokenPipeError:
+            # the client went away before the response was ready.
+            pass
+
+
+class ValidationServer(socketserver.UnixStreamServer):
+    """
+    Validates the files that clients send to its socket, one request at a time.
+
+    :param Path socket_path: where the socket is created.
+    :param dict registries: the registry of each ruleset that can be requested, keyed by ruleset name.
+    """
+
+    def __init__(self, socket_path: Path, registries: dict[str, Mapping]):
+        self.socket_path = Path(socket_path)
+        self.registries = registries
+        remove_stale_socket(self.socket_path)
+        super().__init__(str(self.socket_path), ValidationHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def remove_stale_socket(socket_path: Path):
+    """
+    Removes a socket left behind by a daemon that did not exit cleanly.
+
+    :param Path socket_path: the socket that a new daemon will listen on.
+    :raises RuntimeError: if a daemon is still listening on the socket.
+    """
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+            return
+    raise RuntimeError(f"A daemon is already listening on {socket_path}")
+
+
+def request_validation(
+    filename,
+    ruleset: str,
+    select: Optional[str] = None,
+    output: bool = False,
+    socket_path: Path = DEFAULT_SOCKET,
+) -> dict:
+    """
+    Asks a running daemon to validate a file.
+
+    :param filename: path of the XML to validate. It is resolved here as the daemon may run in another folder.
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :param str select: rule codes that should be run. All rules run if None.
+    :param bool output: whether the user report should be returned as CSV text.
+    :param Path socket_path: the socket that the daemon listens on.
+    :returns: the response of validate_file, or a dict with an error message.
+    :rtype: dict
+    :raises OSError: if no daemon is listening on the socket.
+    """
+    request = {
+        "filename": str(Path(filename).resolve()),
+        "ruleset": ruleset,
+        "select": select,
+        "output": output,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
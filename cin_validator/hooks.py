@@ -0,0 +1,87 @@
+from cin_validator.rule_engine import RuleDefinition
+
+# Callbacks that CinValidator makes around every rule and reporting stage, so that timers, profilers, memory samplers
+# and metrics exporters can be attached to a validation without changing it.
+
+
+class ValidationHooks:
+    """
+    Base class of the hooks passed to CinValidator. Every callback does nothing unless overridden.
+
+    Rules that share a table scan run together: before_rule is called for each of them before the scan and after_rule
+    after it, with an equal share of its time. Set isolate_rules to True to run every rule on its own instead, e.g. to
+    measure rules precisely.
+    """
+
+    isolate_rules = False
+
+    def before_stage(self, stage: str):
+        """
+        :param str stage: the stage about to run: a table scan, include_issue_child or create_user_report.
+        """
+
+    def after_stage(self, stage: str, elapsed: float, issue_count: int):
+        """
+        :param str stage: the stage that has run.
+        :param float elapsed: seconds that it took.
+        :param int issue_count: number of issues found so far.
+        """
+
+    def before_rule(self, rule: RuleDefinition):
+        """
+        :param RuleDefinition rule: the rule about to run.
+        """
+
+    def after_rule(self, rule: RuleDefinition, elapsed: float, issue_count: int):
+        """
+        Called after every rule, including those that raised an exception.
+
+        :param RuleDefinition rule: the rule that has run.
+        :param float elapsed: seconds that it took.
+        :param int issue_count: number of issues that it found.
+        """
+
+    def on_error(self, rule: RuleDefinition, elapsed: float, error: Exception):
+        """
+        Called, before after_rule, when a rule raises an exception. The validation carries on without the issues
+        that the rule did not push.
+
+        :param RuleDefinition rule: the rule that failed.
+        :param float elapsed: seconds until it failed.
+        :param Exception error: what it raised.
+        """
+
+
+class HookList(ValidationHooks):
+    """
+    Makes each callback on several hooks, in order.
+
+    :param list hooks: ValidationHooks, or objects with some of their methods.
+    """
+
+    def __init__(self, hooks):
+        self.hooks = list(hooks)
+        self.isolate_rules = any(
+            getattr(hook, "isolate_rules", False) for hook in self.hooks
+        )
+
+    def _call(self, callback: str, *args):
+        for hook in self.hooks:
+            method = getattr(hook, callback, None)
+            if method is not None:
+                method(*args)
+
+    def before_stage(self, stage):
+        self._call("before_stage", stage)
+
+    def after_stage(self, stage, elapsed, issue_count):
+        self._call("after_stage", stage, elapsed, issue_count)
+
+    def before_rule(self, rule):
+        self._call("before_rule", rule)
+
+    def after_rule(self, rule, elapsed, issue_count):
+        self._call("after_rule", rule, elapsed, issue_count)
+
+    def on_error(self, rule, elapsed, error):
+        self._call("on_error", rule, elapsed, error)
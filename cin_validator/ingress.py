@@ -144,10 +144,30 @@ class XMLtoCSV:
         header = root.find("Header")
         self.Header = self.create_Header(header)
 
+        # rows of each table, as dicts. Each DataFrame is built once all children have been read,
+        # as adding the rows of every child to it would copy the table once per child.
+        self.table_rows = {}
         children = root.find("Children")
         for child in children.findall("Child"):
             self.create_child(child)
 
+        for table, rows in self.table_rows.items():
+            table_df = pd.DataFrame(rows)
+            setattr(
+                self,
+                table,
+                pd.concat([getattr(self, table), table_df], ignore_index=True),
+            )
+
+    def add_rows(self, table: str, rows: list):
+        """
+        Keeps rows for a table. The table is built from them once every child has been read.
+
+        :param str table: name of the table.
+        :param list rows: a dict per row, keyed by column name.
+        """
+        self.table_rows.setdefault(table, []).extend(rows)
+
     # for each table, column names should attempt to find their value in the child.
     # if not found, they should assign themselves to NaN
 
@@ -220,10 +240,7 @@ class XMLtoCSV:
 
         self.LAchildID = identifiers_dict.get("LAchildID", pd.NA)
 
-        identifiers_df = pd.DataFrame.from_dict([identifiers_dict])
-        self.ChildIdentifiers = pd.concat(
-            [self.ChildIdentifiers, identifiers_df], ignore_index=True
-        )
+        self.add_rows("ChildIdentifiers", [identifiers_dict])
 
     def create_ChildCharacteristics(self, child):
         """Populates the ChildCharacteristics table. One ChildCharacteristics block exists per child in CIN XML
@@ -245,10 +262,7 @@ class XMLtoCSV:
             elements, characteristics_dict, characteristics
         )
 
-        characteristics_df = pd.DataFrame.from_dict([characteristics_dict])
-        self.ChildCharacteristics = pd.concat(
-            [self.ChildCharacteristics, characteristics_df], ignore_index=True
-        )
+        self.add_rows("ChildCharacteristics", [characteristics_dict])
 
         # The disabilities block for a child is found within a ChildCharacteristics block.
         self.create_Disabilities(characteristics)
@@ -272,10 +286,7 @@ class XMLtoCSV:
                 disability_dict["Disability"] = disability.text
                 disabilities_list.append(disability_dict)
 
-            disabilities_df = pd.DataFrame(disabilities_list)
-            self.Disabilities = pd.concat(
-                [self.Disabilities, disabilities_df], ignore_index=True
-            )
+            self.add_rows("Disabilities", disabilities_list)
 
     # CINdetailsID needed
     def create_CINdetails(self, child):
@@ -310,10 +321,7 @@ class XMLtoCSV:
             self.create_Section47(cin_detail)
             self.create_ChildProtectionPlans(cin_detail)
 
-        cin_details_df = pd.DataFrame(cin_details_list)
-        self.CINdetails = pd.concat(
-            [self.CINdetails, cin_details_df], ignore_index=True
-        )
+        self.add_rows("CINdetails", cin_details_list)
 
     def create_Assessments(self, cin_detail):
         """Populates the assessments table. Multiple Assessments blocks can exist in one CINdetails block.
@@ -361,21 +369,15 @@ class XMLtoCSV:
                     )
                     assessment_factors_dict["AssessmentFactor"] = factor.text
                     assessment_factors_list.append(assessment_factors_dict)
-                assessment_factors_df = pd.DataFrame(assessment_factors_list)
-                self.AssessmentFactorsList = pd.concat(
-                    [self.AssessmentFactorsList, assessment_factors_df],
-                    ignore_index=True,
-                )
-                assessment_dict["AssessmentFactors"] = assessment_factors_df[
-                    "AssessmentFactor"
-                ].tolist()
+                self.add_rows("AssessmentFactorsList", assessment_factors_list)
+                assessment_dict["AssessmentFactors"] = [
+                    factor_dict["AssessmentFactor"]
+                    for factor_dict in assessment_factors_list
+                ]
 
             assessments_list.append(assessment_dict)
 
-        assessments_df = pd.DataFrame(assessments_list)
-        self.Assessments = pd.concat(
-            [self.Assessments, assessments_df], ignore_index=True
-        )
+        self.add_rows("Assessments", assessments_list)
 
     def create_CINplanDates(self, cin_detail):
         """
@@ -399,8 +401,7 @@ class XMLtoCSV:
             date_dict = get_values(elements, date_dict, date)
             dates_list.append(date_dict)
 
-        dates_df = pd.DataFrame(dates_list)
-        self.CINplanDates = pd.concat([self.CINplanDates, dates_df], ignore_index=True)
+        self.add_rows("CINplanDates", dates_list)
 
     def create_Section47(self, cin_detail):
         """
@@ -424,8 +425,7 @@ class XMLtoCSV:
             section_dict = get_values(elements, section_dict, section)
             sections_list.append(section_dict)
 
-        sections_df = pd.DataFrame(sections_list)
-        self.Section47 = pd.concat([self.Section47, sections_df], ignore_index=True)
+        self.add_rows("Section47", sections_list)
 
     # CINdetails and CPPID needed
     def create_ChildProtectionPlans(self, cin_detail):
@@ -458,10 +458,7 @@ class XMLtoCSV:
             # functions that should use CPPID before it is incremented
             self.create_Reviews(plan)
 
-        plans_df = pd.DataFrame(plans_list)
-        self.ChildProtectionPlans = pd.concat(
-            [self.ChildProtectionPlans, plans_df], ignore_index=True
-        )
+        self.add_rows("ChildProtectionPlans", plans_list)
 
     def create_Reviews(self, plan):
         """
@@ -487,8 +484,7 @@ class XMLtoCSV:
 
             reviews_list.append(review_dict)
 
-        reviews_df = pd.DataFrame(reviews_list)
-        self.Reviews = pd.concat([self.Reviews, reviews_df], ignore_index=True)
+        self.add_rows("Reviews", reviews_list)
 
 
 """
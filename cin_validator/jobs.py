@@ -0,0 +1,226 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from cin_validator.rule_engine import RuleDefinition
+
+# Validations that run in the background of the RPC app, so that the frontend can show their progress.
+# Jobs run on a pool of threads. Each job reports every rule it completes as an event, keeps the issues found so far
+# and can be cancelled, in which case it stops after the rule that is running.
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a cancelled job to stop its validation."""
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while as many jobs as allowed are waiting or running."""
+
+
+class ValidationJob:
+    """
+    The state of one background validation.
+
+    :param str job_id: identifies the job in queries.
+    :param str key: identifies who submitted the job, e.g. a browser session. A new job with the same key
+        cancels this one.
+    """
+
+    def __init__(self, job_id: str, key: Optional[str] = None):
+        self.id = job_id
+        self.key = key
+        self.status = QUEUED
+        self.done = 0
+        self.total: Optional[int] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.events: list[dict] = []
+        self._issues: list[pd.DataFrame] = []
+        self._cancelled = threading.Event()
+        self._changed = threading.Condition()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    def cancel(self):
+        """Stops the job before it starts, or after the rule that it is running."""
+        self._cancelled.set()
+
+    def _emit(self, event: str, **details):
+        with self._changed:
+            self.events.append({"event": event, "time": time.time(), **details})
+            self._changed.notify_all()
+
+    def _set_status(self, status: str, **details):
+        self.status = status
+        self._emit(status, **details)
+
+    def rule_done(
+        self, rule: RuleDefinition, issues: pd.DataFrame, done: int, total: int
+    ):
+        """
+        Records a completed rule. Passed to CinValidator as on_rule_done.
+
+        :param RuleDefinition rule: the rule that has run.
+        :param DataFrame issues: the issues that it found.
+        :param int done: number of rules run so far.
+        :param int total: number of rules to run.
+        :raises JobCancelled: if the job has been cancelled, to stop the validation.
+        """
+        if self.cancelled:
+            raise JobCancelled(self.id)
+        self.done, self.total = done, total
+        if len(issues):
+            self._issues.append(issues)
+        self._emit(
+            "rule", rule_code=str(rule.code), issues=len(issues), done=done, total=total
+        )
+
+    def events_since(self, index: int = 0, timeout: float = 0.0) -> list[dict]:
+        """
+        :param int index: number of events already received.
+        :param float timeout: seconds to wait for a new event if there is none yet, for long-polling.
+        :returns: the events after index.
+        :rtype: list
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: len(self.events) > index or self.finished, timeout=timeout
+            )
+            return self.events[index:]
+
+    def partial_issues(self) -> pd.DataFrame:
+        """
+        :returns: the issues found by the rules completed so far. They are not linked to child IDs yet.
+        :rtype: DataFrame
+        """
+        # a copy of the list, as the validation may add to it meanwhile.
+        issues = list(self._issues)
+        if not issues:
+            return pd.DataFrame()
+        return pd.concat(issues, ignore_index=True)
+
+    def progress(self) -> dict:
+        """
+        :returns: the status of the job and how many of its rules have run.
+        :rtype: dict
+        """
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "done": self.done,
+            "total": self.total,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """
+    Runs validation jobs on a pool of threads.
+
+    :param int max_running: the most jobs that run at the same time.
+    :param int max_waiting: the most jobs that wait for a thread. Further jobs are refused with QueueFull,
+        so that callers back off rather than piling work up.
+    :param int max_finished: the most finished jobs kept for queries. The oldest are forgotten first.
+    """
+
+    def __init__(
+        self, max_running: int = 2, max_waiting: int = 8, max_finished: int = 16
+    ):
+        self.max_running = max_running
+        self.max_waiting = max_waiting
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_running, thread_name_prefix="validation"
+        )
+        self._jobs: OrderedDict[str, ValidationJob] = OrderedDict()
+        self._keys: dict[str, ValidationJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, validate: Callable[[ValidationJob], Any], key: Optional[str] = None
+    ) -> ValidationJob:
+        """
+        :param function validate: runs the validation. It receives the job, whose rule_done method it should pass
+            to CinValidator as on_rule_done. What it returns becomes the result of the job.
+        :param str key: identifies who submits the job. Their unfinished job, if any, is cancelled.
+        :returns: the queued job.
+        :rtype: ValidationJob
+        :raises QueueFull: if max_running jobs are running and max_waiting jobs are waiting.
+        """
+        with self._lock:
+            if key is not None and key in self._keys:
+                self._keys[key].cancel()
+            # cancelled jobs stop at their next rule, so they do not count towards the limit.
+            unfinished = sum(
+                not job.finished and not job.cancelled for job in self._jobs.values()
+            )
+            if unfinished >= self.max_running + self.max_waiting:
+                raise QueueFull(
+                    f"{unfinished} validations are waiting or running, try again later"
+                )
+
+            job = ValidationJob(uuid.uuid4().hex, key)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._keys[key] = job
+            self._forget_finished()
+        job._emit(QUEUED)
+        self._executor.submit(self._run, job, validate)
+        return job
+
+    def _run(self, job: ValidationJob, validate: Callable[[ValidationJob], Any]):
+        if job.cancelled:
+            job._set_status(CANCELLED)
+            return
+        job._set_status(RUNNING)
+        try:
+            job.result = validate(job)
+        except JobCancelled:
+            job._set_status(CANCELLED)
+        except Exception as e:
+            job.error = f"{type(e).__name__}, {e}"
+            job._set_status(FAILED, error=job.error)
+        else:
+            job._set_status(DONE)
+
+    def _forget_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            job = self._jobs.pop(job_id)
+            if job.key is not None and self._keys.get(job.key) is job:
+                del self._keys[job.key]
+
+    def get(self, job_id: str) -> ValidationJob:
+        """
+        :param str job_id: as returned by submit.
+        :returns: the job.
+        :rtype: ValidationJob
+        :raises KeyError: if the job is unknown or has been forgotten.
+        """
+        if job_id not in self._jobs:
+            raise KeyError(f"No validation job {job_id}")
+        return self._jobs[job_id]
+
+    def shutdown(self):
+        """Cancels every job and waits for the running ones to stop."""
+        for job in list(self._jobs.values()):
+            job.cancel()
+        self._executor.shutdown(wait=True)
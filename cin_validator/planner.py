@@ -0,0 +1,86 @@
+import copy
+from collections import ChainMap
+from typing import Callable, Iterable, Mapping, Optional
+
+import pandas as pd
+
+from cin_validator.rule_engine import CINTable, RuleContext, RuleDefinition
+from cin_validator.rule_patterns import TablePattern
+
+
+def table_pattern(rule: RuleDefinition) -> Optional[TablePattern]:
+    """
+    :param RuleDefinition rule: any rule.
+    :returns: the single-table spec that the rule was compiled from, None for hand-written rules.
+    :rtype: TablePattern
+    """
+    spec = getattr(rule.func, "__pattern__", None)
+    return spec if isinstance(spec, TablePattern) else None
+
+
+def plan_rules(rules: Iterable[RuleDefinition]):
+    """
+    Splits rules into those that can share a scan of their table and those that run on their own.
+
+    :param list rules: the rules to run.
+    :returns: single-table rules grouped by their table, and the remaining rules, both in their original order.
+    :rtype: tuple of dict and list
+    """
+    scans: dict[CINTable, list[RuleDefinition]] = {}
+    others: list[RuleDefinition] = []
+    for rule in rules:
+        spec = table_pattern(rule)
+        if spec is None:
+            others.append(rule)
+        else:
+            scans.setdefault(spec.table, []).append(rule)
+    return scans, others
+
+
+def run_table_scan(
+    table: CINTable,
+    rules: list[RuleDefinition],
+    data_container: Mapping[CINTable, pd.DataFrame],
+    on_error: Optional[Callable[[RuleDefinition, Exception], None]] = None,
+    ruleset: Optional[str] = None,
+) -> dict[str, RuleContext]:
+    """
+    Runs several single-table rules against one copy of their table.
+    The failing rows of every rule are found first, then each rule's issues are pushed to its own context.
+
+    :param CINTable table: the table shared by the rules.
+    :param list rules: rules whose table_pattern applies to the table.
+    :param dict data_container: all the CIN tables, keyed by CINTable. They are not modified.
+    :param function on_error: called with a rule and the exception that it raised, and the other rules
+        carry on. If None, the exception is raised.
+    :param str ruleset: name of the rule folder being run, passed to the RuleContext of each rule.
+    :returns: the context of each rule, keyed by rule code.
+    :rtype: dict
+    """
+    # specs do not modify the data so one copy of the table is enough for all of them.
+    df = copy.deepcopy(data_container[table])
+    # the other tables are only looked up when a spec asks for them, e.g. for the ReferenceDate.
+    scan_data = ChainMap({table: df}, data_container)
+
+    contexts: dict[str, RuleContext] = {}
+    failing_rows: dict[str, pd.Series] = {}
+    for rule in rules:
+        contexts[rule.code] = RuleContext(rule, ruleset)
+        try:
+            failing_rows[rule.code] = table_pattern(rule).failing(df, scan_data)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(rule, e)
+
+    for rule in rules:
+        if rule.code not in failing_rows:
+            continue
+        try:
+            table_pattern(rule).push(df, failing_rows[rule.code], contexts[rule.code])
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(rule, e)
+
+    return contexts
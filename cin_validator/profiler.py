@@ -0,0 +1,310 @@
+import contextlib
+import copy
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from cin_validator.hooks import ValidationHooks
+
+# Measures where a validation spends its time and memory, stage by stage: reading the XML, converting it to tables,
+# processing the tables, each rule, linking issues to children and creating the user report.
+# Used by the timer command to find the rules that dominate on a given LA's data.
+# profile_rules then shows where the time of a slow rule goes, e.g. in merges, groupby-apply or Python loops,
+# by running it under cProfile. Used by the profile-rule command.
+
+RULE = "rule"
+STAGE = "stage"
+
+
+@dataclass
+class StageProfile:
+    """
+    The cost of one stage of a validation.
+
+    :param str stage: what ran, e.g. process_data, or the code of a rule.
+    :param str kind: "stage", or "rule" for a validation rule.
+    :param float wall_seconds: elapsed time.
+    :param float cpu_seconds: processor time used by this process.
+    :param int peak_memory: most memory, in bytes, allocated by the stage at any time. None if memory is not traced.
+    """
+
+    stage: str
+    kind: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory: Optional[int]
+
+
+class Profiler(ValidationHooks):
+    """
+    Records the cost of the stages run within its measure blocks, and, as hooks of CinValidator, of each rule and
+    reporting stage. Rules then run on their own rather than in shared table scans, so that each can be measured.
+    Use it as a context manager to trace memory while it is open. Tracing slows Python code down, so wall and cpu
+    times are more accurate without it.
+
+    :param bool trace_memory: whether peak memory is measured, with tracemalloc.
+    """
+
+    isolate_rules = True
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stages: list[StageProfile] = []
+        self._started_tracing = False
+        self._start = None
+
+    def __enter__(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def start(self):
+        """Starts measuring a stage."""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0] if tracing else None
+        self._start = (time.perf_counter(), time.process_time(), start_memory)
+
+    def stop(self, stage: str, kind: str = STAGE):
+        """
+        Records the cost of the stage measured since start.
+
+        :param str stage: name of the stage.
+        :param str kind: "stage" or "rule".
+        """
+        start_wall, start_cpu, start_memory = self._start
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+        peak = (
+            None
+            if start_memory is None
+            else tracemalloc.get_traced_memory()[1] - start_memory
+        )
+        self.stages.append(StageProfile(str(stage), kind, wall, cpu, peak))
+
+    @contextlib.contextmanager
+    def measure(self, stage: str, kind: str = STAGE):
+        """
+        Records the cost of the code run in the with block.
+
+        :param str stage: name of the stage.
+        :param str kind: "stage" or "rule".
+        """
+        self.start()
+        try:
+            yield
+        finally:
+            self.stop(stage, kind)
+
+    def before_stage(self, stage):
+        self.start()
+
+    def after_stage(self, stage, elapsed, issue_count):
+        self.stop(stage)
+
+    def before_rule(self, rule):
+        self.start()
+
+    def after_rule(self, rule, elapsed, issue_count):
+        self.stop(rule.code, RULE)
+
+    def ranked(self) -> list[StageProfile]:
+        """
+        :returns: the stages, slowest first.
+        :rtype: list
+        """
+        return sorted(self.stages, key=lambda stage: stage.wall_seconds, reverse=True)
+
+    def table(self, top: Optional[int] = None) -> str:
+        """
+        :param int top: the number of stages shown. All if None.
+        :returns: the ranked stages as a text table.
+        :rtype: str
+        """
+        total = sum(stage.wall_seconds for stage in self.stages) or 1.0
+        rows = [
+            f"{'stage':<22}{'kind':<7}{'wall s':>10}{'cpu s':>10}{'peak MB':>10}{'% wall':>8}"
+        ]
+        for stage in self.ranked()[:top]:
+            peak = (
+                "-"
+                if stage.peak_memory is None
+                else f"{stage.peak_memory / 1024**2:.2f}"
+            )
+            rows.append(
+                f"{stage.stage:<22}{stage.kind:<7}{stage.wall_seconds:>10.4f}"
+                f"{stage.cpu_seconds:>10.4f}{peak:>10}"
+                f"{100 * stage.wall_seconds / total:>8.1f}"
+            )
+        return "\n".join(rows)
+
+    def to_json(self, path: Path, **metadata):
+        """
+        Writes the stages, slowest first, to a json file.
+
+        :param Path path: where to write.
+        :param metadata: recorded with the stages, e.g. the file and ruleset profiled.
+        """
+        artifact = {
+            **metadata,
+            "total_wall_seconds": sum(stage.wall_seconds for stage in self.stages),
+            "total_cpu_seconds": sum(stage.cpu_seconds for stage in self.stages),
+            "stages": [asdict(stage) for stage in self.ranked()],
+        }
+        Path(path).write_text(json.dumps(artifact, indent=2))
+
+
+def profile_file(
+    filename,
+    ruleset: str,
+    ruleset_registry,
+    selected_rules: Optional[list[str]] = None,
+    trace_memory: bool = True,
+) -> Profiler:
+    """
+    Validates a CIN XML file, as validate_xml does, measuring each stage.
+
+    :param filename: path or open file of the XML to validate.
+    :param str ruleset: name of the rule folder, e.g. cin2024_25.
+    :param dict ruleset_registry: the rules of the ruleset, keyed by rule code.
+    :param list selected_rules: rule codes that should be run. All rules run if None.
+    :param bool trace_memory: whether peak memory is measured.
+    :returns: the cost of each stage.
+    :rtype: Profiler
+    """
+    from cin_validator.cin_validator import CinValidator, convert_data, process_data
+
+    with Profiler(trace_memory) as profiler:
+        with profiler.measure("XML parse"):
+            root = ET.parse(filename).getroot()
+        with profiler.measure("XMLtoCSV"):
+            raw_data = convert_data(root)
+        with profiler.measure("process_data"):
+            data_files = process_data(raw_data, ruleset)
+        CinValidator(
+            data_files,
+            ruleset_registry,
+            selected_rules=selected_rules,
+            hooks=[profiler],
+            ruleset=ruleset,
+        )
+    return profiler
+
+
+def top_functions(stats: pstats.Stats, top: int = 15) -> list[dict]:
+    """
+    :param Stats stats: a cProfile capture.
+    :param int top: the number of functions returned.
+    :returns: the functions with the most cumulative time, i.e. including the functions they call, most first.
+    :rtype: list
+    """
+    functions = []
+    for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        functions.append(
+            {
+                "function": f"{Path(filename).name}:{line}({name})",
+                "path": filename,
+                "calls": calls,
+                "own_seconds": own,
+                "cumulative_seconds": cumulative,
+            }
+        )
+    functions.sort(key=lambda function: function["cumulative_seconds"], reverse=True)
+    return functions[:top]
+
+
+def profile_rules(
+    filename,
+    ruleset: str,
+    ruleset_registry,
+    rule_codes: list[str],
+    output_dir: Path,
+    repeat: int = 3,
+    top: int = 15,
+) -> dict[str, dict]:
+    """
+    Runs rules under cProfile on a CIN XML file, which is read and processed once.
+    Writes rule_<code>.pstats for each rule, which can be explored with pstats or snakeviz,
+    and summary.json of the functions where each rule spends its time.
+
+    :param filename: path or open file of the XML to validate.
+    :param str ruleset: name of the rule folder, e.g. cin2024_25.
+    :param dict ruleset_registry: the rules of the ruleset, keyed by rule code.
+    :param list rule_codes: the rules to profile.
+    :param Path output_dir: where the profiles are written.
+    :param int repeat: number of times each rule runs. The profile covers every run, which evens out noise.
+    :param int top: number of functions in the summary of each rule.
+    :returns: the summary of each rule, keyed by rule code.
+    :rtype: dict
+    """
+    from cin_validator.cin_validator import convert_data, enum_keys, process_data
+    from cin_validator.rule_engine import RuleContext
+
+    root = ET.parse(filename).getroot()
+    data_container = enum_keys(process_data(convert_data(root), ruleset))
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary = {}
+    for code in rule_codes:
+        rule = ruleset_registry[code]
+        profile = cProfile.Profile()
+        for _ in range(repeat):
+            # the copy of the data, which every rule needs, is left out of the profile.
+            data_files = copy.deepcopy(data_container)
+            ctx = RuleContext(rule, ruleset)
+            profile.enable()
+            try:
+                rule.func(data_files, ctx)
+            except Exception as e:
+                print(f"Error with rule {rule.code}: {type(e).__name__}, {e}")
+            finally:
+                profile.disable()
+
+        pstats_path = output_dir / f"rule_{code}.pstats"
+        profile.dump_stats(pstats_path)
+        stats = pstats.Stats(profile)
+        summary[str(code)] = {
+            "pstats": str(pstats_path),
+            "runs": repeat,
+            "seconds_per_run": stats.total_tt / repeat,
+            "top_functions": top_functions(stats, top),
+        }
+
+    (output_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    return summary
+
+
+def summary_table(summary: dict) -> str:
+    """
+    :param dict summary: as returned by profile_rules.
+    :returns: the top functions of each rule as text.
+    :rtype: str
+    """
+    lines = []
+    for code, rule_summary in summary.items():
+        lines.append(
+            f"Rule {code}: {rule_summary['seconds_per_run']:.4f}s per run "
+            f"over {rule_summary['runs']} runs ({rule_summary['pstats']})"
+        )
+        lines.append(f"{'cumulative s':>14}{'own s':>10}{'calls':>9}  function")
+        for function in rule_summary["top_functions"]:
+            lines.append(
+                f"{function['cumulative_seconds']:>14.4f}{function['own_seconds']:>10.4f}"
+                f"{function['calls']:>9}  {function['function']}"
+            )
+        lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,161 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# Writers that append rows of the user report to a file as soon as they are found, instead of writing the
+# whole report once validation is over. CinValidator passes them the rows of each rule as the rule finishes,
+# so a report with many issues is never held in memory at once.
+# CSV and JSON Lines files are appended to. Parquet files get a row group per write and require pyarrow.
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Writing reports in the parquet format requires pyarrow: pip install pyarrow"
+        ) from e
+    return pa, pq
+
+
+class ReportWriter(ABC):
+    """
+    Appends rows of a report to a file. Use it as a context manager, or call close once every row is written.
+
+    :param Path path: the file to write. It is replaced if it exists.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.rows = 0
+
+    def write(self, report: pd.DataFrame):
+        """
+        :param DataFrame report: rows to add to the file. They should have the same columns each time.
+        """
+        if report.empty:
+            return
+        self._write(report)
+        self.rows += len(report)
+
+    @abstractmethod
+    def _write(self, report: pd.DataFrame):
+        """
+        :param DataFrame report: rows to add to the file. It is not empty.
+        """
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CSVReportWriter(ReportWriter):
+    """
+    Writes a CSV file, with a header and row numbers as DataFrame.to_csv does. Rows are numbered across writes.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+
+    def _write(self, report: pd.DataFrame):
+        report = report.set_axis(pd.RangeIndex(self.rows, self.rows + len(report)))
+        report.to_csv(self._file, header=self.rows == 0)
+
+    def close(self):
+        self._file.close()
+
+
+class JSONLinesReportWriter(ReportWriter):
+    """
+    Writes a JSON object per row. Tuples, such as ERROR_IDs, are written as lists.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._file = open(self.path, "w", encoding="utf-8")
+
+    def _write(self, report: pd.DataFrame):
+        lines = report.to_json(orient="records", lines=True, default_handler=str)
+        # some versions of pandas end the last line, others do not.
+        self._file.write(lines.rstrip("\n") + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetReportWriter(ReportWriter):
+    """
+    Writes a Parquet file with a row group per write. Every value is written as text, as in the user report,
+    so that each row group has the same schema.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._pa, self._pq = _import_pyarrow()
+        self._writer = None
+        self._columns: list[str] = []
+
+    def _write(self, report: pd.DataFrame):
+        if self._writer is None:
+            self._columns = [str(column) for column in report.columns]
+            self._writer = self._pq.ParquetWriter(self.path, self._schema())
+        table = self._pa.Table.from_pandas(
+            report.astype(str), schema=self._schema(), preserve_index=False
+        )
+        self._writer.write_table(table)
+
+    def _schema(self):
+        return self._pa.schema(
+            [(column, self._pa.string()) for column in self._columns]
+        )
+
+    def close(self):
+        if self._writer is None:
+            # a report without issues is still a valid, empty, file.
+            self._writer = self._pq.ParquetWriter(self.path, self._schema())
+        self._writer.close()
+
+
+# writer of each format, keyed by the file extension that selects it.
+FORMATS = {
+    "csv": CSVReportWriter,
+    "jsonl": JSONLinesReportWriter,
+    "parquet": ParquetReportWriter,
+}
+
+
+def check_format(file_format: str):
+    """
+    :param str file_format: csv, jsonl or parquet.
+    :raises ValueError: if the format is not known.
+    :raises ImportError: if the format requires pyarrow and it is not installed.
+    """
+    if file_format not in FORMATS:
+        raise ValueError(
+            f"Unknown report format {file_format}, expected one of {', '.join(FORMATS)}"
+        )
+    if file_format == "parquet":
+        _import_pyarrow()
+
+
+def report_writer(path: Path, file_format: Optional[str] = None) -> ReportWriter:
+    """
+    :param Path path: the file to write.
+    :param str file_format: csv, jsonl or parquet. Taken from the extension of path if None.
+    :returns: a writer of that format.
+    :rtype: ReportWriter
+    :raises ValueError: if the format is not known.
+    :raises ImportError: if the format requires pyarrow and it is not installed.
+    """
+    file_format = file_format or Path(path).suffix.lstrip(".").lower()
+    check_format(file_format)
+    return FORMATS[file_format](path)
@@ -0,0 +1,231 @@
+import base64
+import gzip
+import io
+import json
+
+import pandas as pd
+
+# Compact form of the validation results that the RPC app sends to the frontend.
+#
+# The default "records" form repeats every column name in every row and the rule description in every issue.
+# In the "compact" form:
+# - tables are split into their column names and rows of values, as in DataFrame.to_json(orient="split").
+# - rule descriptions are sent once, in the "rules" lookup of rule code to description.
+# - tables_affected and columns_affected hold positions in the "tables" and "columns" lookups.
+# The compact payload can also be gzipped, or have its tables written as Arrow IPC streams (requires pyarrow).
+# Both are then base64-encoded so that they can be sent as json.
+
+RESPONSE_FORMATS = ["records", "compact"]
+ENCODINGS = ["json", "gzip", "arrow"]
+
+# the issue reports of a cin_validate response.
+REPORTS = ["issue_locations", "multichild_issues", "user_report"]
+
+# columns whose values are replaced by their position in a lookup, mapped to the name of that lookup.
+ENCODED_COLUMNS = {"tables_affected": "tables", "columns_affected": "columns"}
+
+
+def check_format(response_format: str, encoding: str):
+    """
+    :param str response_format: one of RESPONSE_FORMATS.
+    :param str encoding: one of ENCODINGS. Only used by the compact format.
+    :raises ValueError: if either is not known.
+    """
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(
+            f"Unknown response format {response_format}, expected one of {RESPONSE_FORMATS}"
+        )
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown encoding {encoding}, expected one of {ENCODINGS}")
+
+
+class CompactEncoder:
+    """
+    Builds the lookups that the tables of one response share, and encodes the tables with them.
+
+    :param str encoding: "json", "gzip" or "arrow".
+    """
+
+    def __init__(self, encoding: str = "json"):
+        check_format("compact", encoding)
+        self.encoding = encoding
+        self.rules: dict[str, str] = {}
+        self.lookups: dict[str, list[str]] = {
+            name: [] for name in ENCODED_COLUMNS.values()
+        }
+        self._positions: dict[str, dict[str, int]] = {
+            name: {} for name in ENCODED_COLUMNS.values()
+        }
+
+    def _encode_column(self, values: pd.Series, lookup: str) -> pd.Series:
+        positions = self._positions[lookup]
+        for value in values.dropna().unique():
+            if value not in positions:
+                positions[value] = len(self.lookups[lookup])
+                self.lookups[lookup].append(value)
+        return values.map(positions).astype("Int64")
+
+    def normalise(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Moves rule descriptions to the rules lookup and replaces table and column names by their positions.
+
+        :param DataFrame df: an issue report, such as full_issue_df or user_report.
+        :returns: a copy of the report without rule_description.
+        :rtype: DataFrame
+        """
+        df = df.copy()
+        if {"rule_code", "rule_description"}.issubset(df.columns):
+            described = df.drop_duplicates("rule_code")
+            self.rules.update(
+                zip(described["rule_code"].astype(str), described["rule_description"])
+            )
+            df = df.drop(columns="rule_description")
+        for column, lookup in ENCODED_COLUMNS.items():
+            if column in df.columns:
+                df[column] = self._encode_column(df[column], lookup)
+        return df
+
+    def table(self, df: pd.DataFrame):
+        """
+        :param DataFrame df: any table of the response.
+        :returns: the table split into columns and rows, or an Arrow IPC stream when the encoding is arrow.
+        :rtype: dict or str
+        """
+        if self.encoding == "arrow":
+            return to_arrow(df)
+        return json.loads(df.to_json(orient="split", index=False))
+
+    def payload(self, tables: dict) -> dict:
+        """
+        :param dict tables: the encoded tables of the response, keyed by name. Values may be dicts of tables.
+        :returns: the response, with the lookups that its tables refer to.
+        :rtype: dict
+        """
+        payload = {
+            "rules": self.rules,
+            **self.lookups,
+            **tables,
+        }
+        if self.encoding == "gzip":
+            compressed = gzip.compress(json.dumps(payload).encode("utf-8"))
+            return {
+                "format": "compact",
+                "encoding": "gzip",
+                "payload": base64.b64encode(compressed).decode("ascii"),
+            }
+        return {"format": "compact", "encoding": self.encoding, **payload}
+
+
+def to_arrow(df: pd.DataFrame) -> str:
+    """
+    :param DataFrame df: the table to encode.
+    :returns: the table as a base64-encoded Arrow IPC stream.
+    :rtype: str
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "The arrow encoding requires pyarrow, which is not a dependency of this package: pip install pyarrow"
+        ) from e
+
+    # object columns can mix types, e.g. dates and strings, which arrow cannot store in one column.
+    df = df.astype(
+        {column: "string" for column in df.columns if df[column].dtype == object}
+    )
+    sink = io.BytesIO()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode("ascii")
+
+
+def compact_data_tables(
+    tables: dict[str, pd.DataFrame], encoding: str = "json"
+) -> dict:
+    """
+    :param dict tables: the CIN tables converted from an upload, keyed by table name.
+    :param str encoding: "json", "gzip" or "arrow".
+    :returns: the compact form of the tables, as returned by generate_tables.
+    :rtype: dict
+    """
+    encoder = CompactEncoder(encoding)
+    return encoder.payload(
+        {
+            "data_tables": {
+                table_name: encoder.table(table_df)
+                for table_name, table_df in tables.items()
+            }
+        }
+    )
+
+
+def compact_validation_results(
+    validator, data: dict[str, pd.DataFrame], encoding: str = "json"
+) -> dict:
+    """
+    :param CinValidator validator: the validator that has been run.
+    :param dict data: the CIN tables, as converted from the upload, keyed by table name.
+    :param str encoding: "json", "gzip" or "arrow".
+    :returns: the compact form of the results returned by cin_validate.
+    :rtype: dict
+    """
+    encoder = CompactEncoder(encoding)
+    reports = [
+        validator.full_issue_df,
+        validator.multichild_issues,
+        validator.user_report,
+    ]
+    tables = {
+        name: encoder.table(encoder.normalise(report))
+        for name, report in zip(REPORTS, reports)
+    }
+    tables["data_tables"] = {
+        table_name: encoder.table(table_df) for table_name, table_df in data.items()
+    }
+    return encoder.payload(tables)
+
+
+def expand_compact(response: dict) -> dict:
+    """
+    Turns a compact response back into DataFrames with the names and descriptions filled in.
+    Shows how the frontend reads the format. Used in tests. Does not read the arrow encoding.
+
+    :param dict response: as returned by compact_validation_results or compact_data_tables.
+    :returns: DataFrame of each report, and a dict of DataFrames for data_tables.
+    :rtype: dict
+    """
+    if response["encoding"] == "gzip":
+        payload = json.loads(gzip.decompress(base64.b64decode(response["payload"])))
+    elif response["encoding"] == "json":
+        payload = response
+    else:
+        raise ValueError(f"Cannot expand the {response['encoding']} encoding")
+
+    def expand(table: dict) -> pd.DataFrame:
+        df = pd.DataFrame(table["data"], columns=table["columns"])
+        for column, lookup in ENCODED_COLUMNS.items():
+            if column in df.columns:
+                names = dict(enumerate(payload[lookup]))
+                df[column] = df[column].map(names)
+        if "rule_code" in df.columns:
+            df["rule_description"] = df["rule_code"].astype(str).map(payload["rules"])
+        return df
+
+    expanded: dict = {
+        name: expand(payload[name]) for name in REPORTS if name in payload
+    }
+    if "data_tables" in payload:
+        expanded["data_tables"] = {
+            name: expand(table) for name, table in payload["data_tables"].items()
+        }
+    return expanded
+
+
+def response_size(response) -> int:
+    """
+    :param response: a response of the RPC app.
+    :returns: number of bytes in its json serialisation, as sent to the frontend.
+    :rtype: int
+    """
+    return len(json.dumps(response).encode("utf-8"))
@@ -0,0 +1,179 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Validation results kept by the RPC app so that the frontend can fetch them a page at a time.
+# The rows of each report are indexed by the values of the columns they can be filtered on, so a
+# filtered query only touches the rows that match.
+
+# what each report can be filtered by, mapped to the column that holds it.
+REPORT_FILTERS = {
+    "issue_locations": {
+        "rule_code": "rule_code",
+        "table": "tables_affected",
+        "child_id": "child_id",
+    },
+    "user_report": {
+        "rule_code": "rule_code",
+        "table": "tables_affected",
+        "child_id": "LAchildID",
+    },
+    "multichild_issues": {"rule_code": "rule_code"},
+}
+DATA_TABLE_FILTERS = {"child_id": "LAchildID"}
+
+
+class IndexedTable:
+    """
+    A table with an index, for each filterable column, of the row positions where each value occurs.
+
+    :param DataFrame df: the table.
+    :param dict filters: names that queries can filter by, mapped to the column they refer to.
+        Filters whose column is missing from the table match no rows.
+    """
+
+    def __init__(self, df: pd.DataFrame, filters: dict[str, str]):
+        self.df = df.reset_index(drop=True)
+        self.filters = filters
+        self.index: dict[str, dict[str, np.ndarray]] = {
+            name: self._index_column(column) for name, column in filters.items()
+        }
+
+    def _index_column(self, column: str) -> dict[str, np.ndarray]:
+        if column not in self.df.columns:
+            return {}
+        values = self.df[column]
+        # values are compared as strings, e.g. rule codes can be stored as int or str.
+        keys = values.astype(str).where(values.notna())
+        return keys.groupby(keys, sort=False).indices
+
+    def __len__(self):
+        return len(self.df)
+
+    def positions(self, **filters) -> Optional[np.ndarray]:
+        """
+        :param filters: values to filter by, keyed by filter name. None values are ignored.
+        :returns: sorted positions of the rows that match every filter, None if no filter was given.
+        :rtype: ndarray
+        :raises ValueError: if a filter name is not known.
+        """
+        matches = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name not in self.index:
+                raise ValueError(
+                    f"Cannot filter by {name}, expected one of {list(self.filters)}"
+                )
+            matches.append(self.index[name].get(str(value), np.array([], dtype=int)))
+        if not matches:
+            return None
+
+        # intersecting from the smallest match keeps the work proportional to the result.
+        matches.sort(key=len)
+        result = matches[0]
+        for match in matches[1:]:
+            result = result[np.isin(result, match, assume_unique=True)]
+        return np.sort(result)
+
+    def query(self, offset: int = 0, limit: int = 100, **filters):
+        """
+        :param int offset: number of matching rows to skip.
+        :param int limit: the most rows returned.
+        :param filters: values to filter by, keyed by filter name.
+        :returns: a page of matching rows and the number of rows that match.
+        :rtype: tuple of DataFrame and int
+        """
+        positions = self.positions(**filters)
+        if positions is None:
+            return self.df.iloc[offset : offset + limit], len(self.df)
+        return self.df.iloc[positions[offset : offset + limit]], len(positions)
+
+
+class StoredResult:
+    """
+    The reports and data of one validation, indexed for queries.
+
+    :param dict reports: issue_locations, user_report and multichild_issues DataFrames.
+    :param dict data_tables: the CIN tables, keyed by table name, as sent to the frontend.
+    """
+
+    def __init__(
+        self, reports: dict[str, pd.DataFrame], data_tables: dict[str, pd.DataFrame]
+    ):
+        self.reports = {
+            name: IndexedTable(report, REPORT_FILTERS[name])
+            for name, report in reports.items()
+        }
+        self.data_tables = {
+            name: IndexedTable(table, DATA_TABLE_FILTERS)
+            for name, table in data_tables.items()
+        }
+
+    def summary(self) -> dict:
+        """
+        :returns: the number of rows of each report and data table, and of issues for each rule and table.
+        :rtype: dict
+        """
+        user_report = self.reports["user_report"]
+        return {
+            "rows": {name: len(report) for name, report in self.reports.items()},
+            "data_table_rows": {
+                name: len(table) for name, table in self.data_tables.items()
+            },
+            "issues_per_rule": {
+                code: len(rows) for code, rows in user_report.index["rule_code"].items()
+            },
+            "issues_per_table": {
+                table: len(rows) for table, rows in user_report.index["table"].items()
+            },
+        }
+
+
+class ResultStore:
+    """
+    Keeps the most recent validation results, under an ID that queries refer to.
+    It can be shared by threads, e.g. the background validations of the RPC app.
+
+    :param int max_results: the most results kept. The least recently used is dropped first.
+    """
+
+    def __init__(self, max_results: int = 4):
+        self.max_results = max_results
+        self._results: OrderedDict[str, StoredResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def add(self, result: StoredResult) -> str:
+        """
+        :param StoredResult result: the result to keep.
+        :returns: the ID of the result.
+        :rtype: str
+        """
+        result_id = uuid.uuid4().hex
+        with self._lock:
+            self._results[result_id] = result
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+        return result_id
+
+    def get(self, result_id: str) -> StoredResult:
+        """
+        :param str result_id: as returned by add.
+        :returns: the stored result.
+        :rtype: StoredResult
+        :raises KeyError: if the result is unknown or has been dropped, so the validation must be run again.
+        """
+        with self._lock:
+            if result_id not in self._results:
+                raise KeyError(
+                    f"No stored result {result_id}, it may have been replaced by newer results"
+                )
+            self._results.move_to_end(result_id)
+            return self._results[result_id]
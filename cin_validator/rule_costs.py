@@ -0,0 +1,87 @@
+import json
+import os
+import statistics
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+# How long each rule has taken to run, so that validations can run the cheapest rules first and show
+# most issues early. Costs are a moving average of recorded run times, keyed by rule code.
+
+# weight of the latest run time in the moving average.
+SMOOTHING = 0.3
+
+
+class RuleCosts:
+    """
+    Run time history of rules.
+
+    :param Path path: json file that the history is read from, if it exists, and saved to.
+        If None, the history is only kept in memory.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else None
+        self.seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            try:
+                self.seconds = json.loads(self.path.read_text())
+            except ValueError:
+                # the history only orders rules, so a damaged file is started again.
+                self.seconds = {}
+
+    def record(self, code: str, seconds: float):
+        """
+        :param str code: the rule that has run.
+        :param float seconds: how long it took.
+        """
+        code = str(code)
+        with self._lock:
+            previous = self.seconds.get(code)
+            self.seconds[code] = (
+                seconds
+                if previous is None
+                else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+            )
+
+    def cost(self, code: str) -> Optional[float]:
+        """
+        :param str code: a rule code.
+        :returns: the average run time of the rule, None if it has not been recorded.
+        :rtype: float
+        """
+        return self.seconds.get(str(code))
+
+    def order(self, rules: Iterable) -> list:
+        """
+        :param list rules: RuleDefinitions.
+        :returns: the rules from cheapest to most expensive. Rules without history are given the median
+            cost, so that they run neither first nor last. Rules of equal cost keep their order.
+        :rtype: list
+        """
+        rules = list(rules)
+        known = [
+            self.cost(rule.code) for rule in rules if self.cost(rule.code) is not None
+        ]
+        if not known:
+            return rules
+        default = statistics.median(known)
+
+        def cost(rule):
+            rule_cost = self.cost(rule.code)
+            return default if rule_cost is None else rule_cost
+
+        return sorted(rules, key=cost)
+
+    def save(self):
+        """
+        Writes the history to path. The file is replaced in one step, so that it is never read half written.
+        """
+        if self.path is None:
+            raise ValueError("RuleCosts without a path cannot be saved")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(f"{self.path.name}.partial")
+        with self._lock:
+            partial.write_text(json.dumps(self.seconds, indent=2, sort_keys=True))
+            os.replace(partial, self.path)
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
+from cin_validator.code_lists import get_code_lists
 from cin_validator.rule_engine import CINTable, RuleDefinition
 from cin_validator.utils import create_issue_locs
 
@@ -47,7 +48,7 @@ class RuleContext:
     >LA level rules contain checks for a whole local authority.
     """
 
-    def __init__(self, definition: RuleDefinition):
+    def __init__(self, definition: RuleDefinition, ruleset: Optional[str] = None):
         """
         Initialises RuleContext class.
 
@@ -56,9 +57,12 @@ class RuleContext:
         :param list issues: Empty list to be populated with type 0 and 1 issues.
         :param list type2_issues: Empty list to be populated with type 2 issues.
         :param list type3_issues: Empty list to be populated with type 3 issues.
+        :param str ruleset: name of the rule folder being run, e.g. cin2024_25. Decides the code lists that
+            the rule checks values against.
         """
 
         self.__definition = definition
+        self.__ruleset = ruleset
 
         self.__issues: list = []
         self.__type1_issues: list = []
@@ -77,6 +81,17 @@ class RuleContext:
 
         return self.__definition
 
+    @property
+    def code_lists(self) -> dict[str, list[str]]:
+        """
+        Valid codes of the coded fields in the ruleset being run, as used by process_data.
+        The most recent lists if no ruleset was given, e.g. in test_validate functions.
+
+        :returns: valid codes mapped to the name of the column they apply to.
+        :rtype: dict
+        """
+        return get_code_lists(self.__ruleset)
+
     # TODO create list of rules according to types to prevent checking all attributes each time a rule is run.
     # Possibly classify rule code by adding it to a list of rules with a similar type, when push is done.
 
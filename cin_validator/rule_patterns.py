@@ -0,0 +1,356 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping, Optional
+
+import pandas as pd
+
+from cin_validator.rule_engine import (
+    CINTable,
+    RuleContext,
+    RuleType,
+    rule_definition,
+)
+from cin_validator.utils import group_codes, make_census_period
+
+# Declarative specifications of the rule shapes listed in Documentation/RULE_PATTERNS.MD.
+# A spec says what must hold for a table. compile() turns it into a rule function that evaluates
+# the check on whole columns at once and pushes the failing rows into the RuleContext.
+
+Header = CINTable.Header
+ReferenceDate = Header.ReferenceDate
+
+
+def group_error_rows(df: pd.DataFrame, error_id: Iterable[str]) -> pd.DataFrame:
+    """
+    Groups the row positions of failing rows by their ERROR_ID, as expected by push_type_1/2/3.
+
+    :param DataFrame df: the failing rows. Their index holds the row positions in the original table.
+    :param list error_id: the columns whose values make up the ERROR_ID of each row.
+    :returns: DataFrame with an ERROR_ID column and a ROW_ID column that contains lists of row positions.
+    :rtype: DataFrame
+    """
+    df_issues = pd.DataFrame(
+        {
+            "ERROR_ID": tuple(zip(*(df[column] for column in error_id))),
+            "ROW_ID": df.index,
+        }
+    )
+    return (
+        df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
+        .apply(list)
+        .reset_index()
+    )
+
+
+class TablePattern(ABC):
+    """
+    Base class of specs that only look at the rows of one table.
+
+    Their check is split into failing(), which finds the failing rows without modifying the table,
+    and push(), which reports them. This allows the planner in cin_validator/planner.py to check
+    several such rules against one copy of their table.
+    """
+
+    table: CINTable
+
+    @abstractmethod
+    def failing(
+        self, df: pd.DataFrame, data_container: Mapping[CINTable, pd.DataFrame]
+    ) -> pd.Series:
+        """
+        :param DataFrame df: the table that the spec applies to. It must not be modified.
+        :param dict data_container: all the tables, for specs that need reference values such as the ReferenceDate.
+        :returns: True for every row of df that fails the check.
+        :rtype: Series
+        """
+
+    @abstractmethod
+    def push(self, df: pd.DataFrame, failing: pd.Series, rule_context: RuleContext):
+        """
+        :param DataFrame df: the table that the spec applies to.
+        :param Series failing: the result of failing() for df.
+        :param RuleContext rule_context: where the issues are pushed to.
+        """
+
+    def compile(self) -> Callable:
+        def validate(
+            data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
+        ):
+            df = data_container[self.table]
+            self.push(df, self.failing(df, data_container), rule_context)
+
+        return validate
+
+
+@dataclass(frozen=True)
+class RowCheck(TablePattern):
+    """
+    Rows of <table> for which <predicate> is True fail, and are reported on <column>. Type 0.
+    For single-column checks that none of the other shapes describe.
+
+    :param CINTable table: the table that is checked.
+    :param str column: the column that the issues are reported on.
+    :param function predicate: takes the table and returns True for each failing row.
+        It must not modify the table.
+    """
+
+    table: CINTable
+    column: str
+    predicate: Callable[[pd.DataFrame], pd.Series]
+
+    def failing(self, df, data_container):
+        return self.predicate(df)
+
+    def push(self, df, failing, rule_context):
+        rule_context.push_issue(
+            table=self.table, field=self.column, row=df.index[failing]
+        )
+
+
+@dataclass(frozen=True)
+class ValuePresent(TablePattern):
+    """
+    <column> must be present. Type 0.
+
+    :param CINTable table: the table that is checked.
+    :param str column: the column that must have a value.
+    """
+
+    table: CINTable
+    column: str
+
+    def failing(self, df, data_container):
+        return df[self.column].isna()
+
+    def push(self, df, failing, rule_context):
+        rule_context.push_issue(
+            table=self.table, field=self.column, row=df.index[failing]
+        )
+
+
+@dataclass(frozen=True)
+class ValueUnique(TablePattern):
+    """
+    Each value of <column> must be unique within the table. Type 0.
+    Every row that shares its value with another row fails.
+
+    :param CINTable table: the table that is checked.
+    :param str column: the column whose values must be unique.
+    """
+
+    table: CINTable
+    column: str
+
+    def failing(self, df, data_container):
+        return df.duplicated(subset=[self.column], keep=False)
+
+    def push(self, df, failing, rule_context):
+        rule_context.push_issue(
+            table=self.table, field=self.column, row=df.index[failing]
+        )
+
+
+@dataclass(frozen=True)
+class DateOnOrAfter(TablePattern):
+    """
+    If both are present, <column> must be on or after <reference> in the same row. Type 1.
+
+    :param CINTable table: the table that is checked.
+    :param str column: the date that must be on or after the reference.
+    :param str reference: the date that is compared against.
+    :param list error_id: the columns that identify a failing row in the report.
+    """
+
+    table: CINTable
+    column: str
+    reference: str
+    error_id: tuple
+
+    def failing(self, df, data_container):
+        # comparisons with missing dates are False so rows without both dates pass.
+        return df[self.reference] > df[self.column]
+
+    def push(self, df, failing, rule_context):
+        df_issues = group_error_rows(df[failing], self.error_id)
+        rule_context.push_type_1(
+            table=self.table, columns=[self.reference, self.column], row_df=df_issues
+        )
+
+
+@dataclass(frozen=True)
+class WithinCensusPeriod(TablePattern):
+    """
+    If present, <column> must be within the census period. Type 0.
+
+    :param CINTable table: the table that is checked.
+    :param str column: the date that is checked.
+    :param bool check_start: whether dates before the collection start also fail.
+        If False, only dates after the collection end fail.
+    """
+
+    table: CINTable
+    column: str
+    check_start: bool = True
+
+    def failing(self, df, data_container):
+        collection_start, collection_end = make_census_period(
+            data_container[Header][ReferenceDate]
+        )
+        dates = df[self.column]
+        outside = dates > collection_end
+        if self.check_start:
+            outside |= dates < collection_start
+        return dates.notna() & outside
+
+    def push(self, df, failing, rule_context):
+        rule_context.push_issue(
+            table=self.table, field=self.column, row=df.index[failing]
+        )
+
+
+@dataclass(frozen=True)
+class OnlyOneInGroup(TablePattern):
+    """
+    Within each group there must be only one row where <column> is missing. Type 3.
+    Every row of a failing group is flagged.
+
+    :param CINTable table: the table that is checked.
+    :param str column: the column whose missing values are counted.
+    :param list group: the columns that define a group. They also make up the ERROR_ID.
+    """
+
+    table: CINTable
+    column: str
+    group: tuple
+
+    def failing(self, df, data_container):
+        groups = group_codes(df, list(self.group))
+        counts = groups[df[self.column].isna()].value_counts()
+        return groups.isin(counts[counts > 1].index)
+
+    def push(self, df, failing, rule_context):
+        df_issues = group_error_rows(df[failing], self.group)
+        rule_context.push_type_3(
+            table=self.table, columns=[self.column], row_df=df_issues
+        )
+
+
+@dataclass(frozen=True)
+class EitherOr(TablePattern):
+    """
+    Either <first> or <second> must be present, but not both. Type 1.
+
+    :param CINTable table: the table that is checked.
+    :param str first: one of the two columns.
+    :param str second: the other column.
+    :param list error_id: the columns that identify a failing row in the report.
+    """
+
+    table: CINTable
+    first: str
+    second: str
+    error_id: tuple
+
+    def failing(self, df, data_container):
+        return df[self.first].notna() == df[self.second].notna()
+
+    def push(self, df, failing, rule_context):
+        df_issues = group_error_rows(df[failing], self.error_id)
+        rule_context.push_type_1(
+            table=self.table, columns=[self.first, self.second], row_df=df_issues
+        )
+
+
+@dataclass(frozen=True)
+class ModuleMustExist:
+    """
+    Each row of <table> must have at least one row in <other> with the same key. Type 2.
+
+    :param CINTable table: the table whose rows are checked.
+    :param CINTable other: the module that must exist.
+    :param list key: the columns that link the two tables. They also make up the ERROR_ID.
+    """
+
+    table: CINTable
+    other: CINTable
+    key: tuple
+
+    def compile(self) -> Callable:
+        table, other, key = self.table, self.other, list(self.key)
+
+        def validate(
+            data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
+        ):
+            df = data_container[table]
+            df_other = data_container[other]
+            if len(key) == 1:
+                linked = df[key[0]].isin(df_other[key[0]])
+            else:
+                linked = pd.MultiIndex.from_frame(df[key]).isin(
+                    pd.MultiIndex.from_frame(df_other[key])
+                )
+            df_issues = group_error_rows(df[~linked], key)
+            rule_context.push_type_2(table=table, columns=key, row_df=df_issues)
+
+        return validate
+
+
+@dataclass(frozen=True)
+class ReturnCounts:
+    """
+    Counts are taken over the whole return, and the return fails at LA level if <flagged> is True for them.
+    Counts of parts of a return add up to the counts of the whole return, so cin_validator/chunked.py can
+    take them one batch of children at a time.
+
+    :param function count: takes the data container and returns a dict of counts. It must not modify the tables.
+    :param function flagged: takes the counts of the return and returns True if the return fails.
+    """
+
+    count: Callable[[Mapping[CINTable, pd.DataFrame]], dict]
+    flagged: Callable[[dict], bool]
+
+    def compile(self) -> Callable:
+        count, flagged = self.count, self.flagged
+
+        def validate(
+            data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
+        ):
+            if flagged(count(data_container)):
+                rule_context.push_la_level(
+                    rule_context.definition.code, rule_context.definition.message
+                )
+
+        return validate
+
+
+def pattern_rule(
+    spec,
+    code: str,
+    module: CINTable,
+    rule_type: RuleType = RuleType.ERROR,
+    message: Optional[str] = None,
+    affected_fields: Optional[Iterable] = None,
+) -> Callable:
+    """
+    Creates a validation rule from a spec. The result can be used wherever a function
+    decorated with rule_definition is expected, e.g. as the validate function of a rule file.
+
+    :param spec: an instance of one of the pattern classes in this module.
+    :param str code: The rule code.
+    :param CINTable module: The module/table that the rule belongs to.
+    :param RuleType rule_type: whether the rule is an error or a query.
+    :param str message: The message displayed for the rule.
+    :param list affected_fields: The fields/columns affected by the rule.
+    :returns: the compiled rule function, with its RuleDefinition attached.
+    :rtype: function
+    """
+    func = spec.compile()
+    # the planner recognises single-table rules by the spec they were compiled from.
+    func.__pattern__ = spec
+    return rule_definition(
+        code=code,
+        module=module,
+        rule_type=rule_type,
+        message=message,
+        affected_fields=affected_fields,
+    )(func)
@@ -2,7 +2,14 @@ from pathlib import Path
 
 from cin_validator.rules.ruleset_utils import extract_validator_functions
 
-files = Path(__file__).parent.glob("*.py")
-registry = extract_validator_functions(files)
+
+def __getattr__(name):
+    # the registry is built on first use, so that importing one rule file doesn't import all the others.
+    if name == "registry":
+        files = Path(__file__).parent.glob("*.py")
+        globals()["registry"] = extract_validator_functions(files)
+        return globals()["registry"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["registry"]
@@ -9,6 +9,7 @@ from cin_validator.rule_engine import (
     rule_definition,
 )
 from cin_validator.test_engine import run_rule
+from cin_validator.timeline import EpisodeTimeline, day_numbers
 
 Assessments = CINTable.Assessments
 AssessmentActualStartDate = Assessments.AssessmentActualStartDate
@@ -33,56 +34,53 @@ CINdetailsID = CINdetails.CINdetailsID
 def validate(
     data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
 ):
-    df_ass = data_container[Assessments].copy()
-    df_refs = data_container[CINdetails].copy()
-
-    df_ass.index.name = "ROW_ID"
-    df_refs.index.name = "ROW_ID"
-
-    df_ass.reset_index(inplace=True)
-    df_refs.reset_index(inplace=True)
+    df_ass = data_container[Assessments]
+    df_refs = data_container[CINdetails]
 
     # Where present, the <AssessmentActualStartDate> (N00159) should be on or after the <CINReferralDate> (N00100)
     # Issues dfs should return rows where Assessment Start Date is less than the Referral Start Date
-    df_ass = df_ass[df_ass[AssessmentActualStartDate].notna()]
-    df_refs = df_refs[df_refs[CINreferralDate].notna()]
 
-    #  Merge tables to get corresponding Assessment group and referrals
-    df_merged = df_ass.merge(
-        df_refs,
-        left_on=["LAchildID", "CINdetailsID"],
-        right_on=["LAchildID", "CINdetailsID"],
-        how="left",
-        suffixes=("_ass", "_refs"),
+    # place every assessment start date on the timeline of its CIN episode.
+    timeline = EpisodeTimeline(
+        data_container, fields={Assessments: [AssessmentActualStartDate]}
     )
 
-    #  Get rows where Assessment Start Date is less than the Referral Start Date
-    condition = df_merged[AssessmentActualStartDate] < df_merged[CINreferralDate]
-    df_merged = df_merged[condition].reset_index()
+    df_refs = df_refs[df_refs[CINreferralDate].notna()]
+    referral_days, _ = day_numbers(df_refs[CINreferralDate])
 
-    df_merged["ERROR_ID"] = tuple(
-        zip(
-            df_merged[LAchildID],
-            df_merged[AssessmentActualStartDate],
-            df_merged[CINreferralDate],
-        )
-    )
+    # find every assessment that starts before the referral date of its own episode.
+    episodes = timeline.lookup(df_refs[LAchildID], df_refs[CINdetailsID])
+    query_positions, event_positions = timeline.events_before(episodes, referral_days)
 
-    # The merges were done on copies of fs_ass and df_refs so that the column names in dataframes themselves aren't affected by the suffixes.
-    # we can now map the suffixes columns to their corresponding source tables such that the failing ROW_IDs and ERROR_IDs exist per table.
-    df_ass_issues = (
-        df_ass.merge(df_merged, left_on="ROW_ID", right_on="ROW_ID_ass")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-    df_refs_issues = (
-        df_refs.merge(df_merged, left_on="ROW_ID", right_on="ROW_ID_refs")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
+    failing_refs = df_refs.iloc[query_positions]
+    failing_ass = df_ass.loc[timeline.rows[event_positions]]
+    df_fails = pd.DataFrame(
+        {
+            "ERROR_ID": tuple(
+                zip(
+                    failing_refs[LAchildID],
+                    failing_ass[AssessmentActualStartDate],
+                    failing_refs[CINreferralDate],
+                )
+            ),
+            "ROW_ID_ass": failing_ass.index,
+            "ROW_ID_refs": failing_refs.index,
+        }
     )
 
+    # each pair of an assessment and a referral is one failure, whose rows are listed per table.
+    def table_issues(row_column):
+        return (
+            df_fails.sort_values(row_column, kind="stable")
+            .groupby("ERROR_ID", group_keys=False)[row_column]
+            .apply(list)
+            .reset_index()
+            .rename(columns={row_column: "ROW_ID"})
+        )
+
+    df_ass_issues = table_issues("ROW_ID_ass")
+    df_refs_issues = table_issues("ROW_ID_refs")
+
     # Ensure that you maintain the ROW_ID, and ERROR_ID column names which are shown above. They are keywords in this project.
     rule_context.push_type_2(
         table=Assessments, columns=[AssessmentActualStartDate], row_df=df_ass_issues
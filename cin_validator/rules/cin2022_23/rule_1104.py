@@ -4,6 +4,7 @@ import pandas as pd
 
 from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
 from cin_validator.test_engine import run_rule
+from cin_validator.timeline import EpisodeTimeline, day_numbers
 
 Section47 = CINTable.Section47
 DateOfInitialCPC = Section47.DateOfInitialCPC
@@ -29,50 +30,48 @@ def validate(
     df_cin = data_container[CINdetails]
     df_47 = data_container[Section47]
 
-    df_cin.index.name = "ROW_ID"
-    df_47.index.name = "ROW_ID"
-
-    df_cin.reset_index(inplace=True)
-    df_47.reset_index(inplace=True)
-
     # Where present, the <DateOfInitialCPC> (N00110) should be on or after <CINreferralDate> (N00100)
-    df_47 = df_47[df_47[DateOfInitialCPC].notna()]
-    # get only relevant rows in df_47 (line above) and relevant columns in CIN
-    # (line below: prevent the other DateOfInitialCPC from coming along in the merge else DateOfInitialCPC column name
-    # will depend on whether the same name in present in the CINdetails table and that is out of scope for this rule.)
-    df_cin_filtered = df_cin[["ROW_ID", LAchildID, CINdetailsID, CINreferralDate]]
-
-    merged_df = df_47.copy().merge(
-        df_cin_filtered,
-        on=[LAchildID, CINdetailsID],
-        how="left",
-        suffixes=["_47", "_cin"],
-    )
 
-    # check that the the dates being compared existed in the same CIN event period and belong to the same child.
-    condition = merged_df[DateOfInitialCPC] < merged_df[CINreferralDate]
+    # place the DateOfInitialCPC of every Section47 module on the timeline of its CIN episode.
+    # The DateOfInitialCPC of the CINdetails table is out of scope for this rule.
+    timeline = EpisodeTimeline(data_container, fields={Section47: [DateOfInitialCPC]})
+
+    df_cin = df_cin[df_cin[CINreferralDate].notna()]
+    referral_days, _ = day_numbers(df_cin[CINreferralDate])
 
-    merged_df = merged_df[condition].reset_index()
+    # find every initial CPC that is before the referral date of its own episode.
+    episodes = timeline.lookup(df_cin[LAchildID], df_cin[CINdetailsID])
+    query_positions, event_positions = timeline.events_before(episodes, referral_days)
 
+    failing_cin = df_cin.iloc[query_positions]
+    failing_47 = df_47.loc[timeline.rows[event_positions]]
     # create an identifier for each error instance.
-    merged_df["ERROR_ID"] = tuple(
-        zip(merged_df[LAchildID], merged_df[CINdetailsID], merged_df[DateOfInitialCPC])
+    df_fails = pd.DataFrame(
+        {
+            "ERROR_ID": tuple(
+                zip(
+                    failing_cin[LAchildID],
+                    failing_cin[CINdetailsID],
+                    failing_47[DateOfInitialCPC],
+                )
+            ),
+            "ROW_ID_47": failing_47.index,
+            "ROW_ID_cin": failing_cin.index,
+        }
     )
 
-    # The merges were done on copies of df_47 and df_cin so that the column names in dataframes themselves aren't affected by the suffixes.
-    # we can now map the suffixes columns to their corresponding source tables such that the failing ROW_IDs and ERROR_IDs exist per table.
-    df_47_issues = (
-        df_47.merge(merged_df, left_on="ROW_ID", right_on="ROW_ID_47")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-    df_cin_issues = (
-        df_cin.merge(merged_df, left_on="ROW_ID", right_on="ROW_ID_cin")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
+    # each pair of a Section47 module and a referral is one failure, whose rows are listed per table.
+    def table_issues(row_column):
+        return (
+            df_fails.sort_values(row_column, kind="stable")
+            .groupby("ERROR_ID", group_keys=False)[row_column]
+            .apply(list)
+            .reset_index()
+            .rename(columns={row_column: "ROW_ID"})
+        )
+
+    df_47_issues = table_issues("ROW_ID_47")
+    df_cin_issues = table_issues("ROW_ID_cin")
 
     rule_context.push_type_2(
         table=Section47, columns=[DateOfInitialCPC], row_df=df_47_issues
@@ -16,6 +16,7 @@ from cin_validator.rule_engine import (
     rule_definition,
 )
 from cin_validator.test_engine import run_rule
+from cin_validator.timeline import EpisodeTimeline, day_numbers
 
 ChildProtectionPlans = CINTable.ChildProtectionPlans
 CPPstartDate = ChildProtectionPlans.CPPstartDate
@@ -40,46 +41,51 @@ CIN_CINdetailsID = CINDetails.CINdetailsID
 def validate(
     data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
 ):
-    df_CPP = data_container[ChildProtectionPlans].copy()
-    df_CIN = data_container[CINDetails].copy()
-
-    df_CPP.index.name = "ROW_ID"
-    df_CIN.index.name = "ROW_ID"
-
-    df_CPP.reset_index(inplace=True)
-    df_CIN.reset_index(inplace=True)
+    df_CPP = data_container[ChildProtectionPlans]
+    df_CIN = data_container[CINDetails]
 
     # <CPPStartDate> (N00105) must be on or after the <CINReferralDate> (N00100)
 
-    # Remove rows without CPP start date
-    df_CPP = df_CPP[df_CPP[CPPstartDate].notna()]
-
-    df = df_CPP.merge(
-        df_CIN,
-        left_on=["LAchildID", "CINdetailsID"],
-        right_on=["LAchildID", "CINdetailsID"],
-        how="left",
-        suffixes=("_CPP", "_CIN"),
+    # place the start date of every plan on the timeline of its CIN episode.
+    timeline = EpisodeTimeline(
+        data_container, fields={ChildProtectionPlans: [CPPstartDate]}
     )
 
-    # Return those where dates don't align
-    df = df[df["CINreferralDate"] > df["CPPstartDate"]].reset_index()
+    df_CIN = df_CIN[df_CIN[CINreferralDate].notna()]
+    referral_days, _ = day_numbers(df_CIN[CINreferralDate])
 
-    df["ERROR_ID"] = tuple(zip(df["LAchildID"], df[CPPstartDate], df[CINreferralDate]))
+    # find every plan that starts before the referral date of its own episode.
+    episodes = timeline.lookup(df_CIN[CIN_LAID], df_CIN[CIN_CINdetailsID])
+    query_positions, event_positions = timeline.events_before(episodes, referral_days)
 
-    df_CPP_issues = (
-        df_CPP.merge(df, left_on="ROW_ID", right_on="ROW_ID_CPP")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
+    failing_CIN = df_CIN.iloc[query_positions]
+    failing_CPP = df_CPP.loc[timeline.rows[event_positions]]
+    df = pd.DataFrame(
+        {
+            "ERROR_ID": tuple(
+                zip(
+                    failing_CIN[CIN_LAID],
+                    failing_CPP[CPPstartDate],
+                    failing_CIN[CINreferralDate],
+                )
+            ),
+            "ROW_ID_CPP": failing_CPP.index,
+            "ROW_ID_CIN": failing_CIN.index,
+        }
     )
 
-    df_CIN_issues = (
-        df_CIN.merge(df, left_on="ROW_ID", right_on="ROW_ID_CIN")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
+    # each pair of a plan and a referral is one failure, whose rows are listed per table.
+    def table_issues(row_column):
+        return (
+            df.sort_values(row_column, kind="stable")
+            .groupby("ERROR_ID", group_keys=False)[row_column]
+            .apply(list)
+            .reset_index()
+            .rename(columns={row_column: "ROW_ID"})
+        )
+
+    df_CPP_issues = table_issues("ROW_ID_CPP")
+    df_CIN_issues = table_issues("ROW_ID_CIN")
 
     rule_context.push_type_2(
         table=ChildProtectionPlans, columns=[CPPstartDate], row_df=df_CPP_issues
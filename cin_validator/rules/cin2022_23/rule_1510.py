@@ -1,30 +1,15 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator
+from cin_validator.rule_patterns import RowCheck, pattern_rule
 from cin_validator.test_engine import run_rule
+from cin_validator.upn import read_upn_checks
 
 ChildIdentifiers = CINTable.ChildIdentifiers
 UPN = ChildIdentifiers.UPN
 
 
-@rule_definition(
-    code="1510",
-    module=CINTable.ChildIdentifiers,
-    message="UPN invalid (wrong check letter at character 1)",
-    affected_fields=[UPN],
-)
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[ChildIdentifiers]
-
+def wrong_check_letter(df: pd.DataFrame) -> pd.Series:
     """
     <UPN> (N00001) if present must contain the correct check letter
 
@@ -45,37 +30,18 @@ def validate(
     Full list avaliable here https://assets.publishing.service.gov.uk/government/uploads/system/uploads/attachment_data/file/807381/UPN_Guide_1.2.pdf
     """
 
-    df.reset_index(inplace=True)
-
-    df2 = df[["index", "UPN"]]
-    df2 = df2[(df2["UPN"].str.len() == 13) & df2["UPN"].notna()]
+    # UPNs which are 13 characters long and whose last 12 characters are digits have a check letter.
+    checks = read_upn_checks(df, UPN)
+    return checks["valid_length"] & checks["digits_2_13"] & ~checks["check_ok"]
 
-    # the reference value is the first character of the UPN string.
-    df2["FIRST_CHAR"] = df2["UPN"].str[0]
 
-    # the last 12 characters have to be digits or else the UPN cannot be considered.
-    df2["LAST_C"] = df2["UPN"].str[1:]
-    df2["LAST_C"] = df2["LAST_C"].apply(lambda x: int(x) if str(x).isdigit() else pd.NA)
-    df2 = df2[df2["LAST_C"].notna()]
-
-    # calculate check value according to rule description.
-    df2["SUMMED"] = 0
-    for i in range(1, 13):
-        # previous check was important because non-digits cannot be converted to int and hence cannot be multiplied.
-        df2["SUMMED"] = (df2["SUMMED"] + (df2["UPN"].str[i].astype(int) * (i + 1))) % 23
-
-    # enumerate object yields (index_position, element) tuples for each element in the string.
-    check_map = enumerate(list("ABCDEFGHJKLMNPQRTUVWXYZ"))
-    check_map = dict((i, j) for i, j in check_map)
-
-    # Deduce the alphabet-letter representation of the calculated value based on rule description.
-    df2["CHECK_CHAR"] = df2["SUMMED"].map(check_map)
-    # select out all the rows where the calculated value does not match the expected value.
-    df2 = df2[df2["CHECK_CHAR"].astype(str) != df2["FIRST_CHAR"].astype(str)]
-    # restore the original index.
-    failing_indices = df2.set_index("index").index
-
-    rule_context.push_issue(table=ChildIdentifiers, field=UPN, row=failing_indices)
+validate = pattern_rule(
+    RowCheck(ChildIdentifiers, UPN, wrong_check_letter),
+    code="1510",
+    module=CINTable.ChildIdentifiers,
+    message="UPN invalid (wrong check letter at character 1)",
+    affected_fields=[UPN],
+)
 
 
 def test_validate():
@@ -1,36 +1,22 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator
+from cin_validator.rule_patterns import RowCheck, pattern_rule
 from cin_validator.test_engine import run_rule
+from cin_validator.upn import read_upn_checks
 
 ChildIdentifiers = CINTable.ChildIdentifiers
 UPN = ChildIdentifiers.UPN
 
 
-@rule_definition(
-    code="1530",
-    module=CINTable.ChildIdentifiers,
-    message="UPN invalid (characters 2-4 not a recognised LA code)",
-    affected_fields=[UPN],
-)
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[ChildIdentifiers]
+def unknown_la_code(df: pd.DataFrame) -> pd.Series:
     """
-    If <UPN> (N00001) present then characters 2-4 of <UPN> must be a valid post April 1998 LA code 
-    or a recognised ‘pseudo LA’ code 
+    If <UPN> (N00001) present then characters 2-4 of <UPN> must be a valid post April 1998 LA code
+    or a recognised ‘pseudo LA’ code
 
-    001-005, 201-213, 301-320, 330-336, 340-344, 350-359, 370-373, 380-384, 390-394, 420, 660-681, 
-    701-708, 800-803, 805-808, 810-813, 815, 816, 820- 823, 825, 826, 830, 831, 835-837, 838-839, 
-    840, 841, 845, 846, 850-852, 855-857, 860, 861, 865-896, 908, 909, 916, 919, 921, 925, 
+    001-005, 201-213, 301-320, 330-336, 340-344, 350-359, 370-373, 380-384, 390-394, 420, 660-681,
+    701-708, 800-803, 805-808, 810-813, 815, 816, 820- 823, 825, 826, 830, 831, 835-837, 838-839,
+    840, 841, 845, 846, 850-852, 855-857, 860, 861, 865-896, 908, 909, 916, 919, 921, 925,
     926, 928, 929, 931, 933, 935-938, 940-941
     """
     LA_list = []
@@ -84,17 +70,20 @@ def validate(
         ]
     )
 
-    LA_list = [str(x) for x in LA_list]
+    LA_codes = [int(x) for x in LA_list]
 
-    df.reset_index(inplace=True)
-    df2 = df[["index", "UPN"]]
-    df2 = df2[(df2["UPN"].str.len() == 13) & df2["UPN"].notna()]
-    df2["C2_to_C4"] = df2["UPN"].str[1:4]
-    df2 = df2[~df2["C2_to_C4"].isin(LA_list)]
+    # characters 2-4 are read as a number. Anything that is not 3 digits is never a valid code.
+    checks = read_upn_checks(df, UPN)
+    return checks["valid_length"] & ~checks["la_code"].isin(LA_codes)
 
-    failing_indices = df2.set_index("index").index
 
-    rule_context.push_issue(table=ChildIdentifiers, field=UPN, row=failing_indices)
+validate = pattern_rule(
+    RowCheck(ChildIdentifiers, UPN, unknown_la_code),
+    code="1530",
+    module=CINTable.ChildIdentifiers,
+    message="UPN invalid (characters 2-4 not a recognised LA code)",
+    affected_fields=[UPN],
+)
 
 
 def test_validate():
@@ -1,28 +1,15 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator
+from cin_validator.rule_patterns import RowCheck, pattern_rule
 from cin_validator.test_engine import run_rule
+from cin_validator.upn import read_upn_checks
 
 ChildIdentifiers = CINTable.ChildIdentifiers
 UPN = ChildIdentifiers.UPN
 
 
-@rule_definition(
-    code="1540",
-    module=CINTable.ChildIdentifiers,
-    message="UPN invalid (characters 5-12 not all numeric)",
-    affected_fields=[UPN],
-)
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
+def non_numeric_characters(df: pd.DataFrame) -> pd.Series:
     """
     Returns indices of rows where character 5:12 of UPN contains non numerical characters.
     Does this by:
@@ -31,16 +18,19 @@ def validate(
     Slicing df according to this criteria.
     Returns indices of the rows of this df to failing_indices."""
 
-    df = data_container[ChildIdentifiers]
-
     # If <UPN> (N00001) present Characters 5-12 of <UPN> must be numeric
 
-    #  df takes a slice of rows of df where the UPN column doesn't have Na/NaN values
-    df = df.loc[df["UPN"].notna()]
+    checks = read_upn_checks(df, UPN)
+    return checks["present"] & ~checks["digits_5_12"]
 
-    failing_indices = df[~df["UPN"].str[4:12].str.isdigit()].index
 
-    rule_context.push_issue(table=ChildIdentifiers, field=UPN, row=failing_indices)
+validate = pattern_rule(
+    RowCheck(ChildIdentifiers, UPN, non_numeric_characters),
+    code="1540",
+    module=CINTable.ChildIdentifiers,
+    message="UPN invalid (characters 5-12 not all numeric)",
+    affected_fields=[UPN],
+)
 
 
 def test_validate():
@@ -1,74 +1,27 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator
+from cin_validator.rule_patterns import RowCheck, pattern_rule
 from cin_validator.test_engine import run_rule
+from cin_validator.upn import read_upn_checks
 
 ChildIdentifiers = CINTable.ChildIdentifiers
 UPN = ChildIdentifiers.UPN
 
 
-@rule_definition(
+def invalid_last_character(df: pd.DataFrame) -> pd.Series:
+    # if <UPN> (N00001)) present Character 13 of <UPN> must be numeric or A-Z omitting I, O and S
+    checks = read_upn_checks(df, UPN)
+    return checks["valid_length"] & ~checks["last_char_valid"]
+
+
+validate = pattern_rule(
+    RowCheck(ChildIdentifiers, UPN, invalid_last_character),
     code="1550",
     module=CINTable.ChildIdentifiers,
     message="UPN invalid (character 13 not a recognised value)",
     affected_fields=[UPN],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[ChildIdentifiers]
-
-    # if <UPN> (N00001)) present Character 13 of <UPN> must be numeric or A-Z omitting I, O and S
-    # Confirm length and value present
-    df2 = df[(df["UPN"].str.len() == 13) & df["UPN"].notna()]
-
-    # Valid characters
-    valid = [
-        "A",
-        "B",
-        "C",
-        "D",
-        "E",
-        "F",
-        "G",
-        "H",
-        "J",
-        "K",
-        "L",
-        "M",
-        "N",
-        "P",
-        "Q",
-        "R",
-        "T",
-        "U",
-        "V",
-        "W",
-        "Y",
-        "X",
-        "Z",
-        "0",
-        "1",
-        "2",
-        "3",
-        "4",
-        "5",
-        "6",
-        "7",
-        "8",
-        "9",
-    ]
-
-    failing_indices = df2[~df2["UPN"].str[12].isin(valid)].index
-
-    rule_context.push_issue(table=ChildIdentifiers, field=UPN, row=failing_indices)
 
 
 def test_validate():
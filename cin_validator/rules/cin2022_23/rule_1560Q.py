@@ -1,53 +1,37 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    RuleType,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator, RuleType
+from cin_validator.rule_patterns import RowCheck, pattern_rule
 from cin_validator.test_engine import run_rule
+from cin_validator.upn import read_upn_checks
 
 ChildIdentifiers = CINTable.ChildIdentifiers
 FormerUPN = ChildIdentifiers.FormerUPN
 
 
-@rule_definition(
-    code="1560Q",
-    module=CINTable.ChildIdentifiers,
-    rule_type=RuleType.QUERY,
-    message="Please check and either amend or provide a reason: Former UPN wrongly formatted",
-    affected_fields=[FormerUPN],
-)
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[ChildIdentifiers]
-
+def wrongly_formatted(df: pd.DataFrame) -> pd.Series:
     # <FormerUPN> (N00002) where present should be in the correct format, as specified in the data table
 
     # Note, there are multiple types of former UPN, there are Temporary UPNs which end in a letter, and
     # those where a child is assigned a UPN but then another is identified for them having been used previously.
     # If this was only a check for temporary UPNs, it would check that the last character was a letter. However, it checks more generally.
 
-    #  filter rows of df where the UPN column doesn't have Na/NaN values
-    df = df.loc[df[FormerUPN].notna()]
-
-    # Flag locations where FormerUPN is not 13 characters long
-    check_length = df[FormerUPN].str.len() != 13
-    # Flag locations where FormerUPN's last twelve characters do not form a full digit
-    digit_within = ~df[FormerUPN].str[1:].str.isdigit()
-    # Flag locations where FormerUPN's first character is not a letter
-    check_edges = ~df[FormerUPN].str[0].str.isalpha()
+    checks = read_upn_checks(df, FormerUPN)
+    # a well formatted FormerUPN is 13 characters long, a letter followed by twelve digits.
+    well_formatted = (
+        checks["valid_length"] & checks["digits_2_13"] & checks["first_alpha"]
+    )
+    return checks["present"] & ~well_formatted
 
-    failing_indices = df[check_length | digit_within | check_edges].index
 
-    rule_context.push_issue(
-        table=ChildIdentifiers, field=FormerUPN, row=failing_indices
-    )
+validate = pattern_rule(
+    RowCheck(ChildIdentifiers, FormerUPN, wrongly_formatted),
+    code="1560Q",
+    module=CINTable.ChildIdentifiers,
+    rule_type=RuleType.QUERY,
+    message="Please check and either amend or provide a reason: Former UPN wrongly formatted",
+    affected_fields=[FormerUPN],
+)
 
 
 def test_validate():
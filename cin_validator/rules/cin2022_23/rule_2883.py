@@ -2,7 +2,8 @@ from typing import Mapping
 
 import pandas as pd
 
-from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
+from cin_validator.rule_engine import CINTable
+from cin_validator.rule_patterns import ReturnCounts, pattern_rule
 from cin_validator.test_engine import run_rule
 from cin_validator.utils import make_census_period
 
@@ -19,17 +20,7 @@ DateOfInitialCPC = CINdetails.DateOfInitialCPC
 Section47 = CINTable.Section47
 
 
-# define characteristics of rule
-@rule_definition(
-    code="2883",
-    # module is table that seems central to the condition.
-    module=CINTable.ChildProtectionPlans,
-    message="There are more child protection plans starting than initial conferences taking place",
-    affected_fields=[CPPstartDate, DateOfInitialCPC],
-)
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
+def count(data_container: Mapping[CINTable, pd.DataFrame]) -> dict:
     df_cpp = data_container[ChildProtectionPlans]
     df_cin = data_container[CINdetails]
     df_47 = data_container[Section47]
@@ -47,31 +38,35 @@ def validate(
     within_census_cpp = (df_cpp[CPPstartDate] >= collection_start) & (
         df_cpp[CPPstartDate] <= collection_end
     )
-    df_cpp = df_cpp[present_cpp & within_census_cpp]
-    num_cpp = len(df_cpp)
+    num_cpp = int((present_cpp & within_census_cpp).sum())
 
     # filter and count DateOfInitialCPC in CINdetails
     present_cin = df_cin[DateOfInitialCPC].notna()
     within_census_cin = (df_cin[DateOfInitialCPC] >= collection_start) & (
         df_cin[DateOfInitialCPC] <= collection_end
     )
-    df_cin = df_cin[present_cin & within_census_cin]
-    num_cin = len(df_cin)
+    num_cin = int((present_cin & within_census_cin).sum())
 
     # filter and count DateOfInitialCPC in Section47
     present_47 = df_47[DateOfInitialCPC].notna()
     within_census_47 = (df_47[DateOfInitialCPC] >= collection_start) & (
         df_47[DateOfInitialCPC] <= collection_end
     )
-    df_47 = df_47[present_47 & within_census_47]
-    num_47 = len(df_47)
-
-    if num_cpp > (num_cin + num_47):
-        rule_context.push_la_level(
-            rule_context.definition.code, rule_context.definition.message
-        )
-    else:
-        pass
+    num_47 = int((present_47 & within_census_47).sum())
+
+    return {"cpp": num_cpp, "cin": num_cin, "s47": num_47}
+
+
+validate = pattern_rule(
+    ReturnCounts(
+        count, flagged=lambda counts: counts["cpp"] > counts["cin"] + counts["s47"]
+    ),
+    code="2883",
+    # module is table that seems central to the condition.
+    module=CINTable.ChildProtectionPlans,
+    message="There are more child protection plans starting than initial conferences taking place",
+    affected_fields=[CPPstartDate, DateOfInitialCPC],
+)
 
 
 def test_validate():
@@ -2,7 +2,8 @@ from typing import Mapping
 
 import pandas as pd
 
-from cin_validator.rule_engine import CINTable, RuleContext, RuleType, rule_definition
+from cin_validator.rule_engine import CINTable, RuleType
+from cin_validator.rule_patterns import ReturnCounts, pattern_rule
 from cin_validator.test_engine import run_rule
 
 Disabilities = CINTable.Disabilities
@@ -10,17 +11,7 @@ Disability = Disabilities.Disability
 LAchildID = Disabilities.LAchildID
 
 
-# define characteristics of rule
-@rule_definition(
-    code="2887Q",
-    rule_type=RuleType.QUERY,
-    module=CINTable.Disabilities,
-    message="Please check and either amend or provide a reason: Less than 8 disability codes have been used in your return",
-    affected_fields=[Disability],
-)
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
+def count(data_container: Mapping[CINTable, pd.DataFrame]) -> dict:
     df = data_container[Disabilities]
 
     # LOGIC
@@ -32,13 +23,17 @@ def validate(
     df = df[condition]
 
     # .nunique() will include NaN values so .count() is used instead which excludes NaNs.
-    num_disabilities = df[Disability].count()
-    if num_disabilities <= 7:
-        rule_context.push_la_level(
-            rule_context.definition.code, rule_context.definition.message
-        )
-    else:
-        pass
+    return {"disabilities": int(df[Disability].count())}
+
+
+validate = pattern_rule(
+    ReturnCounts(count, flagged=lambda counts: counts["disabilities"] <= 7),
+    code="2887Q",
+    rule_type=RuleType.QUERY,
+    module=CINTable.Disabilities,
+    message="Please check and either amend or provide a reason: Less than 8 disability codes have been used in your return",
+    affected_fields=[Disability],
+)
 
 
 def test_validate():
@@ -2,7 +2,8 @@ from typing import Mapping
 
 import pandas as pd
 
-from cin_validator.rule_engine import CINTable, RuleContext, RuleType, rule_definition
+from cin_validator.rule_engine import CINTable, RuleType
+from cin_validator.rule_patterns import ReturnCounts, pattern_rule
 from cin_validator.test_engine import run_rule
 
 Disabilities = CINTable.Disabilities
@@ -10,17 +11,7 @@ Disability = Disabilities.Disability
 LAchildID = Disabilities.LAchildID
 
 
-# define characteristics of rule
-@rule_definition(
-    code="2888Q",
-    rule_type=RuleType.QUERY,
-    module=CINTable.Disabilities,
-    message="Please check and either amend or provide a reason: Only one disability code is recorded per child and multiple disabilities should be recorded where possible.",
-    affected_fields=[Disability],
-)
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
+def count(data_container: Mapping[CINTable, pd.DataFrame]) -> dict:
     df = data_container[Disabilities]
 
     # LOGIC
@@ -30,15 +21,23 @@ def validate(
     # remove "NONE" values
     df = df[df[Disability] != "NONE"]
 
-    disability_count = df.groupby(LAchildID)[Disability].count()
+    # the number of disabilities recorded per child.
+    return df.groupby(LAchildID)[Disability].count().to_dict()
+
+
+def flagged(disability_count: dict) -> bool:
     # maximum number of disabilities recorded per child should be > 1
+    return bool(disability_count) and max(disability_count.values()) <= 1
 
-    if disability_count.max() <= 1:
-        rule_context.push_la_level(
-            rule_context.definition.code, rule_context.definition.message
-        )
-    else:
-        pass
+
+validate = pattern_rule(
+    ReturnCounts(count, flagged),
+    code="2888Q",
+    rule_type=RuleType.QUERY,
+    module=CINTable.Disabilities,
+    message="Please check and either amend or provide a reason: Only one disability code is recorded per child and multiple disabilities should be recorded where possible.",
+    affected_fields=[Disability],
+)
 
 
 def test_validate():
@@ -6,11 +6,10 @@ Rule message: This child is showing more than one open CIN Plan, i.e. with no En
 
 """
 
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
+from cin_validator.rule_engine import CINTable
+from cin_validator.rule_patterns import OnlyOneInGroup, pattern_rule
 from cin_validator.rules.cin2022_23.rule_8925 import LAchildID
 from cin_validator.test_engine import run_rule
 
@@ -20,46 +19,14 @@ CINPlanEndDate = CINplanDates.CINPlanEndDate
 CINdetailsID = CINplanDates.CINdetailsID
 
 
-@rule_definition(
+validate = pattern_rule(
+    # There must be only one <CINplanDates> group where the <CINPlanEnd Date> (N00690) is missing
+    OnlyOneInGroup(CINplanDates, CINPlanEndDate, group=(LAchildID, CINdetailsID)),
     code="4004",
     module=CINTable.CINplanDates,
     message="This child is showing more than one open CIN Plan, i.e. with no End Date",
     affected_fields=[CINPlanEndDate],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[CINplanDates]
-    df.index.name = "ROW_ID"
-    df.reset_index(inplace=True)
-
-    # There must be only one <CINplanDates> group where the <CINPlanEnd Date> (N00690) is missing
-    df_check = df.copy()
-    df_check = df_check[df_check[CINPlanEndDate].isna()]
-
-    # Convert NAs to 1 and count by child
-    df_check[CINPlanEndDate].fillna(1, inplace=True)
-    df_check = (
-        df_check.groupby([LAchildID, CINdetailsID])[CINPlanEndDate]
-        .count()
-        .reset_index()
-    )
-
-    # Find where there is more than 1 open end date
-    df_check = df_check[df_check[CINPlanEndDate] > 1]
-    issue_ids = tuple(zip(df_check[LAchildID], df_check[CINdetailsID]))
-
-    df["ERROR_ID"] = tuple(zip(df[LAchildID], df[CINdetailsID]))
-    df_issues = df[df.ERROR_ID.isin(issue_ids)]
-
-    df_issues = (
-        df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-    rule_context.push_type_3(
-        table=CINplanDates, columns=[CINPlanEndDate], row_df=df_issues
-    )
 
 
 def test_validate():
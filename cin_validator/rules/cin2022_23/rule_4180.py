@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import (
     CINTable,
     IssueLocator,
@@ -36,14 +37,11 @@ def validate(
 
     # implement rule logic as described by the Github issue. Put the description as a comment above the implementation as shown.
 
-    valid_gender_codes = ["1", "2", "0", "9"]
+    valid_gender_codes = rule_context.code_lists[GenderCurrent]
 
     # <GenderCurrent> (N00097) must be present and valid
 
-    failing_indices = df[
-        df[GenderCurrent].isna()
-        | (~df[GenderCurrent].astype("str").isin(valid_gender_codes))
-    ].index
+    failing_indices = df[~valid_code(df[GenderCurrent], valid_gender_codes)].index
 
     # Replace ChildIdentifiers and GenderCurrent with the table and column name concerned in your rule, respectively.
     # If there are multiple columns or table, make this sentence multiple times.
@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import (
     CINTable,
     IssueLocator,
@@ -28,33 +29,12 @@ def validate(
     <Ethnicity> (N00177) must be present and a valid code
     """
 
-    eth_list = [
-        "ABAN",
-        "AIND",
-        "AOTH",
-        "APKN",
-        "BAFR",
-        "BCRB",
-        "BOTH",
-        "CHNE",
-        "MOTH",
-        "MWAS",
-        "MWBA",
-        "MWBC",
-        "NOBT",
-        "OOTH",
-        "REFU",
-        "WBRI",
-        "WIRI",
-        "WIRT",
-        "WOTH",
-        "WROM",
-    ]
+    eth_list = rule_context.code_lists[Ethnicity]
 
     df.reset_index(inplace=True)
 
     # Ethnicity is not in list or is null.
-    df2 = df[(~df["Ethnicity"].isin(eth_list)) | df["Ethnicity"].isna()]
+    df2 = df[~valid_code(df["Ethnicity"], eth_list)]
 
     failing_indices = df2.set_index("index").index
 
@@ -8,39 +8,24 @@ Note: This rule should be evaluated at LA-level for imported data
 Rule message: More than one child record with the same LA Child ID
 
 """
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator
+from cin_validator.rule_patterns import ValueUnique, pattern_rule
 from cin_validator.test_engine import run_rule
 
 ChildIdentifiers = CINTable.ChildIdentifiers
 LAchildID = ChildIdentifiers.LAchildID
 
 
-@rule_definition(
+validate = pattern_rule(
+    # Each <LAchildID> (N00097) must be unique across all children within the same LA return
+    ValueUnique(ChildIdentifiers, LAchildID),
     code="8510",
     module=CINTable.ChildIdentifiers,
     message="More than one child record with the same LA Child ID",
     affected_fields=[LAchildID],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[ChildIdentifiers]
-
-    # Each <LAchildID> (N00097) must be unique across all children within the same LA return
-    failing_indices = df[df.duplicated(subset=[LAchildID], keep=False)].index
-
-    rule_context.push_issue(
-        table=ChildIdentifiers, field=LAchildID, row=failing_indices
-    )
 
 
 def test_validate():
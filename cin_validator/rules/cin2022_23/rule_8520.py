@@ -1,15 +1,8 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator
+from cin_validator.rule_patterns import WithinCensusPeriod, pattern_rule
 from cin_validator.test_engine import run_rule
-from cin_validator.utils import make_census_period
 
 ChildIdentifiers = CINTable.ChildIdentifiers
 Header = CINTable.Header
@@ -17,30 +10,14 @@ PersonBirthDate = ChildIdentifiers.PersonBirthDate
 ReferenceDate = Header.ReferenceDate
 
 
-@rule_definition(
+validate = pattern_rule(
+    # <PersonBirthDate> (N00066) must be on or before <ReferenceDate> (N00603) or null
+    WithinCensusPeriod(ChildIdentifiers, PersonBirthDate, check_start=False),
     code="8520",
     module=CINTable.ChildIdentifiers,
     message="Date of Birth is after data collection period (must be on or before the end of the census period)",
     affected_fields=[PersonBirthDate, ReferenceDate],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[ChildIdentifiers]
-    df_ref = data_container[Header]
-
-    ref_data_series = df_ref[ReferenceDate]
-    collection_start, collection_end = make_census_period(ref_data_series)
-
-    # <PersonBirthDate> (N00066) must be on or before <ReferenceDate> (N00603) or null
-
-    df = df[(df[PersonBirthDate] > collection_end)]
-
-    failing_indices = df.index
-
-    rule_context.push_issue(
-        table=ChildIdentifiers, field=PersonBirthDate, row=failing_indices
-    )
 
 
 def test_validate():
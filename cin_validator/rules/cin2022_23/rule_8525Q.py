@@ -1,8 +1,7 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import CINTable, RuleContext, RuleType, rule_definition
+from cin_validator.rule_engine import CINTable, RuleType
+from cin_validator.rule_patterns import EitherOr, pattern_rule
 from cin_validator.rules.cin2022_23.rule_8535Q import PersonDeathDate
 from cin_validator.test_engine import run_rule
 
@@ -12,52 +11,21 @@ ExpectedPersonBirthDate = ChildIdentifiers.ExpectedPersonBirthDate
 LAchildID = ChildIdentifiers.LAchildID
 
 
-@rule_definition(
+validate = pattern_rule(
+    # Either Date of Birth or Expected Date of Birth must be provided (but not both)
+    # LAchildID is typically unique in ChildIdentifiers so it serves as the ID, since both dates can be null.
+    EitherOr(
+        ChildIdentifiers,
+        PersonBirthDate,
+        ExpectedPersonBirthDate,
+        error_id=(LAchildID,),
+    ),
     code="8525Q",
     module=CINTable.ChildIdentifiers,
     rule_type=RuleType.QUERY,
     message="Either Date of Birth or Expected Date of Birth must be provided (but not both)",
     affected_fields=[PersonBirthDate, ExpectedPersonBirthDate],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[ChildIdentifiers]
-    df = df.drop(columns=["ROW_ID"], errors="ignore")
-    df.index.name = "ROW_ID"
-
-    # Either Date of Birth or Expected Date of Birth must be provided (but not both)
-    # condition_1 = (df[PersonBirthDate].isna() & df[ExpectedPersonBirthDate].isna())
-
-    # condition_1 = (df[PersonBirthDate].isna()) & (df[ExpectedPersonBirthDate].isna())
-    # condition_2 = df[PersonBirthDate].notna() & df[ExpectedPersonBirthDate].notna()
-    mega_condition = (
-        df[PersonBirthDate].isna() & df[ExpectedPersonBirthDate].notna()
-    ) | (df[PersonBirthDate].notna() & df[ExpectedPersonBirthDate].isna())
-
-    df_issues = df[~mega_condition].reset_index()
-
-    # (LAchildID,PersonBirthDate,ExpectedPersonBirthDate) could have been used. However, in some failing conditions,
-    # both (PersonBirthDate,ExpectedPersonBirthDate) can be null so their combination does not serve as a unique ID.
-    # Since this is the ChildIdentifiers table and LAchildID is typically unique in it. We use that to serve as a last resort ID.
-
-    link_id = tuple(
-        zip(
-            df_issues[LAchildID],
-        )
-    )
-    df_issues["ERROR_ID"] = link_id
-    df_issues = (
-        df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-
-    rule_context.push_type_1(
-        table=ChildIdentifiers,
-        columns=[PersonBirthDate, ExpectedPersonBirthDate],
-        row_df=df_issues,
-    )
 
 
 def test_validate():
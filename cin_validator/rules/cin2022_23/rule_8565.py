@@ -18,6 +18,7 @@ import pandas as pd
 
 from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
 from cin_validator.test_engine import run_rule
+from cin_validator.timeline import EpisodeTimeline, day_numbers
 
 # Get tables and columns of interest from the CINTable object defined in rule_engine/__api.py
 
@@ -69,22 +70,6 @@ def validate(
     data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
 ):
     df_cin = data_container[CINdetails]
-    df_ass = data_container[Assessments]
-    df_47 = data_container[Section47]
-    df_cpp = data_container[ChildProtectionPlans]
-    df_plan = data_container[CINplanDates]
-
-    df_cin.index.name = "ROW_ID"
-    df_ass.index.name = "ROW_ID"
-    df_47.index.name = "ROW_ID"
-    df_cpp.index.name = "ROW_ID"
-    df_plan.index.name = "ROW_ID"
-
-    df_cin.reset_index(inplace=True)
-    df_ass.reset_index(inplace=True)
-    df_47.reset_index(inplace=True)
-    df_cpp.reset_index(inplace=True)
-    df_plan.reset_index(inplace=True)
 
     # Rule details: If <CINclosureDate> (N00102) is present then it must be on or after all of the following dates that are present:
     #     <AssessmentActualStartDate> (N00159)
@@ -95,195 +80,65 @@ def validate(
     #     <CINPlanStartDate> (N00689)
     #     <CINPlanEndDate> (N00690)
 
-    # Remove rows without a CIN closure date
-    df_cin = df_cin[df_cin[CINclosureDate].notna()]
-
-    # CIN TABLE
-    df_cin["CINclosureDate"] = pd.to_datetime(
-        df_cin["CINclosureDate"], format="%d/%m/%Y", errors="coerce"
-    )
-    df_cin["DateOfInitialCPC"] = pd.to_datetime(
-        df_cin["DateOfInitialCPC"], format="%d/%m/%Y", errors="coerce"
-    )
-
-    df_cin_fail = df_cin[df_cin["CINclosureDate"] < df_cin["DateOfInitialCPC"]]
-    df_cin_fail["ERROR_ID"] = tuple(
-        zip(
-            df_cin_fail["LAchildID"],
-            df_cin_fail["CINdetailsID"],
-            df_cin_fail["CINclosureDate"],
-        )
-    )
-
-    df_cin_issues_cin = (
-        df_cin_fail.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-
-    # ASSESSMENTS TABLE
-    df_cin_ass = df_cin.merge(
-        df_ass,
-        on=["LAchildID", "CINdetailsID"],
-        how="left",
-        suffixes=["_cin", "_ass"],
-    )
-
-    df_cin_ass_fail = df_cin_ass[
-        (df_cin_ass["CINclosureDate"] < df_cin_ass["AssessmentActualStartDate"])
-        | (df_cin_ass["CINclosureDate"] < df_cin_ass["AssessmentAuthorisationDate"])
-    ]
-    df_cin_ass_fail["ERROR_ID"] = tuple(
-        zip(
-            df_cin_ass_fail["LAchildID"],
-            df_cin_ass_fail["CINdetailsID"],
-            df_cin_ass_fail["CINclosureDate"],
-        )
-    )
-
-    df_cin_issues_ass = (
-        df_cin.merge(df_cin_ass_fail, left_on="ROW_ID", right_on="ROW_ID_cin")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-    df_ass_issues = (
-        df_ass.merge(df_cin_ass_fail, left_on="ROW_ID", right_on="ROW_ID_ass")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-
-    # SECTION47 TABLE
-    df_cin_47 = df_cin.merge(
-        df_47,
-        on=["LAchildID", "CINdetailsID"],
-        how="left",
-        suffixes=["_cin", "_47"],
-    )  # both have the DateOfInitialCPC column so suffixes are applied.
-
-    df_cin_47_fail = df_cin_47[
-        (df_cin_47["CINclosureDate"] < df_cin_47["S47ActualStartDate"])
-        | (df_cin_47["CINclosureDate"] < df_cin_47["DateOfInitialCPC_47"])
-    ]
-    df_cin_47_fail["ERROR_ID"] = tuple(
-        zip(
-            df_cin_47_fail["LAchildID"],
-            df_cin_47_fail["CINdetailsID"],
-            df_cin_47_fail["CINclosureDate"],
-        )
-    )
-
-    df_cin_issues_47 = (
-        df_cin.merge(df_cin_47_fail, left_on="ROW_ID", right_on="ROW_ID_cin")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-    df_47_issues = (
-        df_47.merge(df_cin_47_fail, left_on="ROW_ID", right_on="ROW_ID_47")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-
-    # CHILDPROTECTIONPLANS TABLE
-
-    df_cpp = pd.DataFrame(
-        [
-            {
-                "LAchildID": "child1",
-                "CINdetailsID": "CINID1",
-                "CPPendDate": "27/05/2022",  # fail
-            }
-        ]
-    )
-
-    df_cpp.index.name = "ROW_ID"
-    df_cpp.reset_index(inplace=True)
-
-    df_cpp["CPPendDate"] = pd.to_datetime(
-        df_cpp["CPPendDate"], format="%d/%m/%Y", errors="coerce"
+    # place every date that must not be later than the closure date on the timeline of its CIN episode.
+    timeline = EpisodeTimeline(
+        data_container,
+        fields={
+            CINdetails: [DateOfInitialCPC],
+            Assessments: [AssessmentActualStartDate, AssessmentAuthorisationDate],
+            Section47: [S47ActualStartDate, DateOfInitialCPC],
+            ChildProtectionPlans: [CPPendDate],
+            CINplanDates: [CINPlanStartDate, CINPlanEndDate],
+        },
     )
 
-    df_cin_cpp = df_cin.merge(
-        df_cpp,
-        on=["LAchildID", "CINdetailsID"],
-        how="left",
-        suffixes=["_cin", "_cpp"],
+    # Remove rows without a CIN closure date. The dates are converted on a copy, the table itself is not changed.
+    df_cin = df_cin.assign(
+        **{
+            CINclosureDate: pd.to_datetime(
+                df_cin[CINclosureDate], format="%d/%m/%Y", errors="coerce"
+            )
+        }
     )
+    df_cin = df_cin[df_cin[CINclosureDate].notna()]
+    closure_days, _ = day_numbers(df_cin[CINclosureDate])
 
-    df_cin_cpp_fail = df_cin_cpp[
-        df_cin_cpp["CINclosureDate"] < df_cin_cpp["CPPendDate"]
-    ]
-    df_cin_cpp_fail["ERROR_ID"] = tuple(
-        zip(
-            df_cin_cpp_fail["LAchildID"],
-            df_cin_cpp_fail["CINdetailsID"],
-            df_cin_cpp_fail["CINclosureDate"],
-        )
-    )
+    # find every event that happens after the closure date of its own episode.
+    episodes = timeline.lookup(df_cin[LAchildID], df_cin[CINdetailsID])
+    query_positions, event_positions = timeline.events_after(episodes, closure_days)
 
-    df_cin_issues_cpp = (
-        df_cin.merge(df_cin_cpp_fail, left_on="ROW_ID", right_on="ROW_ID_cin")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-    df_cpp_issues = (
-        df_cpp.merge(df_cin_cpp_fail, left_on="ROW_ID", right_on="ROW_ID_cpp")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
+    failing_cin = df_cin.iloc[query_positions]
+    df_fails = pd.DataFrame(
+        {
+            "ERROR_ID": tuple(
+                zip(
+                    failing_cin[LAchildID],
+                    failing_cin[CINdetailsID],
+                    failing_cin[CINclosureDate],
+                )
+            ),
+            "CIN_ROW_ID": failing_cin.index,
+            "ROW_ID": timeline.rows[event_positions],
+        }
+    )
+
+    # the closed CIN module is flagged alongside every later activity in its episode.
+    df_cin_issues = (
+        df_fails.drop_duplicates("CIN_ROW_ID")
+        .groupby("ERROR_ID", group_keys=False)["CIN_ROW_ID"]
         .apply(list)
         .reset_index()
-    )
-    df_cpp_issues
-
-    # CINPLANDATES TABLE
-    df_cin_plan = df_cin.merge(
-        df_plan,
-        on=["LAchildID", "CINdetailsID"],
-        how="left",
-        suffixes=["_cin", "_plan"],
+        .rename(columns={"CIN_ROW_ID": "ROW_ID"})
     )
 
-    df_cin_plan_fail = df_cin_plan[
-        (df_cin_plan["CINclosureDate"] < df_cin_plan["CINPlanStartDate"])
-        | (df_cin_plan["CINclosureDate"] < df_cin_plan["CINPlanEndDate"])
-    ]
-    df_cin_plan_fail["ERROR_ID"] = tuple(
-        zip(
-            df_cin_47_fail["LAchildID"],
-            df_cin_47_fail["CINdetailsID"],
-            df_cin_47_fail["CINclosureDate"],
+    def table_issues(table):
+        df_table_fails = df_fails[timeline.from_table(event_positions, table)]
+        return (
+            df_table_fails.drop_duplicates(["ERROR_ID", "ROW_ID"])
+            .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
+            .apply(list)
+            .reset_index()
         )
-    )
-
-    df_cin_issues_plan = (
-        df_cin.merge(df_cin_plan_fail, left_on="ROW_ID", right_on="ROW_ID_cin")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-    df_plan_issues = (
-        df_plan.merge(df_cin_plan_fail, left_on="ROW_ID", right_on="ROW_ID_plan")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-
-    # combine failing cin locations from all tables
-    cin_issues_all = pd.concat(
-        [
-            df_cin_issues_plan,
-            df_cin_issues_cpp,
-            df_cin_issues_47,
-            df_cin_issues_ass,
-            df_cin_issues_cin,
-        ],
-        ignore_index=True,
-    )
-    unique_cin_issues = cin_issues_all.astype(str).drop_duplicates().index
-    df_cin_issues = cin_issues_all.loc[unique_cin_issues].reset_index(drop=True)
 
     rule_context.push_type_2(
         table=CINdetails,
@@ -293,20 +148,22 @@ def validate(
     rule_context.push_type_2(
         table=Assessments,
         columns=[AssessmentActualStartDate, AssessmentAuthorisationDate],
-        row_df=df_ass_issues,
+        row_df=table_issues(Assessments),
     )
     rule_context.push_type_2(
         table=Section47,
         columns=[S47ActualStartDate, DateOfInitialCPC],
-        row_df=df_47_issues,
+        row_df=table_issues(Section47),
     )
     rule_context.push_type_2(
-        table=ChildProtectionPlans, columns=[CPPendDate], row_df=df_cpp_issues
+        table=ChildProtectionPlans,
+        columns=[CPPendDate],
+        row_df=table_issues(ChildProtectionPlans),
     )
     rule_context.push_type_2(
         table=CINplanDates,
         columns=[CINPlanStartDate, CINPlanEndDate],
-        row_df=df_plan_issues,
+        row_df=table_issues(CINplanDates),
     )
 
 
@@ -502,5 +359,10 @@ def test_validate():
         ]
     )
 
+    assert issue_rows.equals(expected_df)
+
+    # every other module has one failing row for CINID1, assessments also fail in CINID2.
+    assert [len(issues.row_df) for issues in issues_list[1:]] == [2, 1, 1, 1]
+
     assert result.definition.code == "8565"
     assert result.definition.message == "Activity shown after a case has been closed"
@@ -1,8 +1,7 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
+from cin_validator.rule_engine import CINTable
+from cin_validator.rule_patterns import ModuleMustExist, pattern_rule
 from cin_validator.test_engine import run_rule
 
 ChildIdentifiers = CINTable.ChildIdentifiers
@@ -11,45 +10,14 @@ CINdetails = CINTable.CINdetails
 LAchildID = ChildIdentifiers.LAchildID
 
 
-@rule_definition(
+validate = pattern_rule(
+    # Each child must have at least one <CINdetails> group
+    ModuleMustExist(ChildIdentifiers, CINdetails, key=(LAchildID,)),
     code="8590",
     module=CINTable.ChildIdentifiers,
     message="Child does not have a recorded CIN episode.",
     affected_fields=[LAchildID],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df_cid = data_container[ChildIdentifiers].copy()
-    df_cin = data_container[CINdetails].copy()
-
-    df_cid.index.name = "ROW_ID"
-    df_cin.index.name = "ROW_ID"
-
-    df_cid.reset_index(inplace=True)
-    df_cin.reset_index(inplace=True)
-
-    # Each child must have at least one <CINdetails> group
-    df_merge = df_cid.merge(
-        df_cin[LAchildID], on=[LAchildID], how="left", indicator=True
-    )
-
-    condition = df_merge["_merge"] == "left_only"
-
-    df_merge = df_merge[condition].reset_index()
-
-    df_merge["ERROR_ID"] = tuple(zip(df_merge[LAchildID]))
-
-    df_cid_issues = (
-        df_cid.merge(df_merge, left_on="ROW_ID", right_on="ROW_ID")
-        .groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-
-    rule_context.push_type_2(
-        table=ChildIdentifiers, columns=[LAchildID], row_df=df_cid_issues
-    )
 
 
 def test_validate():
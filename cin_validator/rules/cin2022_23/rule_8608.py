@@ -1,8 +1,7 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
+from cin_validator.rule_engine import CINTable
+from cin_validator.rule_patterns import DateOnOrAfter, pattern_rule
 from cin_validator.test_engine import run_rule
 
 Assessments = CINTable.Assessments
@@ -11,42 +10,19 @@ AssessmentActualStartDate = Assessments.AssessmentActualStartDate
 AssessmentAuthorisationDate = Assessments.AssessmentAuthorisationDate
 
 
-@rule_definition(
+validate = pattern_rule(
+    # If present <AssessmentAuthorisationDate> (N00160) must be on or after the <AssessmentActualStartDate> (N00159)
+    DateOnOrAfter(
+        Assessments,
+        AssessmentAuthorisationDate,
+        reference=AssessmentActualStartDate,
+        error_id=(LAchildID, AssessmentActualStartDate, AssessmentAuthorisationDate),
+    ),
     code="8608",
     module=CINTable.Assessments,
     message="Assessment Start Date cannot be later than its End Date",
     affected_fields=[AssessmentActualStartDate, AssessmentAuthorisationDate],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[Assessments]
-    df.index.name = "ROW_ID"
-
-    # If present <AssessmentAuthorisationDate> (N00160) must be on or after the <AssessmentActualStartDate> (N00159)
-    condition = df[AssessmentActualStartDate] > df[AssessmentAuthorisationDate]
-
-    df_issues = df[condition].reset_index()
-
-    link_id = tuple(
-        zip(
-            df_issues[LAchildID],
-            df_issues[AssessmentActualStartDate],
-            df_issues[AssessmentAuthorisationDate],
-        )
-    )
-    df_issues["ERROR_ID"] = link_id
-    df_issues = (
-        df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
-        .apply(list)
-        .reset_index()
-    )
-
-    rule_context.push_type_1(
-        table=Assessments,
-        columns=[AssessmentActualStartDate, AssessmentAuthorisationDate],
-        row_df=df_issues,
-    )
 
 
 def test_validate():
@@ -1,15 +1,8 @@
-from typing import Mapping
-
 import pandas as pd
 
-from cin_validator.rule_engine import (
-    CINTable,
-    IssueLocator,
-    RuleContext,
-    rule_definition,
-)
+from cin_validator.rule_engine import CINTable, IssueLocator
+from cin_validator.rule_patterns import WithinCensusPeriod, pattern_rule
 from cin_validator.test_engine import run_rule
-from cin_validator.utils import make_census_period
 
 # Get tables and columns of interest from the CINTable object defined in rule_engine/__api.py
 
@@ -19,38 +12,14 @@ Header = CINTable.Header
 ReferenceDate = Header.ReferenceDate
 
 
-# define characteristics of rule
-@rule_definition(
+validate = pattern_rule(
+    # If <CINclosureDate> (N00102) is present, it must be within [Period_of_Census]
+    WithinCensusPeriod(CINdetails, CINclosureDate),
     code="8620",
     module=CINTable.CINdetails,
     message="CIN Closure Date present and does not fall within the Census year",
     affected_fields=[CINclosureDate],
 )
-def validate(
-    data_container: Mapping[CINTable, pd.DataFrame], rule_context: RuleContext
-):
-    df = data_container[CINdetails]
-    df_ref = data_container[Header]
-
-    # ReferenceDate exists in the header table so we get header table too.
-    ref_date_series = df_ref[ReferenceDate]
-
-    # the make_census_period function generates the start and end date so that you don't have to do it each time.
-    collection_start, collection_end = make_census_period(ref_date_series)
-
-    # implement rule logic as described by the Github issue. Put the description as a comment above the implementation as shown.
-
-    # If <CINclosureDate> (N00102) is present, it must be within [Period_of_Census]
-    df = df[df[CINclosureDate].notna()]
-    df = df[
-        ~(
-            (df[CINclosureDate] >= collection_start)
-            & (df[CINclosureDate] <= collection_end)
-        )
-    ]
-    failing_indices = df.index
-
-    rule_context.push_issue(table=CINdetails, field=CINclosureDate, row=failing_indices)
 
 
 def test_validate():
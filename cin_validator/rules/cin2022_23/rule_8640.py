@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import (
     CINTable,
     IssueLocator,
@@ -30,12 +31,13 @@ def validate(
 
     # Reason for Closure must be a valid reason for closure code value as shown in the list below
 
-    valid_reason = ["RC1", "RC2", "RC3", "RC4", "RC5", "RC6", "RC7", "RC8", "RC9"]
+    valid_reason = rule_context.code_lists[ReasonForClosure]
 
     # Check if the Reason For Closure is not in the list of valid reasons and a value has been entered.
 
     df = df[
-        ~(df["ReasonForClosure"].isin(valid_reason)) & df["ReasonForClosure"].notna()
+        ~valid_code(df["ReasonForClosure"], valid_reason)
+        & df["ReasonForClosure"].notna()
     ]
 
     failing_indices = df.index
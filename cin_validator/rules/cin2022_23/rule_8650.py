@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import (
     CINTable,
     IssueLocator,
@@ -27,10 +28,12 @@ def validate(
     df = data_container[CINdetails]
 
     # If present <PrimaryNeedCode> (N00101) must be a valid primary need code value
-    PriNeed_list = ["N0", "N1", "N2", "N3", "N4", "N5", "N6", "N7", "N8", "N9"]
+    PriNeed_list = rule_context.code_lists[PrimaryNeedCode]
 
     # Primary Need Code is not in list.
-    df = df[(~df["PrimaryNeedCode"].isin(PriNeed_list)) & df["PrimaryNeedCode"].notna()]
+    df = df[
+        ~valid_code(df["PrimaryNeedCode"], PriNeed_list) & df["PrimaryNeedCode"].notna()
+    ]
 
     failing_indices = df.index
 
@@ -32,7 +32,12 @@ def validate(
 
     # Create a 'counts' column, a count of rows partitioned by LAchildID and Disability such that
     # if an LAchildID-Disability combination appears twice, then it'll have a count of 2, and so on.
-    df = df.groupby(["LAchildID", "Disability"]).size().reset_index(name="counts")
+    # observed=True so that Disability codes which the child doesn't have are not counted as zeros.
+    df = (
+        df.groupby(["LAchildID", "Disability"], observed=True)
+        .size()
+        .reset_index(name="counts")
+    )
 
     # Add the count column back into the original dataframe, joining by LAchildID and Disability
     df = df.merge(df_orig, how="left", on=["LAchildID", "Disability"])
@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
 from cin_validator.test_engine import run_rule
 
@@ -36,35 +37,12 @@ def validate(
     df.index.name = "ROW_ID"
     df.reset_index(inplace=True)
 
-    valid_referrals = [
-        "1A",
-        "1B",
-        "1C",
-        "1D",
-        "2A",
-        "2B",
-        "3A",
-        "3B",
-        "3C",
-        "3D",
-        "3E",
-        "3F",
-        "4",
-        "5A",
-        "5B",
-        "5C",
-        "5D",
-        "6",
-        "7",
-        "8",
-        "9",
-        "10",
-    ]
+    valid_referrals = rule_context.code_lists[ReferralSource]
 
     # If <CinReferralDate> (N00100) is on or after 1 April 2013 then <ReferralSource> (N00152) must be present and must be a valid code
     condition = (
         df[CINreferralDate] >= pd.to_datetime("01/04/2013", format="%d/%m/%Y")
-    ) & ((df[ReferralSource].isna()) | (~df[ReferralSource].isin(valid_referrals)))
+    ) & (~valid_code(df[ReferralSource], valid_referrals))
     # get all the data that fits the failing condition. Reset the index so that ROW_ID now becomes a column of df
     df_issues = df[condition].reset_index()
 
@@ -4,6 +4,7 @@ import pandas as pd
 
 from cin_validator.rule_engine import CINTable, RuleContext, rule_definition
 from cin_validator.test_engine import run_rule
+from cin_validator.utils import group_codes
 
 # Get tables and columns of interest from the CINTable object defined in rule_engine/__api.py
 
@@ -41,30 +42,18 @@ def validate(
 
     # Within one <CINdetails> group, there must not be more than one <Assessments> group that has no <AssessmentAuthorisationDate> (N00160) recorded
 
-    # DF_CHECK: APPLY GROUPBYs IN A SEPARATE DATAFRAME SO THAT OTHER COLUMNS ARE NOT LOST OR CORRUPTED. THEN, MAP THE RESULTS TO THE INITIAL DATAFRAME.
-    df_check = df.copy()
-    # get all the locations where AssessmentAuthorisationDate is null
-    df_check = df_check[df_check[AssessmentAuthorisationDate].isna()]
-    # We'll have to count the number of nan values per group. NaNs cannot be counted so replace them with something that can.
-    # Do this only if your rule requires that you interact with a column made up of all NaNs.
-    df_check[AssessmentAuthorisationDate].fillna(1, inplace=True)
+    # GROUP CODES: COUNT WITHIN GROUPS USING A GROUP NUMBER PER ROW SO THAT OTHER COLUMNS ARE NOT LOST OR CORRUPTED. THEN, MAP THE RESULTS TO THE INITIAL DATAFRAME.
+    # number every CINdetails group in each child. Integer group numbers are cheaper to count than the ID pairs.
+    episodes = group_codes(df, [LAchildID, CINdetailsID])
     # count how many occurences of missing AssessmentAuthorisationDate per CINdetails group in each child.
-    df_check = (
-        df_check.groupby([LAchildID, CINdetailsID])[AssessmentAuthorisationDate]
-        .count()
-        .reset_index()
-    )
-
-    # when you groupby as shown above a series is returned where the columns in the round brackets become the index and the groupby result are the values.
-    # resetting the index pushes the columns in the () back as columns of the dataframe and assigns the groupby result to the column in the square bracket.
+    unauthorised = episodes[df[AssessmentAuthorisationDate].isna()].value_counts()
 
     # filter out the instances where AssessmentAuthorisationDate is missing more than once in a CINdetails group.
-    df_check = df_check[df_check[AssessmentAuthorisationDate] > 1]
-    issue_ids = tuple(zip(df_check[LAchildID], df_check[CINdetailsID]))
+    issue_episodes = unauthorised[unauthorised > 1].index
 
-    # DF_ISSUES: GET ALL THE DATA ABOUT THE LOCATIONS THAT WERE IDENTIFIED IN DF_CHECK
+    # DF_ISSUES: GET ALL THE DATA ABOUT THE LOCATIONS THAT WERE IDENTIFIED ABOVE
     df["ERROR_ID"] = tuple(zip(df[LAchildID], df[CINdetailsID]))
-    df_issues = df[df["ERROR_ID"].isin(issue_ids)]
+    df_issues = df[episodes.isin(issue_episodes)]
 
     df_issues = (
         df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
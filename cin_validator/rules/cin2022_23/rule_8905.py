@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import (
     CINTable,
     IssueLocator,
@@ -28,13 +29,10 @@ def validate(
     """
     Where a Child Protection Plan module is present, <InitialCategoryOfAbuse> (N00113) must be present and be a valid code
     """
-    abuse_cats = ["NEG", "PHY", "SAB", "EMO", "MUL"]
+    abuse_cats = rule_context.code_lists[InitialCategoryOfAbuse]
 
     # Initial Category Code is not in list.
-    df = df[
-        (~df[InitialCategoryOfAbuse].isin(abuse_cats))
-        | df[InitialCategoryOfAbuse].isna()
-    ]
+    df = df[~valid_code(df[InitialCategoryOfAbuse], abuse_cats)]
 
     failing_indices = df.index
 
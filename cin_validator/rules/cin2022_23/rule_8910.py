@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import (
     CINTable,
     IssueLocator,
@@ -27,13 +28,10 @@ def validate(
     df = data_container[ChildProtectionPlans]
 
     # Where a Child Protection Plan module is present, <LatestCategoryOfAbuse> (N00114) must be present and be a valid code
-    abuse_cats = ["NEG", "PHY", "SAB", "EMO", "MUL"]
+    abuse_cats = rule_context.code_lists[LatestCategoryOfAbuse]
 
     # Initial Category Code is not in list.
-    df = df[
-        (~df["LatestCategoryOfAbuse"].isin(abuse_cats))
-        | df["LatestCategoryOfAbuse"].isna()
-    ]
+    df = df[~valid_code(df["LatestCategoryOfAbuse"], abuse_cats)]
 
     failing_indices = df.index
 
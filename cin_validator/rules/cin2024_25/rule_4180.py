@@ -2,6 +2,7 @@ from typing import Mapping
 
 import pandas as pd
 
+from cin_validator.code_lists import valid_code
 from cin_validator.rule_engine import (
     CINTable,
     IssueLocator,
@@ -36,13 +37,11 @@ def validate(
 
     # implement rule logic as described by the Github issue. Put the description as a comment above the implementation as shown.
 
-    valid_sex_codes = ["M", "F", "U"]
+    valid_sex_codes = rule_context.code_lists[Sex]
 
     # <Sex> (N00783) must be present and valid
 
-    failing_indices = df[
-        df[Sex].isna() | (~df[Sex].astype("str").isin(valid_sex_codes))
-    ].index
+    failing_indices = df[~valid_code(df[Sex], valid_sex_codes)].index
 
     # Replace ChildIdentifiers and Sex with the table and column name concerned in your rule, respectively.
     # If there are multiple columns or table, make this sentence multiple times.
@@ -0,0 +1,2242 @@
+# Generated by `python -m cin_validator manifest`. Do not edit by hand.
+MANIFEST = {
+    "cin2022_23": [
+        {
+            "code": "100",
+            "message": "Reference Date is incorrect",
+            "rule_type": "ERROR",
+            "module": "Header",
+            "file": "cin2022_23/rule_100.py",
+        },
+        {
+            "code": "1103",
+            "message": "The assessment start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_1103.py",
+        },
+        {
+            "code": "1104",
+            "message": "The date of the initial child protection conference cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_1104.py",
+        },
+        {
+            "code": "1105",
+            "message": "The child protection plan start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_1105.py",
+        },
+        {
+            "code": "1510",
+            "message": "UPN invalid (wrong check letter at character 1)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1510.py",
+        },
+        {
+            "code": "1520",
+            "message": "More than one record with the same UPN.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1520.py",
+        },
+        {
+            "code": "1530",
+            "message": "UPN invalid (characters 2-4 not a recognised LA code)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1530.py",
+        },
+        {
+            "code": "1540",
+            "message": "UPN invalid (characters 5-12 not all numeric)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1540.py",
+        },
+        {
+            "code": "1550",
+            "message": "UPN invalid (character 13 not a recognised value)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1550.py",
+        },
+        {
+            "code": "1560Q",
+            "message": "Please check and either amend or provide a reason: Former UPN wrongly formatted",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1560Q.py",
+        },
+        {
+            "code": "2883",
+            "message": "There are more child protection plans starting than initial conferences taking place",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_2883.py",
+        },
+        {
+            "code": "2884",
+            "message": "An initial child protection conference is recorded at both the S47 and CIN Details level and it should only be recorded in one",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_2884.py",
+        },
+        {
+            "code": "2885",
+            "message": "Child protection plan shown as starting a different day to the initial child protection conference.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_2885.py",
+        },
+        {
+            "code": "2886Q",
+            "message": "Please check and either amend or provide a reason: Percentage of children with no gender recorded is more than 2% (excluding unborns)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_2886Q.py",
+        },
+        {
+            "code": "2887Q",
+            "message": "Please check and either amend or provide a reason: Less than 8 disability codes have been used in your return",
+            "rule_type": "QUERY",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_2887Q.py",
+        },
+        {
+            "code": "2888Q",
+            "message": "Please check and either amend or provide a reason: Only one disability code is recorded per child and multiple disabilities should be recorded where possible.",
+            "rule_type": "QUERY",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_2888Q.py",
+        },
+        {
+            "code": "2889",
+            "message": "The S47 start date cannot be before the referral date.",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_2889.py",
+        },
+        {
+            "code": "2990",
+            "message": "Activity is recorded against a case marked as ‘Case closed after assessment, no further action’ or 'case closed after assessment, referred to early help'.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_2990.py",
+        },
+        {
+            "code": "2991Q",
+            "message": "Please check and either amend data or provide a reason: A Section 47 module is recorded and there is no assessment on the episode",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_2991Q.py",
+        },
+        {
+            "code": "4000",
+            "message": "CIN Plan details provided for a referral with no further action",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4000.py",
+        },
+        {
+            "code": "4001",
+            "message": "A CIN Plan cannot run concurrently with a Child Protection Plan",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4001.py",
+        },
+        {
+            "code": "4003",
+            "message": "A CPP review date is shown as being held at the same time as an open CIN Plan.",
+            "rule_type": "ERROR",
+            "module": "Reviews",
+            "file": "cin2022_23/rule_4003.py",
+        },
+        {
+            "code": "4004",
+            "message": "This child is showing more than one open CIN Plan, i.e. with no End Date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4004.py",
+        },
+        {
+            "code": "4008",
+            "message": "CIN Plan shown as starting after the child’s Date of Death.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4008.py",
+        },
+        {
+            "code": "4009Q",
+            "message": "CIN Plan cannot end after the child’s Date of Death",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4009Q.py",
+        },
+        {
+            "code": "4010",
+            "message": "CIN Plan start date is missing or out of data collection period",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4010.py",
+        },
+        {
+            "code": "4011",
+            "message": "CIN Plan End Date earlier than Start Date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4011.py",
+        },
+        {
+            "code": "4012Q",
+            "message": "Please check and either amend or provide a reason: CIN Plan shown as starting and ending on the same day",
+            "rule_type": "QUERY",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4012Q.py",
+        },
+        {
+            "code": "4013",
+            "message": "CIN Plan end date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4013.py",
+        },
+        {
+            "code": "4014",
+            "message": "CIN Plan data contains overlapping dates",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4014.py",
+        },
+        {
+            "code": "4015",
+            "message": "The CIN Plan start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4015.py",
+        },
+        {
+            "code": "4016",
+            "message": "A CIN Plan has been reported as open at the same time as a Child Protection Plan.",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4016.py",
+        },
+        {
+            "code": "4017",
+            "message": "A CIN Plan has been reported as open at the same time as a Child Protection Plan.",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4017.py",
+        },
+        {
+            "code": "4180",
+            "message": "Gender is missing",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4180.py",
+        },
+        {
+            "code": "4220",
+            "message": "Ethnicity is missing or invalid (see Ethnicity table)",
+            "rule_type": "ERROR",
+            "module": "ChildCharacteristics",
+            "file": "cin2022_23/rule_4220.py",
+        },
+        {
+            "code": "8500",
+            "message": "LA Child ID missing",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8500.py",
+        },
+        {
+            "code": "8510",
+            "message": "More than one child record with the same LA Child ID",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8510.py",
+        },
+        {
+            "code": "8520",
+            "message": "Date of Birth is after data collection period (must be on or before the end of the census period)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8520.py",
+        },
+        {
+            "code": "8525Q",
+            "message": "Either Date of Birth or Expected Date of Birth must be provided (but not both)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8525Q.py",
+        },
+        {
+            "code": "8530Q",
+            "message": "Please check and either amend data or provide a reason: Expected Date of Birth is outside the expected range for this census (March to December of the Census Year end)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8530Q.py",
+        },
+        {
+            "code": "8535Q",
+            "message": "Please check and either amend data or provide a reason: Child’s date of death should not be prior to the date of birth",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8535Q.py",
+        },
+        {
+            "code": "8540",
+            "message": "Child’s disability is missing or invalid (see Disability table)",
+            "rule_type": "ERROR",
+            "module": "ChildCharacteristics",
+            "file": "cin2022_23/rule_8540.py",
+        },
+        {
+            "code": "8545Q",
+            "message": "Please check and either amend data or provide a reason: Child's date of death should be within the census year",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8545Q.py",
+        },
+        {
+            "code": "8555Q",
+            "message": "Child cannot be referred after its recorded date of death",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8555Q.py",
+        },
+        {
+            "code": "8565",
+            "message": "Activity shown after a case has been closed",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8565.py",
+        },
+        {
+            "code": "8568",
+            "message": "RNFA flag is missing or invalid",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8568.py",
+        },
+        {
+            "code": "8569Q",
+            "message": "A case with referral date before one working day prior to the collection start date must not be flagged as a no further action case",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8569Q.py",
+        },
+        {
+            "code": "8585Q",
+            "message": "Please check and either amend or provide a reason: CIN episode shows Died as the Closure Reason, however child has no recorded Date of Death",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8585Q.py",
+        },
+        {
+            "code": "8590",
+            "message": "Child does not have a recorded CIN episode.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8590.py",
+        },
+        {
+            "code": "8600",
+            "message": "Child referral date missing or after data collection period",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8600.py",
+        },
+        {
+            "code": "8606",
+            "message": "Child referral date is more than 40 weeks before DOB or expected DOB",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8606.py",
+        },
+        {
+            "code": "8608",
+            "message": "Assessment Start Date cannot be later than its End Date",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8608.py",
+        },
+        {
+            "code": "8610",
+            "message": "Primary Need code is missing for a referral which led to further action.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8610.py",
+        },
+        {
+            "code": "8614",
+            "message": "Parental or child factors at assessment should only be present for a completed assessment.",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8614.py",
+        },
+        {
+            "code": "8615",
+            "message": "Section 47 Enquiry Start Date must be present and cannot be later than the date of the initial Child Protection Conference",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8615.py",
+        },
+        {
+            "code": "8620",
+            "message": "CIN Closure Date present and does not fall within the Census year",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8620.py",
+        },
+        {
+            "code": "8630",
+            "message": "CIN Closure Date is before CIN Referral Date for the same CIN episode",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8630.py",
+        },
+        {
+            "code": "8640",
+            "message": "CIN Reason for closure code invalid (see Reason for Closure table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8640.py",
+        },
+        {
+            "code": "8650",
+            "message": "Primary Need Code invalid (see Primary Need table in CIN census code set)",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8650.py",
+        },
+        {
+            "code": "8670Q",
+            "message": "Please check and either amend data or provide a reason: Assessment started more than 45 working days before the end of the census year. However, there is no Assessment end date.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8670Q.py",
+        },
+        {
+            "code": "8675Q",
+            "message": "Please check and either amend data or provide a reason: S47 Enquiry started more than 15 working days before the end of the census year. However, there is no date of Initial Child Protection Conference.",
+            "rule_type": "QUERY",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8675Q.py",
+        },
+        {
+            "code": "8696",
+            "message": "Assessment end date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8696.py",
+        },
+        {
+            "code": "8715",
+            "message": "Date of Initial Child Protection Conference must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8715.py",
+        },
+        {
+            "code": "8720",
+            "message": "Child Protection Plan Start Date missing or out of data collection period",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8720.py",
+        },
+        {
+            "code": "8730",
+            "message": "Total Number of previous Child Protection Plans missing",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8730.py",
+        },
+        {
+            "code": "8736",
+            "message": "For an Assessment that has not been completed, the start date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8736.py",
+        },
+        {
+            "code": "8740",
+            "message": "For a Section 47 Enquiry that has not held the Initial Child Protection Conference by the end of the census year, the start date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8740.py",
+        },
+        {
+            "code": "8750",
+            "message": "Gender must equal 0 for an unborn child",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8750.py",
+        },
+        {
+            "code": "8770Q",
+            "message": "Please check and either amend data or provide a reason: UPN or reason UPN missing expected for a child who is more than 5 years old",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8770Q.py",
+        },
+        {
+            "code": "8772",
+            "message": "UPN unknown reason is UN7 (Referral with no further action) but at least one CIN details is a referral going on to further action",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8772.py",
+        },
+        {
+            "code": "8775Q",
+            "message": "Please check and either amend data or provide a reason: Child is over 25 years old",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8775Q.py",
+        },
+        {
+            "code": "8790",
+            "message": "Disability information includes both None and other values",
+            "rule_type": "ERROR",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_8790.py",
+        },
+        {
+            "code": "8794",
+            "message": "Child has two or more disabilities with the same code",
+            "rule_type": "ERROR",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_8794.py",
+        },
+        {
+            "code": "8805",
+            "message": "A CIN case cannot have a CIN closure date without a Reason for Closure",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8805.py",
+        },
+        {
+            "code": "8810",
+            "message": "A CIN case cannot have a Reason for Closure without a CIN Closure Date",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8810.py",
+        },
+        {
+            "code": "8815",
+            "message": "More than one open CIN Details episode (a module with no CIN Closure Date) has been provided for this child and case is not a referral with no further action.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8815.py",
+        },
+        {
+            "code": "8816",
+            "message": "An open CIN episode is shown and case is not a referral with no further action, but it is not the latest episode.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8816.py",
+        },
+        {
+            "code": "8820",
+            "message": "The dates on the CIN episodes for this child overlap",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8820.py",
+        },
+        {
+            "code": "8825Q",
+            "message": "Please check and either amend data or provide a reason: Reason for Closure code RC8 (case closed after assessment) or RC9 (case closed after assessment, referred to early help) has been returned but there is no assessment present for the episode.",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8825Q.py",
+        },
+        {
+            "code": "8831",
+            "message": "Activity is recorded against a case marked as a referral with no further action",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8831.py",
+        },
+        {
+            "code": "8832",
+            "message": "Child Protection details provided for a referral with no further action.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8832.py",
+        },
+        {
+            "code": "8839",
+            "message": "Within one CINDetails group there are 2 or more open S47 Assessments",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8839.py",
+        },
+        {
+            "code": "8840",
+            "message": "Child Protection Plan cannot start and end on the same day",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8840.py",
+        },
+        {
+            "code": "8841",
+            "message": "The review date cannot be on the same day or before the Child protection Plan start date.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8841.py",
+        },
+        {
+            "code": "8842Q",
+            "message": "Please check and either amend or provide a reason: Review Record has a missing date",
+            "rule_type": "QUERY",
+            "module": "Reviews",
+            "file": "cin2022_23/rule_8842Q.py",
+        },
+        {
+            "code": "8863Q",
+            "message": "An Assessment is shown as starting when there is another Assessment ongoing.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8863Q.py",
+        },
+        {
+            "code": "8866",
+            "message": "Source of Referral is missing or an invalid code",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8866.py",
+        },
+        {
+            "code": "8867",
+            "message": "CIN episode is shown as closed, however Assessment is not shown as completed",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8867.py",
+        },
+        {
+            "code": "8868",
+            "message": "CIN episode is shown as closed, however Section 47 enquiry is not shown as completed by ICPC date or ICPC not required flag",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8868.py",
+        },
+        {
+            "code": "8869",
+            "message": "The assessment factors code “21” cannot be used in conjunction with any other assessment factors.",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8869.py",
+        },
+        {
+            "code": "8870Q",
+            "message": "Please check and either amend or provide a reason: The Target Date for Initial Child Protection Conference should not be a weekend",
+            "rule_type": "QUERY",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8870Q.py",
+        },
+        {
+            "code": "8873Q",
+            "message": "Please check and either amend data or provide a reason: When there is only one assessment on the episode and the factors code “21 No factors identified” has been used for the completed assessment, the reason for closure ‘RC8’ or 'RC9' should be used.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8873Q.py",
+        },
+        {
+            "code": "8875",
+            "message": "The Date of Initial Child Protection Conference cannot be a weekend",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8875.py",
+        },
+        {
+            "code": "8890",
+            "message": "A Section 47 enquiry is shown as starting when there is another Section 47 Enquiry ongoing",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8890.py",
+        },
+        {
+            "code": "8896",
+            "message": "Within one CINDetails group there are 2 or more open Assessments groups",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8896.py",
+        },
+        {
+            "code": "8897Q",
+            "message": "Parental or child factors at assessment information is missing from a completed assessment",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8897Q.py",
+        },
+        {
+            "code": "8898",
+            "message": " The assessment has more than one parental or child factors with the same code",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8898.py",
+        },
+        {
+            "code": "8905",
+            "message": "Initial Category of Abuse code missing or invalid (see Category of Abuse table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8905.py",
+        },
+        {
+            "code": "8910",
+            "message": "Latest Category of Abuse code missing or invalid (see Category of Abuse table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8910.py",
+        },
+        {
+            "code": "8915",
+            "message": "Child Protection Plan shown as starting after the child’s Date of Death",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8915.py",
+        },
+        {
+            "code": "8920",
+            "message": "Child Protection Plan cannot end after the child’s Date of Death",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8920.py",
+        },
+        {
+            "code": "8925",
+            "message": "Child Protection Plan End Date earlier than Start Date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8925.py",
+        },
+        {
+            "code": "8930",
+            "message": "Child Protection Plan End Date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8930.py",
+        },
+        {
+            "code": "8935",
+            "message": "This child is showing more than one open Child Protection plan, i.e. with no End Date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8935.py",
+        },
+        {
+            "code": "8940",
+            "message": "Child Protection Plan data contains overlapping dates",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8940.py",
+        },
+    ],
+    "cin2023_24": [
+        {
+            "code": "100",
+            "message": "Reference Date is incorrect",
+            "rule_type": "ERROR",
+            "module": "Header",
+            "file": "cin2022_23/rule_100.py",
+        },
+        {
+            "code": "1103",
+            "message": "The assessment start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_1103.py",
+        },
+        {
+            "code": "1104",
+            "message": "The date of the initial child protection conference cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_1104.py",
+        },
+        {
+            "code": "1105",
+            "message": "The child protection plan start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_1105.py",
+        },
+        {
+            "code": "1510",
+            "message": "UPN invalid (wrong check letter at character 1)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1510.py",
+        },
+        {
+            "code": "1520",
+            "message": "More than one record with the same UPN.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1520.py",
+        },
+        {
+            "code": "1530",
+            "message": "UPN invalid (characters 2-4 not a recognised LA code)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2023_24/rule_1530.py",
+        },
+        {
+            "code": "1540",
+            "message": "UPN invalid (characters 5-12 not all numeric)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1540.py",
+        },
+        {
+            "code": "1550",
+            "message": "UPN invalid (character 13 not a recognised value)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1550.py",
+        },
+        {
+            "code": "1560Q",
+            "message": "Please check and either amend or provide a reason: Former UPN wrongly formatted",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1560Q.py",
+        },
+        {
+            "code": "2883",
+            "message": "There are more child protection plans starting than initial conferences taking place",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_2883.py",
+        },
+        {
+            "code": "2884",
+            "message": "An initial child protection conference is recorded at both the S47 and CIN Details level and it should only be recorded in one",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_2884.py",
+        },
+        {
+            "code": "2885",
+            "message": "Child protection plan shown as starting a different day to the initial child protection conference.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_2885.py",
+        },
+        {
+            "code": "2886Q",
+            "message": "Please check and either amend or provide a reason: Percentage of children with no gender recorded is more than 2% (excluding unborns)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_2886Q.py",
+        },
+        {
+            "code": "2887Q",
+            "message": "Please check and either amend or provide a reason: Less than 8 disability codes have been used in your return",
+            "rule_type": "QUERY",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_2887Q.py",
+        },
+        {
+            "code": "2888Q",
+            "message": "Please check and either amend or provide a reason: Only one disability code is recorded per child and multiple disabilities should be recorded where possible.",
+            "rule_type": "QUERY",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_2888Q.py",
+        },
+        {
+            "code": "2889",
+            "message": "The S47 start date cannot be before the referral date.",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_2889.py",
+        },
+        {
+            "code": "2990",
+            "message": "Activity is recorded against a case marked as ‘Case closed after assessment, no further action’ or 'case closed after assessment, referred to early help'.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_2990.py",
+        },
+        {
+            "code": "2991Q",
+            "message": "Please check and either amend data or provide a reason: A Section 47 module is recorded and there is no assessment on the episode",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_2991Q.py",
+        },
+        {
+            "code": "4000",
+            "message": "CIN Plan details provided for a referral with no further action",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4000.py",
+        },
+        {
+            "code": "4001",
+            "message": "A CIN Plan cannot run concurrently with a Child Protection Plan",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4001.py",
+        },
+        {
+            "code": "4003",
+            "message": "A CPP review date is shown as being held at the same time as an open CIN Plan.",
+            "rule_type": "ERROR",
+            "module": "Reviews",
+            "file": "cin2022_23/rule_4003.py",
+        },
+        {
+            "code": "4004",
+            "message": "This child is showing more than one open CIN Plan, i.e. with no End Date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4004.py",
+        },
+        {
+            "code": "4008",
+            "message": "CIN Plan shown as starting after the child’s Date of Death.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4008.py",
+        },
+        {
+            "code": "4009Q",
+            "message": "CIN Plan cannot end after the child’s Date of Death",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4009Q.py",
+        },
+        {
+            "code": "4010",
+            "message": "CIN Plan start date is missing or out of data collection period",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4010.py",
+        },
+        {
+            "code": "4011",
+            "message": "CIN Plan End Date earlier than Start Date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4011.py",
+        },
+        {
+            "code": "4012Q",
+            "message": "Please check and either amend or provide a reason: CIN Plan shown as starting and ending on the same day",
+            "rule_type": "QUERY",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4012Q.py",
+        },
+        {
+            "code": "4013",
+            "message": "CIN Plan end date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4013.py",
+        },
+        {
+            "code": "4014",
+            "message": "CIN Plan data contains overlapping dates",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4014.py",
+        },
+        {
+            "code": "4015",
+            "message": "The CIN Plan start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4015.py",
+        },
+        {
+            "code": "4016",
+            "message": "A CIN Plan has been reported as open at the same time as a Child Protection Plan.",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4016.py",
+        },
+        {
+            "code": "4017",
+            "message": "A CIN Plan has been reported as open at the same time as a Child Protection Plan.",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4017.py",
+        },
+        {
+            "code": "4180",
+            "message": "Gender is missing",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4180.py",
+        },
+        {
+            "code": "4220",
+            "message": "Ethnicity is missing or invalid (see Ethnicity table)",
+            "rule_type": "ERROR",
+            "module": "ChildCharacteristics",
+            "file": "cin2022_23/rule_4220.py",
+        },
+        {
+            "code": "8500",
+            "message": "LA Child ID missing",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8500.py",
+        },
+        {
+            "code": "8510",
+            "message": "More than one child record with the same LA Child ID",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8510.py",
+        },
+        {
+            "code": "8520",
+            "message": "Date of Birth is after data collection period (must be on or before the end of the census period)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8520.py",
+        },
+        {
+            "code": "8525Q",
+            "message": "Either Date of Birth or Expected Date of Birth must be provided (but not both)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8525Q.py",
+        },
+        {
+            "code": "8530Q",
+            "message": "Please check and either amend data or provide a reason: Expected Date of Birth is outside the expected range for this census (March to December of the Census Year end)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8530Q.py",
+        },
+        {
+            "code": "8535Q",
+            "message": "Please check and either amend data or provide a reason: Child’s date of death should not be prior to the date of birth",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8535Q.py",
+        },
+        {
+            "code": "8540",
+            "message": "Child’s disability is missing or invalid (see Disability table)",
+            "rule_type": "ERROR",
+            "module": "ChildCharacteristics",
+            "file": "cin2022_23/rule_8540.py",
+        },
+        {
+            "code": "8545Q",
+            "message": "Please check and either amend data or provide a reason: Child's date of death should be within the census year",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8545Q.py",
+        },
+        {
+            "code": "8555Q",
+            "message": "Child cannot be referred after its recorded date of death",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8555Q.py",
+        },
+        {
+            "code": "8565",
+            "message": "Activity shown after a case has been closed",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8565.py",
+        },
+        {
+            "code": "8568",
+            "message": "RNFA flag is missing or invalid",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8568.py",
+        },
+        {
+            "code": "8569Q",
+            "message": "A case with referral date before one working day prior to the collection start date must not be flagged as a no further action case",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8569Q.py",
+        },
+        {
+            "code": "8585Q",
+            "message": "Please check and either amend or provide a reason: CIN episode shows Died as the Closure Reason, however child has no recorded Date of Death",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8585Q.py",
+        },
+        {
+            "code": "8590",
+            "message": "Child does not have a recorded CIN episode.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8590.py",
+        },
+        {
+            "code": "8600",
+            "message": "Child referral date missing or after data collection period",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8600.py",
+        },
+        {
+            "code": "8606",
+            "message": "Child referral date is more than 40 weeks before DOB or expected DOB",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8606.py",
+        },
+        {
+            "code": "8608",
+            "message": "Assessment Start Date cannot be later than its End Date",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8608.py",
+        },
+        {
+            "code": "8610",
+            "message": "Primary Need code is missing for a referral which led to further action.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8610.py",
+        },
+        {
+            "code": "8614",
+            "message": "Parental or child factors at assessment should only be present for a completed assessment.",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8614.py",
+        },
+        {
+            "code": "8615",
+            "message": "Section 47 Enquiry Start Date must be present and cannot be later than the date of the initial Child Protection Conference",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8615.py",
+        },
+        {
+            "code": "8620",
+            "message": "CIN Closure Date present and does not fall within the Census year",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8620.py",
+        },
+        {
+            "code": "8630",
+            "message": "CIN Closure Date is before CIN Referral Date for the same CIN episode",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8630.py",
+        },
+        {
+            "code": "8640",
+            "message": "CIN Reason for closure code invalid (see Reason for Closure table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8640.py",
+        },
+        {
+            "code": "8650",
+            "message": "Primary Need Code invalid (see Primary Need table in CIN census code set)",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8650.py",
+        },
+        {
+            "code": "8670Q",
+            "message": "Please check and either amend data or provide a reason: Assessment started more than 45 working days before the end of the census year. However, there is no Assessment end date.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8670Q.py",
+        },
+        {
+            "code": "8675Q",
+            "message": "Please check and either amend data or provide a reason: S47 Enquiry started more than 15 working days before the end of the census year. However, there is no date of Initial Child Protection Conference.",
+            "rule_type": "QUERY",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8675Q.py",
+        },
+        {
+            "code": "8696",
+            "message": "Assessment end date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8696.py",
+        },
+        {
+            "code": "8715",
+            "message": "Date of Initial Child Protection Conference must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8715.py",
+        },
+        {
+            "code": "8720",
+            "message": "Child Protection Plan Start Date missing or out of data collection period",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8720.py",
+        },
+        {
+            "code": "8730",
+            "message": "Total Number of previous Child Protection Plans missing",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8730.py",
+        },
+        {
+            "code": "8736",
+            "message": "For an Assessment that has not been completed, the start date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8736.py",
+        },
+        {
+            "code": "8740",
+            "message": "For a Section 47 Enquiry that has not held the Initial Child Protection Conference by the end of the census year, the start date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8740.py",
+        },
+        {
+            "code": "8750",
+            "message": "Gender must equal 0 for an unborn child",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8750.py",
+        },
+        {
+            "code": "8770Q",
+            "message": "Please check and either amend data or provide a reason: UPN or reason UPN missing expected for a child who is more than 5 years old",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8770Q.py",
+        },
+        {
+            "code": "8772",
+            "message": "UPN unknown reason is UN7 (Referral with no further action) but at least one CIN details is a referral going on to further action",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8772.py",
+        },
+        {
+            "code": "8775Q",
+            "message": "Please check and either amend data or provide a reason: Child is over 25 years old",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8775Q.py",
+        },
+        {
+            "code": "8790",
+            "message": "Disability information includes both None and other values",
+            "rule_type": "ERROR",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_8790.py",
+        },
+        {
+            "code": "8794",
+            "message": "Child has two or more disabilities with the same code",
+            "rule_type": "ERROR",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_8794.py",
+        },
+        {
+            "code": "8805",
+            "message": "A CIN case cannot have a CIN closure date without a Reason for Closure",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8805.py",
+        },
+        {
+            "code": "8810",
+            "message": "A CIN case cannot have a Reason for Closure without a CIN Closure Date",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8810.py",
+        },
+        {
+            "code": "8815",
+            "message": "More than one open CIN Details episode (a module with no CIN Closure Date) has been provided for this child and case is not a referral with no further action.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8815.py",
+        },
+        {
+            "code": "8816",
+            "message": "An open CIN episode is shown and case is not a referral with no further action, but it is not the latest episode.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8816.py",
+        },
+        {
+            "code": "8820",
+            "message": "The dates on the CIN episodes for this child overlap",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8820.py",
+        },
+        {
+            "code": "8825Q",
+            "message": "Please check and either amend data or provide a reason: Reason for Closure code RC8 (case closed after assessment) or RC9 (case closed after assessment, referred to early help) has been returned but there is no assessment present for the episode.",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8825Q.py",
+        },
+        {
+            "code": "8831",
+            "message": "Activity is recorded against a case marked as a referral with no further action",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8831.py",
+        },
+        {
+            "code": "8832",
+            "message": "Child Protection details provided for a referral with no further action.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8832.py",
+        },
+        {
+            "code": "8839",
+            "message": "Within one CINDetails group there are 2 or more open S47 Assessments",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8839.py",
+        },
+        {
+            "code": "8840",
+            "message": "Child Protection Plan cannot start and end on the same day",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8840.py",
+        },
+        {
+            "code": "8841",
+            "message": "The review date cannot be on the same day or before the Child protection Plan start date.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8841.py",
+        },
+        {
+            "code": "8842Q",
+            "message": "Please check and either amend or provide a reason: Review Record has a missing date",
+            "rule_type": "QUERY",
+            "module": "Reviews",
+            "file": "cin2022_23/rule_8842Q.py",
+        },
+        {
+            "code": "8863Q",
+            "message": "An Assessment is shown as starting when there is another Assessment ongoing.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8863Q.py",
+        },
+        {
+            "code": "8866",
+            "message": "Source of Referral is missing or an invalid code",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8866.py",
+        },
+        {
+            "code": "8867",
+            "message": "CIN episode is shown as closed, however Assessment is not shown as completed",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8867.py",
+        },
+        {
+            "code": "8868",
+            "message": "CIN episode is shown as closed, however Section 47 enquiry is not shown as completed by ICPC date or ICPC not required flag",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8868.py",
+        },
+        {
+            "code": "8869",
+            "message": "The assessment factors code “21” cannot be used in conjunction with any other assessment factors.",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8869.py",
+        },
+        {
+            "code": "8870Q",
+            "message": "Please check and either amend or provide a reason: The Target Date for Initial Child Protection Conference should not be a weekend",
+            "rule_type": "QUERY",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8870Q.py",
+        },
+        {
+            "code": "8873Q",
+            "message": "Please check and either amend data or provide a reason: When there is only one assessment on the episode and the factors code “21 No factors identified” has been used for the completed assessment, the reason for closure ‘RC8’ or 'RC9' should be used.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8873Q.py",
+        },
+        {
+            "code": "8875",
+            "message": "The Date of Initial Child Protection Conference cannot be a weekend",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8875.py",
+        },
+        {
+            "code": "8890",
+            "message": "A Section 47 enquiry is shown as starting when there is another Section 47 Enquiry ongoing",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8890.py",
+        },
+        {
+            "code": "8896",
+            "message": "Within one CINDetails group there are 2 or more open Assessments groups",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8896.py",
+        },
+        {
+            "code": "8897Q",
+            "message": "Parental or child factors at assessment information is missing from a completed assessment",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8897Q.py",
+        },
+        {
+            "code": "8898",
+            "message": " The assessment has more than one parental or child factors with the same code",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8898.py",
+        },
+        {
+            "code": "8905",
+            "message": "Initial Category of Abuse code missing or invalid (see Category of Abuse table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8905.py",
+        },
+        {
+            "code": "8910",
+            "message": "Latest Category of Abuse code missing or invalid (see Category of Abuse table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8910.py",
+        },
+        {
+            "code": "8915",
+            "message": "Child Protection Plan shown as starting after the child’s Date of Death",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8915.py",
+        },
+        {
+            "code": "8920",
+            "message": "Child Protection Plan cannot end after the child’s Date of Death",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8920.py",
+        },
+        {
+            "code": "8925",
+            "message": "Child Protection Plan End Date earlier than Start Date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8925.py",
+        },
+        {
+            "code": "8930",
+            "message": "Child Protection Plan End Date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8930.py",
+        },
+        {
+            "code": "8935",
+            "message": "This child is showing more than one open Child Protection plan, i.e. with no End Date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8935.py",
+        },
+        {
+            "code": "8940",
+            "message": "Child Protection Plan data contains overlapping dates",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8940.py",
+        },
+    ],
+    "cin2024_25": [
+        {
+            "code": "100",
+            "message": "Reference Date is incorrect",
+            "rule_type": "ERROR",
+            "module": "Header",
+            "file": "cin2022_23/rule_100.py",
+        },
+        {
+            "code": "1103",
+            "message": "The assessment start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_1103.py",
+        },
+        {
+            "code": "1104",
+            "message": "The date of the initial child protection conference cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_1104.py",
+        },
+        {
+            "code": "1105",
+            "message": "The child protection plan start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_1105.py",
+        },
+        {
+            "code": "1510",
+            "message": "UPN invalid (wrong check letter at character 1)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1510.py",
+        },
+        {
+            "code": "1520",
+            "message": "More than one record with the same UPN.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1520.py",
+        },
+        {
+            "code": "1530",
+            "message": "UPN invalid (characters 2-4 not a recognised LA code)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2023_24/rule_1530.py",
+        },
+        {
+            "code": "1540",
+            "message": "UPN invalid (characters 5-12 not all numeric)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1540.py",
+        },
+        {
+            "code": "1550",
+            "message": "UPN invalid (character 13 not a recognised value)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1550.py",
+        },
+        {
+            "code": "1560Q",
+            "message": "Please check and either amend or provide a reason: Former UPN wrongly formatted",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_1560Q.py",
+        },
+        {
+            "code": "1570",
+            "message": "LA Child ID must not be longer than 20 characters",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2024_25/rule_1570.py",
+        },
+        {
+            "code": "1580",
+            "message": "LA Child ID must not contain any non-alphanumeric characters",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2024_25/rule_1580.py",
+        },
+        {
+            "code": "2883",
+            "message": "There are more child protection plans starting than initial conferences taking place",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_2883.py",
+        },
+        {
+            "code": "2884",
+            "message": "An initial child protection conference is recorded at both the S47 and CIN Details level and it should only be recorded in one",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_2884.py",
+        },
+        {
+            "code": "2885",
+            "message": "Child protection plan shown as starting a different day to the initial child protection conference.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_2885.py",
+        },
+        {
+            "code": "2886Q",
+            "message": "Please check and either amend or provide a reason: Percentage of children with no sex recorded is more than 2% (excluding unborns)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2024_25/rule_2886Q.py",
+        },
+        {
+            "code": "2887Q",
+            "message": "Please check and either amend or provide a reason: Less than 8 disability codes have been used in your return",
+            "rule_type": "QUERY",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_2887Q.py",
+        },
+        {
+            "code": "2888Q",
+            "message": "Please check and either amend or provide a reason: Only one disability code is recorded per child and multiple disabilities should be recorded where possible.",
+            "rule_type": "QUERY",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_2888Q.py",
+        },
+        {
+            "code": "2889",
+            "message": "The S47 start date cannot be before the referral date.",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_2889.py",
+        },
+        {
+            "code": "2990",
+            "message": "Activity is recorded against a case marked as ‘Case closed after assessment, no further action’ or 'case closed after assessment, referred to early help'.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_2990.py",
+        },
+        {
+            "code": "2991Q",
+            "message": "Please check and either amend data or provide a reason: A Section 47 module is recorded and there is no assessment on the episode",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_2991Q.py",
+        },
+        {
+            "code": "4000",
+            "message": "CIN Plan details provided for a referral with no further action",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4000.py",
+        },
+        {
+            "code": "4001",
+            "message": "A CIN Plan cannot run concurrently with a Child Protection Plan",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4001.py",
+        },
+        {
+            "code": "4003",
+            "message": "A CPP review date is shown as being held at the same time as an open CIN Plan.",
+            "rule_type": "ERROR",
+            "module": "Reviews",
+            "file": "cin2022_23/rule_4003.py",
+        },
+        {
+            "code": "4004",
+            "message": "This child is showing more than one open CIN Plan, i.e. with no End Date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4004.py",
+        },
+        {
+            "code": "4008",
+            "message": "CIN Plan shown as starting after the child’s Date of Death.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4008.py",
+        },
+        {
+            "code": "4009Q",
+            "message": "CIN Plan cannot end after the child’s Date of Death",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_4009Q.py",
+        },
+        {
+            "code": "4010",
+            "message": "CIN Plan start date is missing or out of data collection period",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4010.py",
+        },
+        {
+            "code": "4011",
+            "message": "CIN Plan End Date earlier than Start Date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4011.py",
+        },
+        {
+            "code": "4012Q",
+            "message": "Please check and either amend or provide a reason: CIN Plan shown as starting and ending on the same day",
+            "rule_type": "QUERY",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4012Q.py",
+        },
+        {
+            "code": "4013",
+            "message": "CIN Plan end date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4013.py",
+        },
+        {
+            "code": "4014",
+            "message": "CIN Plan data contains overlapping dates",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4014.py",
+        },
+        {
+            "code": "4015",
+            "message": "The CIN Plan start date cannot be before the referral date",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4015.py",
+        },
+        {
+            "code": "4016",
+            "message": "A CIN Plan has been reported as open at the same time as a Child Protection Plan.",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4016.py",
+        },
+        {
+            "code": "4017",
+            "message": "A CIN Plan has been reported as open at the same time as a Child Protection Plan.",
+            "rule_type": "ERROR",
+            "module": "CINplanDates",
+            "file": "cin2022_23/rule_4017.py",
+        },
+        {
+            "code": "4180",
+            "message": "Sex must be provided and equal M, F, or U",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2024_25/rule_4180.py",
+        },
+        {
+            "code": "4220",
+            "message": "Ethnicity is missing or invalid (see Ethnicity table)",
+            "rule_type": "ERROR",
+            "module": "ChildCharacteristics",
+            "file": "cin2022_23/rule_4220.py",
+        },
+        {
+            "code": "8500",
+            "message": "LA Child ID missing",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8500.py",
+        },
+        {
+            "code": "8510",
+            "message": "More than one child record with the same LA Child ID",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8510.py",
+        },
+        {
+            "code": "8520",
+            "message": "Date of Birth is after data collection period (must be on or before the end of the census period)",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8520.py",
+        },
+        {
+            "code": "8525Q",
+            "message": "Either Date of Birth or Expected Date of Birth must be provided (but not both)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8525Q.py",
+        },
+        {
+            "code": "8530Q",
+            "message": "Please check and either amend data or provide a reason: Expected Date of Birth is outside the expected range for this census (March to December of the Census Year end)",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8530Q.py",
+        },
+        {
+            "code": "8535Q",
+            "message": "Please check and either amend data or provide a reason: Child’s date of death should not be prior to the date of birth",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8535Q.py",
+        },
+        {
+            "code": "8540",
+            "message": "Child’s disability is missing or invalid (see Disability table)",
+            "rule_type": "ERROR",
+            "module": "ChildCharacteristics",
+            "file": "cin2022_23/rule_8540.py",
+        },
+        {
+            "code": "8545Q",
+            "message": "Please check and either amend data or provide a reason: Child's date of death should be within the census year",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8545Q.py",
+        },
+        {
+            "code": "8555Q",
+            "message": "Child cannot be referred after its recorded date of death",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8555Q.py",
+        },
+        {
+            "code": "8565",
+            "message": "Activity shown after a case has been closed",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8565.py",
+        },
+        {
+            "code": "8568",
+            "message": "RNFA flag is missing or invalid",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8568.py",
+        },
+        {
+            "code": "8569Q",
+            "message": "A case with referral date before one working day prior to the collection start date must not be flagged as a no further action case",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8569Q.py",
+        },
+        {
+            "code": "8585Q",
+            "message": "Please check and either amend or provide a reason: CIN episode shows Died as the Closure Reason, however child has no recorded Date of Death",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8585Q.py",
+        },
+        {
+            "code": "8590",
+            "message": "Child does not have a recorded CIN episode.",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8590.py",
+        },
+        {
+            "code": "8600",
+            "message": "Child referral date missing or after data collection period",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8600.py",
+        },
+        {
+            "code": "8606",
+            "message": "Child referral date is more than 40 weeks before DOB or expected DOB",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8606.py",
+        },
+        {
+            "code": "8608",
+            "message": "Assessment Start Date cannot be later than its End Date",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8608.py",
+        },
+        {
+            "code": "8610",
+            "message": "Primary Need code is missing for a referral which led to further action.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8610.py",
+        },
+        {
+            "code": "8614",
+            "message": "Parental or child factors at assessment should only be present for a completed assessment.",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8614.py",
+        },
+        {
+            "code": "8615",
+            "message": "Section 47 Enquiry Start Date must be present and cannot be later than the date of the initial Child Protection Conference",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8615.py",
+        },
+        {
+            "code": "8620",
+            "message": "CIN Closure Date present and does not fall within the Census year",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8620.py",
+        },
+        {
+            "code": "8630",
+            "message": "CIN Closure Date is before CIN Referral Date for the same CIN episode",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8630.py",
+        },
+        {
+            "code": "8640",
+            "message": "CIN Reason for closure code invalid (see Reason for Closure table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8640.py",
+        },
+        {
+            "code": "8650",
+            "message": "Primary Need Code invalid (see Primary Need table in CIN census code set)",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8650.py",
+        },
+        {
+            "code": "8670Q",
+            "message": "Please check and either amend data or provide a reason: Assessment started more than 45 working days before the end of the census year. However, there is no Assessment end date.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8670Q.py",
+        },
+        {
+            "code": "8675Q",
+            "message": "Please check and either amend data or provide a reason: S47 Enquiry started more than 15 working days before the end of the census year. However, there is no date of Initial Child Protection Conference.",
+            "rule_type": "QUERY",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8675Q.py",
+        },
+        {
+            "code": "8696",
+            "message": "Assessment end date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8696.py",
+        },
+        {
+            "code": "8715",
+            "message": "Date of Initial Child Protection Conference must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8715.py",
+        },
+        {
+            "code": "8720",
+            "message": "Child Protection Plan Start Date missing or out of data collection period",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8720.py",
+        },
+        {
+            "code": "8730",
+            "message": "Total Number of previous Child Protection Plans missing",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8730.py",
+        },
+        {
+            "code": "8736",
+            "message": "For an Assessment that has not been completed, the start date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8736.py",
+        },
+        {
+            "code": "8740",
+            "message": "For a Section 47 Enquiry that has not held the Initial Child Protection Conference by the end of the census year, the start date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8740.py",
+        },
+        {
+            "code": "8750",
+            "message": "Sex must equal U for an unborn child",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2024_25/rule_8750.py",
+        },
+        {
+            "code": "8770Q",
+            "message": "Please check and either amend data or provide a reason: UPN is missing or reason UPN is missing or is UN1 for a child who is of school age.",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2024_25/rule_8770Q.py",
+        },
+        {
+            "code": "8772",
+            "message": "UPN unknown reason is UN7 (Referral with no further action) but at least one CIN details is a referral going on to further action",
+            "rule_type": "ERROR",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8772.py",
+        },
+        {
+            "code": "8775Q",
+            "message": "Please check and either amend data or provide a reason: Child is over 25 years old",
+            "rule_type": "QUERY",
+            "module": "ChildIdentifiers",
+            "file": "cin2022_23/rule_8775Q.py",
+        },
+        {
+            "code": "8790",
+            "message": "Disability information includes both None and other values",
+            "rule_type": "ERROR",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_8790.py",
+        },
+        {
+            "code": "8794",
+            "message": "Child has two or more disabilities with the same code",
+            "rule_type": "ERROR",
+            "module": "Disabilities",
+            "file": "cin2022_23/rule_8794.py",
+        },
+        {
+            "code": "8805",
+            "message": "A CIN case cannot have a CIN closure date without a Reason for Closure",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8805.py",
+        },
+        {
+            "code": "8810",
+            "message": "A CIN case cannot have a Reason for Closure without a CIN Closure Date",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8810.py",
+        },
+        {
+            "code": "8815",
+            "message": "More than one open CIN Details episode (a module with no CIN Closure Date) has been provided for this child and case is not a referral with no further action.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8815.py",
+        },
+        {
+            "code": "8816",
+            "message": "An open CIN episode is shown and case is not a referral with no further action, but it is not the latest episode.",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8816.py",
+        },
+        {
+            "code": "8820",
+            "message": "The dates on the CIN episodes for this child overlap",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8820.py",
+        },
+        {
+            "code": "8825Q",
+            "message": "Please check and either amend data or provide a reason: Reason for Closure code RC8 (case closed after assessment) or RC9 (case closed after assessment, referred to early help) has been returned but there is no assessment present for the episode.",
+            "rule_type": "QUERY",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8825Q.py",
+        },
+        {
+            "code": "8831",
+            "message": "Activity is recorded against a case marked as a referral with no further action",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8831.py",
+        },
+        {
+            "code": "8832",
+            "message": "Child Protection details provided for a referral with no further action.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8832.py",
+        },
+        {
+            "code": "8839",
+            "message": "Within one CINDetails group there are 2 or more open S47 Assessments",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8839.py",
+        },
+        {
+            "code": "8840",
+            "message": "Child Protection Plan cannot start and end on the same day",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8840.py",
+        },
+        {
+            "code": "8841",
+            "message": "The review date cannot be on the same day or before the Child protection Plan start date.",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8841.py",
+        },
+        {
+            "code": "8842Q",
+            "message": "Please check and either amend or provide a reason: Review Record has a missing date",
+            "rule_type": "QUERY",
+            "module": "Reviews",
+            "file": "cin2022_23/rule_8842Q.py",
+        },
+        {
+            "code": "8863Q",
+            "message": "An Assessment is shown as starting when there is another Assessment ongoing.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8863Q.py",
+        },
+        {
+            "code": "8866",
+            "message": "Source of Referral is missing or an invalid code",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8866.py",
+        },
+        {
+            "code": "8867",
+            "message": "CIN episode is shown as closed, however Assessment is not shown as completed",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8867.py",
+        },
+        {
+            "code": "8868",
+            "message": "CIN episode is shown as closed, however Section 47 enquiry is not shown as completed by ICPC date or ICPC not required flag",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8868.py",
+        },
+        {
+            "code": "8869",
+            "message": "The assessment factors code “21” cannot be used in conjunction with any other assessment factors.",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8869.py",
+        },
+        {
+            "code": "8870Q",
+            "message": "Please check and either amend or provide a reason: The Target Date for Initial Child Protection Conference should not be a weekend",
+            "rule_type": "QUERY",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8870Q.py",
+        },
+        {
+            "code": "8873Q",
+            "message": "Please check and either amend data or provide a reason: When there is only one assessment on the episode and the factors code “21 No factors identified” has been used for the completed assessment, the reason for closure ‘RC8’ or 'RC9' should be used.",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8873Q.py",
+        },
+        {
+            "code": "8875",
+            "message": "The Date of Initial Child Protection Conference cannot be a weekend",
+            "rule_type": "ERROR",
+            "module": "Section47",
+            "file": "cin2022_23/rule_8875.py",
+        },
+        {
+            "code": "8890",
+            "message": "A Section 47 enquiry is shown as starting when there is another Section 47 Enquiry ongoing",
+            "rule_type": "ERROR",
+            "module": "CINdetails",
+            "file": "cin2022_23/rule_8890.py",
+        },
+        {
+            "code": "8896",
+            "message": "Within one CINDetails group there are 2 or more open Assessments groups",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8896.py",
+        },
+        {
+            "code": "8897Q",
+            "message": "Parental or child factors at assessment information is missing from a completed assessment",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8897Q.py",
+        },
+        {
+            "code": "8898",
+            "message": " The assessment has more than one parental or child factors with the same code",
+            "rule_type": "ERROR",
+            "module": "Assessments",
+            "file": "cin2022_23/rule_8898.py",
+        },
+        {
+            "code": "8905",
+            "message": "Initial Category of Abuse code missing or invalid (see Category of Abuse table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8905.py",
+        },
+        {
+            "code": "8910",
+            "message": "Latest Category of Abuse code missing or invalid (see Category of Abuse table in CIN Census code set)",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8910.py",
+        },
+        {
+            "code": "8915",
+            "message": "Child Protection Plan shown as starting after the child’s Date of Death",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8915.py",
+        },
+        {
+            "code": "8920",
+            "message": "Child Protection Plan cannot end after the child’s Date of Death",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8920.py",
+        },
+        {
+            "code": "8925",
+            "message": "Child Protection Plan End Date earlier than Start Date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8925.py",
+        },
+        {
+            "code": "8930",
+            "message": "Child Protection Plan End Date must fall within the census year",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8930.py",
+        },
+        {
+            "code": "8935",
+            "message": "This child is showing more than one open Child Protection plan, i.e. with no End Date",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8935.py",
+        },
+        {
+            "code": "8940",
+            "message": "Child Protection Plan data contains overlapping dates",
+            "rule_type": "ERROR",
+            "module": "ChildProtectionPlans",
+            "file": "cin2022_23/rule_8940.py",
+        },
+        {
+            "code": "8945Q",
+            "message": "Please check and either amend data or provide a reason: the assessment factors code '18A' should not be used ('18B' or '18C' should be used instead)",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2024_25/rule_8945Q.py",
+        },
+        {
+            "code": "8950Q",
+            "message": "Please check and either amend data or provide a reason: the assessment factors code '19A' should not be used ('19B' or '19C' should be used instead)",
+            "rule_type": "QUERY",
+            "module": "Assessments",
+            "file": "cin2024_25/rule_8950Q.py",
+        },
+    ],
+}
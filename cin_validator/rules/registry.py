@@ -0,0 +1,175 @@
+import importlib
+import json
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+# Only the standard library is imported at module level so that rules can be listed
+# without loading pandas or any rule file.
+
+RULESETS = ["cin2022_23", "cin2023_24", "cin2024_25"]
+MANIFEST_PATH = Path(__file__).parent / "manifest.py"
+
+
+@dataclass(frozen=True)
+class RuleEntry:
+    """
+    What the manifest records about a rule: enough to describe it without importing it.
+
+    :param str code: The rule code.
+    :param str message: The message displayed for the rule.
+    :param str rule_type: name of the RuleType, ERROR or QUERY.
+    :param str module: name of the CINTable that the rule belongs to.
+    :param str file: path of the rule file, relative to the rules folder.
+    """
+
+    code: str
+    message: Optional[str]
+    rule_type: str
+    module: Optional[str]
+    file: str
+
+    @property
+    def import_path(self) -> str:
+        # for example, "cin2022_23/rule_100.py" becomes "cin_validator.rules.cin2022_23.rule_100"
+        return "cin_validator.rules." + self.file[: -len(".py")].replace("/", ".")
+
+
+def get_manifest_entries(ruleset: str) -> dict[str, RuleEntry]:
+    """
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    :returns: the manifest entries of every rule in the ruleset, keyed by rule code.
+    :rtype: dict
+    """
+    from cin_validator.rules.manifest import MANIFEST
+
+    return {entry["code"]: RuleEntry(**entry) for entry in MANIFEST[ruleset]}
+
+
+class LazyRegistry(Mapping):
+    """
+    Registry of a ruleset that imports rule files only when their RuleDefinition is requested.
+    Behaves like the dict of rule code to RuleDefinition built in each ruleset's __init__.
+
+    :param str ruleset: name of a rule folder, e.g. cin2024_25.
+    """
+
+    def __init__(self, ruleset: str):
+        self.ruleset = ruleset
+        self.entries = get_manifest_entries(ruleset)
+        self._loaded: dict = {}
+
+    def __getitem__(self, code):
+        code = str(code)
+        if code not in self._loaded:
+            entry = self.entries[code]
+            rule_content = importlib.import_module(entry.import_path)
+            self._loaded[code] = next(
+                element.__rule_def__
+                for element in vars(rule_content).values()
+                if hasattr(element, "__rule_def__")
+                and str(element.__rule_def__.code) == code
+            )
+        return self._loaded[code]
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def load_registries(rulesets: list[str] = RULESETS) -> dict[str, LazyRegistry]:
+    """
+    Imports every rule of the given rulesets, for long-running processes that should not
+    make their first requests wait for rule files to be imported.
+
+    :param list rulesets: names of rule folders, e.g. cin2024_25.
+    :returns: the registry of each ruleset, with all of its rules loaded.
+    :rtype: dict
+    """
+    registries = {}
+    for ruleset in rulesets:
+        registry = LazyRegistry(ruleset)
+        for code in registry:
+            registry[code]
+        registries[ruleset] = registry
+    return registries
+
+
+def _rule_files(ruleset: str) -> dict[int, str]:
+    """maps the id of every RuleDefinition defined in a rule folder to the file that defines it."""
+    folder = Path(__file__).parent / ruleset
+    files = {}
+    for path in sorted(folder.glob("*.py")):
+        if path.stem == "__init__":
+            continue
+        rule_content = importlib.import_module(
+            f"cin_validator.rules.{ruleset}.{path.stem}"
+        )
+        for element in vars(rule_content).values():
+            if hasattr(element, "__rule_def__"):
+                files[id(element.__rule_def__)] = f"{ruleset}/{path.name}"
+    return files
+
+
+def build_manifest() -> dict[str, list[dict]]:
+    """
+    Imports the registry of every ruleset and records its rules.
+
+    :returns: the manifest entries, as dicts, of each ruleset.
+    :rtype: dict
+    """
+    files: dict[int, str] = {}
+    manifest = {}
+    for ruleset in RULESETS:
+        registry = importlib.import_module(f"cin_validator.rules.{ruleset}").registry
+        # rules inherited from earlier years are found in the folders read before this one.
+        files.update(_rule_files(ruleset))
+        # sorted so that the manifest does not depend on the order in which files were found.
+        manifest[ruleset] = [
+            asdict(
+                RuleEntry(
+                    code=str(code),
+                    message=rule.message,
+                    rule_type=rule.rule_type.name,
+                    module=rule.module.name if rule.module is not None else None,
+                    file=files[id(rule)],
+                )
+            )
+            for code, rule in sorted(registry.items())
+        ]
+    return manifest
+
+
+def _literal(value) -> str:
+    """python literal of a manifest value, quoted the way black formats strings."""
+    if value is None:
+        return "None"
+    return json.dumps(value, ensure_ascii=False)
+
+
+def write_manifest(path: Path = MANIFEST_PATH):
+    """
+    Regenerates the manifest module. Run it after adding, removing or editing the definition of a rule:
+    python -m cin_validator manifest
+
+    :param Path path: where to write the manifest.
+    """
+    lines = [
+        "# Generated by `python -m cin_validator manifest`. Do not edit by hand.",
+        "MANIFEST = {",
+    ]
+    for ruleset, entries in build_manifest().items():
+        lines.append(f"    {_literal(ruleset)}: [")
+        for entry in entries:
+            lines.append("        {")
+            lines.extend(
+                f"            {_literal(key)}: {_literal(value)},"
+                for key, value in entry.items()
+            )
+            lines.append("        },")
+        lines.append("    ],")
+    lines.append("}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
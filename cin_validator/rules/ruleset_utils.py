@@ -1,7 +1,8 @@
 import importlib
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from cin_validator.rule_engine import RuleDefinition, YearConfig
+from cin_validator.rules.registry import LazyRegistry
 
 
 def check_duplicate_rules(new_funcs: dict, funcs_so_far: dict) -> None:
@@ -63,14 +64,17 @@ def update_validator_functions(
     return updated_validator_funcs
 
 
-def get_year_ruleset(collection_year: str) -> dict[str, RuleDefinition]:
+def year_to_ruleset(collection_year: str) -> str:
     """
-    Gets the registry of validation rules for the year specified in the metadata.
+    Gets the name of the rule folder for the year specified in the metadata.
     """
-    # for example, convert "2023" to "lac2022_23"
-    ruleset = f"cin{int(collection_year)-1}_{collection_year[2:4]}"
+    # for example, convert "2023" to "cin2022_23"
+    return f"cin{int(collection_year)-1}_{collection_year[2:4]}"
 
-    module = importlib.import_module(f"cin_validator.rules.{ruleset}")
-    registry = getattr(module, "registry")
 
-    return registry
+def get_year_ruleset(collection_year: str) -> Mapping[str, RuleDefinition]:
+    """
+    Gets the registry of validation rules for the year specified in the metadata.
+    Rule files are only imported when their rule is used.
+    """
+    return LazyRegistry(year_to_ruleset(collection_year))
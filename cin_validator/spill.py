@@ -0,0 +1,347 @@
+import ast
+import functools
+import inspect
+import shutil
+import sys
+import tempfile
+import weakref
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from cin_validator.rule_engine import CINTable, RuleDefinition
+from cin_validator.upn import CHECK_COLUMNS
+from cin_validator.utils import SURROGATE_KEYS
+
+# Memory budget mode. Once the data has been ingested, its tables are written to disk and the in-memory
+# copies are released. Each rule then reads the tables it asks for from disk, and only the columns that
+# its source refers to. This replaces the deep copy of the whole data that every rule otherwise gets,
+# and the copy kept for the reports.
+
+FORMATS = ["pickle", "arrow"]
+# ID columns are used by shared helpers, such as merge_on_ids, rather than named in the rules.
+ID_COLUMNS = ["LAchildID", "CINdetailsID", "AssessmentID", "CPPID"]
+# each rule, the tables it reads and the reports need one copy of the data each. Data that
+# would not fit that many times in the budget is spilled.
+COPIES_IN_MEMORY = 3
+# codes of rules that always get whole tables. A rule that reads a column its source does not name, e.g. through
+# a helper or a computed name, gets different results on projected tables without raising. Add it here.
+# tests/test_spill.py compares projected and whole-table results of every rule.
+WHOLE_TABLE_RULES: set[str] = set()
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow.feather as feather
+    except ImportError as e:
+        raise ImportError(
+            "Spilling tables in the arrow format requires pyarrow: pip install pyarrow"
+        ) from e
+    return feather
+
+
+def table_name(table) -> str:
+    return table.name if isinstance(table, CINTable) else str(table)
+
+
+class SpilledTables(Mapping):
+    """
+    CIN tables kept on disk. Behaves like the dict of table name to DataFrame returned by process_data,
+    but each access reads a new copy of the table. Tables cannot be changed, so copies of this object
+    are the object itself. The files are deleted when it is closed or garbage collected.
+
+    :param dict tables: the DataFrames to spill, keyed by table name.
+    :param Path directory: where the files are written. A temporary folder if None.
+    :param str file_format: pickle writes a file per column, which keeps every dtype as it is.
+        arrow writes a Feather file per table, which is memory-mapped when read. It requires pyarrow.
+    """
+
+    def __init__(
+        self,
+        tables: dict,
+        directory: Optional[Path] = None,
+        file_format: str = "pickle",
+    ):
+        if file_format not in FORMATS:
+            raise ValueError(
+                f"Unknown format {file_format}, expected one of {', '.join(FORMATS)}"
+            )
+        if file_format == "arrow":
+            _import_pyarrow()
+        self.file_format = file_format
+        if directory is None:
+            self.directory = Path(tempfile.mkdtemp(prefix="cin_spill_"))
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, self.directory, ignore_errors=True
+            )
+        else:
+            self.directory = Path(directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._finalizer = None
+        self.columns: dict[str, list[str]] = {}
+        for name, df in tables.items():
+            self._write(table_name(name), df)
+
+    def _write(self, name: str, df: pd.DataFrame):
+        self.columns[name] = list(df.columns)
+        if self.file_format == "arrow":
+            _import_pyarrow().write_feather(df, self.directory / f"{name}.feather")
+            return
+        folder = self.directory / name
+        folder.mkdir(exist_ok=True)
+        pd.to_pickle(df.index, folder / "index.pkl")
+        # files are named by position as column names need not be valid file names.
+        for position, column in enumerate(df.columns):
+            df[column].to_pickle(folder / f"{position}.pkl")
+
+    def load(self, table, columns: Optional[set[str]] = None) -> pd.DataFrame:
+        """
+        :param table: name of a table, or its CINTable.
+        :param set columns: the columns to read. All of them if None.
+        :returns: a new copy of the table, with its columns in their original order.
+        :rtype: DataFrame
+        """
+        name = table_name(table)
+        selected = [
+            column
+            for column in self.columns[name]
+            if columns is None or column in columns
+        ]
+        if self.file_format == "arrow":
+            return (
+                _import_pyarrow()
+                .read_table(
+                    self.directory / f"{name}.feather",
+                    columns=selected,
+                    memory_map=True,
+                )
+                .to_pandas()
+            )
+        folder = self.directory / name
+        index = pd.read_pickle(folder / "index.pkl")
+        positions = {column: i for i, column in enumerate(self.columns[name])}
+        return pd.DataFrame(
+            {
+                column: pd.read_pickle(folder / f"{positions[column]}.pkl")
+                for column in selected
+            },
+            index=index,
+            columns=selected,
+        )
+
+    def view(
+        self, columns: Optional[dict[str, set[str]]] = None, cache: bool = True
+    ) -> "SpilledView":
+        return SpilledView(self, columns, cache)
+
+    def close(self):
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getitem__(self, table):
+        name = table_name(table)
+        if name not in self.columns:
+            raise KeyError(table)
+        return self.load(name)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class SpilledView(Mapping):
+    """
+    The tables of a SpilledTables keyed by CINTable, as CinValidator passes them to rules.
+    Copies of a view read the tables again.
+
+    :param SpilledTables store: where the tables are read from.
+    :param dict columns: the columns to read from each table, keyed by table name. Tables that are not in it
+        are read whole. All tables are read whole if None.
+    :param bool cache: whether each table is only read once, when it is first asked for, so that a rule
+        that changes a table sees its own changes. Otherwise a table is read each time it is asked for,
+        and released as soon as it is no longer used.
+    """
+
+    def __init__(
+        self,
+        store: SpilledTables,
+        columns: Optional[dict[str, set[str]]] = None,
+        cache: bool = True,
+    ):
+        self.store = store
+        self.selected_columns = columns or {}
+        self.cache = cache
+        self._loaded: dict[CINTable, pd.DataFrame] = {}
+
+    def __getitem__(self, table):
+        if table in self._loaded:
+            return self._loaded[table]
+        df = self.store.load(table, self.selected_columns.get(table_name(table)))
+        if self.cache:
+            self._loaded[table] = df
+        return df
+
+    def __iter__(self):
+        return (CINTable[name] for name in self.store if name in CINTable.__members__)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __copy__(self):
+        return SpilledView(self.store, self.selected_columns)
+
+    def __deepcopy__(self, memo):
+        return SpilledView(self.store, self.selected_columns)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_names(module_name: str) -> Optional[frozenset[str]]:
+    """every name, attribute and string in the source of a module, or None if it cannot be read."""
+    module = sys.modules.get(module_name)
+    try:
+        tree = ast.parse(inspect.getsource(module))
+    except (OSError, TypeError):
+        return None
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            names.add(node.attr)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            names.add(node.value)
+    return frozenset(names)
+
+
+def _rule_modules(rule: RuleDefinition) -> list[str]:
+    """the modules that define a rule. Rules compiled from a pattern are also defined by the file that uses it."""
+    modules = [rule.func.__module__]
+    if getattr(rule.func, "__pattern__", None) is not None:
+        modules += [
+            name
+            for name, module in list(sys.modules.items())
+            if name.startswith("cin_validator.rules.")
+            and any(
+                getattr(element, "__rule_def__", None) is rule
+                for element in vars(module).values()
+            )
+        ]
+    return modules
+
+
+def source_names(rule: RuleDefinition) -> Optional[frozenset[str]]:
+    """
+    :param RuleDefinition rule: any rule.
+    :returns: every name, attribute and string in the source of the rule, such as the tables and columns
+        that it reads and the methods that it calls. None if the source cannot be read.
+    :rtype: frozenset
+    """
+    names: frozenset[str] = frozenset()
+    for module_name in _rule_modules(rule):
+        module_names = _module_names(module_name)
+        if module_names is None:
+            return None
+        names |= module_names
+    return names
+
+
+def rule_columns(
+    rule: RuleDefinition, columns: dict[str, list[str]]
+) -> Optional[dict[str, set[str]]]:
+    """
+    Finds the columns that a rule may read: those named in its source, directly or with the suffix
+    that a merge adds, as well as the ID columns and their surrogate keys, and the UPN checks
+    of the UPN columns that it reads.
+
+    :param RuleDefinition rule: the rule.
+    :param dict columns: the columns of each table, keyed by table name.
+    :returns: the columns of each table that the rule may read, keyed by table name.
+        None if the source of the rule cannot be read or the rule is in WHOLE_TABLE_RULES.
+    :rtype: dict
+    """
+    if rule.code in WHOLE_TABLE_RULES:
+        return None
+    names = source_names(rule)
+    if names is None:
+        return None
+    always = set(ID_COLUMNS) | set(SURROGATE_KEYS.values())
+    return {
+        name: {
+            column
+            for column in table_columns
+            if column in names
+            or column in always
+            or any(other.startswith(f"{column}_") for other in names)
+            or CHECK_COLUMNS.get(column) in names
+        }
+        for name, table_columns in columns.items()
+    }
+
+
+def tables_size(tables: dict) -> int:
+    """
+    :param dict tables: DataFrames keyed by table name.
+    :returns: their size in memory, in bytes.
+    :rtype: int
+    """
+    return int(
+        sum(df.memory_usage(index=True, deep=True).sum() for df in tables.values())
+    )
+
+
+def needs_spill(tables: dict, memory_budget: int) -> bool:
+    """
+    :param dict tables: DataFrames keyed by table name.
+    :param int memory_budget: bytes that validation may use.
+    :returns: whether the tables should be spilled to keep validation within the budget.
+    :rtype: bool
+    """
+    return COPIES_IN_MEMORY * tables_size(tables) > memory_budget
+
+
+def peak_rss() -> Optional[int]:
+    """
+    :returns: the most memory that this process has held, in bytes. None where it is not known, e.g. on Windows.
+    :rtype: int
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def budget_report(memory_budget: int, spilled: bool) -> str:
+    """
+    :param int memory_budget: bytes that validation may use.
+    :param bool spilled: whether the tables were spilled.
+    :returns: the peak memory of this process compared to the budget, as text.
+    :rtype: str
+    """
+    peak = peak_rss()
+    mode = "tables spilled to disk" if spilled else "tables kept in memory"
+    if peak is None:
+        return f"Peak memory is not known on this platform ({mode})."
+    verdict = "within" if peak <= memory_budget else "over"
+    return (
+        f"Peak memory {peak / 1024**2:.0f} MB, {verdict} the budget of "
+        f"{memory_budget / 1024**2:.0f} MB ({mode})."
+    )
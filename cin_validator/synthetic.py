@@ -0,0 +1,431 @@
+import datetime
+import random
+import xml.etree.ElementTree as ET
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, Optional
+
+from cin_validator.code_lists import get_code_lists
+
+# Generates CIN census XML of any size for benchmarking and scaling work. The same seed always gives the same file.
+# Children have a realistic mix of CINdetails episodes, assessments with factors, section 47 enquiries,
+# child protection plans with reviews, CIN plans and disabilities. Errors can be injected at a chosen rate per group
+# of rules, so that the reports are representative of real returns as well.
+
+# groups of errors that can be injected, with what they break.
+ERROR_GROUPS = {
+    "missing": "a mandatory value is left out, e.g. CINreferralDate or PersonBirthDate",
+    "codes": "a value is not in its code list, e.g. ReferralSource or Ethnicity",
+    "dates": "dates are out of order, e.g. a CIN closure before its referral",
+    "upn": "the UPN has a wrong check letter or length",
+    "duplicates": "the LAchildID of an earlier child is reused",
+}
+
+# weights of the number of CINdetails, assessments, ... per parent.
+CINDETAILS_PER_CHILD = {1: 80, 2: 17, 3: 3}
+ASSESSMENTS_PER_EPISODE = {0: 20, 1: 70, 2: 10}
+FACTORS_PER_ASSESSMENT = {1: 40, 2: 30, 3: 20, 4: 10}
+# children without disabilities have NONE recorded.
+DISABILITIES_PER_CHILD = {0: 85, 1: 12, 2: 3}
+SECTION47_RATE = 0.3
+CPP_RATE = 0.15
+CIN_PLAN_RATE = 0.5
+OPEN_EPISODE_RATE = 0.5
+UPN_CHECK_LETTERS = "ABCDEFGHJKLMNPQRTUVWXYZ"
+
+# referrals start at most this many days before the census year.
+EARLIEST_REFERRAL = 120
+# an episode lasts at least this many days.
+EPISODE_DAYS = 90
+# assessments started this many days before the reference date may still be ongoing.
+ONGOING_ASSESSMENT_DAYS = 40
+# RC2 is the death of the child, RC8 and RC9 are for episodes with no further action.
+CLOSURE_REASONS = ["RC1", "RC3", "RC4", "RC5", "RC6", "RC7"]
+
+
+def upn(la_code: str, rng: random.Random) -> str:
+    """
+    :param str la_code: three digit code of the local authority.
+    :param Random rng: source of the other digits.
+    :returns: a UPN with a valid check letter.
+    :rtype: str
+    """
+    digits = la_code + "".join(str(rng.randrange(10)) for _ in range(9))
+    remainder = sum(int(digit) * weight for weight, digit in enumerate(digits, 2)) % 23
+    return UPN_CHECK_LETTERS[remainder] + digits
+
+
+class CensusGenerator:
+    """
+    Generates the children of a synthetic CIN census return.
+
+    :param int seed: seeds the random choices.
+    :param str collection_year: year in which the census is returned, e.g. 2025 for the cin2024_25 rules.
+    :param str lea: three digit code of the local authority.
+    :param dict error_rates: for each group in ERROR_GROUPS, the share of children with an error of that group.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        collection_year: str = "2025",
+        lea: str = "201",
+        error_rates: Optional[dict[str, float]] = None,
+    ):
+        error_rates = error_rates or {}
+        unknown = set(error_rates).difference(ERROR_GROUPS)
+        if unknown:
+            raise ValueError(
+                f"Unknown error groups {sorted(unknown)}, expected some of {list(ERROR_GROUPS)}"
+            )
+        self.rng = random.Random(seed)
+        self.collection_year = str(collection_year)
+        self.lea = lea
+        self.error_rates = error_rates
+        self.injected: Counter = Counter()
+        self.child_ids: list[str] = []
+
+        self.reference_date = datetime.date(int(collection_year), 3, 31)
+        self.collection_start = datetime.date(int(collection_year) - 1, 4, 1)
+        ruleset = f"cin{int(collection_year) - 1}_{str(collection_year)[2:4]}"
+        self.codes = get_code_lists(ruleset)
+        # factor 21 means that no factors were identified.
+        self.factors = [code for code in self.codes["AssessmentFactor"] if code != "21"]
+
+    def choose(self, weights: dict):
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def date_between(self, start: datetime.date, end: datetime.date) -> datetime.date:
+        return start + datetime.timedelta(
+            days=self.rng.randint(0, max(0, (end - start).days))
+        )
+
+    def header(self) -> ET.Element:
+        header = ET.Element("Header")
+        details = ET.SubElement(header, "CollectionDetails")
+        add(details, "Collection", "CIN")
+        add(details, "Year", self.collection_year)
+        add(details, "ReferenceDate", self.reference_date)
+        source = ET.SubElement(header, "Source")
+        add(source, "SourceLevel", "L")
+        add(source, "LEA", self.lea)
+        add(source, "SoftwareCode", "cin_validator.synthetic")
+        add(source, "Release", "1")
+        add(source, "SerialNo", "001")
+        add(source, "DateTime", f"{self.reference_date}T00:00:00")
+        return header
+
+    def child(self, index: int) -> ET.Element:
+        """
+        :param int index: position of the child in the return, which makes its LAchildID.
+        :returns: a Child element, with errors injected at the configured rates.
+        :rtype: Element
+        """
+        rng = self.rng
+        child = ET.Element("Child")
+        child_id = f"SYN{index:08d}"
+
+        identifiers = ET.SubElement(child, "ChildIdentifiers")
+        add(identifiers, "LAchildID", child_id)
+        add(identifiers, "UPN", upn(self.lea, rng))
+        birth_date = self.date_between(
+            self.reference_date - datetime.timedelta(days=17 * 365),
+            self.collection_start - datetime.timedelta(days=365),
+        )
+        add(identifiers, "PersonBirthDate", birth_date)
+        if "Sex" in self.codes:
+            add(identifiers, "Sex", rng.choice(self.codes["Sex"][:2]))
+        else:
+            # returns before 2024 to 2025 record gender instead.
+            add(identifiers, "GenderCurrent", rng.choice(["1", "2"]))
+
+        characteristics = ET.SubElement(child, "ChildCharacteristics")
+        ethnicities = self.codes["Ethnicity"]
+        add(
+            characteristics,
+            "Ethnicity",
+            "WBRI" if rng.random() < 0.7 else rng.choice(ethnicities),
+        )
+        block = ET.SubElement(characteristics, "Disabilities")
+        disabilities = self.choose(DISABILITIES_PER_CHILD)
+        codes = [code for code in self.codes["Disability"] if code != "NONE"]
+        for disability in rng.sample(codes, disabilities) or ["NONE"]:
+            add(block, "Disability", disability)
+
+        # episodes follow each other and end in the census year. Only the last one may still be open.
+        episodes = self.choose(CINDETAILS_PER_CHILD)
+        period_start = self.collection_start - datetime.timedelta(
+            days=EARLIEST_REFERRAL
+        )
+        span = (self.reference_date - period_start).days // episodes
+        for episode in range(episodes):
+            start = period_start + datetime.timedelta(days=episode * span)
+            end = start + datetime.timedelta(days=span - 1)
+            is_open = episode == episodes - 1 and rng.random() < OPEN_EPISODE_RATE
+            child.append(self.cin_details(start, end, is_open))
+
+        self.inject_errors(child)
+        self.child_ids.append(identifiers.findtext("LAchildID"))
+        return child
+
+    def cin_details(
+        self, period_start: datetime.date, period_end: datetime.date, is_open: bool
+    ) -> ET.Element:
+        """
+        :param date period_start: first day that the episode may start.
+        :param date period_end: last day that the episode may end.
+        :param bool is_open: whether the episode is still open on the reference date.
+        :returns: a CINdetails element whose dates are within the period.
+        :rtype: Element
+        """
+        rng = self.rng
+        details = ET.Element("CINdetails")
+        # at least EPISODE_DAYS are left for the work that follows a referral.
+        referral = self.date_between(
+            period_start,
+            max(period_start, period_end - datetime.timedelta(days=EPISODE_DAYS)),
+        )
+        closure = (
+            None
+            if is_open
+            else self.date_between(
+                max(
+                    referral + datetime.timedelta(days=EPISODE_DAYS),
+                    self.collection_start,
+                ),
+                max(period_end, referral + datetime.timedelta(days=EPISODE_DAYS)),
+            )
+        )
+        last_day = closure or self.reference_date
+
+        add(details, "CINreferralDate", referral)
+        add(details, "ReferralSource", rng.choice(self.codes["ReferralSource"]))
+        add(
+            details,
+            "PrimaryNeedCode",
+            rng.choice(
+                [code for code in self.codes["PrimaryNeedCode"] if code != "N0"]
+            ),
+        )
+        if closure is not None:
+            add(details, "CINclosureDate", closure)
+            add(details, "ReasonForClosure", rng.choice(CLOSURE_REASONS))
+
+        has_section47 = rng.random() < SECTION47_RATE
+        conference = None
+        if has_section47:
+            s47_start = self.date_between(
+                referral, referral + datetime.timedelta(days=10)
+            )
+            target = s47_start + datetime.timedelta(days=15)
+            # conferences are held on working days within the census year.
+            conference = self.date_between(s47_start, target)
+            while conference.weekday() >= 5:
+                conference += datetime.timedelta(days=1)
+            if conference < self.collection_start or rng.random() >= CPP_RATE:
+                conference = None
+        has_cpp = conference is not None
+
+        # an enquiry follows an assessment. Assessments follow each other.
+        assessments = self.choose(ASSESSMENTS_PER_EPISODE)
+        start = referral
+        for _ in range(max(assessments, int(has_section47))):
+            if start is None or start > last_day:
+                break
+            assessment, start = self.assessment(start, last_day)
+            details.append(assessment)
+
+        if not has_cpp and rng.random() < CIN_PLAN_RATE:
+            plan = ET.SubElement(details, "CINPlanDates")
+            plan_start = self.date_between(
+                referral, referral + datetime.timedelta(days=30)
+            )
+            add(plan, "CINPlanStartDate", plan_start)
+            if closure is not None:
+                add(plan, "CINPlanEndDate", closure)
+
+        if has_section47:
+            section47 = ET.SubElement(details, "Section47")
+            add(section47, "S47ActualStartDate", s47_start)
+            add(section47, "InitialCPCtarget", target)
+            # the conference is recorded here rather than on the CINdetails.
+            if has_cpp:
+                add(section47, "DateOfInitialCPC", conference)
+            add(section47, "ICPCnotRequired", "false" if has_cpp else "true")
+
+        add(details, "ReferralNFA", "false")
+
+        if has_cpp:
+            details.append(self.protection_plan(conference, closure))
+        return details
+
+    def assessment(self, earliest: datetime.date, last_day: datetime.date):
+        """
+        :param date earliest: first day that the assessment may start.
+        :param date last_day: the closure of the episode, or the reference date if it is open.
+        :returns: an Assessments element, and the day after it was authorised, None if it is still ongoing.
+        :rtype: tuple
+        """
+        rng = self.rng
+        assessment = ET.Element("Assessments")
+        start = self.date_between(
+            earliest, min(earliest + datetime.timedelta(days=20), last_day)
+        )
+        add(assessment, "AssessmentActualStartDate", start)
+        authorisation = start + datetime.timedelta(days=rng.randint(5, 40))
+        # assessments that end before the census year are not returned, and closed episodes have no open assessments.
+        authorisation = max(authorisation, self.collection_start)
+        if authorisation > last_day:
+            if (
+                last_day == self.reference_date
+                and start > last_day - datetime.timedelta(days=ONGOING_ASSESSMENT_DAYS)
+            ):
+                return assessment, None
+            authorisation = last_day
+        add(assessment, "AssessmentAuthorisationDate", authorisation)
+        factors = ET.SubElement(assessment, "FactorsIdentifiedAtAssessment")
+        for factor in rng.sample(self.factors, self.choose(FACTORS_PER_ASSESSMENT)):
+            add(factors, "AssessmentFactors", factor)
+        return assessment, authorisation + datetime.timedelta(days=1)
+
+    def protection_plan(
+        self, start: datetime.date, closure: Optional[datetime.date]
+    ) -> ET.Element:
+        rng = self.rng
+        plan = ET.Element("ChildProtectionPlans")
+        add(plan, "CPPstartDate", start)
+        end = closure if closure is not None and closure > start else None
+        if end is not None:
+            add(plan, "CPPendDate", end)
+        category = rng.choice(self.codes["InitialCategoryOfAbuse"])
+        add(plan, "InitialCategoryOfAbuse", category)
+        add(plan, "LatestCategoryOfAbuse", category)
+        add(plan, "NumberOfPreviousCPP", rng.choice([0, 0, 0, 1, 2]))
+
+        # the first review is within three months, then one every six months.
+        reviews = ET.SubElement(plan, "Reviews")
+        review = start + datetime.timedelta(days=rng.randint(60, 90))
+        while review < (end or self.reference_date):
+            add(reviews, "CPPreviewDate", review)
+            review += datetime.timedelta(days=rng.randint(150, 180))
+        if not len(reviews):
+            plan.remove(reviews)
+        return plan
+
+    def inject_errors(self, child: ET.Element):
+        rng = self.rng
+        for group, rate in self.error_rates.items():
+            if rng.random() >= rate:
+                continue
+            identifiers = child.find("ChildIdentifiers")
+            details = child.find("CINdetails")
+            if group == "missing":
+                parent, tag = rng.choice(
+                    [
+                        (details, "CINreferralDate"),
+                        (details, "ReferralSource"),
+                        (identifiers, "PersonBirthDate"),
+                    ]
+                )
+                parent.remove(parent.find(tag))
+            elif group == "codes":
+                parent, tag = rng.choice(
+                    [
+                        (details, "ReferralSource"),
+                        (details, "PrimaryNeedCode"),
+                        (child.find("ChildCharacteristics"), "Ethnicity"),
+                    ]
+                )
+                if parent.find(tag) is None:
+                    continue
+                parent.find(tag).text = "XX"
+            elif group == "dates":
+                if details.find("CINreferralDate") is None:
+                    # already broken by a missing error.
+                    continue
+                referral = datetime.date.fromisoformat(
+                    details.findtext("CINreferralDate")
+                )
+                closure = details.find("CINclosureDate")
+                if closure is None:
+                    # a referral after the reference date.
+                    details.find("CINreferralDate").text = str(
+                        self.reference_date + datetime.timedelta(days=10)
+                    )
+                else:
+                    closure.text = str(referral - datetime.timedelta(days=10))
+            elif group == "upn":
+                element = identifiers.find("UPN")
+                check, digits = element.text[0], element.text[1:]
+                element.text = rng.choice(
+                    [
+                        UPN_CHECK_LETTERS[
+                            (UPN_CHECK_LETTERS.index(check) + 1)
+                            % len(UPN_CHECK_LETTERS)
+                        ]
+                        + digits,
+                        element.text[:-1],
+                    ]
+                )
+            elif group == "duplicates":
+                if not self.child_ids:
+                    continue
+                identifiers.find("LAchildID").text = rng.choice(self.child_ids)
+            self.injected[group] += 1
+
+
+def add(parent: ET.Element, tag: str, value) -> ET.Element:
+    element = ET.SubElement(parent, tag)
+    element.text = str(value)
+    return element
+
+
+def generate_census(
+    children: int,
+    seed: int = 0,
+    collection_year: str = "2025",
+    lea: str = "201",
+    error_rates: Optional[dict[str, float]] = None,
+    generator: Optional[CensusGenerator] = None,
+) -> Iterator[str]:
+    """
+    Generates a CIN census return one child at a time, so that large returns are not held in memory.
+
+    :param int children: the number of children in the return.
+    :param generator: used instead of creating a generator from seed, collection_year, lea and error_rates,
+        e.g. to read the number of errors injected afterwards.
+    :returns: the pieces of the XML document, in order.
+    :rtype: Iterator of str
+    """
+    if generator is None:
+        generator = CensusGenerator(seed, collection_year, lea, error_rates)
+    yield "<Message>\n"
+    yield ET.tostring(generator.header(), encoding="unicode") + "\n"
+    yield "<Children>\n"
+    for index in range(1, children + 1):
+        yield ET.tostring(generator.child(index), encoding="unicode") + "\n"
+    yield "</Children>\n</Message>\n"
+
+
+def write_census(
+    path: Path,
+    children: int,
+    seed: int = 0,
+    collection_year: str = "2025",
+    lea: str = "201",
+    error_rates: Optional[dict[str, float]] = None,
+) -> Counter:
+    """
+    Writes a synthetic CIN census return. See CensusGenerator for the parameters.
+
+    :param Path path: the XML file to write.
+    :param int children: the number of children in the return.
+    :returns: the number of errors injected in each group.
+    :rtype: Counter
+    """
+    generator = CensusGenerator(seed, collection_year, lea, error_rates)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(generate_census(children, generator=generator))
+    return generator.injected
@@ -1,9 +1,51 @@
-from typing import Callable
+import copy
+from typing import Callable, Optional
+
+import pandas as pd
 
 from cin_validator.rule_engine import RuleContext, RuleDefinition
 
+# the RuleContext properties that make up the report of a rule.
+REPORT_PROPERTIES = [
+    "type_zero_issues",
+    "type_one_issues",
+    "type_two_issues",
+    "type_three_issues",
+    "la_level_issues",
+]
+
 
-def run_rule(rule_func: RuleDefinition, datasets: dict) -> RuleContext:
-    ctx = RuleContext(rule_func.__rule_def__)
+def run_rule(
+    rule_func: RuleDefinition, datasets: dict, ruleset: Optional[str] = None
+) -> RuleContext:
+    ctx = RuleContext(rule_func.__rule_def__, ruleset)
     rule_func(datasets, ctx)
     return ctx
+
+
+def assert_rules_equivalent(first: Callable, second: Callable, datasets: dict):
+    """
+    Checks that two implementations of a rule report the same issue locations.
+    Used when a hand-written rule is ported to another implementation, e.g. a rule pattern.
+
+    :param function first: a function decorated with rule_definition.
+    :param function second: another function decorated with rule_definition.
+    :param dict datasets: the data to run both rules on. Each rule gets its own copy.
+    :raises AssertionError: if the rules report different issues.
+    """
+    first_ctx = run_rule(first, copy.deepcopy(datasets))
+    second_ctx = run_rule(second, copy.deepcopy(datasets))
+
+    for name in REPORT_PROPERTIES:
+        first_issues = getattr(first_ctx, name)
+        second_issues = getattr(second_ctx, name)
+        if isinstance(first_issues, list) or isinstance(second_issues, list):
+            # rules that do not push this kind of issue return an empty list.
+            assert len(first_issues) == len(second_issues) == 0, name
+            continue
+        pd.testing.assert_frame_equal(
+            first_issues.reset_index(drop=True),
+            second_issues.reset_index(drop=True),
+            check_dtype=False,
+            obj=name,
+        )
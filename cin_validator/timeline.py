@@ -0,0 +1,256 @@
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from cin_validator.rule_engine import CINTable
+from cin_validator.utils import id_values
+
+# every dated field that belongs to a CIN episode, i.e. a (LAchildID, CINdetailsID) group.
+EPISODE_DATE_FIELDS = {
+    CINTable.CINdetails: [
+        CINTable.CINdetails.CINreferralDate,
+        CINTable.CINdetails.CINclosureDate,
+        CINTable.CINdetails.DateOfInitialCPC,
+    ],
+    CINTable.Assessments: [
+        CINTable.Assessments.AssessmentActualStartDate,
+        CINTable.Assessments.AssessmentInternalReviewDate,
+        CINTable.Assessments.AssessmentAuthorisationDate,
+    ],
+    CINTable.Section47: [
+        CINTable.Section47.S47ActualStartDate,
+        CINTable.Section47.InitialCPCtarget,
+        CINTable.Section47.DateOfInitialCPC,
+    ],
+    CINTable.ChildProtectionPlans: [
+        CINTable.ChildProtectionPlans.CPPstartDate,
+        CINTable.ChildProtectionPlans.CPPendDate,
+    ],
+    CINTable.CINplanDates: [
+        CINTable.CINplanDates.CINPlanStartDate,
+        CINTable.CINplanDates.CINPlanEndDate,
+    ],
+    CINTable.Reviews: [CINTable.Reviews.CPPreviewDate],
+}
+
+LAchildID = CINTable.CINdetails.LAchildID
+CINdetailsID = CINTable.CINdetails.CINdetailsID
+
+
+def day_numbers(dates: pd.Series, date_format: str = "%d/%m/%Y"):
+    """
+    Converts a column of dates to the number of days since 1970-01-01.
+
+    :param Series dates: dates as datetime values or strings in date_format.
+    :param str date_format: format of string dates, day first as in the rules.
+    :returns: day numbers and a mask of which positions held a date.
+    :rtype: tuple of int64 array and bool array
+    """
+    dates = pd.to_datetime(dates, format=date_format, errors="coerce")
+    present = dates.notna().to_numpy()
+    days = dates.to_numpy().astype("datetime64[D]").astype(np.int64)
+    return days, present
+
+
+class EpisodeTimeline:
+    """
+    Compact timeline of every dated event in each CIN episode.
+
+    Events are held in flat arrays sorted by episode and then by date. The events of
+    episode i sit between offsets[i] and offsets[i + 1] (CSR layout) so that questions like
+    "latest activity in this episode" or "anything after the closure date" are answered
+    with array lookups instead of merging every module onto CINdetails.
+
+    :param dict data_container: CIN tables keyed by CINTable.
+    :param dict fields: the dated columns, per table, which should appear on the timeline.
+    """
+
+    def __init__(
+        self,
+        data_container: Mapping[CINTable, pd.DataFrame],
+        fields: Optional[Mapping[CINTable, list[str]]] = None,
+    ):
+        fields = EPISODE_DATE_FIELDS if fields is None else fields
+
+        # every event knows which table-column pair it came from via its position in this list.
+        self.sources = [
+            (table, column) for table, columns in fields.items() for column in columns
+        ]
+
+        child_ids, cin_ids, days, sources, rows = [], [], [], [], []
+        for source_code, (table, column) in enumerate(self.sources):
+            df = data_container[table]
+            if column not in df.columns:
+                continue
+            table_days, present = day_numbers(df[column])
+            # missing IDs match each other, as they do in the merges that the timeline replaces.
+            child_ids.append(id_values(df[LAchildID]).to_numpy()[present])
+            cin_ids.append(id_values(df[CINdetailsID]).to_numpy()[present])
+            days.append(table_days[present])
+            sources.append(np.full(present.sum(), source_code, dtype=np.int16))
+            rows.append(df.index.to_numpy()[present])
+
+        events = pd.MultiIndex.from_arrays(
+            [
+                pd.Index(np.concatenate(child_ids) if child_ids else [], dtype=object),
+                pd.Index(np.concatenate(cin_ids) if cin_ids else [], dtype=object),
+            ],
+            names=[LAchildID, CINdetailsID],
+        )
+        if len(events):
+            episode_codes, self.keys = events.factorize()
+        else:
+            # factorize cannot build the levels of an empty MultiIndex.
+            episode_codes, self.keys = np.array([], "int64"), events
+        days = np.concatenate(days).astype(np.int64) if days else np.array([], "int64")
+        sources = np.concatenate(sources) if sources else np.array([], "int16")
+        rows = np.concatenate(rows).astype(np.int64) if rows else np.array([], "int64")
+
+        order = np.lexsort((days, episode_codes))
+        self.episodes = episode_codes[order]
+        self.days = days[order]
+        self.event_sources = sources[order]
+        self.rows = rows[order]
+
+        counts = np.bincount(self.episodes, minlength=len(self.keys))
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+    def __len__(self):
+        return len(self.days)
+
+    @property
+    def n_episodes(self):
+        return len(self.keys)
+
+    def lookup(self, child_ids, cin_ids) -> np.ndarray:
+        """
+        :param array-like child_ids: LAchildID values.
+        :param array-like cin_ids: CINdetailsID values, one per child id.
+        :returns: episode positions on the timeline. -1 where the episode has no dated events.
+        :rtype: ndarray
+        """
+        query = pd.MultiIndex.from_arrays(
+            [
+                pd.Index(id_values(pd.Series(child_ids, dtype=object))),
+                pd.Index(id_values(pd.Series(cin_ids, dtype=object))),
+            ]
+        )
+        return self.keys.get_indexer(query)
+
+    def max_date(self, episodes: np.ndarray) -> np.ndarray:
+        """
+        :param ndarray episodes: episode positions as returned by lookup.
+        :returns: day number of the latest event per episode, NaN where it has none.
+        :rtype: ndarray
+        """
+        episodes = np.asarray(episodes)
+        result = np.full(len(episodes), np.nan)
+        found = episodes >= 0
+        result[found] = self.days[self.offsets[episodes[found] + 1] - 1]
+        return result
+
+    def min_date(self, episodes: np.ndarray) -> np.ndarray:
+        """
+        :param ndarray episodes: episode positions as returned by lookup.
+        :returns: day number of the earliest event per episode, NaN where it has none.
+        :rtype: ndarray
+        """
+        episodes = np.asarray(episodes)
+        result = np.full(len(episodes), np.nan)
+        found = episodes >= 0
+        result[found] = self.days[self.offsets[episodes[found]]]
+        return result
+
+    def _first_after(
+        self, episodes: np.ndarray, days: np.ndarray, side: str = "right"
+    ) -> np.ndarray:
+        """
+        position of the first event in each episode that is strictly later than the given day,
+        or on or after it if side is "left".
+        """
+        # a single sorted key of (episode, day) allows one searchsorted call for all queries.
+        low = self.days.min()
+        span = int(self.days.max() - low) + 2
+        # event keys of an episode run from episode * span + 1 to episode * span + span - 1, so query keys
+        # clipped to episode * span and episode * span + span stay within the episode, before or after every event.
+        event_keys = self.episodes * span + (self.days - low) + 1
+        query_days = np.clip(days - low, -1, span - 1) + 1
+        query_keys = np.maximum(episodes, 0) * span + query_days
+        return np.searchsorted(event_keys, query_keys, side=side)
+
+    def events_after(self, episodes: np.ndarray, days: np.ndarray):
+        """
+        Finds every event that happens strictly after a given day in the same episode.
+
+        :param ndarray episodes: episode positions as returned by lookup.
+        :param ndarray days: day number to compare against, one per episode position.
+        :returns: query positions and the timeline positions of the events that are later.
+            Both arrays have one element per (query, event) pair.
+        :rtype: tuple of ndarrays
+        """
+        episodes = np.asarray(episodes, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        if len(self.days) == 0:
+            return np.array([], "int64"), np.array([], "int64")
+
+        starts = self._first_after(episodes, days)
+        ends = self.offsets[np.maximum(episodes, 0) + 1]
+        counts = np.where(episodes >= 0, ends - starts, 0)
+        return self._expand(starts, counts)
+
+    def events_before(self, episodes: np.ndarray, days: np.ndarray):
+        """
+        Finds every event that happens strictly before a given day in the same episode.
+
+        :param ndarray episodes: episode positions as returned by lookup.
+        :param ndarray days: day number to compare against, one per episode position.
+        :returns: query positions and the timeline positions of the events that are earlier.
+            Both arrays have one element per (query, event) pair.
+        :rtype: tuple of ndarrays
+        """
+        episodes = np.asarray(episodes, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        if len(self.days) == 0:
+            return np.array([], "int64"), np.array([], "int64")
+
+        starts = self.offsets[np.maximum(episodes, 0)]
+        ends = self._first_after(episodes, days, side="left")
+        counts = np.where(episodes >= 0, ends - starts, 0)
+        return self._expand(starts, counts)
+
+    def _expand(self, starts: np.ndarray, counts: np.ndarray):
+        """expands each range of counts[i] events from starts[i] into (query, event) position pairs."""
+        query_positions = np.repeat(np.arange(len(starts)), counts)
+        range_starts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        event_positions = np.arange(counts.sum()) + range_starts
+        return query_positions, event_positions
+
+    def any_after(self, episodes: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """
+        :param ndarray episodes: episode positions as returned by lookup.
+        :param ndarray days: day number to compare against, one per episode position.
+        :returns: True where the episode has any event strictly after the day.
+        :rtype: ndarray
+        """
+        episodes = np.asarray(episodes, dtype=np.int64)
+        latest = self.max_date(episodes)
+        return (episodes >= 0) & (latest > np.asarray(days))
+
+    def source_of(self, event_positions: np.ndarray):
+        """
+        :param ndarray event_positions: positions on the timeline.
+        :returns: the (table, column) pair that each event came from.
+        :rtype: list of tuples
+        """
+        return [self.sources[code] for code in self.event_sources[event_positions]]
+
+    def from_table(self, event_positions: np.ndarray, table: CINTable) -> np.ndarray:
+        """
+        :param ndarray event_positions: positions on the timeline.
+        :param CINTable table: the table of interest.
+        :returns: mask of the events that were recorded in the table.
+        :rtype: ndarray
+        """
+        codes = [code for code, (t, _) in enumerate(self.sources) if t == table]
+        return np.isin(self.event_sources[event_positions], codes)
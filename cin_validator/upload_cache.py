@@ -0,0 +1,109 @@
+import hashlib
+import sys
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pandas as pd
+
+from cin_validator.cin_validator import convert_data
+
+
+@dataclass
+class ConvertedUpload:
+    """
+    The tables converted from one uploaded XML file.
+
+    :param dict tables: DataFrame of each CIN table, keyed by table name, as returned by convert_data.
+    :param dict json_tables: each table converted to json records, as sent to the frontend.
+    :param int nbytes: approximate memory used by the tables and their json.
+    """
+
+    tables: dict[str, pd.DataFrame]
+    json_tables: dict[str, str]
+    nbytes: int
+
+
+def convert_upload(filebytes: bytes) -> ConvertedUpload:
+    """
+    :param bytes filebytes: content of an uploaded CIN XML file.
+    :returns: its tables, in DataFrame and json form.
+    :rtype: ConvertedUpload
+    """
+    root = ET.fromstring(filebytes.decode("utf-8"))
+    tables = convert_data(root)
+
+    # make data json-serialisable
+    json_tables = {
+        table_name: table_df.to_json(orient="records")
+        for table_name, table_df in tables.items()
+    }
+
+    nbytes = sum(
+        int(table_df.memory_usage(deep=True).sum()) for table_df in tables.values()
+    ) + sum(sys.getsizeof(json_table) for json_table in json_tables.values())
+    return ConvertedUpload(tables, json_tables, nbytes)
+
+
+class UploadCache:
+    """
+    Keeps the tables of recently uploaded files so that a file is only parsed once, e.g. when the
+    frontend calls generate_tables and then cin_validate with the same upload.
+    Uploads are identified by the hash of their content. The least recently used uploads are dropped
+    when there are more than max_entries or when together they use more than max_bytes.
+    It can be shared by threads, e.g. the background validations of the RPC app.
+
+    :param int max_entries: the most uploads kept.
+    :param int max_bytes: the most memory, approximately, used by the uploads kept.
+    """
+
+    def __init__(self, max_entries: int = 8, max_bytes: int = 512 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, ConvertedUpload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, filebytes: bytes) -> ConvertedUpload:
+        """
+        :param bytes filebytes: content of an uploaded CIN XML file.
+        :returns: its tables, converted now or earlier. The DataFrames are copies that callers may modify.
+        :rtype: ConvertedUpload
+        """
+        key = hashlib.sha256(filebytes).hexdigest()
+        with self._lock:
+            upload = self._entries.get(key)
+            if upload is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+        if upload is None:
+            # converted without holding the lock so that other uploads are not held up.
+            upload = convert_upload(filebytes)
+            with self._lock:
+                self.misses += 1
+                if key not in self._entries:
+                    self._store(key, upload)
+
+        # process_data and the validator modify tables in place, so the cached ones are never handed out.
+        return ConvertedUpload(
+            tables={name: df.copy() for name, df in upload.tables.items()},
+            json_tables=upload.json_tables,
+            nbytes=upload.nbytes,
+        )
+
+    def _store(self, key: str, upload: ConvertedUpload):
+        if upload.nbytes > self.max_bytes:
+            # keeping it would push every other upload out.
+            return
+        self._entries[key] = upload
+        self.nbytes += upload.nbytes
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, dropped = self._entries.popitem(last=False)
+            self.nbytes -= dropped.nbytes
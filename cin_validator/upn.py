@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+
+UPN_LENGTH = 13
+
+# the check letter is the letter at position (weighted sum of digits 2 to 13) % 23.
+CHECK_LETTERS = np.array([ord(letter) for letter in "ABCDEFGHJKLMNPQRTUVWXYZ"])
+# character 13 may be a digit or any letter other than I, O and S.
+INVALID_LAST_LETTERS = np.array([ord(letter) for letter in "IOS"])
+
+# the columns that hold UPNs. process_data parses them once per validation, and adds a column per check
+# named <column>_<check>, e.g. UPN_check_ok, which the UPN rules read instead of parsing the column again.
+UPN_COLUMNS = ["UPN", "FormerUPN"]
+CHECKS = [
+    "present",
+    "valid_length",
+    "first_alpha",
+    "digits_2_13",
+    "digits_5_12",
+    "check_ok",
+    "la_code",
+    "last_char_valid",
+]
+# the column that each check column is worked out from.
+CHECK_COLUMNS = {
+    f"{column}_{check}": column for column in UPN_COLUMNS for check in CHECKS
+}
+
+
+def upn_checks(upns: pd.Series) -> pd.DataFrame:
+    """
+    Parses a column of UPNs (or former UPNs) once and works out everything that the UPN rules check.
+
+    The strings are laid out as a fixed-width array of character codes, one row per UPN,
+    so that every check is a vectorised comparison on that array.
+    See https://assets.publishing.service.gov.uk/government/uploads/system/uploads/attachment_data/file/807381/UPN_Guide_1.2.pdf
+
+    :param Series upns: UPN values. Missing values are allowed.
+    :returns: one row per UPN, aligned to the index of upns, with the columns
+        present: a value was provided.
+        valid_length: the value is exactly 13 characters long.
+        first_alpha: character 1 is a letter.
+        digits_2_13: characters 2 to 13 are all digits.
+        digits_5_12: characters 5 to 12 that exist are all digits.
+        check_ok: character 1 is the check letter calculated from characters 2 to 13.
+        la_code: characters 2 to 4 as a number, -1 if they are not all digits.
+        last_char_valid: character 13 is a digit or a letter other than I, O and S.
+    :rtype: DataFrame
+    """
+    present = upns.notna().to_numpy()
+    text = upns.astype(object).where(upns.notna(), "").astype(str).to_numpy()
+
+    # one extra column reveals values that are longer than a UPN. Shorter values are padded with zeros.
+    width = UPN_LENGTH + 1
+    chars = text.astype(f"U{width}").view(np.uint32).reshape(len(text), width)
+    length = (chars != 0).sum(axis=1)
+
+    is_digit = (chars >= ord("0")) & (chars <= ord("9"))
+    is_upper = (chars >= ord("A")) & (chars <= ord("Z"))
+    is_alpha = is_upper | ((chars >= ord("a")) & (chars <= ord("z")))
+    digit_values = np.where(is_digit, chars.astype(np.int64) - ord("0"), 0)
+
+    valid_length = present & (length == UPN_LENGTH)
+    digits_2_13 = is_digit[:, 1:UPN_LENGTH].all(axis=1)
+
+    # digits 2 to 13 are weighted by their position and summed.
+    weights = np.arange(2, UPN_LENGTH + 1)
+    remainder = (digit_values[:, 1:UPN_LENGTH] * weights).sum(axis=1) % 23
+    check_ok = chars[:, 0] == CHECK_LETTERS[remainder]
+
+    # like str[4:12].isdigit(): only the characters that exist are considered, and there must be at least one.
+    window = chars[:, 4:12]
+    padding = window == 0
+    digits_5_12 = (is_digit[:, 4:12] | padding).all(axis=1) & ~padding.all(axis=1)
+
+    la_digits = is_digit[:, 1:4].all(axis=1)
+    la_code = np.where(la_digits, digit_values[:, 1:4] @ np.array([100, 10, 1]), -1)
+
+    last_char = chars[:, UPN_LENGTH - 1]
+    last_char_valid = is_digit[:, UPN_LENGTH - 1] | (
+        is_upper[:, UPN_LENGTH - 1] & ~np.isin(last_char, INVALID_LAST_LETTERS)
+    )
+
+    return pd.DataFrame(
+        {
+            "present": present,
+            "valid_length": valid_length,
+            "first_alpha": present & is_alpha[:, 0],
+            "digits_2_13": present & digits_2_13,
+            "digits_5_12": present & digits_5_12,
+            "check_ok": valid_length & digits_2_13 & check_ok,
+            "la_code": la_code,
+            "last_char_valid": valid_length & last_char_valid,
+        },
+        index=upns.index,
+    )
+
+
+def add_upn_checks(cin_tables: dict):
+    """
+    Adds the checks of upn_checks to every table that holds a UPN column, a column per check.
+
+    :param dict cin_tables: dataframes of CIN data, keyed by table name or CINTable.
+    :returns: the same tables, with check columns added.
+    :rtype: dict
+    """
+    for table in cin_tables.values():
+        for column in UPN_COLUMNS:
+            if column not in table.columns:
+                continue
+            checks = upn_checks(table[column])
+            for check in CHECKS:
+                table[f"{column}_{check}"] = checks[check]
+    return cin_tables
+
+
+def read_upn_checks(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    :param DataFrame df: a table that holds a UPN column.
+    :param str column: UPN or FormerUPN.
+    :returns: the checks of the column, as in upn_checks. They are read from the columns added by
+        process_data, and only worked out here if the table was not processed, e.g. in rule tests.
+    :rtype: DataFrame
+    """
+    check_columns = [f"{column}_{check}" for check in CHECKS]
+    if set(check_columns).issubset(df.columns):
+        return df[check_columns].set_axis(CHECKS, axis=1)
+    return upn_checks(df[column])
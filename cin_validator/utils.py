@@ -3,6 +3,17 @@ import pandas as pd
 
 from cin_validator.england_holidates import england_holidates
 
+# integer surrogate keys that stand in for the string ID columns they are built from.
+SURROGATE_KEYS = {
+    ("LAchildID",): "child_code",
+    ("LAchildID", "CINdetailsID"): "episode_key",
+    ("LAchildID", "CINdetailsID", "CPPID"): "plan_key",
+}
+# missing IDs are given a code of their own so that they match each other, as they do in pd.merge.
+MISSING_ID = "__missing__"
+# the largest value that a surrogate key may need to hold.
+MAX_SURROGATE_KEY = np.iinfo(np.int64).max
+
 
 def get_values(xml_elements, table_dict: dict, xml_block):
     """
@@ -134,3 +145,114 @@ def england_working_days(num_days: int):
 
     # pd.offsets.CustomBusinessDay doesn't seem to include the end date so offset by 1 so that it does.
     return pd.offsets.CustomBusinessDay(n=num_days - 1, calendar=holiday_calendar)
+
+
+def id_values(column: pd.Series) -> pd.Series:
+    """ID values as objects, with missing values replaced by a matchable placeholder."""
+    column = column.astype(object)
+    return column.where(column.notna(), MISSING_ID)
+
+
+def add_surrogate_keys(cin_tables: dict):
+    """
+    Adds integer keys to every table that contains the ID columns they are built from.
+    child_code factorises LAchildID across all tables, episode_key combines it with CINdetailsID
+    and plan_key further combines it with CPPID. Equal IDs get equal keys in every table so that
+    merges and groupbys can hash int64 values instead of python strings.
+
+    :param dict cin_tables: dataframes of CIN data, keyed by table name or CINTable.
+    :returns: the same tables, with key columns added where possible.
+    :rtype: dict
+    """
+
+    id_columns = [id_column[-1] for id_column in SURROGATE_KEYS]
+    # one set of codes per ID column, shared by all tables so that keys can be compared across tables.
+    uniques = {}
+    for id_column in id_columns:
+        values = [
+            id_values(table[id_column])
+            for table in cin_tables.values()
+            if id_column in table.columns
+        ]
+        uniques[id_column] = pd.Index(
+            pd.unique(pd.concat(values, ignore_index=True)) if values else [],
+            dtype=object,
+        )
+
+    # a key combines the codes of its ID columns as the digits of a number, whose base for each column
+    # is the number of IDs in that column. Keys that could overflow int64 are not added, so helpers
+    # such as merge_on_ids fall back to the ID columns.
+    key_names = []
+    key_range = 1
+    for id_cols, key_name in SURROGATE_KEYS.items():
+        key_range *= max(len(uniques[id_cols[-1]]), 1)
+        if key_range > MAX_SURROGATE_KEY:
+            break
+        key_names.append(key_name)
+
+    for table in cin_tables.values():
+        key = None
+        for id_cols, key_name in SURROGATE_KEYS.items():
+            if key_name not in key_names or not set(id_cols).issubset(table.columns):
+                break
+            id_column = id_cols[-1]
+            codes = uniques[id_column].get_indexer(id_values(table[id_column]))
+            codes = codes.astype("int64")
+            key = codes if key is None else key * len(uniques[id_column]) + codes
+            table[key_name] = key
+
+    return cin_tables
+
+
+def merge_on_ids(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    on: list,
+    how: str = "inner",
+    suffixes=("_x", "_y"),
+):
+    """
+    Merges two tables on ID columns. When both tables carry the surrogate key for those columns,
+    the merge is done on the integer key and the result keeps a single copy of the ID columns,
+    just like a merge on the ID columns would.
+
+    :param DataFrame left: left table, as in pd.merge.
+    :param DataFrame right: right table, as in pd.merge.
+    :param list on: ID columns, e.g. ["LAchildID", "CINdetailsID"].
+    :param str how: type of merge. Only inner and left merges use the surrogate key.
+    :param tuple suffixes: suffixes for overlapping column names, as in pd.merge.
+    :returns: merged table.
+    :rtype: DataFrame
+    """
+    on = [on] if isinstance(on, str) else list(on)
+    key = SURROGATE_KEYS.get(tuple(on))
+    if (
+        key is None
+        or how not in ("inner", "left")
+        or key not in left.columns
+        or key not in right.columns
+    ):
+        return left.merge(right, on=on, how=how, suffixes=suffixes)
+
+    # rows only match where the IDs are equal so right's copies of them are redundant.
+    redundant = set(on) | set(SURROGATE_KEYS.values())
+    redundant.discard(key)
+    right = right.drop(columns=[column for column in right if column in redundant])
+    return left.merge(right, on=key, how=how, suffixes=suffixes)
+
+
+def group_codes(df: pd.DataFrame, by: list) -> pd.Series:
+    """
+    Gives every row a group number such that rows with the same values in the by columns
+    share it. Uses the surrogate key of the by columns when the table carries it.
+
+    :param DataFrame df: table whose rows should be grouped.
+    :param list by: ID columns to group by, e.g. ["LAchildID", "CINdetailsID"].
+    :returns: integer group number per row, aligned to the index of df.
+    :rtype: Series
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    key = SURROGATE_KEYS.get(tuple(by))
+    if key in df.columns:
+        return df[key]
+    return df.groupby(by, dropna=False, sort=False).ngroup()
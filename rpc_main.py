@@ -1,13 +1,24 @@
 import datetime
 import json
 import logging
-import xml.etree.ElementTree as ET
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Optional
 
 from prpc_python import RpcApp
 
 from cin_validator import cin_validator
-from cin_validator.rules.ruleset_utils import get_year_ruleset
+from cin_validator.jobs import JobQueue
+from cin_validator.response_format import (
+    CompactEncoder,
+    check_format,
+    compact_data_tables,
+    compact_validation_results,
+)
+from cin_validator.result_store import ResultStore, StoredResult
+from cin_validator.rule_costs import RuleCosts
+from cin_validator.rules.registry import get_manifest_entries, load_registries
+from cin_validator.rules.ruleset_utils import year_to_ruleset
+from cin_validator.upload_cache import UploadCache
 
 logger = logging.getLogger(__name__)
 handler = logging.FileHandler(
@@ -20,6 +31,22 @@ logger.addHandler(handler)
 
 app = RpcApp("validate_cin")
 
+# every rule is imported when the app starts, rather than during the first validation of each year.
+registries = load_registries()
+
+# generate_tables and cin_validate are called with the same upload. It is only parsed once.
+upload_cache = UploadCache()
+
+# results stored by cin_validate(store_result=True), for query_issues and query_data_table.
+result_store = ResultStore()
+
+# validations submitted with submit_validation run in the background, two at a time.
+job_queue = JobQueue(max_running=2, max_waiting=8)
+
+# how long each rule took in earlier validations, so that background jobs report the quickest rules first.
+# Saved after each validation in the working directory of the app, next to its logs, to survive restarts.
+rule_costs = RuleCosts(Path("rule_costs.json"))
+
 
 @app.call
 def get_rules(collection_year: str) -> str:
@@ -27,10 +54,11 @@ def get_rules(collection_year: str) -> str:
     :param str collection_year: validation year e.g "2023" for 2022/2023 validation rules.
     :return rules_df: available rule codes and definitions according to chosen ruleset.
     """
-    ruleset_registry = get_year_ruleset(collection_year)
+    # the manifest describes every rule without importing the rule files.
+    rule_entries = get_manifest_entries(year_to_ruleset(collection_year))
 
     rules = []
-    for _, rule in ruleset_registry.items():
+    for _, rule in rule_entries.items():
         rules.append(
             {
                 "code": str(rule.code),
@@ -42,25 +70,26 @@ def get_rules(collection_year: str) -> str:
 
 
 @app.call
-def generate_tables(cin_data: dict) -> dict[str, dict]:
+def generate_tables(
+    cin_data: dict, response_format: str = "records", encoding: str = "json"
+) -> dict[str, dict]:
     """
     :param cin_data: files uploaded by user mapped to the field where files were uploaded.
+    :param response_format: "records" (default) or "compact", see cin_validator/response_format.py.
+    :param encoding: "json" (default), "gzip" or "arrow". Only used by the compact format.
     :return cin_data_tables:  a dictionary of dataframes that has been converted to json.
     """
+    check_format(response_format, encoding)
+
     # Only a single XML file representing the current year is accepted as an input by the tool.
     cin_data_file = cin_data["This year"][0]
-    filetext = cin_data_file.read().decode("utf-8")
-    root = ET.fromstring(filetext)
+    upload = upload_cache.get(cin_data_file.read())
 
-    data_files = cin_validator.convert_data(root)
+    if response_format == "compact":
+        return compact_data_tables(upload.tables, encoding)
 
-    # make data json-serialisable
-    cin_data_tables = {
-        table_name: table_df.to_json(orient="records")
-        for table_name, table_df in data_files.items()
-    }
-
-    return cin_data_tables
+    # json-serialisable version of the data
+    return upload.json_tables
 
 
 @app.call
@@ -68,40 +97,97 @@ def cin_validate(
     cin_data: dict,
     file_metadata: dict,
     selected_rules: Optional[list[str]] = None,
+    response_format: str = "records",
+    encoding: str = "json",
+    store_result: bool = False,
 ):
     """
     :param cin_data: eys are table names and values are CIN csv files.
     :param file_metadata: contains collection year and local authority as strings.
     :param selected_rules: array of rules the user has chosen. consists of rule codes as strings.
+    :param response_format: "records" (default) or "compact". The compact format sends each table as
+        column names and rows, and each rule description once. See cin_validator/response_format.py.
+    :param encoding: "json" (default), "gzip" or "arrow". Only used by the compact format.
+    :param store_result: if True, the results are kept rather than returned. The response contains the ID
+        to pass to query_issues and query_data_table, and the number of issues per rule and table.
 
     :return issue_report: issue locations in the data.
     :return rule_defs: codes and descriptions of the rules that triggers issues in the data.
     """
+    check_format(response_format, encoding)
+
     cin_data_file = cin_data["This year"][0]
-    filetext = cin_data_file.read().decode("utf-8")
-    root = ET.fromstring(filetext)
+    return validate_upload(
+        cin_data_file.read(),
+        file_metadata,
+        selected_rules,
+        response_format,
+        encoding,
+        store_result,
+    )
 
-    # fulltree = ET.parse("fake_data\\fake_CIN_data.xml")
-    # root = fulltree.getroot()
 
-    raw_data = cin_validator.convert_data(root)
+def validate_upload(
+    filebytes: bytes,
+    file_metadata: dict,
+    selected_rules: Optional[list[str]] = None,
+    response_format: str = "records",
+    encoding: str = "json",
+    store_result: bool = False,
+    on_rule_done: Optional[Callable] = None,
+):
+    """
+    Validates an uploaded file and builds the response of cin_validate.
+    The parameters are those of cin_validate, except:
 
-    # Send string-format data to the frontend.
-    cin_data_tables = {
-        table_name: table_df.to_json(orient="records")
-        for table_name, table_df in raw_data.items()
-    }
+    :param filebytes: content of the uploaded CIN XML file.
+    :param on_rule_done: passed to CinValidator, called after each rule.
+    """
+    upload = upload_cache.get(filebytes)
+    raw_data = upload.tables
+
+    if response_format == "compact" or store_result:
+        # the string-format data, before process_data converts it.
+        string_tables = {name: df.copy() for name, df in raw_data.items()}
 
+    ruleset = year_to_ruleset(file_metadata["collectionYear"])
     # Convert date columns to datetime format to enable comparison in rules.
-    data_files = cin_validator.process_data(raw_data)
+    data_files = cin_validator.process_data(raw_data, ruleset)
     # get rules to run based on specified year.
-    ruleset_registry = get_year_ruleset(file_metadata["collectionYear"])
+    ruleset_registry = registries[ruleset]
 
     # run validation
-    validator = cin_validator.CinValidator(data_files, ruleset_registry, selected_rules)
+    validator = cin_validator.CinValidator(
+        data_files,
+        ruleset_registry,
+        selected_rules,
+        on_rule_done,
+        rule_costs=rule_costs,
+        ruleset=ruleset,
+    )
+    try:
+        rule_costs.save()
+    except OSError as e:
+        # the history only orders rules, the validation still succeeded.
+        logger.warning(f"Could not save rule costs: {e}")
+
+    if store_result:
+        reports = {
+            "issue_locations": validator.full_issue_df,
+            "multichild_issues": validator.multichild_issues,
+            "user_report": validator.user_report,
+        }
+        stored = StoredResult(reports, string_tables)
+        return {"result_id": result_store.add(stored), **stored.summary()}
+
+    if response_format == "compact":
+        return compact_validation_results(validator, string_tables, encoding)
 
     # make return data json-serialisable
 
+    # Send string-format data to the frontend.
+    cin_data_tables = upload.json_tables
+
     # what the frontend will display
     issue_report = validator.full_issue_df.to_json(orient="records")
     multichild_issues = validator.multichild_issues.to_json(orient="records")
@@ -116,3 +202,175 @@ def cin_validate(
         "user_report": [user_report],
     }
     return validation_results
+
+
+def page_response(
+    page, total: int, offset: int, limit: int, response_format: str, encoding: str
+) -> dict:
+    """
+    :param DataFrame page: the rows returned by a query.
+    :param int total: the number of rows that match the query.
+    :param int offset: number of matching rows skipped.
+    :param int limit: the most rows returned.
+    :param str response_format: "records" or "compact".
+    :param str encoding: the encoding of the compact format.
+    :return: the page, in the requested format, with the information needed to fetch the next one.
+    """
+    response = {"total": total, "offset": offset, "limit": limit}
+    if response_format == "compact":
+        encoder = CompactEncoder(encoding)
+        response["rows"] = encoder.payload(
+            {"rows": encoder.table(encoder.normalise(page))}
+        )
+    else:
+        response["rows"] = page.to_json(orient="records")
+    return response
+
+
+@app.call
+def query_issues(
+    result_id: str,
+    report: str = "issue_locations",
+    rule_code: Optional[str] = None,
+    table: Optional[str] = None,
+    child_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 100,
+    response_format: str = "records",
+    encoding: str = "json",
+):
+    """
+    :param result_id: returned by cin_validate when store_result is True.
+    :param report: "issue_locations", "user_report" or "multichild_issues".
+    :param rule_code: only return issues of this rule.
+    :param table: only return issues in this table. Not available for multichild_issues.
+    :param child_id: only return issues of this child. Not available for multichild_issues.
+    :param offset: number of matching issues to skip.
+    :param limit: the most issues returned.
+    :param response_format: "records" (default) or "compact".
+    :param encoding: "json" (default), "gzip" or "arrow". Only used by the compact format.
+
+    :return: a page of matching issues and the total number of matching issues.
+    """
+    check_format(response_format, encoding)
+    stored = result_store.get(result_id)
+    page, total = stored.reports[report].query(
+        offset, limit, rule_code=rule_code, table=table, child_id=child_id
+    )
+    return page_response(page, total, offset, limit, response_format, encoding)
+
+
+@app.call
+def query_data_table(
+    result_id: str,
+    table: str,
+    child_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 100,
+    response_format: str = "records",
+    encoding: str = "json",
+):
+    """
+    :param result_id: returned by cin_validate when store_result is True.
+    :param table: name of the CIN table, e.g. "ChildIdentifiers".
+    :param child_id: only return the rows of this child.
+    :param offset: number of matching rows to skip.
+    :param limit: the most rows returned.
+    :param response_format: "records" (default) or "compact".
+    :param encoding: "json" (default), "gzip" or "arrow". Only used by the compact format.
+
+    :return: a page of the table and the total number of matching rows.
+    """
+    check_format(response_format, encoding)
+    stored = result_store.get(result_id)
+    page, total = stored.data_tables[table].query(offset, limit, child_id=child_id)
+    return page_response(page, total, offset, limit, response_format, encoding)
+
+
+@app.call
+def submit_validation(
+    cin_data: dict,
+    file_metadata: dict,
+    selected_rules: Optional[list[str]] = None,
+    response_format: str = "records",
+    encoding: str = "json",
+    store_result: bool = False,
+    session_id: Optional[str] = None,
+):
+    """
+    Starts a validation in the background. Its progress is read with job_progress and its response,
+    the same as that of cin_validate, with job_result.
+
+    :param session_id: identifies the user. Their unfinished validation, if any, is cancelled,
+        e.g. when they upload a new file.
+    The other parameters are those of cin_validate.
+
+    :return: the ID of the job. Raises QueueFull if too many validations are waiting.
+    """
+    check_format(response_format, encoding)
+    filebytes = cin_data["This year"][0].read()
+
+    def validate(job):
+        return validate_upload(
+            filebytes,
+            file_metadata,
+            selected_rules,
+            response_format,
+            encoding,
+            store_result,
+            on_rule_done=job.rule_done,
+        )
+
+    job = job_queue.submit(validate, key=session_id)
+    return job.progress()
+
+
+@app.call
+def job_progress(job_id: str, since: int = 0, wait: float = 0.0):
+    """
+    :param job_id: returned by submit_validation.
+    :param since: number of events already received. Only later events are returned.
+    :param wait: seconds to wait for a new event if there is none yet. Allows the frontend to long-poll.
+
+    :return: the status of the job, the number of rules run and to run, and its events. Each completed rule
+        is an event with its code and number of issues.
+    """
+    job = job_queue.get(job_id)
+    events = job.events_since(since, timeout=wait)
+    return {**job.progress(), "events": events, "next": since + len(events)}
+
+
+@app.call
+def job_partial_results(job_id: str):
+    """
+    :param job_id: returned by submit_validation.
+
+    :return: the issue locations found by the rules that have run so far. Child IDs are added when the
+        job is done.
+    """
+    job = job_queue.get(job_id)
+    return {**job.progress(), "issues": job.partial_issues().to_json(orient="records")}
+
+
+@app.call
+def job_result(job_id: str):
+    """
+    :param job_id: returned by submit_validation.
+
+    :return: the response of cin_validate once the job is done, otherwise its status.
+    """
+    job = job_queue.get(job_id)
+    return {**job.progress(), "result": job.result}
+
+
+@app.call
+def cancel_job(job_id: str):
+    """
+    Stops a validation after the rule that it is running.
+
+    :param job_id: returned by submit_validation.
+    :return: the status of the job.
+    """
+    job = job_queue.get(job_id)
+    job.cancel()
+    return job.progress()
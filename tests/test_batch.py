@@ -0,0 +1,75 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from cin_validator.batch import (
+    find_files,
+    report_paths,
+    validate_batch,
+    write_summary,
+)
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+LA_ISSUES_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_la_issues_2887Q.xml"
+
+
+def test_report_paths_do_not_collide(tmp_path):
+    files = [Path("a/return.xml"), Path("b/return.xml"), Path("b/other.xml")]
+
+    assert report_paths(files, tmp_path) == [
+        tmp_path / "return_user_report.csv",
+        tmp_path / "return_2_user_report.csv",
+        tmp_path / "other_user_report.csv",
+    ]
+
+
+def test_validate_batch(tmp_path):
+    returns = tmp_path / "returns"
+    returns.mkdir()
+    shutil.copy(SAMPLE_FILE, returns / "la_1.xml")
+    (returns / "la_2.xml").write_text("<Message><Header>")
+    output_dir = tmp_path / "reports"
+
+    files = find_files(str(returns))
+    progress = []
+    results = validate_batch(
+        files,
+        "cin2024_25",
+        output_dir,
+        workers=2,
+        on_result=lambda result, done, total: progress.append((done, total)),
+    )
+    files_df, summary = write_summary(results, output_dir)
+
+    assert progress == [(1, 2), (2, 2)]
+    # the file that cannot be read fails without stopping the batch.
+    assert [result.status for result in results] == ["validated", "failed"]
+    assert results[1].error.startswith("ParseError")
+
+    user_report = pd.read_csv(output_dir / "la_1_user_report.csv")
+    # and the la-level issue 2887Q.
+    assert results[0].issues == len(user_report) + 1 > 1
+    assert results[0].issue_counts["2887Q"] == 1
+    assert summary.loc[str(returns / "la_1.xml")].sum() == results[0].issues
+    assert summary.loc[str(returns / "la_2.xml")].isna().all()
+    assert list(files_df["status"]) == ["validated", "failed"]
+    assert (output_dir / "files.csv").exists()
+    assert (output_dir / "summary.csv").exists()
+
+
+def test_la_level_issues_are_counted(tmp_path):
+    output_dir = tmp_path / "reports"
+
+    (result,) = validate_batch([LA_ISSUES_FILE], "cin2024_25", output_dir, workers=1)
+    _, summary = write_summary([result], output_dir)
+
+    multichild_issues = pd.read_csv(result.multichild_report, dtype=str)
+    assert result.multichild_report == str(
+        output_dir / "CIN_la_issues_2887Q_multichild_issues.csv"
+    )
+    assert set(multichild_issues["rule_code"]) == {"2886Q", "2887Q"}
+    assert result.issue_counts["2886Q"] == result.issue_counts["2887Q"] == 1
+    assert summary.loc[str(LA_ISSUES_FILE), "2887Q"] == 1
+    user_report = pd.read_csv(result.report)
+    assert result.issues == len(user_report) + 2
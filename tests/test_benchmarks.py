@@ -0,0 +1,130 @@
+import math
+
+import pandas as pd
+import pytest
+
+from benchmarks.rules import fit_complexity, replicate, sample_data, scale_rules
+from benchmarks.suite import compare_results, regressions_table, run_benchmarks
+from cin_validator.rule_engine import CINTable
+
+
+def results(wall_seconds, peak_memory, stages=None):
+    stages = stages or {
+        "XMLtoCSV": {
+            "kind": "stage",
+            "wall_seconds": wall_seconds,
+            "cpu_seconds": wall_seconds,
+            "peak_memory": peak_memory,
+        }
+    }
+    return {
+        "sizes": {
+            "1000": {
+                "wall_seconds": sum(stage["wall_seconds"] for stage in stages.values()),
+                "stages": stages,
+            }
+        }
+    }
+
+
+def test_compare_results():
+    baseline = results(1.0, 10 * 1024**2)
+
+    # within the threshold.
+    assert compare_results(baseline, results(1.1, 11 * 1024**2)) == []
+
+    regressions = compare_results(baseline, results(2.0, 30 * 1024**2))
+    assert {(r.stage, r.metric) for r in regressions} == {
+        ("total", "wall_seconds"),
+        ("XMLtoCSV", "wall_seconds"),
+        ("XMLtoCSV", "cpu_seconds"),
+        ("XMLtoCSV", "peak_memory"),
+    }
+    assert regressions[0].metric == "peak_memory"
+    assert "30.0 MB" in regressions_table(regressions)
+
+
+def test_compare_ignores_noise_and_new_stages():
+    stage = {"kind": "rule", "wall_seconds": 0.001, "cpu_seconds": 0.001}
+    baseline = results(0, 0, {"8500": stage})
+    slower = {**stage, "wall_seconds": 0.005, "cpu_seconds": 0.005}
+
+    # five times slower, but only by a few milliseconds.
+    assert compare_results(baseline, results(0, 0, {"8500": slower})) == []
+
+    # a new rule makes the total slower, but has no baseline of its own.
+    new_rule = {**stage, "wall_seconds": 5}
+    regressions = compare_results(
+        baseline, results(0, 0, {"8500": stage, "1510": new_rule})
+    )
+    assert [regression.stage for regression in regressions] == ["total"]
+
+
+def test_run_benchmarks(tmp_path):
+    run = run_benchmarks(sizes=[5], data_dir=tmp_path, trace_memory=False)
+
+    stages = run["sizes"]["5"]["stages"]
+    assert {
+        "XML parse",
+        "XMLtoCSV",
+        "process_data",
+        "8500",
+        "create_user_report",
+    } <= set(stages)
+    assert stages["8500"]["kind"] == "rule"
+    assert stages["8500"]["peak_memory"] is None
+    assert list(tmp_path.iterdir()) == [tmp_path / "cin_2025_5_seed0.xml"]
+    assert compare_results(run, run) == []
+
+
+def test_sample_data():
+    sample = sample_data("cin2022_23", "8840")
+
+    plans = sample[CINTable.ChildProtectionPlans]
+    assert plans["LAchildID"].to_list() == [f"child{i}" for i in range(1, 6)]
+    assert pd.api.types.is_datetime64_any_dtype(plans["CPPstartDate"])
+
+
+def test_replicate():
+    header = pd.DataFrame({"ReferenceDate": ["31/03/2025"]})
+    assessments = pd.DataFrame(
+        {"LAchildID": ["child1", pd.NA], "AssessmentID": ["a1", "a2"], "Factor": [1, 2]}
+    )
+
+    replicated = replicate(
+        {CINTable.Header: header, CINTable.Assessments: assessments}, 3
+    )
+
+    assert replicated[CINTable.Header].equals(header)
+    assert replicated[CINTable.Assessments].to_dict("list") == {
+        "LAchildID": ["child1", pd.NA, "child1_1", pd.NA, "child1_2", pd.NA],
+        "AssessmentID": ["a1", "a2", "a1_1", "a2_1", "a1_2", "a2_2"],
+        "Factor": [1, 2, 1, 2, 1, 2],
+    }
+
+
+@pytest.mark.parametrize(
+    "growth, complexity",
+    [
+        (lambda n: 0.001, "constant"),
+        (lambda n: 1e-6 * n, "linear"),
+        (lambda n: 1e-6 * n * math.log(n), "n log n"),
+        (lambda n: 1e-9 * n**2, "quadratic"),
+    ],
+)
+def test_fit_complexity(growth, complexity):
+    rows = [1_000, 4_000, 16_000, 64_000]
+
+    assert fit_complexity(rows, [growth(n) for n in rows])[0] == complexity
+
+
+def test_scale_rules():
+    scaling, header_only = scale_rules(
+        "cin2022_23", ["100", "8840"], rows=[50, 200], repeat=1
+    )
+
+    assert scaling.code == "8840"
+    # the sample has 5 plans.
+    assert scaling.rows == [50, 200]
+    assert scaling.complexity is not None
+    assert "header" in header_only.error
@@ -0,0 +1,96 @@
+import pandas as pd
+import pytest
+
+from cin_validator.chunked import (
+    is_whole_return_rule,
+    iter_batches,
+    validate_in_batches,
+)
+from cin_validator.cin_validator import validate_xml
+from cin_validator.rules.registry import LazyRegistry
+from cin_validator.synthetic import write_census
+
+
+@pytest.fixture(scope="module")
+def census(tmp_path_factory):
+    path = tmp_path_factory.mktemp("chunked") / "census.xml"
+    write_census(
+        path,
+        30,
+        seed=4,
+        collection_year="2025",
+        error_rates={"missing": 0.2, "codes": 0.2, "dates": 0.2, "upn": 0.2},
+    )
+    return path
+
+
+def test_iter_batches(census):
+    batches = list(iter_batches(census, 12))
+
+    assert [len(root.find("Children")) for root in batches] == [12, 12, 6]
+    assert all(root.find("Header") is not None for root in batches)
+
+
+def test_whole_return_rules():
+    registry = LazyRegistry("cin2024_25")
+
+    # unique LAchildIDs, la-level issues and the header.
+    for code in ["8510", "1520", "2887Q", "100"]:
+        assert is_whole_return_rule(registry[code])
+    # hand-written and pattern rules that check one child at a time.
+    for code in ["8840", "8620"]:
+        assert not is_whole_return_rule(registry[code])
+
+
+def test_validate_in_batches(census):
+    registry = LazyRegistry("cin2024_25")
+    whole = validate_xml(census, "cin2024_25", registry)
+
+    batch_reports = []
+    result = validate_in_batches(
+        census, "cin2024_25", registry, batch_size=12, on_issues=batch_reports.append
+    )
+
+    assert (result.children, result.batches) == (30, 3)
+    columns = list(whole.user_report.columns)
+    in_batches = pd.concat(batch_reports).sort_values(columns).reset_index(drop=True)
+    expected = whole.user_report.sort_values(columns).reset_index(drop=True)
+    pd.testing.assert_frame_equal(in_batches, expected)
+    assert sum(result.issues.values()) == len(expected)
+
+
+def test_children_split_between_batches(tmp_path):
+    path = tmp_path / "census.xml"
+    write_census(
+        path,
+        60,
+        seed=2,
+        collection_year="2025",
+        error_rates={"duplicates": 0.2, "upn": 0.2, "missing": 0.2},
+    )
+    registry = LazyRegistry("cin2024_25")
+    whole_return = [code for code in registry if is_whole_return_rule(registry[code])]
+    whole = validate_xml(path, "cin2024_25", registry)
+
+    batch_reports = []
+    with pytest.warns(UserWarning, match="more than one batch"):
+        result = validate_in_batches(
+            path,
+            "cin2024_25",
+            registry,
+            whole_return,
+            batch_size=7,
+            on_issues=batch_reports.append,
+        )
+
+    assert result.split_children
+    # rules on the whole return still compare the children of every batch.
+    columns = list(whole.user_report.columns)
+    in_batches = pd.concat(batch_reports).sort_values(columns).reset_index(drop=True)
+    expected = whole.user_report[whole.user_report["rule_code"].isin(whole_return)]
+    expected = expected.sort_values(columns).reset_index(drop=True)
+    pd.testing.assert_frame_equal(in_batches, expected)
+    assert "8510" in set(expected["rule_code"])
+    assert sorted(result.multichild_issues["rule_code"]) == sorted(
+        whole.multichild_issues["rule_code"]
+    )
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parents[1]
+
+# generous so that slow machines pass; importing pandas alone usually takes longer than this.
+LIST_IMPORT_BUDGET_SECONDS = 2.0
+
+
+def import_times(*args) -> dict[str, tuple[int, bool]]:
+    """
+    Runs a CLI command with python -X importtime.
+
+    :param str args: the command and its arguments, e.g. "list".
+    :returns: for every module imported by the command, its cumulative import time in microseconds
+        and whether it was imported at the top level rather than by another module.
+    :rtype: dict
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "cin_validator", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # e.g. "import time:       663 |     413761 |   pandas"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        # nested imports are indented further than the single space after the separator.
+        times[module.strip()] = (int(cumulative), not module.startswith("  "))
+    return times
+
+
+def test_list_does_not_import_pandas_or_pytest():
+    times = import_times("list")
+
+    assert "pandas" not in times
+    assert "pytest" not in times
+    # the cumulative time of top level imports includes the nested ones.
+    # site is imported by every python process, so it is left out.
+    top_level = sum(
+        time
+        for module, (time, is_top_level) in times.items()
+        if is_top_level and module != "site"
+    )
+    assert top_level < LIST_IMPORT_BUDGET_SECONDS * 1_000_000
+
+
+def test_run_does_not_import_pytest():
+    times = import_times("run", "fake_data/fake_CIN_data.xml")
+
+    assert "pandas" in times
+    assert "pytest" not in times
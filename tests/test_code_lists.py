@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pandas as pd
+
+from cin_validator.cin_validator import validate_xml
+from cin_validator.code_lists import (
+    CODE_LISTS,
+    apply_code_lists,
+    get_code_lists,
+    valid_code,
+)
+from cin_validator.rule_engine import CINTable, RuleContext
+from cin_validator.rules.registry import LazyRegistry
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+
+
+def test_code_lists_per_year():
+    # Sex was added to the ChildIdentifiers module in 2024/25.
+    assert "Sex" not in get_code_lists("cin2022_23")
+    assert get_code_lists("cin2024_25")["Sex"] == ["M", "F", "U"]
+    # unknown rulesets use the latest lists.
+    assert get_code_lists() == get_code_lists("cin2024_25")
+
+
+def test_apply_code_lists():
+    cin_tables = {
+        "CINdetails": pd.DataFrame(
+            {"ReasonForClosure": ["RC1", "RC10", pd.NA, "RC9"], "Other": [1, 2, 3, 4]}
+        )
+    }
+    code_lists = {"ReasonForClosure": get_code_lists()["ReasonForClosure"]}
+    cin_tables = apply_code_lists(cin_tables, code_lists)
+    column = cin_tables["CINdetails"]["ReasonForClosure"]
+
+    assert isinstance(column.dtype, pd.CategoricalDtype)
+    # invalid values are kept so that they can be shown in the report.
+    assert column.astype(object).tolist()[:2] == ["RC1", "RC10"]
+    assert pd.isna(column[2])
+
+    expected = [True, False, False, True]
+    assert valid_code(column, code_lists["ReasonForClosure"]).tolist() == expected
+    # plain columns give the same result.
+    plain = column.astype(object)
+    assert valid_code(plain, code_lists["ReasonForClosure"]).tolist() == expected
+
+
+def test_rules_check_the_codes_of_their_ruleset(monkeypatch):
+    # a later year that adds a reason for closure.
+    reasons = [*CODE_LISTS["cin2024_25"]["ReasonForClosure"], "RC10"]
+    later = CODE_LISTS["cin2024_25"] | {"ReasonForClosure": reasons}
+    monkeypatch.setitem(CODE_LISTS, "cin2024_25", later)
+    registry = LazyRegistry("cin2024_25")
+    # 8640 is written in cin2022_23 and inherited by later years.
+    rule = registry["8640"]
+
+    def failing_rows(ruleset):
+        cin_details = pd.DataFrame({"ReasonForClosure": ["RC1", "RC10", "RC13"]})
+        data = apply_code_lists(
+            {CINTable.CINdetails: cin_details}, get_code_lists(ruleset)
+        )
+        ctx = RuleContext(rule, ruleset)
+        rule.func(data, ctx)
+        return [issue.row for issue in ctx.issues]
+
+    assert failing_rows("cin2024_25") == [2]
+    assert failing_rows("cin2022_23") == [1, 2]
+
+    # validation passes the ruleset to the rules.
+    validator = validate_xml(SAMPLE_FILE, "cin2024_25", registry, ["8640"])
+    assert validator.ruleset == "cin2024_25"
@@ -0,0 +1,71 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from cin_validator.cin_validator import convert_data
+from cin_validator.convert import convert_files
+from cin_validator.synthetic import write_census
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+
+
+@pytest.fixture(scope="module")
+def returns(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("returns")
+    write_census(folder / "a" / "return.xml", 5, seed=1, lea="201")
+    write_census(folder / "b" / "return.xml", 5, seed=2, lea="202")
+    (folder / "broken.xml").write_text("<Message><Header>")
+    return [folder / "a" / "return.xml", folder / "b" / "return.xml"]
+
+
+def test_convert_single_file(tmp_path):
+    results = convert_files([SAMPLE_FILE], tmp_path)
+
+    tables = convert_data(ET.parse(SAMPLE_FILE).getroot())
+    assert results[0].status == "converted"
+    assert results[0].rows == {name: len(df) for name, df in tables.items()}
+    # a single file keeps the layout of the original command, a CSV per table.
+    written = pd.read_csv(tmp_path / "ChildIdentifiers.csv", index_col=0, dtype=str)
+    assert list(written.columns) == list(tables["ChildIdentifiers"].columns)
+    assert written["LAchildID"].equals(tables["ChildIdentifiers"]["LAchildID"])
+
+
+def test_convert_files_by_la(tmp_path, returns):
+    progress = []
+    results = convert_files(
+        returns + [returns[0].parents[1] / "broken.xml"],
+        tmp_path,
+        partition_by_la=True,
+        workers=2,
+        on_result=lambda result, done, total: progress.append((done, total)),
+    )
+
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+    assert [result.status for result in results] == ["converted", "converted", "failed"]
+    assert [result.lea for result in results[:2]] == ["201", "202"]
+    assert results[2].error.startswith("ParseError")
+    # files with the same name do not overwrite each other.
+    for lea, name, result in [
+        ("201", "return", results[0]),
+        ("202", "return_2", results[1]),
+    ]:
+        written = pd.read_csv(
+            tmp_path / "ChildIdentifiers" / f"LEA={lea}" / f"{name}.csv"
+        )
+        assert len(written) == result.rows["ChildIdentifiers"] == 5
+
+
+def test_convert_to_parquet(tmp_path, returns):
+    pytest.importorskip("pyarrow")
+    convert_files(returns, tmp_path, "parquet", workers=1)
+
+    tables = convert_data(ET.parse(returns[1]).getroot())
+    written = pd.read_parquet(tmp_path / "ChildIdentifiers" / "return_2.parquet")
+    pd.testing.assert_frame_equal(written, tables["ChildIdentifiers"])
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        convert_files([SAMPLE_FILE], tmp_path, "xlsx")
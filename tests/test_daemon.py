@@ -0,0 +1,78 @@
+import io
+import socket
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from cin_validator.daemon import (
+    ValidationServer,
+    remove_stale_socket,
+    request_validation,
+    validate_file,
+)
+from cin_validator.rules.registry import LazyRegistry
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "fake_CIN_data.xml"
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    registries = {"cin2024_25": LazyRegistry("cin2024_25")}
+    server = ValidationServer(tmp_path / "validator.sock", registries)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_daemon_matches_local_run(daemon):
+    expected = validate_file(
+        SAMPLE_FILE, "cin2024_25", LazyRegistry("cin2024_25"), output=True
+    )
+    result = request_validation(
+        SAMPLE_FILE, "cin2024_25", output=True, socket_path=daemon.socket_path
+    )
+
+    assert result == expected
+    assert sum(result["issues"].values()) == len(
+        pd.read_csv(io.StringIO(result["user_report"]))
+    )
+
+
+def test_daemon_reports_errors(daemon):
+    result = request_validation(
+        SAMPLE_FILE, "cin2019_20", socket_path=daemon.socket_path
+    )
+    assert result == {"error": "KeyError, 'cin2019_20'"}
+
+    # the daemon keeps serving after an error.
+    result = request_validation(
+        SAMPLE_FILE, "cin2024_25", select="8500", socket_path=daemon.socket_path
+    )
+    assert "error" not in result
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    socket_path = tmp_path / "validator.sock"
+    # a socket file that nothing listens on, as left by a daemon that was killed.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(socket_path))
+
+    remove_stale_socket(socket_path)
+    assert not socket_path.exists()
+
+
+def test_only_one_daemon_per_socket(daemon, capsys):
+    with pytest.raises(RuntimeError):
+        remove_stale_socket(daemon.socket_path)
+
+    # requests are handled in turn, so the probe has been handled once this returns.
+    request_validation(
+        SAMPLE_FILE, "cin2024_25", select="8500", socket_path=daemon.socket_path
+    )
+    # the probe closes its connection without a request, which is not an error.
+    assert "Traceback" not in capsys.readouterr().err
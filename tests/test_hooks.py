@@ -0,0 +1,129 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from cin_validator.cin_validator import CinValidator, convert_data, process_data
+from cin_validator.hooks import ValidationHooks
+from cin_validator.planner import plan_rules
+from cin_validator.rule_engine import CINTable, RuleDefinition
+from cin_validator.rule_patterns import RowCheck, pattern_rule
+from cin_validator.rules.registry import LazyRegistry
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+
+
+def broken_rule(data_container, rule_context):
+    raise KeyError("missing column")
+
+
+BROKEN_RULE = RuleDefinition(
+    code="9999", func=broken_rule, module=CINTable.ChildIdentifiers
+)
+
+
+def broken_check(df):
+    raise KeyError("missing column")
+
+
+# a rule that fails inside the scan of its table.
+BROKEN_SCAN_RULE = pattern_rule(
+    RowCheck(CINTable.ChildIdentifiers, "UPN", broken_check),
+    code="9998",
+    module=CINTable.ChildIdentifiers,
+).__rule_def__
+
+
+class RecordingHooks(ValidationHooks):
+    def __init__(self):
+        self.calls = []
+
+    def before_stage(self, stage):
+        self.calls.append(("before_stage", stage))
+
+    def after_stage(self, stage, elapsed, issue_count):
+        self.calls.append(("after_stage", stage, issue_count))
+
+    def before_rule(self, rule):
+        self.calls.append(("before_rule", rule.code))
+
+    def after_rule(self, rule, elapsed, issue_count):
+        assert elapsed >= 0
+        self.calls.append(("after_rule", rule.code, issue_count))
+
+    def on_error(self, rule, elapsed, error):
+        self.calls.append(("on_error", rule.code, type(error).__name__))
+
+
+def validate(registry, hooks):
+    data = process_data(convert_data(ET.parse(SAMPLE_FILE).getroot()), "cin2024_25")
+    return CinValidator(data, registry, hooks=hooks)
+
+
+def test_hooks_around_rules_and_stages():
+    lazy_registry = LazyRegistry("cin2024_25")
+    registry = {code: lazy_registry[code] for code in ["8500", "1510", "1540", "2887Q"]}
+    registry[BROKEN_RULE.code] = BROKEN_RULE
+    hooks = RecordingHooks()
+
+    validator = validate(registry, [hooks])
+
+    issues = {call[1]: call[2] for call in hooks.calls if call[0] == "after_rule"}
+    assert set(issues) == set(registry)
+    assert issues["1510"] == (validator.user_report["rule_code"] == "1510").sum()
+
+    # errors are reported to the hooks, and the other rules carry on.
+    assert ("on_error", "9999", "KeyError") in hooks.calls
+    assert issues["9999"] == 0
+
+    # every rule that shares a table scan is inside the scan stage.
+    scans, _ = plan_rules(registry.values())
+    assert scans
+    for table, table_rules in scans.items():
+        start = hooks.calls.index(("before_stage", f"scan {table.name}"))
+        for rule in table_rules:
+            assert hooks.calls.index(("before_rule", rule.code)) > start
+
+    stages = [call[1] for call in hooks.calls if call[0] == "after_stage"]
+    assert stages[-2:] == ["include_issue_child", "create_user_report"]
+    assert hooks.calls[-1] == (
+        "after_stage",
+        "create_user_report",
+        len(validator.user_report),
+    )
+
+
+def test_partial_hooks():
+    # hooks need not define every callback.
+    class ErrorCounter:
+        errors = 0
+
+        def on_error(self, rule, elapsed, error):
+            self.errors += 1
+
+    counter = ErrorCounter()
+    validate({BROKEN_RULE.code: BROKEN_RULE}, [counter])
+
+    assert counter.errors == 1
+
+
+def test_scan_errors_are_reported_like_rule_errors(capsys):
+    lazy_registry = LazyRegistry("cin2024_25")
+    registry = {code: lazy_registry[code] for code in ["1510", "1540"]}
+    registry[BROKEN_SCAN_RULE.code] = BROKEN_SCAN_RULE
+    registry[BROKEN_RULE.code] = BROKEN_RULE
+    hooks = RecordingHooks()
+
+    validate(registry, [hooks])
+
+    scans, _ = plan_rules(registry.values())
+    assert BROKEN_SCAN_RULE in scans[CINTable.ChildIdentifiers]
+    errors = [call for call in hooks.calls if call[0] == "on_error"]
+    assert errors == [
+        ("on_error", "9998", "KeyError"),
+        ("on_error", "9999", "KeyError"),
+    ]
+    # each error is printed once, in the same way.
+    printed = [line for line in capsys.readouterr().out.splitlines() if "Error" in line]
+    assert printed == [
+        "Error with rule 9998: KeyError, 'missing column'",
+        "Error with rule 9999: KeyError, 'missing column'",
+    ]
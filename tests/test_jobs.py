@@ -0,0 +1,141 @@
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from cin_validator.cin_validator import CinValidator, convert_data, process_data
+from cin_validator.jobs import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    JobQueue,
+    QueueFull,
+)
+from cin_validator.rule_engine import CINTable, RuleDefinition
+from cin_validator.rules.registry import LazyRegistry
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+
+RULES = [
+    RuleDefinition(code=str(code), func=None, module=CINTable.ChildIdentifiers)
+    for code in range(5)
+]
+
+
+def gated_validation(gate: threading.Event, started: threading.Event = None):
+    """a validation that runs its first rule, then waits for the gate before running the others."""
+
+    def validate(job):
+        for done, rule in enumerate(RULES, start=1):
+            job.rule_done(rule, pd.DataFrame({"ROW_ID": [done]}), done, len(RULES))
+            if done == 1:
+                if started is not None:
+                    started.set()
+                gate.wait(timeout=10)
+        return "result"
+
+    return validate
+
+
+def wait_until_finished(job):
+    while not job.finished:
+        job.events_since(len(job.events), timeout=10)
+
+
+def test_progress_and_partial_results():
+    queue = JobQueue(max_running=1)
+    gate, started = threading.Event(), threading.Event()
+
+    job = queue.submit(gated_validation(gate, started))
+    started.wait(timeout=10)
+
+    assert (job.done, job.total) == (1, 5)
+    assert list(job.partial_issues()["ROW_ID"]) == [1]
+
+    gate.set()
+    wait_until_finished(job)
+
+    assert job.status == DONE
+    assert job.result == "result"
+    assert [event["event"] for event in job.events] == [
+        "queued",
+        "running",
+        *["rule"] * 5,
+        "done",
+    ]
+    assert len(job.partial_issues()) == 5
+    queue.shutdown()
+
+
+def test_resubmitting_cancels_the_running_job():
+    queue = JobQueue(max_running=1)
+    gate, started = threading.Event(), threading.Event()
+
+    first = queue.submit(gated_validation(gate, started), key="session")
+    started.wait(timeout=10)
+    second = queue.submit(gated_validation(gate), key="session")
+    gate.set()
+    wait_until_finished(first)
+    wait_until_finished(second)
+
+    # the first job stopped after the rule it was running.
+    assert first.status == CANCELLED
+    assert first.done == 1
+    assert second.status == DONE
+    queue.shutdown()
+
+
+def test_backpressure():
+    queue = JobQueue(max_running=1, max_waiting=1)
+    gate = threading.Event()
+
+    running = queue.submit(gated_validation(gate))
+    waiting = queue.submit(gated_validation(gate))
+    with pytest.raises(QueueFull):
+        queue.submit(gated_validation(gate))
+
+    # a cancelled job no longer counts towards the limit.
+    waiting.cancel()
+    queue.submit(gated_validation(gate))
+
+    gate.set()
+    wait_until_finished(running)
+    wait_until_finished(waiting)
+    assert waiting.status == CANCELLED
+    assert waiting.done == 0
+    queue.shutdown()
+
+
+def test_failed_job():
+    queue = JobQueue()
+
+    def validate(job):
+        raise ValueError("unreadable file")
+
+    job = queue.submit(validate)
+    wait_until_finished(job)
+
+    assert job.status == FAILED
+    assert job.error == "ValueError, unreadable file"
+    queue.shutdown()
+
+
+def test_validator_reports_each_rule():
+    data = process_data(convert_data(ET.parse(SAMPLE_FILE).getroot()), "cin2024_25")
+    progress = []
+
+    validator = CinValidator(
+        data,
+        LazyRegistry("cin2024_25"),
+        selected_rules=["8500", "1510", "2887Q"],
+        on_rule_done=lambda rule, issues, done, total: progress.append(
+            (rule.code, len(issues), done, total)
+        ),
+    )
+
+    assert [done for _, _, done, _ in progress] == [1, 2, 3]
+    assert {total for _, _, _, total in progress} == {3}
+    issues = {code: count for code, count, _, _ in progress}
+    assert issues["1510"] == (validator.user_report["rule_code"] == "1510").sum()
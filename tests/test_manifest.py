@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+from cin_validator.rules.manifest import MANIFEST
+from cin_validator.rules.registry import LazyRegistry, build_manifest
+
+
+def test_manifest_up_to_date():
+    # if this fails, regenerate the manifest with: python -m cin_validator manifest
+    assert build_manifest() == MANIFEST
+
+
+def test_lazy_registry_matches_registry():
+    from cin_validator.rules.cin2024_25 import registry
+
+    lazy_registry = LazyRegistry("cin2024_25")
+    assert set(lazy_registry) == set(registry)
+    assert lazy_registry["8500"] is registry["8500"]
+    assert lazy_registry["1530"] is registry["1530"]
+
+
+def test_listing_rules_does_not_import_them():
+    code = (
+        "import sys;"
+        "from cin_validator.rules.registry import LazyRegistry;"
+        "registry = LazyRegistry('cin2024_25');"
+        "assert len(registry) == 109;"
+        "rule = registry['8500'];"
+        "print(sorted(m for m in sys.modules if m.startswith('cin_validator.rules.cin') and '.rule_' in m))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    # only the rule that was requested has been imported.
+    assert result.stdout.strip() == "['cin_validator.rules.cin2022_23.rule_8500']"
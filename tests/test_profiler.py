@@ -0,0 +1,80 @@
+import json
+import pstats
+from pathlib import Path
+
+from cin_validator.profiler import RULE, STAGE, Profiler, profile_file, profile_rules
+from cin_validator.rules.registry import LazyRegistry
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+
+
+def test_measure():
+    with Profiler() as profiler:
+        with profiler.measure("allocate"):
+            data = [0] * 1_000_000
+        with profiler.measure("8500", RULE):
+            pass
+    del data
+
+    allocate, rule = profiler.stages
+    assert (allocate.stage, allocate.kind) == ("allocate", STAGE)
+    assert allocate.peak_memory >= 8_000_000
+    assert (rule.stage, rule.kind) == ("8500", RULE)
+    assert profiler.ranked()[0] is allocate
+
+
+def test_without_memory():
+    with Profiler(trace_memory=False) as profiler:
+        with profiler.measure("stage"):
+            pass
+
+    assert profiler.stages[0].peak_memory is None
+    assert "-" in profiler.table()
+
+
+def test_profile_file(tmp_path):
+    selected_rules = ["8500", "1510", "2887Q"]
+    profiler = profile_file(
+        SAMPLE_FILE, "cin2024_25", LazyRegistry("cin2024_25"), selected_rules
+    )
+
+    assert {stage.stage for stage in profiler.stages} == {
+        "XML parse",
+        "XMLtoCSV",
+        "process_data",
+        *selected_rules,
+        "include_issue_child",
+        "create_user_report",
+    }
+    assert all(stage.peak_memory is not None for stage in profiler.stages)
+
+    path = tmp_path / "profile.json"
+    profiler.to_json(path, ruleset="cin2024_25")
+    artifact = json.loads(path.read_text())
+    assert artifact["ruleset"] == "cin2024_25"
+    assert len(artifact["stages"]) == 8
+    walls = [stage["wall_seconds"] for stage in artifact["stages"]]
+    assert walls == sorted(walls, reverse=True)
+
+
+def test_profile_rules(tmp_path):
+    summary = profile_rules(
+        SAMPLE_FILE,
+        "cin2024_25",
+        LazyRegistry("cin2024_25"),
+        ["2990"],
+        tmp_path,
+        repeat=2,
+        top=5,
+    )
+
+    rule_summary = summary["2990"]
+    assert rule_summary["runs"] == 2
+    assert len(rule_summary["top_functions"]) == 5
+    # the rule's own validate function includes the time of everything it calls.
+    assert rule_summary["top_functions"][0]["function"].startswith("rule_2990.py")
+    assert rule_summary["top_functions"][0]["calls"] == 2
+
+    stats = pstats.Stats(str(tmp_path / "rule_2990.pstats"))
+    assert stats.total_tt > 0
+    assert json.loads((tmp_path / "summary.json").read_text()) == summary
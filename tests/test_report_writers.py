@@ -0,0 +1,108 @@
+import json
+import sys
+
+import pandas as pd
+import pytest
+
+from cin_validator.cin_validator import validate_xml
+from cin_validator.report_writers import report_writer
+from cin_validator.rules.registry import LazyRegistry
+from cin_validator.synthetic import write_census
+
+REPORT = pd.DataFrame(
+    {
+        "ERROR_ID": [("child1", "1"), ("child2", "1"), "nan"],
+        "rule_code": ["8840", "8840", "100"],
+        "ROW_ID": ["0", "3", "0"],
+    }
+)
+
+
+def test_csv_writer(tmp_path):
+    with report_writer(tmp_path / "report.csv") as writer:
+        writer.write(REPORT.iloc[:2])
+        writer.write(REPORT.iloc[:0])
+        writer.write(REPORT.iloc[2:])
+
+    written = pd.read_csv(
+        tmp_path / "report.csv", index_col=0, dtype=str, keep_default_na=False
+    )
+    assert written.index.to_list() == [0, 1, 2]
+    assert written["ERROR_ID"].to_list() == [
+        str(("child1", "1")),
+        str(("child2", "1")),
+        "nan",
+    ]
+    assert writer.rows == 3
+
+
+def test_jsonl_writer(tmp_path):
+    with report_writer(tmp_path / "report.jsonl") as writer:
+        writer.write(REPORT.iloc[:1])
+        writer.write(REPORT.iloc[1:])
+
+    lines = (tmp_path / "report.jsonl").read_text().splitlines()
+    assert [json.loads(line)["ERROR_ID"] for line in lines] == [
+        ["child1", "1"],
+        ["child2", "1"],
+        "nan",
+    ]
+
+
+def test_parquet_writer(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    with report_writer(tmp_path / "report.parquet") as writer:
+        writer.write(REPORT.iloc[:1])
+        writer.write(REPORT.iloc[1:])
+
+    # a row group per write.
+    assert pq.ParquetFile(tmp_path / "report.parquet").num_row_groups == 2
+    assert pq.read_table(tmp_path / "report.parquet").num_rows == 3
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        report_writer(tmp_path / "report.xlsx")
+
+
+@pytest.mark.parametrize("memory_budget", [None, 0])
+def test_streamed_report(tmp_path, memory_budget):
+    path = tmp_path / "census.xml"
+    write_census(
+        path,
+        30,
+        seed=4,
+        collection_year="2025",
+        error_rates={"missing": 0.2, "codes": 0.2, "dates": 0.2, "upn": 0.2},
+    )
+    registry = LazyRegistry("cin2024_25")
+    whole = validate_xml(path, "cin2024_25", registry).user_report
+
+    with report_writer(tmp_path / "report.csv") as writer:
+        streamed = validate_xml(
+            path,
+            "cin2024_25",
+            registry,
+            memory_budget=memory_budget,
+            report_writer=writer,
+        )
+
+    assert streamed.user_report is None
+    columns = list(whole.columns)
+    written = pd.read_csv(
+        tmp_path / "report.csv", index_col=0, dtype=str, keep_default_na=False
+    )
+    # rows are written rule by rule, so only their order differs.
+    assert (
+        written.sort_values(columns)
+        .reset_index(drop=True)
+        .equals(whole.astype(str).sort_values(columns).reset_index(drop=True))
+    )
+
+
+def test_parquet_without_pyarrow(tmp_path, monkeypatch):
+    # a None entry in sys.modules makes the import fail, as if pyarrow was not installed.
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        report_writer(tmp_path / "report.parquet")
@@ -0,0 +1,119 @@
+import base64
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from cin_validator.cin_validator import CinValidator, convert_data, process_data
+from cin_validator.response_format import (
+    REPORTS,
+    check_format,
+    compact_validation_results,
+    expand_compact,
+    response_size,
+)
+from cin_validator.rules.registry import LazyRegistry
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+
+
+@pytest.fixture(scope="module")
+def validated():
+    raw_data = convert_data(ET.parse(SAMPLE_FILE).getroot())
+    data = {name: df.copy() for name, df in raw_data.items()}
+    validator = CinValidator(
+        process_data(raw_data, "cin2024_25"), LazyRegistry("cin2024_25")
+    )
+    return validator, data
+
+
+def records(df: pd.DataFrame) -> pd.DataFrame:
+    """the table as the frontend reads it from the records format."""
+    return pd.DataFrame(json.loads(df.to_json(orient="records")))
+
+
+@pytest.mark.parametrize("encoding", ["json", "gzip"])
+def test_compact_results_match_records(validated, encoding):
+    validator, data = validated
+    reports = [
+        validator.full_issue_df,
+        validator.multichild_issues,
+        validator.user_report,
+    ]
+
+    expanded = expand_compact(compact_validation_results(validator, data, encoding))
+
+    for name, report in zip(REPORTS, reports):
+        expected = records(report)
+        pd.testing.assert_frame_equal(
+            expanded[name][expected.columns], expected, check_dtype=False, obj=name
+        )
+    for name, table in data.items():
+        expected = records(table)
+        if expected.empty:
+            # the records of an empty table do not name its columns.
+            assert expanded["data_tables"][name].empty
+            continue
+        pd.testing.assert_frame_equal(
+            expanded["data_tables"][name], expected, check_dtype=False, obj=name
+        )
+
+
+def test_compact_results_are_smaller(validated):
+    validator, data = validated
+    records_response = {
+        name: [report.to_json(orient="records")]
+        for name, report in zip(
+            REPORTS,
+            [
+                validator.full_issue_df,
+                validator.multichild_issues,
+                validator.user_report,
+            ],
+        )
+    }
+    records_response["data_tables"] = [
+        {name: table.to_json(orient="records") for name, table in data.items()}
+    ]
+
+    compact = compact_validation_results(validator, data)
+    gzipped = compact_validation_results(validator, data, "gzip")
+
+    assert response_size(compact) * 2 < response_size(records_response)
+    assert response_size(gzipped) * 2 < response_size(compact)
+    # each rule description is only sent once.
+    assert "rule_description" not in compact["user_report"]["columns"]
+    rule_codes = pd.concat(
+        [validator.user_report["rule_code"], validator.multichild_issues["rule_code"]]
+    )
+    assert set(compact["rules"]) == set(rule_codes.astype(str))
+
+
+def test_arrow_encoding(validated):
+    pa = pytest.importorskip("pyarrow")
+    validator, data = validated
+
+    compact = compact_validation_results(validator, data, "arrow")
+
+    reader = pa.ipc.open_stream(base64.b64decode(compact["user_report"]))
+    user_report = reader.read_pandas()
+    assert len(user_report) == len(validator.user_report)
+    assert "rule_description" not in user_report.columns
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        check_format("columns", "json")
+    with pytest.raises(ValueError):
+        check_format("compact", "zip")
+
+
+def test_processed_columns_are_not_reported(validated):
+    validator, _ = validated
+    processed = {"child_code", "UPN_check_ok"}
+    assert processed.issubset(validator.data_files["ChildIdentifiers"].columns)
+    for report in [validator.full_issue_df, validator.user_report]:
+        assert not processed & set(report.columns)
+        assert not processed & set(report["columns_affected"].dropna())
@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+
+from cin_validator.result_store import (
+    REPORT_FILTERS,
+    IndexedTable,
+    ResultStore,
+    StoredResult,
+)
+
+
+def make_user_report():
+    return pd.DataFrame(
+        {
+            "LAchildID": ["child1", "child1", "child2", pd.NA, "child2"],
+            "rule_code": [8500, "1510", 8500, "2887Q", "1510"],
+            "tables_affected": [
+                "ChildIdentifiers",
+                "ChildIdentifiers",
+                "CINdetails",
+                None,
+                "ChildIdentifiers",
+            ],
+            "value_flagged": ["a", "b", "c", "d", "e"],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+
+def test_filters():
+    table = IndexedTable(make_user_report(), REPORT_FILTERS["user_report"])
+
+    page, total = table.query(rule_code="8500")
+    assert total == 2
+    assert list(page["value_flagged"]) == ["a", "c"]
+
+    # filters are combined, and codes stored as int or str can be found as either.
+    page, total = table.query(
+        rule_code=1510, table="ChildIdentifiers", child_id="child2"
+    )
+    assert total == 1
+    assert list(page["value_flagged"]) == ["e"]
+
+    page, total = table.query(child_id="child3")
+    assert (len(page), total) == (0, 0)
+
+
+def test_pages():
+    table = IndexedTable(make_user_report(), REPORT_FILTERS["user_report"])
+
+    page, total = table.query(offset=1, limit=2)
+    assert total == 5
+    assert list(page["value_flagged"]) == ["b", "c"]
+
+    page, total = table.query(offset=1, limit=2, table="ChildIdentifiers")
+    assert total == 3
+    assert list(page["value_flagged"]) == ["b", "e"]
+
+
+def test_unknown_filter():
+    table = IndexedTable(make_user_report(), REPORT_FILTERS["multichild_issues"])
+
+    with pytest.raises(ValueError):
+        table.query(child_id="child1")
+
+
+def test_stored_result_summary():
+    user_report = make_user_report()
+    result = StoredResult(
+        {"user_report": user_report, "multichild_issues": user_report.iloc[[3]]},
+        {"ChildIdentifiers": pd.DataFrame({"LAchildID": ["child1", "child2"]})},
+    )
+
+    summary = result.summary()
+
+    assert summary["rows"] == {"user_report": 5, "multichild_issues": 1}
+    assert summary["data_table_rows"] == {"ChildIdentifiers": 2}
+    assert summary["issues_per_rule"] == {"8500": 2, "1510": 2, "2887Q": 1}
+    # issues that are not linked to a table are not counted per table.
+    assert summary["issues_per_table"] == {"ChildIdentifiers": 3, "CINdetails": 1}
+
+
+def test_store_keeps_recent_results():
+    store = ResultStore(max_results=2)
+    results = [StoredResult({}, {}) for _ in range(3)]
+
+    first, second, third = [store.add(result) for result in results]
+
+    assert len(store) == 2
+    assert store.get(third) is results[2]
+    with pytest.raises(KeyError):
+        store.get(first)
@@ -0,0 +1,106 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from cin_validator.cin_validator import CinValidator, convert_data, process_data
+from cin_validator.planner import plan_rules
+from cin_validator.rule_costs import SMOOTHING, RuleCosts
+from cin_validator.rule_engine import CINTable, RuleDefinition
+from cin_validator.rules.registry import LazyRegistry
+
+SAMPLE_FILE = Path(__file__).parents[1] / "fake_data" / "CIN_Census_2024.xml"
+
+
+def make_rules(*codes):
+    return [
+        RuleDefinition(code=code, func=None, module=CINTable.ChildIdentifiers)
+        for code in codes
+    ]
+
+
+def test_moving_average():
+    costs = RuleCosts()
+
+    costs.record("8500", 1.0)
+    assert costs.cost("8500") == 1.0
+
+    costs.record(8500, 2.0)
+    assert costs.cost("8500") == pytest.approx(SMOOTHING * 2.0 + (1 - SMOOTHING))
+    assert costs.cost("1510") is None
+
+
+def test_order():
+    costs = RuleCosts()
+    rules = make_rules("a", "b", "c", "d")
+
+    # without history, the order is unchanged.
+    assert costs.order(rules) == rules
+
+    costs.record("a", 3.0)
+    costs.record("b", 1.0)
+    costs.record("d", 1.0)
+
+    # c has no history so it is given the median cost, 1.0. Equal costs keep their order.
+    assert [rule.code for rule in costs.order(rules)] == ["b", "c", "d", "a"]
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "costs" / "rule_costs.json"
+    costs = RuleCosts(path)
+    costs.record("8500", 0.5)
+    costs.save()
+
+    assert RuleCosts(path).cost("8500") == 0.5
+
+    with pytest.raises(ValueError):
+        RuleCosts().save()
+
+
+def test_validator_runs_cheapest_rules_first():
+    def validate(**kwargs):
+        data = process_data(convert_data(ET.parse(SAMPLE_FILE).getroot()), "cin2024_25")
+        return CinValidator(data, LazyRegistry("cin2024_25"), **kwargs)
+
+    costs = RuleCosts()
+    first = validate(rule_costs=costs)
+    # every rule that ran has been timed.
+    assert set(costs.seconds) == {
+        str(rule.code) for rule in LazyRegistry("cin2024_25").values()
+    }
+
+    # make the last rule that runs on its own look like the cheapest.
+    scans, others = plan_rules(LazyRegistry("cin2024_25").values())
+    last_code = str(others[-1].code)
+    costs.seconds[last_code] = -1.0
+    order = []
+    second = validate(
+        rule_costs=costs,
+        on_rule_done=lambda rule, issues, done, total: order.append(str(rule.code)),
+    )
+    plain = validate()
+
+    # only the rules that share a table scan, which are done first, come before it.
+    scanned = {str(rule.code) for table_rules in scans.values() for rule in table_rules}
+    assert set(order[: order.index(last_code)]) == scanned
+
+    # the reports do not depend on the order that rules ran in.
+    for validator in [first, second]:
+        pd.testing.assert_frame_equal(validator.full_issue_df, plain.full_issue_df)
+        pd.testing.assert_frame_equal(validator.user_report, plain.user_report)
+        pd.testing.assert_frame_equal(
+            validator.multichild_issues, plain.multichild_issues
+        )
+
+
+def test_damaged_history_is_ignored(tmp_path):
+    path = tmp_path / "rule_costs.json"
+    path.write_text('{"8500": 0.')
+
+    costs = RuleCosts(path)
+    assert costs.seconds == {}
+    costs.record("8500", 0.5)
+    costs.save()
+    assert RuleCosts(path).cost("8500") == 0.5
+    assert [file.name for file in tmp_path.iterdir()] == ["rule_costs.json"]
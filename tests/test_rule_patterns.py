@@ -0,0 +1,297 @@
+import pandas as pd
+import pytest
+
+from cin_validator.rule_engine import CINTable, rule_definition
+from cin_validator.rule_patterns import (
+    DateOnOrAfter,
+    EitherOr,
+    ModuleMustExist,
+    OnlyOneInGroup,
+    ReturnCounts,
+    ValuePresent,
+    ValueUnique,
+    WithinCensusPeriod,
+    pattern_rule,
+)
+from cin_validator.test_engine import assert_rules_equivalent, run_rule
+from cin_validator.utils import make_census_period
+
+ChildIdentifiers = CINTable.ChildIdentifiers
+CINdetails = CINTable.CINdetails
+CINplanDates = CINTable.CINplanDates
+Header = CINTable.Header
+
+
+def make_data():
+    return {
+        Header: pd.DataFrame([{"ReferenceDate": "31/03/2022"}]),
+        ChildIdentifiers: pd.DataFrame(
+            [
+                {
+                    "LAchildID": "child1",
+                    "PersonBirthDate": pd.to_datetime("2019-01-01"),
+                    "ExpectedPersonBirthDate": pd.NaT,
+                },
+                {
+                    "LAchildID": pd.NA,
+                    "PersonBirthDate": pd.to_datetime("2022-05-01"),
+                    "ExpectedPersonBirthDate": pd.to_datetime("2022-05-01"),
+                },
+                {
+                    "LAchildID": "child1",
+                    "PersonBirthDate": pd.NaT,
+                    "ExpectedPersonBirthDate": pd.NaT,
+                },
+                {
+                    "LAchildID": "child4",
+                    "PersonBirthDate": pd.to_datetime("2020-01-01"),
+                    "ExpectedPersonBirthDate": pd.to_datetime("2019-12-01"),
+                },
+            ]
+        ),
+        CINdetails: pd.DataFrame(
+            [
+                {
+                    "LAchildID": "child1",
+                    "CINdetailsID": "cin1",
+                    "CINreferralDate": pd.to_datetime("2021-01-01"),
+                    "CINclosureDate": pd.to_datetime("2020-01-01"),
+                },
+                {
+                    "LAchildID": "child1",
+                    "CINdetailsID": "cin2",
+                    "CINreferralDate": pd.to_datetime("2021-06-01"),
+                    "CINclosureDate": pd.NaT,
+                },
+                {
+                    "LAchildID": "child4",
+                    "CINdetailsID": "cin1",
+                    "CINreferralDate": pd.NaT,
+                    "CINclosureDate": pd.to_datetime("2022-04-01"),
+                },
+            ]
+        ),
+        CINplanDates: pd.DataFrame(
+            [
+                {
+                    "LAchildID": "child1",
+                    "CINdetailsID": "cin1",
+                    "CINPlanEndDate": pd.NaT,
+                },
+                {
+                    "LAchildID": "child1",
+                    "CINdetailsID": "cin1",
+                    "CINPlanEndDate": pd.NaT,
+                },
+                {
+                    "LAchildID": "child1",
+                    "CINdetailsID": "cin2",
+                    "CINPlanEndDate": pd.NaT,
+                },
+                {
+                    "LAchildID": "child4",
+                    "CINdetailsID": "cin1",
+                    "CINPlanEndDate": pd.to_datetime("2021-01-01"),
+                },
+            ]
+        ),
+    }
+
+
+# hand-written versions of each shape, written the way the rules in the repo are.
+@rule_definition(code="reference", module=ChildIdentifiers)
+def reference_value_present(data_container, rule_context):
+    df = data_container[ChildIdentifiers]
+    failing_indices = df[df["LAchildID"].isna()].index
+    rule_context.push_issue(
+        table=ChildIdentifiers, field="LAchildID", row=failing_indices
+    )
+
+
+@rule_definition(code="reference", module=ChildIdentifiers)
+def reference_value_unique(data_container, rule_context):
+    df = data_container[ChildIdentifiers]
+    failing_indices = df[df.duplicated(subset=["LAchildID"], keep=False)].index
+    rule_context.push_issue(
+        table=ChildIdentifiers, field="LAchildID", row=failing_indices
+    )
+
+
+@rule_definition(code="reference", module=ChildIdentifiers)
+def reference_either_or(data_container, rule_context):
+    df = data_container[ChildIdentifiers]
+    df.index.name = "ROW_ID"
+    condition = (
+        df["PersonBirthDate"].isna() & df["ExpectedPersonBirthDate"].notna()
+    ) | (df["PersonBirthDate"].notna() & df["ExpectedPersonBirthDate"].isna())
+    df_issues = df[~condition].reset_index()
+    df_issues["ERROR_ID"] = tuple(zip(df_issues["LAchildID"]))
+    df_issues = (
+        df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
+        .apply(list)
+        .reset_index()
+    )
+    rule_context.push_type_1(
+        table=ChildIdentifiers,
+        columns=["PersonBirthDate", "ExpectedPersonBirthDate"],
+        row_df=df_issues,
+    )
+
+
+@rule_definition(code="reference", module=CINdetails)
+def reference_date_on_or_after(data_container, rule_context):
+    df = data_container[CINdetails]
+    df.index.name = "ROW_ID"
+    df_issues = df[df["CINreferralDate"] > df["CINclosureDate"]].reset_index()
+    df_issues["ERROR_ID"] = tuple(
+        zip(df_issues["LAchildID"], df_issues["CINdetailsID"])
+    )
+    df_issues = (
+        df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
+        .apply(list)
+        .reset_index()
+    )
+    rule_context.push_type_1(
+        table=CINdetails,
+        columns=["CINreferralDate", "CINclosureDate"],
+        row_df=df_issues,
+    )
+
+
+@rule_definition(code="reference", module=CINdetails)
+def reference_within_census_period(data_container, rule_context):
+    df = data_container[CINdetails]
+    collection_start, collection_end = make_census_period(
+        data_container[Header]["ReferenceDate"]
+    )
+    df = df[df["CINclosureDate"].notna()]
+    df = df[
+        ~(
+            (df["CINclosureDate"] >= collection_start)
+            & (df["CINclosureDate"] <= collection_end)
+        )
+    ]
+    rule_context.push_issue(table=CINdetails, field="CINclosureDate", row=df.index)
+
+
+@rule_definition(code="reference", module=CINplanDates)
+def reference_only_one_in_group(data_container, rule_context):
+    df = data_container[CINplanDates]
+    df.index.name = "ROW_ID"
+    df.reset_index(inplace=True)
+    df_check = df[df["CINPlanEndDate"].isna()].copy()
+    df_check["CINPlanEndDate"] = 1
+    df_check = (
+        df_check.groupby(["LAchildID", "CINdetailsID"])["CINPlanEndDate"]
+        .count()
+        .reset_index()
+    )
+    df_check = df_check[df_check["CINPlanEndDate"] > 1]
+    issue_ids = tuple(zip(df_check["LAchildID"], df_check["CINdetailsID"]))
+    df["ERROR_ID"] = tuple(zip(df["LAchildID"], df["CINdetailsID"]))
+    df_issues = df[df["ERROR_ID"].isin(issue_ids)]
+    df_issues = (
+        df_issues.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
+        .apply(list)
+        .reset_index()
+    )
+    rule_context.push_type_3(
+        table=CINplanDates, columns=["CINPlanEndDate"], row_df=df_issues
+    )
+
+
+@rule_definition(code="reference", module=ChildIdentifiers)
+def reference_module_must_exist(data_container, rule_context):
+    df_cid = data_container[ChildIdentifiers].copy()
+    df_cin = data_container[CINdetails].copy()
+    df_cid.index.name = "ROW_ID"
+    df_cid.reset_index(inplace=True)
+    df_merge = df_cid.merge(
+        df_cin["LAchildID"], on=["LAchildID"], how="left", indicator=True
+    )
+    df_merge = df_merge[df_merge["_merge"] == "left_only"]
+    df_merge["ERROR_ID"] = tuple(zip(df_merge["LAchildID"]))
+    df_issues = (
+        df_merge.groupby("ERROR_ID", group_keys=False)["ROW_ID"]
+        .apply(list)
+        .reset_index()
+    )
+    rule_context.push_type_2(
+        table=ChildIdentifiers, columns=["LAchildID"], row_df=df_issues
+    )
+
+
+@pytest.mark.parametrize(
+    "reference, spec",
+    [
+        (reference_value_present, ValuePresent(ChildIdentifiers, "LAchildID")),
+        (reference_value_unique, ValueUnique(ChildIdentifiers, "LAchildID")),
+        (
+            reference_either_or,
+            EitherOr(
+                ChildIdentifiers,
+                "PersonBirthDate",
+                "ExpectedPersonBirthDate",
+                error_id=("LAchildID",),
+            ),
+        ),
+        (
+            reference_date_on_or_after,
+            DateOnOrAfter(
+                CINdetails,
+                "CINclosureDate",
+                reference="CINreferralDate",
+                error_id=("LAchildID", "CINdetailsID"),
+            ),
+        ),
+        (
+            reference_within_census_period,
+            WithinCensusPeriod(CINdetails, "CINclosureDate"),
+        ),
+        (
+            reference_only_one_in_group,
+            OnlyOneInGroup(
+                CINplanDates, "CINPlanEndDate", group=("LAchildID", "CINdetailsID")
+            ),
+        ),
+        (
+            reference_module_must_exist,
+            ModuleMustExist(ChildIdentifiers, CINdetails, key=("LAchildID",)),
+        ),
+    ],
+)
+def test_patterns_match_hand_written_rules(reference, spec):
+    compiled = pattern_rule(spec, code="compiled", module=spec.table)
+    assert_rules_equivalent(reference, compiled, make_data())
+
+
+def test_pattern_rule_definition():
+    validate = pattern_rule(
+        WithinCensusPeriod(ChildIdentifiers, "PersonBirthDate", check_start=False),
+        code="8520",
+        module=ChildIdentifiers,
+        message="Date of Birth is after data collection period",
+    )
+    result = run_rule(validate, make_data())
+
+    assert result.definition.code == "8520"
+    assert result.definition.message == "Date of Birth is after data collection period"
+    # only the birth date after the end of the census period fails.
+    assert [issue.row for issue in result.issues] == [1]
+
+
+def test_return_counts():
+    def count(data_container):
+        df = data_container[ChildIdentifiers]
+        return {"missing": int(df["PersonBirthDate"].isna().sum())}
+
+    validate = pattern_rule(
+        ReturnCounts(count, flagged=lambda counts: counts["missing"] > 0),
+        code="2886Q",
+        module=ChildIdentifiers,
+        message="Some children have no date of birth",
+    )
+
+    result = run_rule(validate, make_data())
+    assert result.la_issues == ("2886Q", "Some children have no date of birth")
+    assert list(result.issues) == []
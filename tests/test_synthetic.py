@@ -0,0 +1,65 @@
+import random
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+import pytest
+
+from cin_validator.cin_validator import validate_xml
+from cin_validator.rules.registry import LazyRegistry
+from cin_validator.synthetic import CensusGenerator, upn, write_census
+from cin_validator.upn import upn_checks
+
+
+def test_same_seed_same_file(tmp_path):
+    first, second, other = (tmp_path / name for name in ["1.xml", "2.xml", "3.xml"])
+
+    write_census(first, 20, seed=1, error_rates={"codes": 0.2})
+    write_census(second, 20, seed=1, error_rates={"codes": 0.2})
+    write_census(other, 20, seed=2, error_rates={"codes": 0.2})
+
+    assert first.read_bytes() == second.read_bytes()
+    assert first.read_bytes() != other.read_bytes()
+    assert len(ET.parse(first).getroot().find("Children")) == 20
+
+
+def test_valid_upns():
+    upns = pd.Series([upn("201", random.Random(seed)) for seed in range(50)])
+    checks = upn_checks(upns)
+
+    assert checks["check_ok"].all()
+    assert (checks["la_code"] == 201).all()
+
+
+@pytest.mark.parametrize(
+    "collection_year, ruleset",
+    [("2023", "cin2022_23"), ("2024", "cin2023_24"), ("2025", "cin2024_25")],
+)
+def test_clean_return_passes(tmp_path, collection_year, ruleset):
+    path = tmp_path / "census.xml"
+    write_census(path, 100, seed=3, collection_year=collection_year)
+
+    validator = validate_xml(path, ruleset, LazyRegistry(ruleset))
+
+    assert validator.user_report.empty
+    assert validator.multichild_issues.empty
+
+
+def test_injected_errors(tmp_path):
+    # a rule that each group of errors breaks.
+    broken_rules = {"missing": "8525Q", "codes": "8866", "upn": "1510", "dates": "8630"}
+    path = tmp_path / "census.xml"
+    injected = write_census(
+        path, 50, seed=4, error_rates={group: 0.3 for group in broken_rules}
+    )
+
+    validator = validate_xml(path, "cin2024_25", LazyRegistry("cin2024_25"))
+
+    assert set(injected) == set(broken_rules)
+    assert set(broken_rules.values()) <= set(
+        validator.user_report["rule_code"].astype(str)
+    )
+
+
+def test_unknown_error_group():
+    with pytest.raises(ValueError):
+        CensusGenerator(error_rates={"typos": 0.1})
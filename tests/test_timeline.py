@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+from cin_validator.rule_engine import CINTable
+from cin_validator.timeline import EpisodeTimeline, day_numbers
+
+CINdetails = CINTable.CINdetails
+Assessments = CINTable.Assessments
+
+
+def make_tables():
+    df_cin = pd.DataFrame(
+        [
+            {
+                "LAchildID": "child1",
+                "CINdetailsID": 1,
+                "CINreferralDate": "01/04/2022",
+                "CINclosureDate": "01/06/2022",
+            },
+            {
+                "LAchildID": "child1",
+                "CINdetailsID": 2,
+                "CINreferralDate": "01/07/2022",
+                "CINclosureDate": pd.NA,
+            },
+            {
+                "LAchildID": "child2",
+                "CINdetailsID": 1,
+                "CINreferralDate": pd.NA,
+                "CINclosureDate": pd.NA,
+            },
+        ]
+    )
+    df_ass = pd.DataFrame(
+        [
+            {
+                "LAchildID": "child1",
+                "CINdetailsID": 1,
+                "AssessmentActualStartDate": "05/06/2022",
+            },
+            {
+                "LAchildID": "child1",
+                "CINdetailsID": 1,
+                "AssessmentActualStartDate": "01/05/2022",
+            },
+            {
+                "LAchildID": "child1",
+                "CINdetailsID": 2,
+                "AssessmentActualStartDate": "02/07/2022",
+            },
+        ]
+    )
+    return {CINdetails: df_cin, Assessments: df_ass}
+
+
+def test_timeline_layout():
+    timeline = EpisodeTimeline(
+        make_tables(),
+        fields={
+            CINdetails: ["CINreferralDate", "CINclosureDate"],
+            Assessments: ["AssessmentActualStartDate"],
+        },
+    )
+    # child2 has no dates so it has no episode on the timeline.
+    assert timeline.n_episodes == 2
+    assert len(timeline) == 6
+    assert timeline.offsets.tolist() == [0, 4, 6]
+    # dates are sorted within each episode.
+    first_episode = timeline.days[timeline.offsets[0] : timeline.offsets[1]]
+    assert (np.diff(first_episode) >= 0).all()
+
+
+def test_timeline_queries():
+    tables = make_tables()
+    timeline = EpisodeTimeline(
+        tables, fields={Assessments: ["AssessmentActualStartDate"]}
+    )
+    episodes = timeline.lookup(["child1", "child1", "child2"], [1, 2, 1])
+    assert episodes.tolist()[2] == -1
+
+    closure_days, _ = day_numbers(pd.Series(["01/06/2022", "05/07/2022", "01/01/2022"]))
+    assert timeline.any_after(episodes, closure_days).tolist() == [True, False, False]
+
+    latest = timeline.max_date(episodes)
+    assert latest[0] == day_numbers(pd.Series(["05/06/2022"]))[0][0]
+    assert np.isnan(latest[2])
+
+    query_positions, event_positions = timeline.events_after(episodes, closure_days)
+    assert query_positions.tolist() == [0]
+    # the failing event points back at its row in the Assessments table.
+    assert timeline.rows[event_positions].tolist() == [0]
+    assert timeline.source_of(event_positions) == [
+        (Assessments, "AssessmentActualStartDate")
+    ]
+    assert timeline.from_table(event_positions, Assessments).all()
+
+
+def test_day_numbers_are_day_first():
+    days, present = day_numbers(pd.Series(["01/06/2022", None]))
+
+    assert days[0] == (pd.Timestamp("2022-06-01") - pd.Timestamp("1970-01-01")).days
+    assert present.tolist() == [True, False]
+
+
+def test_events_before():
+    timeline = EpisodeTimeline(
+        make_tables(), fields={Assessments: ["AssessmentActualStartDate"]}
+    )
+    episodes = timeline.lookup(["child1", "child1"], [1, 2])
+    referral_days, _ = day_numbers(pd.Series(["01/07/2022", "02/07/2022"]))
+
+    query_positions, event_positions = timeline.events_before(episodes, referral_days)
+    # both assessments of the first episode are earlier, including the latest one. Same day is not earlier.
+    assert query_positions.tolist() == [0, 0]
+    assert sorted(timeline.rows[event_positions].tolist()) == [0, 1]
+
+
+def test_missing_ids_match_each_other():
+    tables = make_tables()
+    tables[Assessments].loc[2, "LAchildID"] = pd.NA
+    timeline = EpisodeTimeline(
+        tables, fields={Assessments: ["AssessmentActualStartDate"]}
+    )
+
+    episodes = timeline.lookup([None, "child2"], [2, 2])
+    assert episodes[0] >= 0 and episodes[1] == -1
+
+
+def test_empty_timeline():
+    timeline = EpisodeTimeline(make_tables(), fields={Assessments: []})
+    episodes = timeline.lookup(["child1"], [1])
+
+    assert timeline.n_episodes == 0 and episodes.tolist() == [-1]
+    for query_positions, event_positions in [
+        timeline.events_before(episodes, [0]),
+        timeline.events_after(episodes, [0]),
+    ]:
+        assert len(query_positions) == len(event_positions) == 0
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pandas as pd
+
+from cin_validator.upload_cache import UploadCache, convert_upload
+
+FAKE_DATA = Path(__file__).parents[1] / "fake_data"
+FIRST_FILE = (FAKE_DATA / "CIN_Census_2024.xml").read_bytes()
+SECOND_FILE = (FAKE_DATA / "CIN2rows.xml").read_bytes()
+THIRD_FILE = (FAKE_DATA / "CIN_header_issues_100.xml").read_bytes()
+
+
+def test_upload_is_parsed_once():
+    cache = UploadCache()
+
+    first = cache.get(FIRST_FILE)
+    second = cache.get(FIRST_FILE)
+
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert second.json_tables == first.json_tables
+    for name, df in first.tables.items():
+        pd.testing.assert_frame_equal(second.tables[name], df)
+
+
+def test_cached_tables_are_not_modified_by_callers():
+    cache = UploadCache()
+
+    tables = cache.get(FIRST_FILE).tables
+    tables["ChildIdentifiers"]["LAchildID"] = "changed"
+
+    assert (
+        cache.get(FIRST_FILE).tables["ChildIdentifiers"]["LAchildID"] != "changed"
+    ).all()
+
+
+def test_least_recently_used_upload_is_dropped():
+    cache = UploadCache(max_entries=2)
+
+    cache.get(FIRST_FILE)
+    cache.get(SECOND_FILE)
+    cache.get(FIRST_FILE)
+    cache.get(THIRD_FILE)
+    assert len(cache) == 2
+
+    # FIRST_FILE was used more recently than SECOND_FILE so it is still cached.
+    cache.get(FIRST_FILE)
+    assert cache.hits == 2
+    cache.get(SECOND_FILE)
+    assert cache.misses == 4
+
+
+def test_memory_budget():
+    sizes = [convert_upload(file).nbytes for file in [FIRST_FILE, SECOND_FILE]]
+    cache = UploadCache(max_bytes=max(sizes))
+
+    cache.get(FIRST_FILE)
+    cache.get(SECOND_FILE)
+    assert len(cache) == 1
+    assert cache.nbytes <= cache.max_bytes
+
+    # an upload that does not fit is converted but not kept.
+    small_cache = UploadCache(max_bytes=min(sizes) - 1)
+    small_cache.get(FIRST_FILE)
+    assert len(small_cache) == 0
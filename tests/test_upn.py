@@ -0,0 +1,77 @@
+import pandas as pd
+
+from cin_validator.upn import CHECKS, add_upn_checks, read_upn_checks, upn_checks
+
+
+def test_upn_checks():
+    upns = pd.Series(
+        [
+            "H003278544154",  # wrong check letter
+            "Q003278544154",  # valid
+            pd.NA,
+            "R34",  # too short
+            "X0000y0000000",  # letter among the digits
+            "H00327854415I",  # temporary UPN ending in an invalid letter
+            "H00327854415AB",  # too long
+        ],
+        index=[10, 11, 12, 13, 14, 15, 16],
+    )
+    checks = upn_checks(upns)
+
+    assert checks.index.tolist() == upns.index.tolist()
+    assert checks["present"].tolist() == [True, True, False, True, True, True, True]
+    assert checks["valid_length"].tolist() == [
+        True,
+        True,
+        False,
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert checks["digits_2_13"].tolist() == [
+        True,
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert checks.loc[11, "check_ok"] and not checks.loc[10, "check_ok"]
+    assert checks.loc[11, "la_code"] == 3
+    assert checks.loc[14, "la_code"] == 0
+    assert checks.loc[12, "la_code"] == -1
+    assert not checks.loc[15, "last_char_valid"]
+    # like str[4:12].isdigit(), short values only have their existing characters checked.
+    assert checks["digits_5_12"].tolist() == [
+        True,
+        True,
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_upn_checks_empty():
+    checks = upn_checks(pd.Series([], dtype=object))
+    assert len(checks) == 0
+
+
+def test_add_upn_checks():
+    upns = pd.Series(["Q003278544154", pd.NA, "R34"], index=[3, 4, 5])
+    tables = add_upn_checks(
+        {"ChildIdentifiers": pd.DataFrame({"UPN": upns}), "Header": pd.DataFrame()}
+    )
+    child_identifiers = tables["ChildIdentifiers"]
+
+    assert list(child_identifiers.columns) == ["UPN"] + [f"UPN_{c}" for c in CHECKS]
+    assert list(tables["Header"].columns) == []
+    pd.testing.assert_frame_equal(
+        read_upn_checks(child_identifiers, "UPN"), upn_checks(upns)
+    )
+    # rules read the added columns rather than parsing the UPNs again.
+    child_identifiers["UPN_check_ok"] = False
+    assert not read_upn_checks(child_identifiers, "UPN")["check_ok"].any()
@@ -2,7 +2,12 @@
 import pandas as pd
 from pandas.api.types import is_datetime64_any_dtype as is_datetime
 
-from cin_validator.utils import process_date_columns
+from cin_validator.utils import (
+    add_surrogate_keys,
+    group_codes,
+    merge_on_ids,
+    process_date_columns,
+)
 
 
 def test_date_process_function():
@@ -52,3 +57,73 @@ def test_date_process_function():
     assert df["Aniversaries"].dtype == object
     assert is_datetime(df["dates"])
     assert is_datetime(df["Dates"])
+
+
+def test_surrogate_keys():
+    cin_tables = {
+        "ChildIdentifiers": pd.DataFrame({"LAchildID": ["child1", "child2", pd.NA]}),
+        "CINdetails": pd.DataFrame(
+            {
+                "LAchildID": ["child2", "child1", "child1"],
+                "CINdetailsID": [1, 1, 2],
+                "CINreferralDate": ["2022/04/25", "2022/03/01", "2022/12/25"],
+            }
+        ),
+        "Assessments": pd.DataFrame(
+            {
+                "LAchildID": ["child1", "child1", "child2"],
+                "CINdetailsID": [2, 2, 1],
+                "AssessmentActualStartDate": ["2022/04/27", "2022/11/21", pd.NA],
+            }
+        ),
+    }
+    cin_tables = add_surrogate_keys(cin_tables)
+
+    child_ids = cin_tables["ChildIdentifiers"]
+    cin = cin_tables["CINdetails"]
+    ass = cin_tables["Assessments"]
+
+    # equal IDs have equal keys across tables.
+    assert "episode_key" not in child_ids.columns
+    assert cin["child_code"].tolist() == [1, 0, 0]
+    assert ass["child_code"].tolist() == [0, 0, 1]
+    assert cin["episode_key"].nunique() == 3
+    assert ass["episode_key"].tolist()[0] == cin["episode_key"].tolist()[2]
+    assert ass["episode_key"].tolist()[2] == cin["episode_key"].tolist()[0]
+
+    # merging on the integer key gives the same rows as merging on the ID columns.
+    expected = cin.merge(ass, on=["LAchildID", "CINdetailsID"], how="left")
+    merged = merge_on_ids(cin, ass, on=["LAchildID", "CINdetailsID"], how="left")
+    assert len(merged) == len(expected) == 4
+    assert merged["LAchildID"].tolist() == expected["LAchildID"].tolist()
+    assert (
+        merged["AssessmentActualStartDate"].tolist()
+        == expected["AssessmentActualStartDate"].tolist()
+    )
+
+    # rows of the same CINdetails group share a group code, with or without the keys.
+    assert group_codes(ass, ["LAchildID", "CINdetailsID"]).nunique() == 2
+    no_keys = ass.drop(columns=["child_code", "episode_key"])
+    assert group_codes(no_keys, ["LAchildID", "CINdetailsID"]).tolist() == [0, 0, 1]
+
+
+def test_surrogate_keys_that_could_overflow(monkeypatch):
+    cin_tables = {
+        "CINdetails": pd.DataFrame(
+            {"LAchildID": ["child1", "child2", "child3"], "CINdetailsID": [1, 2, 3]}
+        ),
+        "Assessments": pd.DataFrame(
+            {"LAchildID": ["child3", "child1"], "CINdetailsID": [3, 1]}
+        ),
+    }
+    # 3 children and 3 CINdetailsIDs need episode keys up to 9.
+    monkeypatch.setattr("cin_validator.utils.MAX_SURROGATE_KEY", 8)
+    cin_tables = add_surrogate_keys(cin_tables)
+
+    cin = cin_tables["CINdetails"]
+    ass = cin_tables["Assessments"]
+    assert "child_code" in cin.columns
+    assert "episode_key" not in cin.columns
+    # merges fall back to the ID columns.
+    merged = merge_on_ids(cin, ass, on=["LAchildID", "CINdetailsID"])
+    assert merged["LAchildID"].tolist() == ["child1", "child3"]